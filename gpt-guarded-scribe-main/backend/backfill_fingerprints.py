@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+"""
+기존 document_sources에 content_hash / SimHash 지문과 문장 청크를 채우는 스크립트
+지문/청크 도입 전에 저장된 문서에 한 번 실행합니다. 본문이 같은 중복 문서는 비활성화됩니다.
+긴 본문은 압축 블롭(content_blob)으로 옮기고 content에는 미리보기만 남깁니다.
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database import create_tables
+from services.document_repository import get_document_repository
+
+
+def main():
+    create_tables()
+    print("🔎 문서 지문 채우는 중...")
+    stats = get_document_repository().backfill_fingerprints()
+    print(f"✅ 완료: 지문 {stats['updated']}개 저장, 중복 {stats['deactivated']}개 비활성화")
+
+    print("✂️  문장 청크 만드는 중...")
+    chunked = get_document_repository().backfill_chunks()
+    print(f"✅ 완료: 문서 {chunked}개 청크 저장")
+
+    print("🗜️  긴 본문 압축 중...")
+    compressed = get_document_repository().backfill_compression()
+    print(f"✅ 완료: 문서 {compressed}개 압축")
+
+
+if __name__ == "__main__":
+    main()
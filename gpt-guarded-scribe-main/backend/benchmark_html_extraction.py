@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+HTML 본문 추출 벤치마크
+저장된 HTML(fixtures/html)로 기존 BeautifulSoup 방식과 lxml HtmlExtractor의 초당 페이지 수를 비교합니다.
+
+사용법: python benchmark_html_extraction.py [반복 횟수] [HTML 디렉토리]
+"""
+
+import glob
+import os
+import re
+import sys
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from bs4 import BeautifulSoup
+
+from services.ai_crawler_service import AICrawlerService
+from services.web_crawler_service import PAGE_EXTRACTOR
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "html")
+
+
+def clean_text(text: str) -> str:
+    text = re.sub(r'\s+', ' ', text)
+    return re.sub(r'[^\w\s가-힣ㄱ-ㅎㅏ-ㅣ.,!?():;-]', '', text).strip()
+
+
+def legacy_extract(html: str, content_selectors, title_selectors, fallback: bool):
+    """기존 방식: html.parser로 파싱 → 잡음 태그 decompose → 선택자 하나씩 시도 → 정규식 정리"""
+    soup = BeautifulSoup(html, 'html.parser')
+    title = None
+    for selector in title_selectors:
+        element = soup.select_one(selector)
+        if element and element.get_text().strip():
+            title = element.get_text().strip()[:200]
+            break
+    for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
+        element.decompose()
+    for selector in content_selectors:
+        elements = soup.select(selector)
+        if elements:
+            content = clean_text(' '.join(el.get_text() for el in elements))
+            if len(content) > 200:
+                return title, content
+    if not fallback:
+        return title, ""
+    return title, clean_text(' '.join(p.get_text() for p in soup.find_all('p')) or soup.get_text())
+
+
+def new_extract(html: str, extractor):
+    page = extractor.parse(html)
+    return extractor.title(page), clean_text(extractor.content(page))
+
+
+def measure(label, pages, iterations, extract):
+    started = time.perf_counter()
+    for _ in range(iterations):
+        for html in pages:
+            extract(html)
+    elapsed = time.perf_counter() - started
+    rate = len(pages) * iterations / elapsed
+    print(f"  {label:<28} {rate:8.1f} pages/s")
+    return rate
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    fixture_dir = sys.argv[2] if len(sys.argv) > 2 else FIXTURE_DIR
+    paths = sorted(glob.glob(os.path.join(fixture_dir, "*.html")))
+    if not paths:
+        print(f"❌ HTML 파일이 없습니다: {fixture_dir}")
+        return 1
+
+    pages = [open(path, encoding="utf-8").read() for path in paths]
+    total_kb = sum(len(page.encode("utf-8")) for page in pages) // 1024
+    print(f"📄 {len(pages)}개 페이지 ({total_kb}KB) x {iterations}회")
+
+    # 위키백과 대상 선택자 (AICrawlerService) / 일반 웹페이지 선택자 (WebCrawlerService)
+    wikipedia = AICrawlerService(repository=object()).crawl_targets['wikipedia']
+    cases = [
+        ("위키백과 대상", wikipedia.content_selectors, wikipedia.title_selectors, False, wikipedia.extractor),
+        ("일반 웹페이지", ['.content', '.article', '.post', '#content', 'main', '.main-content', 'article', '.entry-content'],
+         ['title', 'h1', '.title', '#title', '[class*="title"]'], True, PAGE_EXTRACTOR),
+    ]
+    for name, content_selectors, title_selectors, fallback, extractor in cases:
+        print(f"\n▶ {name}")
+        legacy = measure("BeautifulSoup(html.parser)", pages, iterations,
+                         lambda html: legacy_extract(html, content_selectors, title_selectors, fallback))
+        fast = measure("lxml HtmlExtractor", pages, iterations, lambda html: new_extract(html, extractor))
+        print(f"  속도 향상: {fast / legacy:.1f}배")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
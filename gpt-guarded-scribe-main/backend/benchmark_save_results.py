@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+검사 결과 저장 벤치마크
+기존 ORM 방식(매치마다 db.add)과 ResultWriter 일괄 저장의 초당 행 수를 비교합니다.
+
+사용법: python benchmark_save_results.py [매치 수] [반복 횟수]
+DATABASE_URL을 지정하면 해당 DB(예: PostgreSQL)에서 측정하고,
+지정하지 않으면 임시 SQLite 파일을 사용합니다.
+"""
+
+import sys
+import os
+import tempfile
+import time
+import uuid
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from models import Base, PlagiarismCheck, PlagiarismMatch
+from services.result_writer import ResultWriter
+
+
+def make_matches(count: int):
+    return [
+        {
+            "matched_text": f"공통 단어 {i} 인공지능 머신러닝 딥러닝",
+            "source_title": f"벤치마크 문서 {i % 50}",
+            "source_url": f"https://example.com/doc/{i % 50}",
+            "similarity_score": 40.0 + (i % 50),
+            "start_index": i * 10,
+            "end_index": i * 10 + 25,
+        }
+        for i in range(count)
+    ]
+
+
+def orm_save(db, check_id, matches, similarity_score, processing_time):
+    """기존 _save_results 방식 (print 제외)"""
+    check = db.query(PlagiarismCheck).filter(PlagiarismCheck.id == check_id).first()
+    check.similarity_score = similarity_score
+    check.status = "completed"
+    check.processing_time = processing_time
+    for match_data in matches:
+        db.add(PlagiarismMatch(
+            check_id=check_id,
+            matched_text=match_data["matched_text"],
+            source_text=match_data["matched_text"],
+            source_title=match_data["source_title"],
+            source_url=match_data["source_url"],
+            similarity_score=match_data["similarity_score"],
+            start_index=match_data["start_index"],
+            end_index=match_data["end_index"]
+        ))
+    db.commit()
+
+
+def bulk_save(db, check_id, matches, similarity_score, processing_time):
+    ResultWriter(db).save(check_id, matches, similarity_score, processing_time)
+
+
+def run(save_fn, SessionLocal, matches, repeat: int) -> float:
+    """repeat번 저장하고 초당 행 수 반환"""
+    elapsed = 0.0
+    for _ in range(repeat):
+        db = SessionLocal()
+        check_id = str(uuid.uuid4())
+        db.add(PlagiarismCheck(id=check_id, original_text="benchmark", status="checking"))
+        db.commit()
+
+        start = time.perf_counter()
+        save_fn(db, check_id, matches, 50.0, 0.1)
+        elapsed += time.perf_counter() - start
+        db.close()
+
+    return len(matches) * repeat / elapsed if elapsed > 0 else 0.0
+
+
+def main():
+    match_count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    db_url = os.getenv("DATABASE_URL")
+    tmp_dir = None
+    if not db_url:
+        tmp_dir = tempfile.mkdtemp()
+        db_url = f"sqlite:///{os.path.join(tmp_dir, 'benchmark.db')}"
+
+    engine = create_engine(db_url)
+    Base.metadata.create_all(bind=engine)
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    matches = make_matches(match_count)
+    print(f"🏁 결과 저장 벤치마크: {engine.dialect.name}, 매치 {match_count}개 x {repeat}회")
+
+    orm_rate = run(orm_save, SessionLocal, matches, repeat)
+    print(f"   ORM (db.add)     : {orm_rate:10.0f} rows/sec")
+
+    bulk_rate = run(bulk_save, SessionLocal, matches, repeat)
+    print(f"   ResultWriter     : {bulk_rate:10.0f} rows/sec")
+
+    if orm_rate > 0:
+        print(f"📈 속도 향상: {bulk_rate / orm_rate:.1f}배")
+
+    engine.dispose()
+    if tmp_dir:
+        os.remove(os.path.join(tmp_dir, 'benchmark.db'))
+        os.rmdir(tmp_dir)
+
+
+if __name__ == "__main__":
+    main()
@@ -44,6 +44,10 @@ celery_app.conf.beat_schedule = {
         'task': 'tasks.maintenance_tasks.cleanup_old_results',
         'schedule': 3600.0,  # 1시간마다
     },
+    'maintain-partitions': {
+        'task': 'tasks.maintenance_tasks.maintain_partitions',
+        'schedule': 86400.0,  # 24시간마다 (PARTITIONING_ENABLED일 때만 동작)
+    },
     'update-statistics': {
         'task': 'tasks.maintenance_tasks.update_daily_statistics',
         'schedule': 86400.0,  # 24시간마다
@@ -8,9 +8,22 @@ class Settings:
         "sqlite:///./plagiarism.db"
     )
     
+    # SQLite 성능 프로파일 (단일 노드 배포용)
+    SQLITE_JOURNAL_MODE: str = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS: str = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")  # WAL에서는 NORMAL로도 손상 없음
+    SQLITE_BUSY_TIMEOUT_MS: int = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_CACHE_SIZE_KB: int = int(os.getenv("SQLITE_CACHE_SIZE_KB", str(64 * 1024)))  # 연결당 페이지 캐시
+    SQLITE_MMAP_SIZE: int = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_POOL_SIZE: int = int(os.getenv("SQLITE_POOL_SIZE", "8"))
+    
     # Redis 설정 (캐싱용)
     REDIS_URL: str = os.getenv("REDIS_URL", "redis://localhost:6379")
-    
+
+    # 완료된 검사 결과 응답 캐시
+    RESULT_CACHE_MAX_ENTRIES: int = int(os.getenv("RESULT_CACHE_MAX_ENTRIES", "1000"))
+    RESULT_CACHE_TTL: int = int(os.getenv("RESULT_CACHE_TTL", "86400"))  # 초
+    RESULT_CACHE_USE_REDIS: bool = os.getenv("RESULT_CACHE_USE_REDIS", "False").lower() == "true"
+
     # API 설정
     API_V1_STR: str = "/api/v1"
     PROJECT_NAME: str = "GPT 표절 검사기 API"
@@ -40,11 +53,92 @@ class Settings:
         "application/msword",
         "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
     ]
+
+    # 업로드 스트리밍 / 문서 추출 설정
+    UPLOAD_CHUNK_SIZE: int = 256 * 1024  # 업로드를 읽어들이는 단위 (256KB)
+    UPLOAD_SPOOL_MAX_SIZE: int = 1024 * 1024  # 이 크기를 넘으면 임시 파일로 전환 (1MB)
+    PDF_EXTRACTION_WORKERS: int = int(os.getenv("PDF_EXTRACTION_WORKERS", "0"))  # 0이면 CPU 코어 수
+    PDF_PARALLEL_MIN_PAGES: int = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))  # 이보다 적으면 직접 추출
+    PDF_PAGES_PER_TASK: int = 4  # 프로세스 풀 작업 하나가 처리할 페이지 수
+    PDF_PAGE_CACHE_DIR: str = os.getenv("PDF_PAGE_CACHE_DIR", "./cache/pdf_pages")
+    PDF_PAGE_CACHE_MAX_BYTES: int = int(os.getenv("PDF_PAGE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))  # 0이면 캐시 끔
+
+    # 결과 일괄 저장 설정
+    BULK_INSERT_BATCH_SIZE: int = 1000  # executemany 한 번에 보내는 최대 행 수
+    BULK_COPY_MIN_ROWS: int = int(os.getenv("BULK_COPY_MIN_ROWS", "500"))  # PostgreSQL에서 COPY를 쓰는 최소 행 수
+    INGEST_BATCH_SIZE: int = 200  # 크롤링 문서를 INSERT 한 문장에 담는 최대 행 수
+    SIMHASH_MAX_DISTANCE: int = int(os.getenv("SIMHASH_MAX_DISTANCE", "3"))  # 근사 중복 판정 해밍 거리 (0이면 끔, 최대 3)
+    CONTENT_COMPRESSION: str = os.getenv("CONTENT_COMPRESSION", "zstd")  # 전체 본문 블롭: zstd(없으면 zlib), zlib, none
+    CONTENT_PREVIEW_CHARS: int = 1000  # 블롭으로 저장한 문서의 content 컬럼에 남기는 앞부분 길이
+    
+    # 오래된 검사 결과 정리 (보관 기간)
+    RETENTION_DAYS: int = int(os.getenv("RETENTION_DAYS", "30"))
+    RETENTION_BATCH_SIZE: int = int(os.getenv("RETENTION_BATCH_SIZE", "500"))  # 한 트랜잭션에서 지우는 검사 수
+    RETENTION_BATCH_PAUSE: float = float(os.getenv("RETENTION_BATCH_PAUSE", "0.1"))  # 배치 사이 대기 (초)
+    RETENTION_DROP_PARTITIONS: bool = os.getenv("RETENTION_DROP_PARTITIONS", "True").lower() == "true"  # PostgreSQL 파티션 통째로 삭제
+    
+    # PostgreSQL 검사/매치 테이블 created_at 범위 파티셔닝 (선택)
+    PARTITIONING_ENABLED: bool = os.getenv("PARTITIONING_ENABLED", "False").lower() == "true"
+    PARTITION_INTERVAL: str = os.getenv("PARTITION_INTERVAL", "month")  # day | month
+    PARTITION_PREMAKE: int = int(os.getenv("PARTITION_PREMAKE", "3"))  # 미리 만들어 둘 다음 기간 파티션 수
+    
+    # 통계 (일별 카운터 스냅샷)
+    STATS_CACHE_TTL: float = float(os.getenv("STATS_CACHE_TTL", "10"))  # 통계 API 메모리 캐시 유지 시간 (초)
+    STATS_DAYS: int = 7  # 스냅샷에 담는 최근 일수
+    
+    # 크롤러 HTTP 클라이언트 (호스트별 연결 풀)
+    HTTP_POOL_MAXSIZE: int = int(os.getenv("HTTP_POOL_MAXSIZE", "10"))  # 호스트당 유지할 keep-alive 연결 수
+    HTTP_RETRIES: int = int(os.getenv("HTTP_RETRIES", "3"))
+    HTTP_BACKOFF_FACTOR: float = float(os.getenv("HTTP_BACKOFF_FACTOR", "0.5"))  # 재시도 대기: factor * 2^n 초
+    HTTP_CONNECT_TIMEOUT: float = float(os.getenv("HTTP_CONNECT_TIMEOUT", "5"))
+    HTTP_READ_TIMEOUT: float = float(os.getenv("HTTP_READ_TIMEOUT", "15"))
+    HTTP_CACHE_DIR: str = os.getenv("HTTP_CACHE_DIR", "./cache/http")  # 재크롤링용 ETag/본문 캐시
+    HTTP_CACHE_MAX_BYTES: int = int(os.getenv("HTTP_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))  # 0이면 캐시 끔
+    
+    # 비동기 크롤링 (도메인별 토큰 버킷)
+    CRAWL_DOMAIN_RATE: float = float(os.getenv("CRAWL_DOMAIN_RATE", "1.0"))  # 도메인당 초당 요청 수
+    CRAWL_DOMAIN_BURST: int = int(os.getenv("CRAWL_DOMAIN_BURST", "2"))  # 도메인당 연속 허용 요청 수
+    CRAWL_MAX_CONCURRENCY: int = int(os.getenv("CRAWL_MAX_CONCURRENCY", "16"))  # 전체 동시 요청 수
+    CRAWL_TIMEOUT: float = float(os.getenv("CRAWL_TIMEOUT", "15"))
+    CRAWL_PARSE_WORKERS: int = int(os.getenv("CRAWL_PARSE_WORKERS", "0"))  # HTML 파싱 프로세스 수 (0이면 CPU 코어 수)
+    CRAWL_PIPELINE_QUEUE_SIZE: int = int(os.getenv("CRAWL_PIPELINE_QUEUE_SIZE", "32"))  # 파이프라인 단계 사이 큐 크기
+    
+    # 크롤링 프런티어 (DB 큐)
+    FRONTIER_WORKERS: int = int(os.getenv("FRONTIER_WORKERS", "4"))  # 프로세스당 워커 스레드 수
+    FRONTIER_LEASE_SECONDS: int = int(os.getenv("FRONTIER_LEASE_SECONDS", "300"))  # 이 시간 안에 끝나지 않으면 다시 대기열로
+    FRONTIER_MAX_ATTEMPTS: int = int(os.getenv("FRONTIER_MAX_ATTEMPTS", "3"))
+    FRONTIER_RETRY_DELAY: int = int(os.getenv("FRONTIER_RETRY_DELAY", "60"))  # 실패 후 재시도 대기: delay * 2^(n-1) 초
+    FRONTIER_RECRAWL_DAYS: int = int(os.getenv("FRONTIER_RECRAWL_DAYS", "7"))  # 완료 후 이 기간이 지나면 다시 대기열로 (0이면 안 함)
+    FRONTIER_BLOOM_CAPACITY: int = int(os.getenv("FRONTIER_BLOOM_CAPACITY", "1000000"))
+    FRONTIER_BLOOM_ERROR_RATE: float = float(os.getenv("FRONTIER_BLOOM_ERROR_RATE", "0.001"))
+    
+    # 검사 중 백그라운드 크롤링 힌트 (단일 워커)
+    CRAWL_HINT_QUEUE_SIZE: int = int(os.getenv("CRAWL_HINT_QUEUE_SIZE", "100"))  # 가득 차면 새 힌트는 버림
+    CRAWL_HINT_INTERVAL: float = float(os.getenv("CRAWL_HINT_INTERVAL", "5"))  # 키워드 크롤링 사이 최소 간격 (초)
+    CRAWL_HINT_DEDUP_TTL: float = float(os.getenv("CRAWL_HINT_DEDUP_TTL", "3600"))  # 같은 키워드 재크롤링 금지 기간 (초)
+    CRAWL_HINT_MAX_DOCUMENTS: int = int(os.getenv("CRAWL_HINT_MAX_DOCUMENTS", "100"))  # 활성 문서가 이만큼 있으면 생략
+    CRAWL_HINT_TEXT_CHARS: int = 2000  # 키워드 추출에 쓰는 텍스트 앞부분 길이
+    
+    # 위키백과 덤프 일괄 적재 (import_wiki_dump.py)
+    WIKI_DUMP_PATH: str = os.getenv("WIKI_DUMP_PATH", "")  # kowiki-*-pages-articles.xml.bz2 경로
+    WIKI_DUMP_BATCH_SIZE: int = int(os.getenv("WIKI_DUMP_BATCH_SIZE", "500"))  # 한 번에 정리/저장하는 문서 수
+    WIKI_DUMP_MIN_CHARS: int = 500  # 마크업 제거 후 이보다 짧은 문서는 건너뜀
+    
+    # 배치 크롤링/지식 생성 작업 (/crawl/batch, /ai-knowledge/batch-generate)
+    BATCH_JOB_MAX_RUNNING: int = int(os.getenv("BATCH_JOB_MAX_RUNNING", "2"))  # 동시에 실행하는 배치 작업 수
+    BATCH_JOB_HISTORY: int = 50  # 진행 상황을 조회할 수 있게 남겨 두는 끝난 작업 수
+    BATCH_JOB_HEARTBEAT: int = 15  # 실행 중 작업의 생존 시각 갱신 주기 (초), 3배 넘게 끊기면 중단된 작업으로 봄
     
     # 텍스트 처리 설정
     MIN_TEXT_LENGTH: int = 10
     MAX_TEXT_LENGTH: int = 100000  # 100KB
     
+    # 후보 청크 검색 (PostgreSQL pg_trgm)
+    RETRIEVAL_SIMILARITY_THRESHOLD: float = float(os.getenv("RETRIEVAL_SIMILARITY_THRESHOLD", "0.3"))
+    RETRIEVAL_CHUNKS_PER_SENTENCE: int = 5  # 입력 문장마다 가져올 최대 청크 수
+    RETRIEVAL_MAX_QUERY_SENTENCES: int = 200  # 검색에 사용할 입력 문장 수 상한
+    RETRIEVAL_MAX_CANDIDATES: int = 500
+    
     # 유사도 임계값
     SIMILARITY_THRESHOLD: float = 0.3
     HIGH_SIMILARITY_THRESHOLD: float = 0.7
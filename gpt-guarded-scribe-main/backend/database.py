@@ -1,8 +1,25 @@
-from sqlalchemy import create_engine
+import os
+
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker
 from config import settings
 from models import Base
 
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+def apply_sqlite_pragmas(dbapi_connection, in_memory: bool = False):
+    """연결마다 SQLite 성능 프로파일 적용 (WAL: 쓰기 중에도 읽기가 막히지 않음)"""
+    cursor = dbapi_connection.cursor()
+    if not in_memory:
+        cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+    cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+    cursor.execute(f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}")
+    cursor.execute(f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}")
+    cursor.execute(f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA foreign_keys=ON")  # ON DELETE CASCADE 동작에 필요
+    cursor.close()
+
 # 데이터베이스 연결: SQLite와 기타(DB) 분기 처리
 db_url = settings.DATABASE_URL
 
@@ -10,9 +27,21 @@ if db_url.startswith("sqlite"):
     # SQLite 전용 옵션
     engine = create_engine(
         db_url,
-        connect_args={"check_same_thread": False},
+        connect_args={
+            "check_same_thread": False,
+            "timeout": settings.SQLITE_BUSY_TIMEOUT_MS / 1000,
+        },
         echo=settings.DEBUG,
+        # 파일 DB는 연결 풀 사용 (:memory:는 SQLAlchemy가 스레드별 단일 연결 사용)
+        **({} if ":memory:" in db_url else {
+            "pool_size": settings.SQLITE_POOL_SIZE,
+            "max_overflow": settings.SQLITE_POOL_SIZE,
+        }),
     )
+
+    @event.listens_for(engine, "connect")
+    def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, in_memory=":memory:" in db_url)
 else:
     # Postgres/MySQL 등 일반 DB
     engine = create_engine(
@@ -24,8 +53,28 @@ else:
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 def create_tables():
-    """데이터베이스 테이블 생성"""
+    """데이터베이스 테이블 생성 후 마이그레이션 적용"""
+    if engine.dialect.name == "postgresql":
+        # document_chunks 트라이그램 인덱스에 필요
+        with engine.begin() as conn:
+            conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
+    run_migrations()
+    if settings.PARTITIONING_ENABLED and engine.dialect.name == "postgresql":
+        from services.partition_manager import PartitionManager
+        PartitionManager(engine).setup()
+
+def run_migrations():
+    """alembic upgrade head (create_all이 기존 테이블에 반영하지 못한 컬럼/인덱스/제약 보충)"""
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(os.path.join(BASE_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BASE_DIR, "migrations"))
+    config.attributes["configure_logger"] = False
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
 
 def get_db():
     """데이터베이스 세션 의존성"""
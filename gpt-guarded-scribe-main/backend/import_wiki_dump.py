@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+위키백과 덤프 적재 스크립트
+https://dumps.wikimedia.org/kowiki/latest/ 의 kowiki-latest-pages-articles.xml.bz2를 내려받은 뒤
+API로 한 문서씩 가져오는 대신 덤프에서 바로 참조 문서를 만듭니다. 다시 실행하면 이미 저장된 문서는 건너뜁니다.
+
+사용법: python import_wiki_dump.py 덤프경로 [--limit N] [--workers N] [--batch-size N]
+"""
+
+import argparse
+import sys
+import os
+from concurrent.futures import ProcessPoolExecutor
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from config import settings
+from database import create_tables
+from services.wiki_dump_importer import WikiDumpImporter
+
+
+def main():
+    parser = argparse.ArgumentParser(description="위키백과 XML 덤프를 document_sources에 적재")
+    parser.add_argument("path", nargs="?", default=settings.WIKI_DUMP_PATH, help="덤프 파일 (.xml 또는 .xml.bz2)")
+    parser.add_argument("--limit", type=int, default=None, help="적재할 최대 문서 수")
+    parser.add_argument("--workers", type=int, default=settings.CRAWL_PARSE_WORKERS or None,
+                        help="마크업 제거/지문 계산 프로세스 수 (기본: CPU 코어 수)")
+    parser.add_argument("--batch-size", type=int, default=settings.WIKI_DUMP_BATCH_SIZE)
+    args = parser.parse_args()
+
+    if not args.path or not os.path.exists(args.path):
+        print(f"❌ 덤프 파일이 없습니다: {args.path or '(WIKI_DUMP_PATH 미설정)'}")
+        return 1
+
+    create_tables()
+    print(f"📚 위키백과 덤프 적재 시작: {args.path}")
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        stats = WikiDumpImporter(executor=executor, batch_size=args.batch_size).run(args.path, limit=args.limit)
+    print(f"✅ 완료: {stats['saved']}개 문서 저장")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
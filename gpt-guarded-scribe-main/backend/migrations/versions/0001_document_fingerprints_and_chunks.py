@@ -0,0 +1,99 @@
+"""document fingerprints and chunks
+
+create_all로 만든 기존 DB에 문서 지문(content_hash, simhash), SimHash 밴드,
+문장 청크 테이블과 인덱스를 보충합니다. 이미 있는 항목은 건너뜁니다.
+URL이 겹치는 기존 문서는 가장 오래된 것만 남기고 비활성화합니다.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    _add_missing_columns(inspector, "document_sources", [
+        sa.Column("content_hash", sa.String(64), nullable=True),
+        sa.Column("simhash", sa.BigInteger, nullable=True),
+    ])
+
+    if not inspector.has_table("document_simhash_bands"):
+        op.create_table(
+            "document_simhash_bands",
+            sa.Column("source_id", sa.Integer,
+                      sa.ForeignKey("document_sources.id", ondelete="CASCADE"), primary_key=True),
+            sa.Column("band", sa.SmallInteger, primary_key=True),
+            sa.Column("value", sa.Integer, primary_key=True),
+        )
+
+    if not inspector.has_table("document_chunks"):
+        op.create_table(
+            "document_chunks",
+            sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column("source_id", sa.Integer,
+                      sa.ForeignKey("document_sources.id", ondelete="CASCADE"), nullable=False),
+            sa.Column("chunk_index", sa.Integer, nullable=False),
+            sa.Column("content", sa.Text, nullable=False),
+        )
+    _add_missing_columns(inspector, "document_chunks", [
+        sa.Column("start_offset", sa.Integer, nullable=True),
+        sa.Column("end_offset", sa.Integer, nullable=True),
+        sa.Column("token_count", sa.Integer, nullable=True),
+        sa.Column("chunk_hash", sa.String(64), nullable=True),
+    ])
+
+    _create_unique_index("ux_document_sources_url", "document_sources", "url")
+    _create_unique_index("ux_document_sources_content_hash", "document_sources", "content_hash")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_document_simhash_bands_lookup "
+               "ON document_simhash_bands (band, value)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_document_chunks_source_id "
+               "ON document_chunks (source_id, chunk_index)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_document_chunks_chunk_hash "
+               "ON document_chunks (chunk_hash)")
+
+    if bind.dialect.name == "postgresql":
+        op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        op.execute("CREATE INDEX IF NOT EXISTS ix_document_chunks_content_trgm "
+                   "ON document_chunks USING gin (content gin_trgm_ops)")
+
+
+def downgrade():
+    for name in ("ix_document_chunks_content_trgm", "ix_document_chunks_chunk_hash",
+                 "ix_document_chunks_source_id", "ix_document_simhash_bands_lookup",
+                 "ux_document_sources_content_hash", "ux_document_sources_url"):
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    op.drop_table("document_chunks")
+    op.drop_table("document_simhash_bands")
+    with op.batch_alter_table("document_sources") as batch:
+        batch.drop_column("simhash")
+        batch.drop_column("content_hash")
+
+
+def _add_missing_columns(inspector, table_name, columns):
+    existing = {column["name"] for column in inspector.get_columns(table_name)}
+    for column in columns:
+        if column.name not in existing:
+            op.add_column(table_name, column)
+
+
+def _create_unique_index(name, table_name, column_name):
+    """중복 값은 가장 오래된 행만 남기고 나머지는 비활성화 + 값 비움 후 고유 인덱스 생성"""
+    result = op.get_bind().execute(sa.text(
+        f"UPDATE {table_name} SET is_active = :inactive, {column_name} = NULL "
+        f"WHERE {column_name} IS NOT NULL AND id NOT IN ("
+        f"SELECT MIN(id) FROM {table_name} WHERE {column_name} IS NOT NULL GROUP BY {column_name})"
+    ), {"inactive": False})
+    if result.rowcount:
+        print(f"[DB] {table_name}.{column_name} 중복 {result.rowcount}건 비활성화")
+    op.execute(f"CREATE UNIQUE INDEX IF NOT EXISTS {name} ON {table_name} ({column_name})")
@@ -0,0 +1,85 @@
+"""hot path indexes and match cascade
+
+자주 실행되는 조회(활성 문서 집계, 이력 키셋 페이지네이션, 상태/기간 필터,
+검사별 매치 조회)용 복합/부분 인덱스를 추가하고, plagiarism_matches.check_id
+외래 키에 ON DELETE CASCADE를 붙여 검사 삭제 시 매치를 DB가 지우게 합니다.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ("ix_plagiarism_checks_created_at_id", "plagiarism_checks", "created_at, id"),
+    ("ix_plagiarism_checks_status_created_at", "plagiarism_checks", "status, created_at"),
+    ("ix_plagiarism_matches_check_id", "plagiarism_matches", "check_id"),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+
+    for name, table_name, columns in INDEXES:
+        op.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {table_name} ({columns})")
+
+    # 활성 문서만 담는 부분 인덱스 (is_active = true 조건의 집계/그룹핑용)
+    active = "is_active" if bind.dialect.name == "postgresql" else "is_active = 1"
+    op.execute("CREATE INDEX IF NOT EXISTS ix_document_sources_active_source_type "
+               f"ON document_sources (source_type) WHERE {active}")
+
+    if not _match_fk_cascades(bind):
+        if bind.dialect.name == "sqlite":
+            # SQLite는 제약 변경이 안 되므로 같은 구조로 테이블을 다시 만듦
+            with op.batch_alter_table("plagiarism_matches", recreate="always",
+                                      copy_from=_matches_table()):
+                pass
+        else:
+            for fk in sa.inspect(bind).get_foreign_keys("plagiarism_matches"):
+                if fk["referred_table"] == "plagiarism_checks" and fk.get("name"):
+                    op.drop_constraint(fk["name"], "plagiarism_matches", type_="foreignkey")
+            op.create_foreign_key(
+                "plagiarism_matches_check_id_fkey", "plagiarism_matches", "plagiarism_checks",
+                ["check_id"], ["id"], ondelete="CASCADE",
+            )
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_document_sources_active_source_type")
+    for name, _, _ in INDEXES:
+        op.execute(f"DROP INDEX IF EXISTS {name}")
+    # ON DELETE CASCADE는 되돌리지 않음 (삭제 동작만 DB로 옮긴 것이라 이전 코드와도 호환)
+
+
+def _match_fk_cascades(bind) -> bool:
+    for fk in sa.inspect(bind).get_foreign_keys("plagiarism_matches"):
+        if fk["referred_table"] == "plagiarism_checks":
+            return (fk.get("options") or {}).get("ondelete", "").upper() == "CASCADE"
+    return False
+
+
+def _matches_table() -> sa.Table:
+    """재생성할 plagiarism_matches 구조 (마이그레이션 시점 기준으로 고정)"""
+    return sa.Table(
+        "plagiarism_matches", sa.MetaData(),
+        sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+        sa.Column("check_id", sa.String,
+                  sa.ForeignKey("plagiarism_checks.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("matched_text", sa.Text, nullable=False),
+        sa.Column("source_text", sa.Text, nullable=False),
+        sa.Column("source_title", sa.String, nullable=False),
+        sa.Column("source_url", sa.String, nullable=True),
+        sa.Column("similarity_score", sa.Float, nullable=False),
+        sa.Column("start_index", sa.Integer, nullable=False),
+        sa.Column("end_index", sa.Integer, nullable=False),
+        sa.Column("created_at", sa.DateTime),
+        sa.Index("ix_plagiarism_matches_check_id", "check_id"),
+    )
@@ -0,0 +1,93 @@
+"""incremental statistics
+
+일별 통계(statistics)를 검사 완료/문서 적재 시 증가하는 카운터 테이블로 바꾸고
+출처 유형별 활성 문서 수(source_type_counts)를 추가합니다. 비어 있으면 기존
+검사/문서에서 한 번 채우고, PostgreSQL의 update_daily_statistics() 함수는 지웁니다.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+COUNTER_COLUMNS = (
+    ("total_checks", sa.Integer, "0"),
+    ("completed_checks", sa.Integer, "0"),
+    ("error_checks", sa.Integer, "0"),
+    ("similarity_score_sum", sa.Float, "0"),
+    ("processing_time_sum", sa.Float, "0"),
+    ("documents_ingested", sa.Integer, "0"),
+)
+
+
+def upgrade():
+    bind = op.get_bind()
+    inspector = sa.inspect(bind)
+
+    if not inspector.has_table("statistics"):
+        op.create_table(
+            "statistics",
+            sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column("date", sa.Date, nullable=False),
+        )
+    existing = {column["name"] for column in inspector.get_columns("statistics")}
+    for name, type_, default in COUNTER_COLUMNS:
+        if name not in existing:
+            op.add_column("statistics", sa.Column(name, type_, nullable=False, server_default=default))
+    if "updated_at" not in existing:
+        op.add_column("statistics", sa.Column("updated_at", sa.DateTime, nullable=True))
+
+    # 날짜별 한 행만 남기고 UPSERT 기준 고유 인덱스 생성 (이전 함수는 같은 날짜 행을 여러 번 넣을 수 있었음)
+    op.execute("DELETE FROM statistics WHERE id NOT IN (SELECT MAX(id) FROM statistics GROUP BY date)")
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_statistics_date ON statistics (date)")
+
+    if not inspector.has_table("source_type_counts"):
+        op.create_table(
+            "source_type_counts",
+            sa.Column("source_type", sa.String, primary_key=True),
+            sa.Column("active_count", sa.Integer, nullable=False, server_default="0"),
+        )
+
+    _seed_statistics(bind)
+
+    if bind.dialect.name == "postgresql":
+        op.execute("DROP FUNCTION IF EXISTS update_daily_statistics()")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ux_statistics_date")
+    op.drop_table("source_type_counts")
+    with op.batch_alter_table("statistics") as batch:
+        for name, _, _ in COUNTER_COLUMNS[3:]:
+            batch.drop_column(name)
+        batch.drop_column("updated_at")
+
+
+def _seed_statistics(bind):
+    """카운터 테이블이 비어 있을 때만 기존 데이터로 한 번 채움"""
+    if not bind.execute(sa.text("SELECT EXISTS (SELECT 1 FROM source_type_counts)")).scalar():
+        bind.execute(sa.text(
+            "INSERT INTO source_type_counts (source_type, active_count) "
+            "SELECT source_type, COUNT(*) FROM document_sources "
+            "WHERE is_active = :active GROUP BY source_type"
+        ), {"active": True})
+
+    if not bind.execute(sa.text("SELECT EXISTS (SELECT 1 FROM statistics)")).scalar():
+        bind.execute(sa.text(
+            "INSERT INTO statistics (date, total_checks, completed_checks, error_checks, "
+            "similarity_score_sum, processing_time_sum, documents_ingested) "
+            "SELECT DATE(created_at), COUNT(*), "
+            "SUM(CASE WHEN status = 'completed' THEN 1 ELSE 0 END), "
+            "SUM(CASE WHEN status = 'error' THEN 1 ELSE 0 END), "
+            "COALESCE(SUM(CASE WHEN status = 'completed' THEN similarity_score END), 0), "
+            "COALESCE(SUM(CASE WHEN status = 'completed' THEN processing_time END), 0), 0 "
+            "FROM plagiarism_checks WHERE created_at IS NOT NULL GROUP BY DATE(created_at)"
+        ))
@@ -0,0 +1,58 @@
+"""crawl frontier
+
+크롤링 작업을 호출 스택 대신 DB에 두는 대기열(crawl_frontier)과 도메인별
+다음 요청 시각(crawl_domains)을 추가합니다.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("crawl_frontier"):
+        op.create_table(
+            "crawl_frontier",
+            sa.Column("id", sa.Integer, primary_key=True, autoincrement=True),
+            sa.Column("url", sa.String, nullable=False),
+            sa.Column("domain", sa.String, nullable=False),
+            sa.Column("priority", sa.Integer, nullable=False, server_default="0"),
+            sa.Column("status", sa.String, nullable=False, server_default="pending"),
+            sa.Column("query", sa.String, nullable=True),
+            sa.Column("source_type", sa.String, nullable=False, server_default="crawled"),
+            sa.Column("attempts", sa.Integer, nullable=False, server_default="0"),
+            sa.Column("next_fetch_at", sa.DateTime, nullable=False, server_default=sa.func.current_timestamp()),
+            sa.Column("leased_until", sa.DateTime, nullable=True),
+            sa.Column("last_error", sa.String, nullable=True),
+            sa.Column("created_at", sa.DateTime, nullable=True),
+            sa.Column("updated_at", sa.DateTime, nullable=True),
+        )
+    op.execute("CREATE UNIQUE INDEX IF NOT EXISTS ux_crawl_frontier_url ON crawl_frontier (url)")
+    op.execute("CREATE INDEX IF NOT EXISTS ix_crawl_frontier_status_due "
+               "ON crawl_frontier (status, next_fetch_at, priority)")
+
+    if not inspector.has_table("crawl_domains"):
+        op.create_table(
+            "crawl_domains",
+            sa.Column("domain", sa.String, primary_key=True),
+            sa.Column("next_fetch_at", sa.DateTime, nullable=False, server_default=sa.func.current_timestamp()),
+            sa.Column("crawl_delay", sa.Float, nullable=False),
+        )
+
+
+def downgrade():
+    op.drop_table("crawl_domains")
+    op.execute("DROP INDEX IF EXISTS ix_crawl_frontier_status_due")
+    op.execute("DROP INDEX IF EXISTS ux_crawl_frontier_url")
+    op.drop_table("crawl_frontier")
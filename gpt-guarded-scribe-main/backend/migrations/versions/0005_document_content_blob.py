@@ -0,0 +1,31 @@
+"""document content blob
+
+document_sources에 압축된 전체 본문(content_blob)을 추가합니다. 새로 적재하는
+문서는 content에 앞부분 미리보기만 두고 전체 본문은 블롭으로 저장합니다.
+기존 행은 그대로 두며 backfill_fingerprints.py가 긴 본문을 압축합니다.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    existing = {column["name"] for column in inspector.get_columns("document_sources")}
+    if "content_blob" not in existing:
+        op.add_column("document_sources", sa.Column("content_blob", sa.LargeBinary, nullable=True))
+
+
+def downgrade():
+    with op.batch_alter_table("document_sources") as batch:
+        batch.drop_column("content_blob")
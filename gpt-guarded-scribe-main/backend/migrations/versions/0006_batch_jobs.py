@@ -0,0 +1,44 @@
+"""batch jobs
+
+배치 크롤링/지식 생성 작업의 상태와 항목별 결과를 프로세스 메모리 대신
+DB(batch_jobs)에 둡니다. 다른 워커 프로세스나 재시작 후에도 조회됩니다.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+
+    if not inspector.has_table("batch_jobs"):
+        op.create_table(
+            "batch_jobs",
+            sa.Column("id", sa.String(32), primary_key=True),
+            sa.Column("kind", sa.String, nullable=False),
+            sa.Column("status", sa.String, nullable=False, server_default="queued"),
+            sa.Column("items", sa.JSON, nullable=False),
+            sa.Column("results", sa.JSON, nullable=True),
+            sa.Column("error", sa.String, nullable=True),
+            sa.Column("created_at", sa.DateTime, nullable=False, server_default=sa.func.current_timestamp()),
+            sa.Column("started_at", sa.DateTime, nullable=True),
+            sa.Column("finished_at", sa.DateTime, nullable=True),
+            sa.Column("heartbeat_at", sa.DateTime, nullable=True),
+        )
+    op.execute("CREATE INDEX IF NOT EXISTS ix_batch_jobs_status_created_at "
+               "ON batch_jobs (status, created_at)")
+
+
+def downgrade():
+    op.execute("DROP INDEX IF EXISTS ix_batch_jobs_status_created_at")
+    op.drop_table("batch_jobs")
@@ -0,0 +1,30 @@
+"""drop document_chunks.token_count
+
+표절 검사가 후보 청크의 본문/오프셋/해시로 문장을 검증하게 되면서 아무도 읽지 않는
+token_count를 더 이상 저장하지 않습니다.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-19
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "0007"
+down_revision = "0006"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    inspector = sa.inspect(op.get_bind())
+    existing = {column["name"] for column in inspector.get_columns("document_chunks")}
+    if "token_count" in existing:
+        with op.batch_alter_table("document_chunks") as batch:
+            batch.drop_column("token_count")
+
+
+def downgrade():
+    op.add_column("document_chunks", sa.Column("token_count", sa.Integer, nullable=True))
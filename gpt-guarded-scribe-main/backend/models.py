@@ -1,13 +1,20 @@
-from sqlalchemy import Column, Integer, String, Text, Float, DateTime, JSON, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, BigInteger, SmallInteger, String, Text, Float, Date, DateTime, JSON, Boolean, ForeignKey, Index, LargeBinary, text
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import deferred, relationship
 from datetime import datetime
 import bcrypt
 
+from utils import content_codec, text_fingerprint
+
 Base = declarative_base()
 
 class PlagiarismCheck(Base):
     __tablename__ = "plagiarism_checks"
+    __table_args__ = (
+        # 이력 키셋 페이지네이션 / 보관 기간 정리
+        Index("ix_plagiarism_checks_created_at_id", "created_at", "id"),
+        Index("ix_plagiarism_checks_status_created_at", "status", "created_at"),
+    )
     
     id = Column(String, primary_key=True)
     original_text = Column(Text, nullable=False)
@@ -19,14 +26,18 @@ class PlagiarismCheck(Base):
     file_type = Column(String, nullable=True)
     processing_time = Column(Float, nullable=True)
     
-    # Relationships
-    matches = relationship("PlagiarismMatch", back_populates="check")
+    # Relationships (매치 삭제는 DB의 ON DELETE CASCADE에 맡김, 파티션 테이블은 트리거)
+    matches = relationship("PlagiarismMatch", back_populates="check",
+                           cascade="all, delete-orphan", passive_deletes=True)
 
 class PlagiarismMatch(Base):
     __tablename__ = "plagiarism_matches"
+    __table_args__ = (
+        Index("ix_plagiarism_matches_check_id", "check_id"),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
-    check_id = Column(String, ForeignKey("plagiarism_checks.id"), nullable=False)
+    check_id = Column(String, ForeignKey("plagiarism_checks.id", ondelete="CASCADE"), nullable=False)
     matched_text = Column(Text, nullable=False)
     source_text = Column(Text, nullable=False)
     source_title = Column(String, nullable=False)
@@ -34,6 +45,7 @@ class PlagiarismMatch(Base):
     similarity_score = Column(Float, nullable=False)
     start_index = Column(Integer, nullable=False)
     end_index = Column(Integer, nullable=False)
+    # 검사의 created_at과 같은 값 (ResultWriter가 채움, 파티션 테이블에서 검사와 같은 파티션에 들어감)
     created_at = Column(DateTime, default=datetime.utcnow)
     
     # Relationships
@@ -41,16 +53,143 @@ class PlagiarismMatch(Base):
 
 class DocumentSource(Base):
     __tablename__ = "document_sources"
+    __table_args__ = (
+        # 크롤링 적재 시 ON CONFLICT 중복 판정에 사용
+        Index("ux_document_sources_url", "url", unique=True),
+        Index("ux_document_sources_content_hash", "content_hash", unique=True),
+        # 활성 문서 수/유형별 집계 (활성 문서만 담는 부분 인덱스)
+        Index("ix_document_sources_active_source_type", "source_type",
+              sqlite_where=text("is_active = 1"), postgresql_where=text("is_active")),
+    )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String, nullable=False)
-    content = Column(Text, nullable=False)
+    content = Column(Text, nullable=False)  # content_blob이 있으면 앞부분 미리보기만
+    # 전체 본문 압축 블롭 (content_codec, 필요할 때만 읽도록 지연 로딩)
+    content_blob = deferred(Column(LargeBinary, nullable=True))
     url = Column(String, nullable=True)
     source_type = Column(String, nullable=False)  # academic, web, book, etc.
     vector_embedding = Column(JSON, nullable=True)  # Store vector embeddings as JSON
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_active = Column(Boolean, default=True)
+    # 정규화된 본문 SHA-256 / 64비트 SimHash (값을 주지 않으면 content로 계산)
+    content_hash = Column(String(64), nullable=True,
+                          default=lambda ctx: text_fingerprint.content_hash(ctx.get_current_parameters()["content"]))
+    simhash = Column(BigInteger, nullable=True,
+                     default=lambda ctx: text_fingerprint.to_signed64(text_fingerprint.simhash(ctx.get_current_parameters()["content"])))
+
+    @property
+    def full_content(self) -> str:
+        """전체 본문 (처음 접근할 때 블롭을 읽어 압축 해제)"""
+        return content_codec.full_text(self.content, self.content_blob)
+
+class DocumentSimhashBand(Base):
+    """SimHash 밴드 테이블 (근사 중복 후보를 인덱스로 찾기 위함)"""
+    __tablename__ = "document_simhash_bands"
+    __table_args__ = (
+        Index("ix_document_simhash_bands_lookup", "band", "value"),
+    )
+
+    source_id = Column(Integer, ForeignKey("document_sources.id", ondelete="CASCADE"), primary_key=True)
+    band = Column(SmallInteger, primary_key=True)
+    value = Column(Integer, primary_key=True)
+
+class DocumentChunk(Base):
+    """문서를 문장 단위로 나눈 청크 (PostgreSQL 트라이그램 후보 검색용, 다른 DB에서는 저장하지 않음)"""
+    __tablename__ = "document_chunks"
+    __table_args__ = (
+        Index("ix_document_chunks_source_id", "source_id", "chunk_index"),
+        # 정규화된 문장이 그대로 복사된 경우를 인덱스로 찾기 위함
+        Index("ix_document_chunks_chunk_hash", "chunk_hash"),
+        # PostgreSQL: pg_trgm GIN 인덱스로 % / similarity() 검색
+        Index(
+            "ix_document_chunks_content_trgm", "content",
+            postgresql_using="gin", postgresql_ops={"content": "gin_trgm_ops"},
+        ).ddl_if(dialect="postgresql"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    source_id = Column(Integer, ForeignKey("document_sources.id", ondelete="CASCADE"), nullable=False)
+    chunk_index = Column(Integer, nullable=False)
+    content = Column(Text, nullable=False)
+    start_offset = Column(Integer, nullable=True)  # 원문(document_sources.content) 내 위치
+    end_offset = Column(Integer, nullable=True)
+    chunk_hash = Column(String(64), nullable=True)  # 정규화된 청크 SHA-256
+
+class DailyStatistics(Base):
+    """일별 검사/적재 카운터 (검사 완료·문서 적재 시 증가, 평균은 합계/건수로 계산)"""
+    __tablename__ = "statistics"
+    __table_args__ = (
+        Index("ux_statistics_date", "date", unique=True),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    date = Column(Date, nullable=False)
+    total_checks = Column(Integer, default=0, nullable=False)
+    completed_checks = Column(Integer, default=0, nullable=False)
+    error_checks = Column(Integer, default=0, nullable=False)
+    similarity_score_sum = Column(Float, default=0.0, nullable=False)  # 완료된 검사 기준
+    processing_time_sum = Column(Float, default=0.0, nullable=False)
+    documents_ingested = Column(Integer, default=0, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class SourceTypeCount(Base):
+    """출처 유형별 활성 문서 수 (document_sources COUNT 대신 사용)"""
+    __tablename__ = "source_type_counts"
+    
+    source_type = Column(String, primary_key=True)
+    active_count = Column(Integer, default=0, nullable=False)
+
+class CrawlFrontierEntry(Base):
+    """크롤링 대기열 (정규화된 URL당 한 행, 재시작 후에도 이어서 처리)"""
+    __tablename__ = "crawl_frontier"
+    __table_args__ = (
+        Index("ux_crawl_frontier_url", "url", unique=True),
+        # 워커가 가져갈 항목: 대기 중이고 시간이 된 것부터 우선순위 순
+        Index("ix_crawl_frontier_status_due", "status", "next_fetch_at", "priority"),
+    )
+    
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    url = Column(String, nullable=False)  # normalize_url() 결과
+    domain = Column(String, nullable=False)
+    priority = Column(Integer, default=0, nullable=False)  # 클수록 먼저
+    status = Column(String, default="pending", nullable=False)  # pending, in_progress, done, failed
+    query = Column(String, nullable=True)  # URL을 넣은 검색어
+    source_type = Column(String, default="crawled", nullable=False)
+    attempts = Column(Integer, default=0, nullable=False)
+    next_fetch_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    leased_until = Column(DateTime, nullable=True)
+    last_error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+class CrawlDomain(Base):
+    """도메인별 다음 요청 가능 시각 (여러 워커 프로세스가 같은 사이트 간격을 공유)"""
+    __tablename__ = "crawl_domains"
+    
+    domain = Column(String, primary_key=True)
+    next_fetch_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    crawl_delay = Column(Float, nullable=False)  # 요청 간격 (초)
+
+class BatchJobRecord(Base):
+    """배치 작업 상태 (다른 워커 프로세스나 재시작 후에도 진행 상황 조회)"""
+    __tablename__ = "batch_jobs"
+    __table_args__ = (
+        # 실행 중인 작업 수 / 중단된 작업 회수 / 끝난 작업 정리
+        Index("ix_batch_jobs_status_created_at", "status", "created_at"),
+    )
+    
+    id = Column(String(32), primary_key=True)
+    kind = Column(String, nullable=False)  # crawl, ai-knowledge
+    status = Column(String, default="queued", nullable=False)  # queued, running, completed, failed
+    items = Column(JSON, nullable=False)  # 입력 순서의 항목 목록
+    results = Column(JSON, nullable=True)  # 항목 → 결과 (끝난 항목만)
+    error = Column(String, nullable=True)
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)  # 실행 중인 프로세스가 주기적으로 갱신
 
 class User(Base):
     __tablename__ = "users"
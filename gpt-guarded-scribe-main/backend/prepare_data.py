@@ -2,25 +2,35 @@
 """
 데이터베이스 초기 데이터 준비 스크립트
 나무위키, 위키백과에서 주요 주제들의 데이터를 미리 수집합니다.
+위키백과 덤프 경로(인자 또는 WIKI_DUMP_PATH)가 있으면 페이지별 크롤링 대신 덤프를 적재합니다.
 """
 
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from database import get_db, engine
+from config import settings
+from database import engine
 from models import Base
 from services.web_crawler_service import WebCrawlerService
-import time
+from services.crawl_workers import CrawlWorkerPool
+from services.wiki_dump_importer import WikiDumpImporter
 
 # 데이터베이스 테이블 생성
 Base.metadata.create_all(bind=engine)
 
-def prepare_initial_data():
+def prepare_initial_data(wiki_dump: str = ""):
     """초기 데이터 준비"""
     print("🚀 CopyKiller 초기 데이터 준비 시작...")
     
-    db = next(get_db())
+    if wiki_dump:
+        # 덤프 한 번 읽기로 위키백과 전체를 적재 (주제별 검색/요청 간격 없음)
+        print(f"📚 위키백과 덤프 적재: {wiki_dump}")
+        stats = WikiDumpImporter().run(wiki_dump)
+        print(f"\n🎉 초기 데이터 준비 완료!")
+        print(f"📊 총 {stats['saved']}개 문서 저장됨")
+        return
+    
     crawler = WebCrawlerService()
     
     # 주요 주제 키워드들
@@ -42,28 +52,21 @@ def prepare_initial_data():
         "전자상거래", "핀테크", "스마트시티", "바이오기술", "신재생에너지"
     ]
     
-    total_saved = 0
-    
+    # 주제별 URL을 프런티어에 넣고 워커 풀로 수집 (중단 후 다시 실행하면 남은 URL부터 이어서 처리)
     for i, topic in enumerate(topics, 1):
         try:
-            print(f"\n📚 [{i}/{len(topics)}] '{topic}' 데이터 수집 중...")
-            
-            result = crawler.crawl_and_save(topic, 2)  # 주제당 2개 문서
-            saved_count = result.get('saved_count', 0)
-            total_saved += saved_count
-            
-            print(f"✅ '{topic}' 완료: {saved_count}개 저장")
-            
-            # 서버 부하 방지를 위한 대기 (1.5초)
-            time.sleep(1.5)
-            
+            print(f"\n📚 [{i}/{len(topics)}] '{topic}' 대기열 추가...")
+            crawler.enqueue_search(topic, 2)  # 주제당 2개 문서
         except Exception as e:
             print(f"❌ '{topic}' 오류: {e}")
             continue
     
+    result = CrawlWorkerPool(crawler=crawler).run(until_empty=True)
+    total_saved = result.get('saved', 0)
+    
     print(f"\n🎉 초기 데이터 준비 완료!")
     print(f"📊 총 {total_saved}개 문서 수집됨")
     print(f"💡 이제 CopyKiller가 풍부한 데이터로 정확한 표절 검사를 제공합니다!")
 
 if __name__ == "__main__":
-    prepare_initial_data()
\ No newline at end of file
+    prepare_initial_data(sys.argv[1] if len(sys.argv) > 1 else settings.WIKI_DUMP_PATH)
\ No newline at end of file
@@ -1,22 +1,33 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Request, Response
+from starlette.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict
 import uuid
 import time
 from datetime import datetime
 
+from config import settings
 from database import get_db
 from models import PlagiarismCheck, PlagiarismMatch
-from services.plagiarism_service import PlagiarismService
-from services.text_processor import TextProcessor
+from services.plagiarism_service import PlagiarismService, check_exists
+from services.document_extractor import DocumentExtractor, FileTooLargeError
+from services.result_cache import result_cache, etag_matches
+from services.statistics_service import get_statistics_service
+from services.response_shaper import ResponseShape, negotiate_shape, shape_payload, render_payload
 from services.web_crawler_service import WebCrawlerService
 from services.ai_crawler_service import AICrawlerService
+from services.http_client import get_http_client
+from services.crawl_frontier import get_crawl_frontier
+from services.crawl_hint_worker import get_crawl_hint_worker
+from services.batch_jobs import BatchJobLimitError, get_batch_jobs
 from services.ai_knowledge_generator import AIKnowledgeGenerator
 from services.ai_plagiarism_avoidance import AIPlagiarismAvoidance
 from services.ai_plagiarism_fixer import AIPlagiarismFixer
 from services.sentence_improvement_service import SentenceImprovementService
-from schemas import PlagiarismCheckCreate, PlagiarismCheckResponse, PlagiarismMatchResponse
-import sqlite3
+from schemas import (
+    PlagiarismCheckCreate, PlagiarismCheckResponse, PlagiarismMatchResponse,
+    PlagiarismCheckSummary, PlagiarismHistoryPage
+)
 # ⬇️⬇️⬇️ 1. Celery 작업을 직접 import 합니다. ⬇️⬇️⬇️
 # 임시로 Celery 대신 직접 처리
 # from tasks.plagiarism_tasks import process_plagiarism_check
@@ -35,13 +46,25 @@ async def get_database_stats(db: Session = Depends(get_db)):
     stats = service.get_database_stats()
     return stats
 
+@router.get("/statistics")
+async def get_statistics():
+    """일별 검사/적재 통계 (메모리 스냅샷, 최근 STATS_DAYS일)"""
+    try:
+        return await run_in_threadpool(get_statistics_service().snapshot)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"통계 조회 오류: {str(e)}")
+
 @router.post("/check/text", response_model=PlagiarismCheckResponse)
 async def check_text_plagiarism(
     payload: PlagiarismCheckCreate,
+    request: Request,
+    text: str = "full",
+    sources: str = "inline",
     db: Session = Depends(get_db)
 ):
-    """텍스트 표절 검사"""
+    """텍스트 표절 검사 (text=omit|gzip, sources=table로 응답 크기 축소 가능)"""
     print(f"[*] 표절 검사 요청 받음: {len(payload.text)}자")
+    shape = _negotiate_shape(request, text, sources)
     try:
         text = payload.text
         if not text or len(text.strip()) < 10:
@@ -58,8 +81,8 @@ async def check_text_plagiarism(
             print(f"[*] 표절 검사 처리 시작...")
             service.process_plagiarism_check(check_id, text)
             print(f"[OK] 표절 검사 처리 완료")
-            # 처리 완료 후 결과 재조회
-            updated_check = service.get_check_result(check_id)
+            # 처리 완료 후 결과를 매치와 함께 한 번에 재조회
+            updated_check = service.get_check_result(check_id, with_matches=True)
             if updated_check:
                 check = updated_check
                 print(f"[*] 업데이트된 결과 조회 완료")
@@ -69,30 +92,11 @@ async def check_text_plagiarism(
             traceback.print_exc()
             # 오류가 발생해도 기본 응답 반환
         
-        # 매치 정보 포함
-        matches = []
-        if hasattr(check, 'matches') and check.matches:
-            matches = [
-                PlagiarismMatchResponse(
-                    matched_text=match.matched_text or "",
-                    source_title=match.source_title or "Unknown",
-                    source_url=match.source_url or "",
-                    similarity_score=match.similarity_score or 0.0,
-                    start_index=match.start_index or 0,
-                    end_index=match.end_index or 0
-                )
-                for match in check.matches
-            ]
-        
-        # 응답 반환 (Pydantic 모델이 자동으로 JSON 변환)
-        return PlagiarismCheckResponse(
-            id=check.id,
-            original_text=check.original_text,
-            similarity_score=check.similarity_score or 0.0,
-            status=check.status,
-            created_at=check.created_at,
-            matches=matches
-        )
+        body = _render_check(check, shape)
+        if check.status == "completed":
+            # 이후 GET /check/{check_id} 폴링이 바로 캐시를 사용하도록 미리 저장
+            result_cache.set(shape.cache_key(check_id), body)
+        return Response(content=body, media_type=shape.media_type, headers=shape.headers())
     except Exception as e:
         print(f"API 오류: {e}")
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
@@ -109,12 +113,20 @@ async def check_file_plagiarism(
     if file.content_type not in allowed_types:
         raise HTTPException(status_code=400, detail="지원하지 않는 파일 타입입니다")
     
-    content = await file.read()
-    if len(content) > 10 * 1024 * 1024:
+    extractor = DocumentExtractor()
+    try:
+        spooled = await extractor.spool_upload(file)
+    except FileTooLargeError:
         raise HTTPException(status_code=400, detail="파일 크기가 너무 큽니다 (최대 10MB)")
     
-    processor = TextProcessor()
-    text = processor.extract_text_from_file(content, file.content_type)
+    # 추출은 CPU 작업이므로 이벤트 루프 밖에서 실행 (MAX_TEXT_LENGTH까지만 읽고 남은 페이지는 취소)
+    try:
+        text = await run_in_threadpool(extractor.extract_text, spooled, file.content_type,
+                                       settings.MAX_TEXT_LENGTH)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    finally:
+        spooled.close()
     
     if not text or len(text.strip()) < 10:
         raise HTTPException(status_code=400, detail="파일에서 텍스트를 추출할 수 없습니다")
@@ -149,66 +161,137 @@ async def check_file_plagiarism(
         matches=[]
     )
 
-# ... (이하 나머지 코드는 동일)
-@router.get("/check/{check_id}", response_model=PlagiarismCheckResponse)
-async def get_plagiarism_result(check_id: str, db: Session = Depends(get_db)):
-    """표절 검사 결과 조회"""
-    service = PlagiarismService(db)
-    check = service.get_check_result(check_id)
-    
-    if not check:
-        raise HTTPException(status_code=404, detail="검사 결과를 찾을 수 없습니다")
-    
-    matches = [
-        PlagiarismMatchResponse(
-            matched_text=match.matched_text,
-            source_title=match.source_title,
-            source_url=match.source_url,
-            similarity_score=match.similarity_score,
-            start_index=match.start_index,
-            end_index=match.end_index
-        )
-        for match in check.matches
-    ]
-    
+def _build_check_response(check: PlagiarismCheck) -> PlagiarismCheckResponse:
+    """검사 객체를 응답 모델로 변환"""
     return PlagiarismCheckResponse(
         id=check.id,
         original_text=check.original_text,
-        similarity_score=check.similarity_score,
+        similarity_score=check.similarity_score or 0.0,
         status=check.status,
         created_at=check.created_at,
         processing_time=check.processing_time,
-        matches=matches
+        matches=[
+            PlagiarismMatchResponse(
+                matched_text=match.matched_text or "",
+                source_title=match.source_title or "Unknown",
+                source_url=match.source_url or "",
+                similarity_score=match.similarity_score or 0.0,
+                start_index=match.start_index or 0,
+                end_index=match.end_index or 0
+            )
+            for match in check.matches
+        ]
     )
 
-@router.get("/history", response_model=List[PlagiarismCheckResponse])
+def _negotiate_shape(request: Request, text: str, sources: str) -> ResponseShape:
+    """쿼리 파라미터와 요청 헤더로 응답 형태 결정"""
+    try:
+        return negotiate_shape(
+            text, sources,
+            request.headers.get("accept"),
+            request.headers.get("accept-encoding")
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+def _render_check(check: PlagiarismCheck, shape: ResponseShape) -> bytes:
+    """검사 결과를 요청된 형태로 직렬화"""
+    payload = _build_check_response(check).model_dump(mode="json")
+    return render_payload(shape_payload(payload, shape), shape)
+
+@router.get("/check/{check_id}", response_model=PlagiarismCheckResponse)
+async def get_plagiarism_result(
+    check_id: str,
+    request: Request,
+    text: str = "full",
+    sources: str = "inline",
+    db: Session = Depends(get_db)
+):
+    """표절 검사 결과 조회 (완료된 결과는 캐시 + ETag로 응답, 캐시 적중 시에도 행 존재는 확인)
+    
+    text=omit|gzip: 원문 생략 또는 gzip+base64 압축
+    sources=table: 출처를 테이블로 분리하고 매치는 source_index로 참조
+    Accept: application/msgpack, Accept-Encoding: br/gzip 협상 지원
+    """
+    shape = _negotiate_shape(request, text, sources)
+    cache_key = shape.cache_key(check_id)
+    cached = result_cache.get(cache_key)
+    if cached is not None and not check_exists(db, check_id):
+        # 다른 워커의 삭제, 보관 기간 정리, 파티션 삭제로 사라진 결과는 캐시에 남아 있어도 내보내지 않음
+        result_cache.invalidate(check_id)
+        cached = None
+    
+    if cached is None:
+        service = PlagiarismService(db)
+        check = service.get_check_result(check_id, with_matches=True)
+        
+        if not check:
+            raise HTTPException(status_code=404, detail="검사 결과를 찾을 수 없습니다")
+        
+        body = _render_check(check, shape)
+        if check.status != "completed":
+            # 진행 중인 결과는 바뀔 수 있으므로 캐시하지 않음
+            return Response(content=body, media_type=shape.media_type, headers=shape.headers())
+        cached = result_cache.set(cache_key, body)
+    
+    headers = {"ETag": cached.etag, "Cache-Control": "no-cache", "Vary": "Accept, Accept-Encoding"}
+    if etag_matches(request.headers.get("if-none-match"), cached.etag):
+        return Response(status_code=304, headers=headers)
+    
+    headers.update(shape.headers())
+    return Response(content=cached.body, media_type=shape.media_type, headers=headers)
+
+@router.get("/history", response_model=PlagiarismHistoryPage)
 async def get_check_history(
     limit: int = 10,
-    offset: int = 0,
+    cursor: Optional[str] = None,
+    include: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """검사 이력 조회"""
+    """검사 이력 조회 (커서 기반 페이지네이션, include=matches로 매치 포함)"""
+    if limit < 1 or limit > 100:
+        raise HTTPException(status_code=400, detail="limit은 1~100 사이여야 합니다")
+    
+    include_matches = "matches" in (include or "").split(",")
     service = PlagiarismService(db)
-    checks = service.get_check_history(limit, offset)
+    try:
+        checks, next_cursor = service.get_check_history(limit, cursor, include_matches)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
-    return [
-        PlagiarismCheckResponse(
-            id=check.id,
-            original_text=check.original_text,
-            similarity_score=check.similarity_score,
-            status=check.status,
-            created_at=check.created_at,
-            processing_time=check.processing_time,
-            matches=[]
-        )
-        for check in checks
-    ]
+    return PlagiarismHistoryPage(
+        items=[
+            PlagiarismCheckSummary(
+                id=check.id,
+                similarity_score=check.similarity_score or 0.0,
+                status=check.status,
+                created_at=check.created_at,
+                processing_time=check.processing_time,
+                file_name=check.file_name,
+                file_type=check.file_type,
+                matches=[
+                    PlagiarismMatchResponse(
+                        matched_text=match.matched_text,
+                        source_title=match.source_title,
+                        source_url=match.source_url,
+                        similarity_score=match.similarity_score,
+                        start_index=match.start_index,
+                        end_index=match.end_index
+                    )
+                    for match in check.matches
+                ] if include_matches else None
+            )
+            for check in checks
+        ],
+        next_cursor=next_cursor
+    )
 
 @router.delete("/check/{check_id}")
 async def delete_check(check_id: str, db: Session = Depends(get_db)):
     """검사 결과 삭제"""
     service = PlagiarismService(db)
     success = service.delete_check(check_id)
+    result_cache.invalidate(check_id)
     
     if not success:
         raise HTTPException(status_code=404, detail="검사 결과를 찾을 수 없습니다")
@@ -247,25 +330,13 @@ async def crawl_web_content(
 async def get_database_stats(db: Session = Depends(get_db)):
     """데이터베이스 통계 정보"""
     try:
-        from models import DocumentSource
-        
-        # 총 문서 수
-        total_docs = db.query(DocumentSource).filter(DocumentSource.is_active == True).count()
-        
-        # 소스 타입별 통계
-        from sqlalchemy import func
-        type_stats = db.query(
-            DocumentSource.source_type,
-            func.count(DocumentSource.id).label('count')
-        ).filter(
-            DocumentSource.is_active == True
-        ).group_by(DocumentSource.source_type).all()
+        documents = get_statistics_service().snapshot()["documents"]
         
         return {
-            "total_documents": total_docs,
+            "total_documents": documents["total"],
             "source_types": [
-                {"type": stat.source_type, "count": stat.count}
-                for stat in type_stats
+                {"type": source_type, "count": count}
+                for source_type, count in documents["by_source_type"].items()
             ]
         }
         
@@ -403,7 +474,7 @@ async def ai_enhanced_crawl(
         ai_crawler = AICrawlerService()
         
         # AI 강화 크롤링 실행
-        result = ai_crawler.ai_enhanced_crawl(query.strip(), num_results)
+        result = await ai_crawler.ai_enhanced_crawl_async(query.strip(), num_results)
         
         return {
             "success": True,
@@ -424,6 +495,30 @@ async def ai_enhanced_crawl(
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"AI 크롤링 중 오류: {str(e)}")
 
+@router.get("/crawl/http-metrics")
+async def get_crawl_http_metrics():
+    """크롤러 HTTP 연결 재사용 지표 (호스트별 요청 수/새 연결 수/재사용률)"""
+    return get_http_client().metrics()
+
+@router.post("/crawl/frontier")
+async def enqueue_crawl(query: str, num_results: int = 5, priority: int = 0):
+    """검색 결과 URL을 크롤링 프런티어에 추가 (크롤링은 run_crawl_workers.py 워커가 수행)"""
+    if not query or len(query.strip()) < 2:
+        raise HTTPException(status_code=400, detail="검색어는 2자 이상이어야 합니다")
+    
+    added = await run_in_threadpool(WebCrawlerService().enqueue_search, query.strip(), num_results, priority)
+    return {"query": query.strip(), "added": added}
+
+@router.get("/crawl/frontier")
+async def get_crawl_frontier_stats():
+    """크롤링 프런티어 상태 (상태별 항목 수, 도메인 수, 다음 요청 시각)"""
+    return await run_in_threadpool(get_crawl_frontier().stats)
+
+@router.get("/crawl/hints")
+async def get_crawl_hint_status():
+    """검사 중 등록된 백그라운드 크롤링 힌트 처리 현황"""
+    return get_crawl_hint_worker().status()
+
 @router.get("/crawl/sources")
 async def get_crawl_sources():
     """사용 가능한 크롤링 소스 목록"""
@@ -452,76 +547,51 @@ async def get_crawl_sources():
         ]
     }
 
-@router.post("/crawl/batch")
+@router.post("/crawl/batch", status_code=202)
 async def batch_ai_crawl(
     queries: List[str],
-    results_per_query: int = 10,
-    db: Session = Depends(get_db)
+    results_per_query: int = 10
 ):
-    """여러 주제에 대한 배치 AI 크롤링"""
+    """여러 주제에 대한 배치 AI 크롤링 (백그라운드 작업, 진행 상황은 GET /jobs/{job_id})"""
+    queries = _unique_items(queries)
     print(f"📦 배치 AI 크롤링 요청: {len(queries)}개 주제")
     
-    if not queries or len(queries) == 0:
+    if not queries:
         raise HTTPException(status_code=400, detail="최소 1개 이상의 검색어가 필요합니다")
     
     if len(queries) > 10:
         raise HTTPException(status_code=400, detail="한 번에 최대 10개까지만 처리 가능합니다")
     
+    ai_crawler = AICrawlerService()
+    jobs = get_batch_jobs()
+    
+    async def run(job):
+        # 모든 주제를 엔진 하나에서 동시에 (도메인별 요청 간격은 공유)
+        await ai_crawler.batch_crawl_async(
+            job.items, results_per_query,
+            on_result=lambda query, result: jobs.record(job, query, result)
+        )
+    
     try:
-        ai_crawler = AICrawlerService()
-        batch_results = []
-        total_collected = 0
-        total_saved = 0
-        
-        for i, query in enumerate(queries):
-            print(f"🔄 진행률: {i+1}/{len(queries)} - '{query}' 처리 중...")
-            
-            try:
-                result = ai_crawler.ai_enhanced_crawl(query.strip(), results_per_query)
-                batch_results.append({
-                    "query": query,
-                    "status": "success",
-                    "collected": result['total_crawled'],
-                    "saved": result['saved_count'],
-                    "sources": result['sources_used']
-                })
-                
-                total_collected += result['total_crawled']
-                total_saved += result['saved_count']
-                
-            except Exception as e:
-                print(f"[ERROR] '{query}' 크롤링 실패: {e}")
-                batch_results.append({
-                    "query": query,
-                    "status": "failed",
-                    "error": str(e),
-                    "collected": 0,
-                    "saved": 0,
-                    "sources": []
-                })
-        
-        successful_queries = [r for r in batch_results if r["status"] == "success"]
-        failed_queries = [r for r in batch_results if r["status"] == "failed"]
-        
-        return {
-            "success": True,
-            "batch_summary": {
-                "total_queries": len(queries),
-                "successful": len(successful_queries),
-                "failed": len(failed_queries),
-                "total_collected": total_collected,
-                "total_saved": total_saved,
-                "success_rate": f"{(len(successful_queries) / len(queries) * 100):.1f}%"
-            },
-            "results": batch_results,
-            "message": f"{len(successful_queries)}/{len(queries)}개 주제에서 총 {total_saved}개 콘텐츠를 수집했습니다."
-        }
-        
-    except Exception as e:
-        print(f"배치 크롤링 오류: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"배치 크롤링 중 오류: {str(e)}")
+        job = jobs.submit("crawl", queries, run)
+    except BatchJobLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return _job_accepted(job, f"{len(queries)}개 주제 배치 크롤링을 시작했습니다.")
+
+def _crawl_batch_summary(results: List[Dict], total: int) -> Dict:
+    successful = [r for r in results if r["status"] == "success"]
+    total_saved = sum(r["saved"] for r in successful)
+    return {
+        "batch_summary": {
+            "total_queries": total,
+            "successful": len(successful),
+            "failed": len(results) - len(successful),
+            "total_collected": sum(r["collected"] for r in successful),
+            "total_saved": total_saved,
+            "success_rate": f"{(len(successful) / max(len(results), 1) * 100):.1f}%"
+        },
+        "message": f"{len(successful)}/{total}개 주제에서 총 {total_saved}개 콘텐츠를 수집했습니다."
+    }
 
 @router.get("/crawl/stats")
 async def get_crawl_statistics(db: Session = Depends(get_db)):
@@ -599,76 +669,86 @@ async def generate_ai_knowledge(
         traceback.print_exc()
         raise HTTPException(status_code=500, detail=f"AI 지식 생성 중 오류: {str(e)}")
 
-@router.post("/ai-knowledge/batch-generate")
+@router.post("/ai-knowledge/batch-generate", status_code=202)
 async def batch_generate_ai_knowledge(
     topics: List[str],
-    articles_per_topic: int = 3,
-    db: Session = Depends(get_db)
+    articles_per_topic: int = 3
 ):
-    """여러 주제에 대한 AI 지식 배치 생성"""
+    """여러 주제에 대한 AI 지식 배치 생성 (백그라운드 작업, 진행 상황은 GET /jobs/{job_id})"""
+    topics = _unique_items(topics)
     print(f"📦 AI 지식 배치 생성 요청: {len(topics)}개 주제")
     
-    if not topics or len(topics) == 0:
+    if not topics:
         raise HTTPException(status_code=400, detail="최소 1개 이상의 주제가 필요합니다")
     
     if len(topics) > 5:
         raise HTTPException(status_code=400, detail="한 번에 최대 5개 주제까지만 처리 가능합니다")
     
+    ai_generator = AIKnowledgeGenerator()
+    jobs = get_batch_jobs()
+    
+    async def run(job):
+        await ai_generator.batch_generate_async(
+            job.items, articles_per_topic,
+            on_result=lambda topic, result: jobs.record(job, topic, result)
+        )
+    
     try:
-        ai_generator = AIKnowledgeGenerator()
-        batch_results = []
-        total_generated = 0
-        total_saved = 0
-        
-        for i, topic in enumerate(topics):
-            print(f"🔄 AI 생성 진행률: {i+1}/{len(topics)} - '{topic}' 처리 중...")
-            
-            try:
-                result = ai_generator.generate_and_save_knowledge(topic.strip(), articles_per_topic)
-                batch_results.append({
-                    "topic": topic,
-                    "status": "success",
-                    "generated": result['generated_count'],
-                    "saved": result['saved_count'],
-                    "contents": result['contents_summary']
-                })
-                
-                total_generated += result['generated_count']
-                total_saved += result['saved_count']
-                
-            except Exception as e:
-                print(f"[ERROR] '{topic}' AI 생성 실패: {e}")
-                batch_results.append({
-                    "topic": topic,
-                    "status": "failed",
-                    "error": str(e),
-                    "generated": 0,
-                    "saved": 0,
-                    "contents": []
-                })
-        
-        successful_topics = [r for r in batch_results if r["status"] == "success"]
-        failed_topics = [r for r in batch_results if r["status"] == "failed"]
-        
-        return {
-            "success": True,
-            "batch_summary": {
-                "total_topics": len(topics),
-                "successful": len(successful_topics),
-                "failed": len(failed_topics),
-                "total_generated": total_generated,
-                "total_saved": total_saved,
-                "success_rate": f"{(len(successful_topics) / len(topics) * 100):.1f}%"
-            },
-            "results": batch_results,
-            "message": f"{len(successful_topics)}/{len(topics)}개 주제에서 총 {total_saved}개의 AI 지식을 생성했습니다."
-        }
-        
-    except Exception as e:
-        print(f"AI 지식 배치 생성 오류: {e}")
-        import traceback
-        traceback.print_exc()
-        raise HTTPException(status_code=500, detail=f"AI 지식 배치 생성 중 오류: {str(e)}")
+        job = jobs.submit("ai-knowledge", topics, run)
+    except BatchJobLimitError as e:
+        raise HTTPException(status_code=429, detail=str(e))
+    return _job_accepted(job, f"{len(topics)}개 주제 AI 지식 배치 생성을 시작했습니다.")
+
+def _knowledge_batch_summary(results: List[Dict], total: int) -> Dict:
+    successful = [r for r in results if r["status"] == "success"]
+    total_saved = sum(r["saved"] for r in successful)
+    return {
+        "batch_summary": {
+            "total_topics": total,
+            "successful": len(successful),
+            "failed": len(results) - len(successful),
+            "total_generated": sum(r["generated"] for r in successful),
+            "total_saved": total_saved,
+            "success_rate": f"{(len(successful) / max(len(results), 1) * 100):.1f}%"
+        },
+        "message": f"{len(successful)}/{total}개 주제에서 총 {total_saved}개의 AI 지식을 생성했습니다."
+    }
+
+# 다른 프로세스에서 시작한 작업도 같은 요약으로 조회되도록 종류별 요약 함수 등록
+get_batch_jobs().register_kind("crawl", _crawl_batch_summary)
+get_batch_jobs().register_kind("ai-knowledge", _knowledge_batch_summary)
+
+def _unique_items(items: List[str]) -> List[str]:
+    """앞뒤 공백 제거 후 빈 항목/중복 제거 (입력 순서 유지)"""
+    return list(dict.fromkeys(item.strip() for item in items if item and item.strip()))
+
+def _job_accepted(job, message: str) -> Dict:
+    return {
+        "success": True,
+        "job_id": job.id,
+        "status": job.status,
+        "total": len(job.items),
+        "status_url": f"/api/jobs/{job.id}",
+        "message": message
+    }
+
+@router.get("/jobs")
+async def list_batch_jobs():
+    """최근 배치 작업 목록 (결과 제외)"""
+    return {
+        "jobs": [
+            {key: value for key, value in job.to_dict().items() if key in ("job_id", "kind", "status", "progress", "elapsed")}
+            for job in get_batch_jobs().list()
+        ]
+    }
+
+@router.get("/jobs/{job_id}")
+async def get_batch_job(job_id: str):
+    """배치 작업 진행 상황과 지금까지 끝난 항목 결과"""
+    job = get_batch_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="배치 작업을 찾을 수 없습니다")
+    return job.to_dict()
 
 @router.get("/ai-knowledge/capabilities")
 async def get_ai_knowledge_capabilities():
@@ -716,28 +796,17 @@ async def get_ai_knowledge_stats(db: Session = Depends(get_db)):
         service = PlagiarismService(db)
         all_stats = service.get_database_stats()
         
-        # AI 생성 콘텐츠만 필터링해서 통계 계산
-        conn = sqlite3.connect("plagiarism.db")
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT COUNT(*) FROM document_sources 
-            WHERE source_type LIKE '%ai_generated%' AND is_active = 1
-        """)
-        ai_generated_count = cursor.fetchone()[0]
-        
-        cursor.execute("""
-            SELECT source_type, COUNT(*) FROM document_sources 
-            WHERE source_type LIKE '%ai_generated%' AND is_active = 1
-            GROUP BY source_type
-        """)
-        ai_types = cursor.fetchall()
-        
-        conn.close()
+        # AI 생성 콘텐츠만 필터링해서 통계 계산 (유형별 문서 카운터 스냅샷)
+        by_type = get_statistics_service().snapshot()["documents"]["by_source_type"]
+        ai_types = {
+            source_type: count for source_type, count in by_type.items()
+            if 'ai_generated' in source_type
+        }
+        ai_generated_count = sum(ai_types.values())
         
         ai_stats = {
             "total_ai_documents": ai_generated_count,
-            "ai_document_types": dict(ai_types),
+            "ai_document_types": ai_types,
             "ai_generation_enabled": True,
             "supported_languages": ["한국어"],
             "generation_capabilities": [
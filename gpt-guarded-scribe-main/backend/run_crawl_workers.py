@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+"""
+크롤링 프런티어 워커 실행 스크립트
+crawl_frontier 대기열의 URL을 가져와 크롤링하고 document_sources에 저장합니다.
+같은 DATABASE_URL을 보는 프로세스를 여러 개 띄우면 나눠서 처리합니다.
+
+사용법: python run_crawl_workers.py [--workers N] [--once]
+  --once  대기열이 빌 때까지 처리하고 종료 (기본은 Ctrl+C까지 계속 대기)
+"""
+
+import argparse
+import os
+import sys
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database import create_tables
+from services.crawl_frontier import get_crawl_frontier
+from services.crawl_workers import CrawlWorkerPool
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤링 프런티어 워커")
+    parser.add_argument("--workers", type=int, default=None, help="워커 스레드 수 (기본 FRONTIER_WORKERS)")
+    parser.add_argument("--once", action="store_true", help="대기열이 비면 종료")
+    args = parser.parse_args()
+
+    create_tables()
+    frontier = get_crawl_frontier()
+    frontier.recover_expired(force=True)
+    print(f"🕷️  프런티어 상태: {frontier.stats()}")
+
+    stop_event = threading.Event()
+    pool = CrawlWorkerPool(frontier=frontier, workers=args.workers)
+    runner = threading.Thread(target=pool.run, args=(args.once, stop_event))
+    runner.start()
+    try:
+        while runner.is_alive():
+            runner.join(timeout=1)
+    except KeyboardInterrupt:
+        print("\n⏹️  종료 중... (처리 중인 항목을 마치고 멈춤)")
+        stop_event.set()
+        runner.join()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -27,6 +27,20 @@ class PlagiarismCheckResponse(BaseModel):
     class Config:
         from_attributes = True
 
+class PlagiarismCheckSummary(BaseModel):
+    id: str
+    similarity_score: float
+    status: str
+    created_at: datetime
+    processing_time: Optional[float] = None
+    file_name: Optional[str] = None
+    file_type: Optional[str] = None
+    matches: Optional[List[PlagiarismMatchResponse]] = None
+
+class PlagiarismHistoryPage(BaseModel):
+    items: List[PlagiarismCheckSummary]
+    next_cursor: Optional[str] = None
+
 class HealthResponse(BaseModel):
     status: str
     timestamp: datetime
@@ -2,17 +2,26 @@
 # -*- coding: utf-8 -*-
 """AI 기반 고급 웹 크롤링 서비스"""
 
-import requests
-from bs4 import BeautifulSoup
-import sqlite3
-from datetime import datetime
+import asyncio
 import re
-import time
-import json
-from urllib.parse import urljoin, urlparse, quote
-from typing import List, Dict, Optional
-import random
+from urllib.parse import quote
+from typing import AsyncIterator, Callable, List, Dict, Optional
 from dataclasses import dataclass
+from functools import cached_property
+
+from services.async_crawl_engine import AsyncCrawlEngine
+from services.crawl_pipeline import CrawlPipeline, PageJob, PipelineResult
+from services.html_extractor import HtmlExtractor
+from services.document_repository import DocumentRepository, get_document_repository
+
+def clean_article_text(text: str) -> str:
+    """텍스트 정리 (파이프라인 작업 프로세스에서도 호출하므로 모듈 함수)"""
+    # 불필요한 공백 제거
+    text = re.sub(r'\s+', ' ', text)
+    # 특수 문자 정리 (한국어 보존)
+    text = re.sub(r'[^\w\s가-힣ㄱ-ㅎㅏ-ㅣ.,!?():;-]', '', text)
+    # 길이는 자르지 않음 (저장소가 전체 본문을 압축해 저장)
+    return text.strip()
 
 @dataclass
 class CrawlTarget:
@@ -24,11 +33,16 @@ class CrawlTarget:
     title_selectors: List[str]
     requires_js: bool = False
 
+    @cached_property
+    def extractor(self) -> HtmlExtractor:
+        """이 대상의 선택자를 미리 컴파일한 추출기 (대상마다 한 번 생성)"""
+        return HtmlExtractor(self.content_selectors, list(self.title_selectors) + ["title"])
+
 class AICrawlerService:
     """AI 기반 고급 웹 크롤링 서비스"""
     
-    def __init__(self, db_path="plagiarism.db"):
-        self.db_path = db_path
+    def __init__(self, repository: Optional[DocumentRepository] = None):
+        self.repository = repository or get_document_repository()
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -100,37 +114,69 @@ class AICrawlerService:
         }
     
     def intelligent_search(self, query: str, num_results: int = 10) -> List[Dict]:
-        """AI 기반 지능형 검색 및 크롤링"""
-        print(f"🤖 AI 기반 지능형 검색 시작: '{query}'")
+        """AI 기반 지능형 검색 및 크롤링 (동기 호출용, 이벤트 루프 밖에서 사용)"""
+        return asyncio.run(self.intelligent_search_async(query, num_results))
+    
+    async def intelligent_search_async(self, query: str, num_results: int = 10) -> List[Dict]:
+        """AI 기반 지능형 검색 및 크롤링 (모든 소스를 동시에, 도메인별 요청 간격 유지)"""
+        result = await self._run_pipeline(query, num_results)
+        return result.articles
+    
+    async def _run_pipeline(self, query: str, num_results: int, repository=None,
+                            engine: Optional[AsyncCrawlEngine] = None) -> PipelineResult:
+        """검색 → 기사 가져오기 → 파싱(프로세스 풀) → 정리/지문 → 저장(repository가 있을 때)
+
+        engine을 넘기면 그 엔진의 도메인별 토큰 버킷과 동시 요청 제한을 다른 검색과 공유합니다.
+        """
+        if engine is None:
+            async with AsyncCrawlEngine(headers=self.headers) as engine:
+                return await self._run_pipeline(query, num_results, repository, engine)
         
-        all_articles = []
+        print(f"🤖 AI 기반 지능형 검색 시작: '{query}'")
         
         # 1. 키워드 확장 및 다양화
         expanded_queries = self._expand_search_queries(query)
         print(f"📝 확장된 검색어: {expanded_queries}")
         
-        # 2. 각 소스별로 크롤링
-        for target_name, target in self.crawl_targets.items():
-            print(f"\n🎯 {target.name} 크롤링 중...")
-            
-            for search_query in expanded_queries[:3]:  # 상위 3개 검색어만 사용
+        # 2. 소스 x 검색어 조합을 한꺼번에 검색하고, 찾은 기사는 바로 파이프라인으로
+        #    (차단 방지는 도메인별 토큰 버킷, 중복 제거/품질 필터링은 정리 단계에서)
+        jobs = [
+            (target, search_query)
+            for target in self.crawl_targets.values()
+            for search_query in expanded_queries[:3]  # 상위 3개 검색어만 사용
+        ]
+        seen_urls, seen_titles = set(), set()
+        pipeline = CrawlPipeline(engine, repository=repository)
+        result = await pipeline.run(
+            self._discover(engine, jobs),
+            accept=lambda article: self._accept_article(article, seen_urls, seen_titles),
+            limit=num_results,
+            clean=clean_article_text,
+        )
+        print(f"⏱️  크롤링 {len(jobs)}건 완료: {result.elapsed:.1f}초")
+        return result
+    
+    async def _discover(self, engine: AsyncCrawlEngine, jobs) -> AsyncIterator[PageJob]:
+        """검색이 끝나는 순서대로 기사 작업을 내보냄 (같은 URL은 한 번만)"""
+        tasks = [
+            asyncio.ensure_future(self._discover_from_source(engine, target, search_query, max_articles=3))
+            for target, search_query in jobs
+        ]
+        seen = set()
+        try:
+            for task in asyncio.as_completed(tasks):
                 try:
-                    articles = self._crawl_from_source(target, search_query, max_articles=3)
-                    all_articles.extend(articles)
-                    print(f"✅ {target.name}: {len(articles)}개 수집")
-                    
-                    # 요청 간 지연 (차단 방지)
-                    time.sleep(random.uniform(1, 3))
-                    
+                    page_jobs = await task
                 except Exception as e:
-                    print(f"❌ {target.name} 오류: {e}")
+                    print(f"❌ 검색 오류: {e}")
                     continue
-        
-        # 3. 중복 제거 및 품질 필터링
-        filtered_articles = self._filter_and_deduplicate(all_articles)
-        
-        # 4. 상위 결과만 반환
-        return filtered_articles[:num_results]
+                for job in page_jobs:
+                    if job.url not in seen:
+                        seen.add(job.url)
+                        yield job
+        finally:
+            for task in tasks:
+                task.cancel()
     
     def _expand_search_queries(self, original_query: str) -> List[str]:
         """검색어 확장 및 다양화"""
@@ -168,242 +214,95 @@ class AICrawlerService:
         
         return list(set(queries))[:10]  # 중복 제거 후 최대 10개
     
-    def _crawl_from_source(self, target: CrawlTarget, query: str, max_articles: int = 5) -> List[Dict]:
-        """특정 소스에서 크롤링"""
-        articles = []
-        
+    async def _discover_from_source(self, engine: AsyncCrawlEngine, target: CrawlTarget, query: str,
+                                    max_articles: int = 5) -> List[PageJob]:
+        """특정 소스의 검색 결과에서 기사 작업 목록 생성"""
         try:
-            # 검색 URL 생성
-            search_url = target.search_url_pattern.format(quote(query))
-            
             # 위키백과 API 특별 처리
             if target.domain == 'ko.wikipedia.org':
-                return self._crawl_wikipedia_api(query, max_articles)
-            
-            # 일반 웹사이트 크롤링
-            response = requests.get(search_url, headers=self.headers, timeout=15)
-            if response.status_code != 200:
-                return articles
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
+                return await self._discover_wikipedia(engine, query, max_articles)
             
-            # 검색 결과에서 링크 추출
-            links = self._extract_search_result_links(soup, target)
-            
-            # 각 링크에서 콘텐츠 추출
-            for link in links[:max_articles]:
-                try:
-                    article = self._extract_article_content(link, target)
-                    if article:
-                        articles.append(article)
-                    time.sleep(random.uniform(0.5, 1.5))
-                except Exception as e:
-                    print(f"⚠️  링크 처리 실패 {link}: {e}")
-                    continue
-                    
-        except Exception as e:
-            print(f"❌ {target.name} 크롤링 오류: {e}")
+            # 일반 웹사이트 검색 페이지
+            search_url = target.search_url_pattern.format(quote(query))
+            response = await engine.fetch(search_url)
+            if not response or not response.ok:
+                return []
             
-        return articles
-    
-    def _crawl_wikipedia_api(self, query: str, max_articles: int = 5) -> List[Dict]:
-        """위키백과 API를 통한 크롤링"""
-        articles = []
+            links = self._extract_search_result_links(response.text, search_url, target)
+            jobs = [
+                PageJob(url=link, content_selectors=tuple(target.content_selectors),
+                        title_selectors=tuple(target.title_selectors) + ('title',),
+                        source_type='crawled', source_name=target.name)
+                for link in links[:max_articles]
+            ]
+            print(f"🔗 {target.name}: 기사 {len(jobs)}개 발견")
+            return jobs
         
-        try:
-            # OpenSearch API로 검색
-            search_url = f"https://ko.wikipedia.org/w/api.php?action=opensearch&search={quote(query)}&limit={max_articles}&format=json"
-            response = requests.get(search_url, headers=self.headers, timeout=10)
-            
-            if response.status_code == 200:
-                data = response.json()
-                titles = data[1] if len(data) > 1 else []
-                urls = data[3] if len(data) > 3 else []
-                
-                for title, url in zip(titles, urls):
-                    try:
-                        # 각 페이지 내용 가져오기
-                        content_response = requests.get(url, headers=self.headers, timeout=10)
-                        if content_response.status_code == 200:
-                            soup = BeautifulSoup(content_response.text, 'html.parser')
-                            
-                            # 본문 추출
-                            content_element = soup.select_one('.mw-parser-output')
-                            if content_element:
-                                content = self._clean_text(content_element.get_text())
-                                if len(content) > 200:
-                                    articles.append({
-                                        'title': title,
-                                        'content': content,
-                                        'url': url,
-                                        'source_type': 'wikipedia',
-                                        'source_name': '위키백과'
-                                    })
-                        
-                        time.sleep(0.5)
-                        
-                    except Exception as e:
-                        print(f"⚠️  위키백과 페이지 처리 실패 {title}: {e}")
-                        continue
-                        
         except Exception as e:
-            print(f"❌ 위키백과 API 오류: {e}")
-            
-        return articles
+            print(f"❌ {target.name} 검색 오류: {e}")
+            return []
     
-    def _extract_search_result_links(self, soup: BeautifulSoup, target: CrawlTarget) -> List[str]:
-        """검색 결과에서 링크 추출"""
-        links = []
-        
-        # 일반적인 링크 선택자들
-        link_selectors = ['a[href]', '.result a', '.search-result a', '.title a']
+    async def _discover_wikipedia(self, engine: AsyncCrawlEngine, query: str, max_articles: int = 5) -> List[PageJob]:
+        """위키백과 OpenSearch API로 문서 작업 목록 생성"""
+        search_url = f"https://ko.wikipedia.org/w/api.php?action=opensearch&search={quote(query)}&limit={max_articles}&format=json"
+        response = await engine.fetch(search_url)
+        if not response or not response.ok:
+            return []
         
-        for selector in link_selectors:
-            elements = soup.select(selector)
-            for element in elements:
-                href = element.get('href', '')
-                if href:
-                    # 상대 링크를 절대 링크로 변환
-                    if href.startswith('/'):
-                        href = f"https://{target.domain}{href}"
-                    elif href.startswith('http'):
-                        # 동일 도메인인지 확인
-                        if target.domain in href:
-                            links.append(href)
-                    
-            if len(links) >= 10:
-                break
-                
-        return list(set(links))[:10]
+        data = response.json()
+        titles = data[1] if len(data) > 1 else []
+        urls = data[3] if len(data) > 3 else []
+        target = self.crawl_targets['wikipedia']
+        return [
+            PageJob(url=url, content_selectors=tuple(target.content_selectors),
+                    title_selectors=tuple(target.title_selectors), source_type='wikipedia',
+                    source_name=target.name, title=title)
+            for title, url in zip(titles, urls)
+        ]
     
-    def _extract_article_content(self, url: str, target: CrawlTarget) -> Optional[Dict]:
-        """개별 기사 콘텐츠 추출"""
-        try:
-            response = requests.get(url, headers=self.headers, timeout=15)
-            if response.status_code != 200:
-                return None
-                
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # 제목 추출
-            title = None
-            for selector in target.title_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    title = element.get_text().strip()
-                    break
-            
-            if not title:
-                title = soup.title.get_text().strip() if soup.title else "제목 없음"
-            
-            # 본문 추출
-            content = None
-            for selector in target.content_selectors:
-                element = soup.select_one(selector)
-                if element:
-                    content = self._clean_text(element.get_text())
-                    if len(content) > 200:
-                        break
-            
-            if not content or len(content) < 200:
-                return None
-            
-            return {
-                'title': title[:200],
-                'content': content,
-                'url': url,
-                'source_type': 'crawled',
-                'source_name': target.name
-            }
-            
-        except Exception as e:
-            print(f"❌ 콘텐츠 추출 실패 {url}: {e}")
-            return None
+    def _extract_search_result_links(self, markup: str, base_url: str, target: CrawlTarget) -> List[str]:
+        """검색 결과에서 같은 도메인 링크 추출 (상대 링크는 절대 링크로 변환)"""
+        root = target.extractor.parse(markup)
+        if root is None:
+            return []
+        return target.extractor.links(root, base_url, same_domain=target.domain, limit=10)
     
-    def _filter_and_deduplicate(self, articles: List[Dict]) -> List[Dict]:
-        """중복 제거 및 품질 필터링"""
-        # URL 기반 중복 제거
-        seen_urls = set()
-        unique_articles = []
-        
-        for article in articles:
-            url = article.get('url', '')
-            if url not in seen_urls:
-                seen_urls.add(url)
-                unique_articles.append(article)
+    def _accept_article(self, article: Dict, seen_urls: set, seen_titles: set) -> bool:
+        """URL/제목 중복이 아니고 본문이 충분히 긴 기사만 통과 (통과한 기사는 seen에 기록)"""
+        url = article.get('url', '')
+        if url in seen_urls:
+            return False
+        seen_urls.add(url)
         
         # 콘텐츠 길이 기준 필터링
-        quality_articles = [
-            article for article in unique_articles 
-            if len(article.get('content', '')) >= 500
-        ]
-        
-        # 제목 유사도 기반 중복 제거 (간단한 방식)
-        final_articles = []
-        seen_titles = set()
+        if len(article.get('content', '')) < 500:
+            return False
         
-        for article in quality_articles:
-            title = article.get('title', '').lower()
-            title_key = ''.join(title.split()[:3])  # 첫 3단어로 유사도 판단
-            
-            if title_key not in seen_titles:
-                seen_titles.add(title_key)
-                final_articles.append(article)
-        
-        return final_articles
-    
-    def _clean_text(self, text: str) -> str:
-        """텍스트 정리"""
-        # 불필요한 공백 제거
-        text = re.sub(r'\s+', ' ', text)
-        # 특수 문자 정리 (한국어 보존)
-        text = re.sub(r'[^\w\s가-힣ㄱ-ㅎㅏ-ㅣ.,!?():;-]', '', text)
-        # 길이 제한
-        return text.strip()[:8000]
+        # 제목 유사도 기반 중복 제거 (첫 3단어로 유사도 판단)
+        title_key = ''.join(article.get('title', '').lower().split()[:3])
+        if title_key in seen_titles:
+            return False
+        seen_titles.add(title_key)
+        return True
     
     def save_to_database(self, articles: List[Dict]) -> int:
-        """크롤링된 데이터를 데이터베이스에 저장"""
+        """크롤링된 데이터를 데이터베이스에 저장 (이미 있는 URL은 건너뜀)"""
         if not articles:
             return 0
             
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-            saved_count = 0
-            
-            for article in articles:
-                # 중복 체크 (URL과 제목 모두)
-                cursor.execute("""
-                    SELECT id FROM document_sources 
-                    WHERE (url = ? OR title = ?) AND is_active = 1
-                """, (article['url'], article['title']))
-                
-                if cursor.fetchone():
-                    print(f"⚠️  이미 존재: {article['title'][:50]}...")
-                    continue
-                
-                # 저장
-                cursor.execute("""
-                    INSERT INTO document_sources 
-                    (title, content, url, source_type, created_at, updated_at, is_active)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    article['title'],
-                    article['content'],
-                    article['url'],
-                    f"{article['source_type']}_{article.get('source_name', 'unknown')}",
-                    current_time,
-                    current_time,
-                    1
-                ))
-                saved_count += 1
-                print(f"💾 저장됨: [{article.get('source_name', 'Unknown')}] {article['title'][:50]}...")
-            
-            conn.commit()
-            conn.close()
-            
+            documents = [
+                {
+                    'title': article['title'],
+                    'content': article['content'],
+                    'url': article['url'],
+                    'source_type': f"{article['source_type']}_{article.get('source_name', 'unknown')}",
+                }
+                for article in articles
+            ]
+            saved_count = self.repository.insert_documents(documents)
+            skipped = len(articles) - saved_count
+            print(f"💾 저장됨: {saved_count}개" + (f" (⚠️  중복 {skipped}개 제외)" if skipped else ""))
             return saved_count
             
         except Exception as e:
@@ -411,15 +310,19 @@ class AICrawlerService:
             return 0
     
     def ai_enhanced_crawl(self, query: str, num_results: int = 15) -> Dict:
-        """AI 강화 크롤링 메인 함수"""
+        """AI 강화 크롤링 메인 함수 (동기 호출용)"""
+        return asyncio.run(self.ai_enhanced_crawl_async(query, num_results))
+    
+    async def ai_enhanced_crawl_async(self, query: str, num_results: int = 15,
+                                      engine: Optional[AsyncCrawlEngine] = None) -> Dict:
+        """AI 강화 크롤링 메인 함수 (engine을 넘기면 도메인별 요청 간격을 공유)"""
         print(f"🚀 AI 강화 웹 크롤링 시작: '{query}'")
         print(f"🎯 대상 소스: {len(self.crawl_targets)}개 사이트")
         
-        # 지능형 검색 및 크롤링
-        articles = self.intelligent_search(query, num_results)
-        
-        # 데이터베이스 저장
-        saved_count = self.save_to_database(articles)
+        # 지능형 검색 및 크롤링 (파이프라인 마지막 단계가 묶음으로 저장)
+        pipeline_result = await self._run_pipeline(query, num_results, repository=self.repository, engine=engine)
+        articles = pipeline_result.articles
+        saved_count = pipeline_result.saved
         
         # 결과 정리
         result = {
@@ -427,6 +330,7 @@ class AICrawlerService:
             'total_crawled': len(articles),
             'saved_count': saved_count,
             'sources_used': list(set([article.get('source_name', 'Unknown') for article in articles])),
+            'pipeline': pipeline_result.stages,
             'articles': [
                 {
                     'title': article['title'][:100],
@@ -444,6 +348,33 @@ class AICrawlerService:
         print(f"   🌐 사용 소스: {', '.join(result['sources_used'])}")
         
         return result
+    
+    async def batch_crawl_async(self, queries: List[str], results_per_query: int = 10,
+                                on_result: Optional[Callable[[str, Dict], None]] = None) -> List[Dict]:
+        """여러 검색어를 한 엔진에서 동시에 크롤링 (도메인별 요청 간격은 모든 검색어가 공유)
+
+        검색어마다 끝나는 대로 on_result(query, 결과)를 호출하고, 입력 순서의 결과 목록을 돌려줍니다.
+        """
+        async with AsyncCrawlEngine(headers=self.headers) as engine:
+            async def crawl_one(query: str) -> Dict:
+                try:
+                    result = await self.ai_enhanced_crawl_async(query, results_per_query, engine=engine)
+                    outcome = {
+                        "query": query,
+                        "status": "success",
+                        "collected": result['total_crawled'],
+                        "saved": result['saved_count'],
+                        "sources": result['sources_used'],
+                    }
+                except Exception as e:
+                    print(f"[ERROR] '{query}' 크롤링 실패: {e}")
+                    outcome = {"query": query, "status": "failed", "error": str(e),
+                               "collected": 0, "saved": 0, "sources": []}
+                if on_result:
+                    on_result(query, outcome)
+                return outcome
+            
+            return await asyncio.gather(*(crawl_one(query) for query in queries))
 
 if __name__ == "__main__":
     # 테스트
@@ -460,4 +391,4 @@ if __name__ == "__main__":
         print(f"   수집: {result['total_crawled']}개")
         print(f"   저장: {result['saved_count']}개")
         print(f"   소스: {', '.join(result['sources_used'])}")
-        print("="*60)
\ No newline at end of file
+        print("="*60)
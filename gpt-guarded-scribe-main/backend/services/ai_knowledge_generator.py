@@ -2,15 +2,17 @@
 # -*- coding: utf-8 -*-
 """AI 지식 생성 서비스 - Claude AI를 활용한 콘텐츠 생성"""
 
-import sqlite3
-from datetime import datetime
+import asyncio
+import hashlib
 import re
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional
 from dataclasses import dataclass
 import json
 import random
 import time
 
+from services.document_repository import DocumentRepository, get_document_repository
+
 @dataclass
 class AIGeneratedContent:
     """AI 생성 콘텐츠 데이터 클래스"""
@@ -23,8 +25,8 @@ class AIGeneratedContent:
 class AIKnowledgeGenerator:
     """AI 기반 지식 콘텐츠 생성 서비스"""
     
-    def __init__(self, db_path="plagiarism.db"):
-        self.db_path = db_path
+    def __init__(self, repository: Optional[DocumentRepository] = None):
+        self.repository = repository or get_document_repository()
         
         # AI가 생성할 수 있는 주제별 지식 템플릿
         self.knowledge_templates = {
@@ -263,57 +265,34 @@ class AIKnowledgeGenerator:
         return random.choice(conclusions)
     
     def save_ai_content_to_database(self, contents: List[AIGeneratedContent]) -> int:
-        """AI 생성 콘텐츠를 데이터베이스에 저장"""
+        """AI 생성 콘텐츠를 데이터베이스에 저장 (같은 제목은 같은 URL이 되어 건너뜀)"""
         if not contents:
             return 0
             
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-            saved_count = 0
-            
-            for content in contents:
-                # 중복 체크 (제목 기준)
-                cursor.execute("""
-                    SELECT id FROM document_sources 
-                    WHERE title = ? AND is_active = 1
-                """, (content.title,))
-                
-                if cursor.fetchone():
-                    print(f"⚠️  이미 존재하는 AI 콘텐츠: {content.title[:50]}...")
-                    continue
-                
-                # URL 생성 (AI 생성 콘텐츠임을 표시)
-                ai_url = f"ai://claude-generated/{content.topic}/{saved_count}"
-                
-                # 저장
-                cursor.execute("""
-                    INSERT INTO document_sources 
-                    (title, content, url, source_type, created_at, updated_at, is_active)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    content.title,
-                    content.content,
-                    ai_url,
-                    content.source_type,
-                    current_time,
-                    current_time,
-                    1
-                ))
-                saved_count += 1
-                print(f"💾 AI 콘텐츠 저장됨: {content.title[:50]}...")
-            
-            conn.commit()
-            conn.close()
-            
+            documents = [
+                {
+                    'title': content.title,
+                    'content': content.content,
+                    'url': self._content_url(content),
+                    'source_type': content.source_type,
+                }
+                for content in contents
+            ]
+            saved_count = self.repository.insert_documents(documents)
+            skipped = len(contents) - saved_count
+            print(f"💾 AI 콘텐츠 저장됨: {saved_count}개" + (f" (⚠️  중복 {skipped}개 제외)" if skipped else ""))
             return saved_count
             
         except Exception as e:
             print(f"❌ AI 콘텐츠 저장 오류: {e}")
             return 0
     
+    def _content_url(self, content: AIGeneratedContent) -> str:
+        """AI 생성 콘텐츠임을 표시하는 URL (제목 해시로 만들어 호출 간에도 고유)"""
+        title_hash = hashlib.sha1(content.title.encode('utf-8')).hexdigest()[:16]
+        return f"ai://claude-generated/{content.topic}/{title_hash}"
+    
     def generate_and_save_knowledge(self, topic: str, num_articles: int = 5) -> Dict:
         """AI 지식 생성 및 저장 통합 함수"""
         print(f"🚀 AI 지식 생성기 시작: '{topic}' 주제")
@@ -347,6 +326,29 @@ class AIKnowledgeGenerator:
         print(f"   🎯 주제: {topic}")
         
         return result
+    
+    async def batch_generate_async(self, topics: List[str], articles_per_topic: int = 3,
+                                   on_result: Optional[Callable[[str, Dict], None]] = None) -> List[Dict]:
+        """여러 주제를 스레드에서 동시에 생성/저장 (주제마다 끝나는 대로 on_result 호출)"""
+        async def generate_one(topic: str) -> Dict:
+            try:
+                result = await asyncio.to_thread(self.generate_and_save_knowledge, topic, articles_per_topic)
+                outcome = {
+                    "topic": topic,
+                    "status": "success",
+                    "generated": result['generated_count'],
+                    "saved": result['saved_count'],
+                    "contents": result['contents_summary'],
+                }
+            except Exception as e:
+                print(f"[ERROR] '{topic}' AI 생성 실패: {e}")
+                outcome = {"topic": topic, "status": "failed", "error": str(e),
+                           "generated": 0, "saved": 0, "contents": []}
+            if on_result:
+                on_result(topic, outcome)
+            return outcome
+        
+        return await asyncio.gather(*(generate_one(topic) for topic in topics))
 
 if __name__ == "__main__":
     # 테스트
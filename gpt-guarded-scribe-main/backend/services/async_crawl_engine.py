@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""비동기 크롤링 엔진 (httpx + 도메인별 토큰 버킷)"""
+
+import asyncio
+import json
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from config import settings
+from services.http_client import RETRY_STATUSES, get_http_client
+
+
+@dataclass
+class FetchResult:
+    url: str
+    status_code: int
+    text: str
+    elapsed: float
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code == 200
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 요청 토큰"""
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class DomainScheduler:
+    """도메인마다 토큰 버킷을 따로 두어 같은 사이트에만 요청 간격을 적용"""
+
+    def __init__(self, rate: float = None, burst: int = None, overrides: Optional[Dict[str, float]] = None):
+        self.rate = rate or settings.CRAWL_DOMAIN_RATE
+        self.burst = burst or settings.CRAWL_DOMAIN_BURST
+        self.overrides = overrides or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+
+    def bucket(self, host: str) -> TokenBucket:
+        if host not in self._buckets:
+            self._buckets[host] = TokenBucket(self.overrides.get(host, self.rate), self.burst)
+        return self._buckets[host]
+
+    async def wait(self, url: str):
+        await self.bucket(urlparse(url).netloc).acquire()
+
+
+class AsyncCrawlEngine:
+    """여러 도메인을 동시에 가져오는 비동기 HTTP 클라이언트
+
+    요청 간 지연은 전역 sleep 대신 도메인별 토큰 버킷으로 걸고, 전체 동시 요청 수는
+    세마포어로 제한합니다. 전체 소요 시간이 도메인별 소요 시간의 합이 아니라
+    가장 느린 도메인에 가까워집니다. `async with`로 열고 닫습니다.
+    연결 풀/재시도 설정과 연결 재사용 지표는 http_client와 공유합니다.
+    """
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, scheduler: Optional[DomainScheduler] = None,
+                 max_concurrency: int = None, timeout: float = None,
+                 client: Optional[httpx.AsyncClient] = None):
+        self.headers = headers or {}
+        self.scheduler = scheduler or DomainScheduler()
+        self.timeout = timeout or settings.CRAWL_TIMEOUT
+        self.max_concurrency = max_concurrency or settings.CRAWL_MAX_CONCURRENCY
+        self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        self._client = client
+        self._owns_client = client is None
+
+    async def __aenter__(self):
+        if self._client is None:
+            # 호스트당 keep-alive 연결 수 제한 + 연결 실패 재시도
+            transport = httpx.AsyncHTTPTransport(
+                retries=settings.HTTP_RETRIES,
+                limits=httpx.Limits(
+                    max_connections=self.max_concurrency,
+                    max_keepalive_connections=settings.HTTP_POOL_MAXSIZE,
+                ),
+            )
+            self._client = httpx.AsyncClient(
+                headers=self.headers,
+                timeout=httpx.Timeout(self.timeout, connect=settings.HTTP_CONNECT_TIMEOUT),
+                follow_redirects=True,
+                transport=transport,
+            )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        if self._owns_client and self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch(self, url: str) -> Optional[FetchResult]:
+        """도메인 토큰을 받은 뒤 GET (429/5xx는 백오프 후 재시도, 네트워크 오류는 None)"""
+        for attempt in range(settings.HTTP_RETRIES + 1):
+            await self.scheduler.wait(url)
+            async with self._semaphore:
+                started = time.monotonic()
+                try:
+                    response = await self._get(url)
+                except httpx.HTTPError as e:
+                    print(f"⚠️  요청 실패 {url}: {e}")
+                    return None
+            delay = _retry_delay(response, attempt)
+            if response.status_code not in RETRY_STATUSES or attempt == settings.HTTP_RETRIES or delay is None:
+                return FetchResult(url, response.status_code, response.text, time.monotonic() - started)
+            await asyncio.sleep(delay)
+
+    async def _get(self, url: str) -> httpx.Response:
+        connected = False
+
+        async def trace(event_name, info):
+            nonlocal connected
+            if event_name == "connection.connect_tcp.complete":
+                connected = True
+
+        response = await self._client.get(url, extensions={"trace": trace})
+        get_http_client().record_async(response.url.host, connected)
+        return response
+
+    async def fetch_many(self, urls: Iterable[str]) -> List[Optional[FetchResult]]:
+        return await asyncio.gather(*(self.fetch(url) for url in urls))
+
+
+def _retry_delay(response: httpx.Response, attempt: int) -> Optional[float]:
+    """Retry-After(초)가 있으면 따르고 없으면 지수 백오프
+
+    Retry-After가 HTTP_READ_TIMEOUT보다 길면 None (기다리지 않고 포기, 요청 하나가 API를 오래 붙잡지 않도록)
+    """
+    retry_after = response.headers.get("Retry-After", "")
+    if retry_after.isdigit():
+        if float(retry_after) > settings.HTTP_READ_TIMEOUT:
+            print(f"⚠️  Retry-After {retry_after}초가 너무 길어 재시도 포기: {response.url}")
+            return None
+        return float(retry_after)
+    return settings.HTTP_BACKOFF_FACTOR * (2 ** attempt)
@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+"""여러 주제를 한꺼번에 처리하는 배치 작업 (백그라운드 실행 + 진행 상황 조회, 상태는 DB에 저장)"""
+
+import asyncio
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Awaitable, Callable, Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.engine import Engine
+
+from config import settings
+from database import engine as default_engine
+from models import BatchJobRecord
+
+ACTIVE_STATUSES = ("queued", "running")
+FINISHED_STATUSES = ("completed", "failed")
+STALE_HEARTBEATS = 3  # 생존 시각이 이만큼의 주기 동안 갱신되지 않으면 중단된 작업
+
+
+class BatchJobLimitError(Exception):
+    """동시에 실행 중인 배치 작업이 너무 많음"""
+    pass
+
+
+def _no_summary(results: List[Dict], total: int) -> Dict:
+    return {}
+
+
+@dataclass
+class BatchJob:
+    """배치 작업 하나의 상태 (항목별 결과는 끝나는 순서대로 채워짐)"""
+    id: str
+    kind: str
+    items: List[str]
+    summarize: Callable[[List[Dict], int], Dict]  # (항목 결과 목록, 전체 항목 수) → batch_summary/message
+    status: str = "queued"  # queued, running, completed, failed
+    created_at: datetime = field(default_factory=datetime.utcnow)
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+    results: Dict[str, Dict] = field(default_factory=dict)
+
+    @property
+    def done(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+    def to_dict(self) -> Dict:
+        finished = len(self.results)
+        # 입력 순서대로 (아직 끝나지 않은 항목은 빠짐)
+        results = [self.results[item] for item in self.items if item in self.results]
+        end = self.finished_at or datetime.utcnow()
+        return {
+            "success": self.status != "failed",
+            "job_id": self.id,
+            "kind": self.kind,
+            "status": self.status,
+            "progress": {
+                "total": len(self.items),
+                "finished": finished,
+                "failed": sum(1 for result in results if result.get("status") == "failed"),
+                "percent": round(finished / len(self.items) * 100, 1) if self.items else 100.0,
+            },
+            "elapsed": round((end - self.started_at).total_seconds(), 2) if self.started_at else 0.0,
+            "error": self.error,
+            "results": results,
+            **self.summarize(results, len(self.items)),
+        }
+
+
+class BatchJobRegistry:
+    """배치 작업 목록 (batch_jobs 테이블)
+
+    작업은 요청을 받은 프로세스의 데몬 스레드에서 이벤트 루프 하나로 실행하므로 HTTP 요청은
+    작업 ID만 받고 바로 끝납니다. 상태와 항목별 결과는 끝날 때마다 DB에 기록하므로 다른 워커
+    프로세스나 재시작 후에도 조회되고, 동시 실행 수 제한도 DB 기준입니다. 실행 중인 작업은
+    BATCH_JOB_HEARTBEAT초마다 생존 시각을 갱신하며, 프로세스가 중단돼 갱신이 끊긴 작업은
+    그때까지의 결과를 남긴 채 failed가 됩니다. 끝난 작업은 최근 BATCH_JOB_HISTORY개만 남깁니다.
+    """
+
+    def __init__(self, engine: Optional[Engine] = None, max_running: int = None, history: int = None):
+        self.engine = engine or default_engine
+        self.table = BatchJobRecord.__table__
+        self.max_running = max_running or settings.BATCH_JOB_MAX_RUNNING
+        self.history = history or settings.BATCH_JOB_HISTORY
+        self._summaries: Dict[str, Callable[[List[Dict], int], Dict]] = {}
+        self._lock = threading.Lock()
+        self._last_recover = 0.0
+
+    def register_kind(self, kind: str, summarize: Callable[[List[Dict], int], Dict]):
+        """작업 종류별 요약 함수 등록 (어느 프로세스에서 조회해도 같은 요약을 만들도록 모듈 로드 시 호출)"""
+        self._summaries[kind] = summarize
+
+    def submit(self, kind: str, items: List[str], run: Callable[[BatchJob], Awaitable[None]]) -> BatchJob:
+        """작업 등록 후 백그라운드에서 run(job) 실행 (실행 중인 작업이 많으면 BatchJobLimitError)"""
+        self.recover_stale()
+        job = BatchJob(id=uuid.uuid4().hex, kind=kind, items=list(items), summarize=self._summary(kind))
+        t = self.table
+        with self._lock, self.engine.begin() as conn:
+            running = conn.execute(
+                select(func.count()).select_from(t).where(t.c.status.in_(ACTIVE_STATUSES))
+            ).scalar()
+            if running >= self.max_running:
+                raise BatchJobLimitError(f"실행 중인 배치 작업이 {running}개입니다. 잠시 후 다시 시도하세요.")
+            conn.execute(insert(t).values(
+                id=job.id, kind=kind, status=job.status, items=job.items, results={},
+                created_at=job.created_at, heartbeat_at=job.created_at,
+            ))
+            self._evict(conn)
+
+        threading.Thread(target=self._run, args=(job, run), name=f"batch-{kind}", daemon=True).start()
+        print(f"📦 배치 작업 {job.id[:8]} 시작: {kind} {len(job.items)}개")
+        return job
+
+    def record(self, job: BatchJob, item: str, result: Dict):
+        """항목 하나의 결과 기록 (작업 스레드에서 호출)"""
+        job.results[item] = result
+        self._save(job.id, results=dict(job.results), heartbeat_at=datetime.utcnow())
+        print(f"🔄 배치 {job.id[:8]} 진행률: {len(job.results)}/{len(job.items)} - '{item}' {result.get('status')}")
+
+    def get(self, job_id: str) -> Optional[BatchJob]:
+        self.recover_stale()
+        with self.engine.connect() as conn:
+            row = conn.execute(select(self.table).where(self.table.c.id == job_id)).first()
+        return self._from_row(row) if row else None
+
+    def list(self) -> List[BatchJob]:
+        self.recover_stale()
+        with self.engine.connect() as conn:
+            rows = conn.execute(select(self.table).order_by(self.table.c.created_at.desc())).all()
+        return [self._from_row(row) for row in rows]
+
+    def recover_stale(self, now: Optional[datetime] = None, force: bool = False) -> int:
+        """생존 시각 갱신이 끊긴 작업(실행하던 프로세스가 중단됨)을 failed로"""
+        if not force and time.monotonic() - self._last_recover < settings.BATCH_JOB_HEARTBEAT:
+            return 0
+        self._last_recover = time.monotonic()
+        now = now or datetime.utcnow()
+        t = self.table
+        with self.engine.begin() as conn:
+            recovered = conn.execute(
+                update(t)
+                .where(t.c.status.in_(ACTIVE_STATUSES),
+                       t.c.heartbeat_at < now - timedelta(seconds=settings.BATCH_JOB_HEARTBEAT * STALE_HEARTBEATS))
+                .values(status="failed", error="작업을 실행하던 프로세스가 중단되었습니다", finished_at=now)
+            ).rowcount
+        if recovered:
+            print(f"⚠️  중단된 배치 작업 {recovered}개 실패 처리")
+        return recovered
+
+    def _run(self, job: BatchJob, run: Callable[[BatchJob], Awaitable[None]]):
+        job.status = "running"
+        job.started_at = datetime.utcnow()
+        self._save(job.id, status=job.status, started_at=job.started_at, heartbeat_at=job.started_at)
+        status, error = "completed", None
+        try:
+            asyncio.run(self._run_with_heartbeat(job, run))
+        except Exception as e:
+            print(f"❌ 배치 작업 {job.id[:8]} 실패: {e}")
+            status, error = "failed", str(e)
+        finished_at = datetime.utcnow()
+        # DB에 기록한 뒤에 메모리 상태를 바꿈 (job.done이면 다른 프로세스에서도 끝난 상태로 보임)
+        self._save(job.id, status=status, error=error, finished_at=finished_at)
+        job.status, job.error, job.finished_at = status, error, finished_at
+        print(f"✅ 배치 작업 {job.id[:8]} {job.status}: {(job.finished_at - job.started_at).total_seconds():.1f}초")
+
+    async def _run_with_heartbeat(self, job: BatchJob, run: Callable[[BatchJob], Awaitable[None]]):
+        heartbeat = asyncio.ensure_future(self._heartbeat(job))
+        try:
+            await run(job)
+        finally:
+            heartbeat.cancel()
+
+    async def _heartbeat(self, job: BatchJob):
+        while True:
+            await asyncio.sleep(settings.BATCH_JOB_HEARTBEAT)
+            await asyncio.to_thread(self._save, job.id, heartbeat_at=datetime.utcnow())
+
+    def _save(self, job_id: str, **values):
+        with self.engine.begin() as conn:
+            conn.execute(update(self.table).where(self.table.c.id == job_id).values(**values))
+
+    def _evict(self, conn):
+        t = self.table
+        keep = (
+            select(t.c.id).where(t.c.status.in_(FINISHED_STATUSES))
+            .order_by(t.c.created_at.desc()).limit(self.history)
+        )
+        conn.execute(delete(t).where(t.c.status.in_(FINISHED_STATUSES), t.c.id.not_in(keep)))
+
+    def _summary(self, kind: str) -> Callable[[List[Dict], int], Dict]:
+        return self._summaries.get(kind, _no_summary)
+
+    def _from_row(self, row) -> BatchJob:
+        return BatchJob(
+            id=row.id, kind=row.kind, items=list(row.items), summarize=self._summary(row.kind),
+            status=row.status, created_at=row.created_at, started_at=row.started_at,
+            finished_at=row.finished_at, error=row.error, results=dict(row.results or {}),
+        )
+
+
+_registry: Optional[BatchJobRegistry] = None
+
+
+def get_batch_jobs() -> BatchJobRegistry:
+    """프로세스 공용 배치 작업 목록"""
+    global _registry
+    if _registry is None:
+        _registry = BatchJobRegistry()
+    return _registry
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""표절 후보 청크 검색 (PostgreSQL pg_trgm)"""
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session
+from sqlalchemy.types import Text
+
+from config import settings
+from services.text_chunker import split_chunks
+from utils.text_fingerprint import content_hash
+
+
+@dataclass
+class ChunkCandidate:
+    """검색된 후보 청크와 DB에서 계산한 점수"""
+    chunk_id: int
+    source_id: int
+    source_title: str
+    source_url: Optional[str]
+    content: str
+    start_offset: Optional[int]  # 출처 문서 내 청크 위치
+    end_offset: Optional[int]
+    score: float
+    query_text: str  # 이 후보를 찾은 입력 문장과 입력 텍스트 내 위치
+    query_start: int
+    query_end: int
+    exact: bool  # 정규화된 문장이 그대로 일치 (chunk_hash 동일)
+
+
+class TrigramRetriever:
+    """입력 문장마다 트라이그램 유사도가 높은 청크를 GIN 인덱스로 찾음
+
+    문장 배열을 unnest 하고 LATERAL 서브쿼리에서 `%` 연산자(인덱스 사용)로
+    거른 뒤 similarity() 순으로 상위 청크를 가져오므로 쿼리 한 번으로 끝납니다.
+    """
+
+    QUERY = text("""
+        SELECT q.idx, c.id, c.source_id, s.title, s.url, c.content,
+               c.start_offset, c.end_offset, c.chunk_hash, c.score
+        FROM unnest(:sentences) WITH ORDINALITY AS q(sentence, idx)
+        CROSS JOIN LATERAL (
+            SELECT dc.id, dc.source_id, dc.content, dc.start_offset, dc.end_offset, dc.chunk_hash,
+                   similarity(dc.content, q.sentence) AS score
+            FROM document_chunks dc
+            WHERE dc.content % q.sentence
+            ORDER BY score DESC
+            LIMIT :per_sentence
+        ) c
+        JOIN document_sources s ON s.id = c.source_id AND s.is_active
+        ORDER BY c.score DESC
+        LIMIT :max_candidates
+    """).bindparams(bindparam("sentences", type_=ARRAY(Text)))
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def search(self, original_text: str) -> List[ChunkCandidate]:
+        queries = split_chunks(original_text)[:settings.RETRIEVAL_MAX_QUERY_SENTENCES]
+        if not queries:
+            return []
+        sentences = [query.text for query in queries]
+        query_hashes = [content_hash(sentence) for sentence in sentences]
+
+        # `%` 연산자의 임계값 (현재 트랜잭션에만 적용)
+        self.db.execute(
+            text("SELECT set_config('pg_trgm.similarity_threshold', :threshold, true)"),
+            {"threshold": str(settings.RETRIEVAL_SIMILARITY_THRESHOLD)}
+        )
+        rows = self.db.execute(self.QUERY, {
+            "sentences": sentences,
+            "per_sentence": settings.RETRIEVAL_CHUNKS_PER_SENTENCE,
+            "max_candidates": settings.RETRIEVAL_MAX_CANDIDATES,
+        }).all()
+
+        candidates = []
+        for row in rows:
+            index = int(row.idx) - 1
+            query = queries[index]
+            candidates.append(ChunkCandidate(
+                chunk_id=row.id,
+                source_id=row.source_id,
+                source_title=row.title,
+                source_url=row.url,
+                content=row.content,
+                start_offset=row.start_offset,
+                end_offset=row.end_offset,
+                score=float(row.score),
+                query_text=query.text,
+                query_start=query.start,
+                query_end=query.end,
+                exact=row.chunk_hash == query_hashes[index],
+            ))
+        return candidates
+
+
+def get_retriever(db: Session) -> Optional[TrigramRetriever]:
+    """현재 DB에서 쓸 수 있는 후보 검색기 (없으면 None: 전체 문서 비교)"""
+    if db.get_bind().dialect.name == "postgresql":
+        return TrigramRetriever(db)
+    return None
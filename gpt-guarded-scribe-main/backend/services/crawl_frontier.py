@@ -0,0 +1,302 @@
+#!/usr/bin/env python3
+"""DB 기반 크롤링 프런티어 (URL 정규화, Bloom 필터, 우선순위, 도메인별 다음 요청 시각)"""
+
+import hashlib
+import math
+import threading
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import parse_qsl, quote, unquote, urlencode, urlsplit, urlunsplit
+
+from sqlalchemy import func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+
+from config import settings
+from database import engine as default_engine
+from models import CrawlDomain, CrawlFrontierEntry
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+TRACKING_PARAMS = {"fbclid", "gclid", "ref", "source"}
+PATH_SAFE = "/:@!$&'()*+,;=-._~"
+RECOVER_INTERVAL = 30  # 만료된 임대 회수 주기 (초)
+RECRAWL_INTERVAL = 3600  # 오래된 완료 항목 재크롤링 예약 주기 (초)
+
+
+def normalize_url(url: str) -> Optional[str]:
+    """같은 문서를 가리키는 URL을 한 형태로 통일 (http(s)가 아니면 None)
+
+    스킴/호스트 소문자, 기본 포트·프래그먼트·추적 파라미터 제거, 쿼리 정렬,
+    퍼센트 인코딩 통일(`/wiki/인공지능`과 `/wiki/%EC%9D%B8...`을 같은 URL로 봄).
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except (ValueError, AttributeError):
+        return None
+    scheme = parts.scheme.lower()
+    if scheme not in DEFAULT_PORTS or not parts.hostname:
+        return None
+
+    netloc = parts.hostname.lower()
+    if port is not None and port != DEFAULT_PORTS[scheme]:
+        netloc = f"{netloc}:{port}"
+    path = quote(unquote(parts.path), safe=PATH_SAFE) or "/"
+    params = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not key.lower().startswith("utm_") and key.lower() not in TRACKING_PARAMS
+    )
+    return urlunsplit((scheme, netloc, path, urlencode(params, quote_via=quote), ""))
+
+
+class BloomFilter:
+    """이미 본 URL 판정용 Bloom 필터 (거짓 양성만 있고 거짓 음성은 없음)"""
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item: str):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item: str):
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+
+
+@dataclass
+class FrontierItem:
+    id: int
+    url: str
+    domain: str
+    query: Optional[str]
+    source_type: str
+    attempts: int
+
+
+class CrawlFrontier:
+    """crawl_frontier 테이블을 큐로 사용
+
+    enqueue는 정규화한 URL을 Bloom 필터로 먼저 거르고 UNIQUE(url) + ON CONFLICT DO NOTHING으로
+    저장하므로 호출이 반복되거나 여러 프로세스가 같은 URL을 넣어도 한 번만 크롤링됩니다.
+    lease는 시간이 된 도메인마다 우선순위가 가장 높은 항목 하나를 조건부 UPDATE로 가져가므로
+    여러 워커/프로세스가 같은 항목이나 같은 도메인 간격을 동시에 잡지 않습니다.
+    끝나지 않은 임대는 FRONTIER_LEASE_SECONDS 뒤 다시 대기 상태가 되어 재시작 후에도 이어집니다.
+    완료 후 FRONTIER_RECRAWL_DAYS가 지난 항목은 다시 대기 상태가 되어 조건부 GET으로 재검증됩니다
+    (행을 그대로 되돌리므로 Bloom 필터와 UNIQUE(url)는 그대로 둡니다).
+    """
+
+    def __init__(self, engine: Optional[Engine] = None):
+        self.engine = engine or default_engine
+        self.table = CrawlFrontierEntry.__table__
+        self.domains = CrawlDomain.__table__
+        self.lease_seconds = settings.FRONTIER_LEASE_SECONDS
+        self.seen: Optional[BloomFilter] = None  # 첫 enqueue에서 기존 URL로 채움
+        self._lock = threading.Lock()
+        self._last_recover = 0.0
+        self._last_recrawl = 0.0
+
+    def _seen_filter(self) -> BloomFilter:
+        with self._lock:
+            if self.seen is None:
+                seen = BloomFilter(settings.FRONTIER_BLOOM_CAPACITY, settings.FRONTIER_BLOOM_ERROR_RATE)
+                with self.engine.connect() as conn:
+                    for (url,) in conn.execute(select(self.table.c.url)).yield_per(10000):
+                        seen.add(url)
+                self.seen = seen
+            return self.seen
+
+    def enqueue(self, urls: Iterable[str], priority: int = 0, query: Optional[str] = None,
+                source_type: str = "crawled") -> int:
+        """URL 목록을 대기열에 추가하고 새로 들어간 수 반환 (이미 본 URL은 건너뜀)"""
+        seen = self._seen_filter()
+        now = datetime.utcnow()
+        rows = {}
+        for url in urls:
+            normalized = normalize_url(url)
+            if not normalized or normalized in rows or normalized in seen:
+                continue
+            rows[normalized] = {
+                "url": normalized,
+                "domain": urlsplit(normalized).netloc,
+                "priority": priority,
+                "status": "pending",
+                "query": query,
+                "source_type": source_type,
+                "attempts": 0,
+                "next_fetch_at": now,
+                "created_at": now,
+                "updated_at": now,
+            }
+        if not rows:
+            return 0
+
+        delay = 1.0 / settings.CRAWL_DOMAIN_RATE
+        domains = [{"domain": domain, "next_fetch_at": now, "crawl_delay": delay}
+                   for domain in {row["domain"] for row in rows.values()}]
+        with self.engine.begin() as conn:
+            self._insert_ignore(conn, self.domains, domains, self.domains.c.domain)
+            added = self._insert_ignore(conn, self.table, list(rows.values()), self.table.c.url)
+        with self._lock:
+            for url in rows:
+                seen.add(url)
+        return added
+
+    def _insert_ignore(self, conn, table, rows: List[Dict], key) -> int:
+        dialect = self.engine.dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = pg_insert if dialect == "postgresql" else sqlite_insert
+            stmt = dialect_insert(table).values(rows).on_conflict_do_nothing().returning(key)
+            return len(conn.execute(stmt).all())
+
+        # ON CONFLICT를 지원하지 않는 DB: 기존 키를 한 번에 조회해 제외
+        existing = set(conn.execute(select(key).where(key.in_([row[key.name] for row in rows]))).scalars())
+        rows = [row for row in rows if row[key.name] not in existing]
+        if rows:
+            conn.execute(table.insert(), rows)
+        return len(rows)
+
+    def lease(self, limit: int = 1, now: Optional[datetime] = None) -> List[FrontierItem]:
+        """시간이 된 항목을 도메인당 하나씩 최대 limit개 가져감"""
+        now = now or datetime.utcnow()
+        self.recover_expired(now)
+        self.requeue_stale(now)
+
+        t, d = self.table, self.domains
+        with self.engine.connect() as conn:
+            candidates = conn.execute(
+                select(t.c.id, t.c.url, t.c.domain, t.c.query, t.c.source_type, t.c.attempts, d.c.crawl_delay)
+                .join(d, d.c.domain == t.c.domain)
+                .where(t.c.status == "pending", t.c.next_fetch_at <= now, d.c.next_fetch_at <= now)
+                .order_by(t.c.priority.desc(), t.c.id)
+                .limit(limit * 10)
+            ).all()
+
+        leased: List[FrontierItem] = []
+        claimed_domains = set()
+        for row in candidates:
+            if len(leased) >= limit:
+                break
+            if row.domain in claimed_domains:
+                continue
+            if self._claim(row, now):
+                claimed_domains.add(row.domain)
+                leased.append(FrontierItem(row.id, row.url, row.domain, row.query,
+                                           row.source_type, row.attempts + 1))
+        return leased
+
+    def _claim(self, row, now: datetime) -> bool:
+        """도메인 다음 요청 시각과 항목 상태를 한 트랜잭션에서 조건부로 갱신 (다른 워커가 먼저 잡으면 False)"""
+        t, d = self.table, self.domains
+        with self.engine.connect() as conn:
+            trans = conn.begin()
+            domain_claimed = conn.execute(
+                update(d)
+                .where(d.c.domain == row.domain, d.c.next_fetch_at <= now)
+                .values(next_fetch_at=now + timedelta(seconds=row.crawl_delay))
+            ).rowcount == 1
+            item_claimed = domain_claimed and conn.execute(
+                update(t)
+                .where(t.c.id == row.id, t.c.status == "pending")
+                .values(status="in_progress", attempts=t.c.attempts + 1,
+                        leased_until=now + timedelta(seconds=self.lease_seconds), updated_at=now)
+            ).rowcount == 1
+            if item_claimed:
+                trans.commit()
+            else:
+                trans.rollback()
+            return item_claimed
+
+    def complete(self, item: FrontierItem, error: Optional[str] = None):
+        """처리 결과 기록 (실패하면 백오프 후 재시도, FRONTIER_MAX_ATTEMPTS회 실패 시 failed)"""
+        now = datetime.utcnow()
+        values = {"leased_until": None, "updated_at": now}
+        if error is None:
+            values.update(status="done", last_error=None)
+        elif item.attempts >= settings.FRONTIER_MAX_ATTEMPTS:
+            values.update(status="failed", last_error=error[:500])
+        else:
+            delay = settings.FRONTIER_RETRY_DELAY * (2 ** (item.attempts - 1))
+            values.update(status="pending", last_error=error[:500],
+                          next_fetch_at=now + timedelta(seconds=delay))
+        with self.engine.begin() as conn:
+            conn.execute(update(self.table).where(self.table.c.id == item.id).values(**values))
+
+    def recover_expired(self, now: Optional[datetime] = None, force: bool = False) -> int:
+        """임대 시간이 지난 항목(중단된 워커)을 다시 대기 상태로"""
+        if not force and time.monotonic() - self._last_recover < RECOVER_INTERVAL:
+            return 0
+        self._last_recover = time.monotonic()
+        now = now or datetime.utcnow()
+        with self.engine.begin() as conn:
+            recovered = conn.execute(
+                update(self.table)
+                .where(self.table.c.status == "in_progress", self.table.c.leased_until < now)
+                .values(status="pending", leased_until=None, updated_at=now)
+            ).rowcount
+        if recovered:
+            print(f"[FRONTIER] 만료된 임대 {recovered}개 회수")
+        return recovered
+
+    def requeue_stale(self, now: Optional[datetime] = None, force: bool = False) -> int:
+        """FRONTIER_RECRAWL_DAYS보다 오래전에 완료된 항목을 다시 대기 상태로 (재크롤링)"""
+        if settings.FRONTIER_RECRAWL_DAYS <= 0:
+            return 0
+        if not force and time.monotonic() - self._last_recrawl < RECRAWL_INTERVAL:
+            return 0
+        self._last_recrawl = time.monotonic()
+        now = now or datetime.utcnow()
+        with self.engine.begin() as conn:
+            requeued = conn.execute(
+                update(self.table)
+                .where(self.table.c.status == "done",
+                       self.table.c.updated_at < now - timedelta(days=settings.FRONTIER_RECRAWL_DAYS))
+                .values(status="pending", attempts=0, next_fetch_at=now, updated_at=now)
+            ).rowcount
+        if requeued:
+            print(f"[FRONTIER] 재크롤링 대상 {requeued}개 다시 대기열로")
+        return requeued
+
+    def has_work(self) -> bool:
+        """대기 중이거나 처리 중인 항목이 남았는지"""
+        with self.engine.connect() as conn:
+            return conn.execute(
+                select(self.table.c.id).where(self.table.c.status.in_(("pending", "in_progress"))).limit(1)
+            ).first() is not None
+
+    def stats(self) -> Dict:
+        with self.engine.connect() as conn:
+            by_status = dict(conn.execute(
+                select(self.table.c.status, func.count()).group_by(self.table.c.status)
+            ).all())
+            domains = conn.execute(select(func.count()).select_from(self.domains)).scalar()
+            next_due = conn.execute(
+                select(func.min(self.table.c.next_fetch_at)).where(self.table.c.status == "pending")
+            ).scalar()
+        return {
+            "total": sum(by_status.values()),
+            "by_status": by_status,
+            "domains": domains,
+            "next_due": next_due.isoformat() if next_due else None,
+        }
+
+
+_crawl_frontier: Optional[CrawlFrontier] = None
+
+
+def get_crawl_frontier() -> CrawlFrontier:
+    """프로세스 공용 프런티어 (Bloom 필터를 한 번만 채우기 위함)"""
+    global _crawl_frontier
+    if _crawl_frontier is None:
+        _crawl_frontier = CrawlFrontier()
+    return _crawl_frontier
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""표절 검사에서 나온 크롤링 힌트를 처리하는 단일 백그라운드 워커"""
+
+import queue
+import re
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+from config import settings
+from services.statistics_service import get_statistics_service
+from services.web_crawler_service import WebCrawlerService
+
+# 한글 키워드 불용어
+STOP_WORDS = {
+    '이것', '그것', '저것', '하나', '때문', '이런', '그런', '저런', '있는', '없는', '같은', '다른',
+    '것을', '것이', '것은', '이를', '이는', '그를', '그는', '저를', '저는', '할수', '있게', '되는',
+    '하는', '되고', '있다', '있고', '없고', '같이', '처럼', '정도', '부분', '경우', '때와',
+    '사람', '여자', '남자', '아이', '학생', '선생', '이번', '다음', '저번', '지난', '올해', '작년'
+}
+DEFAULT_KEYWORDS = ["정보", "기술", "사회"]  # 키워드를 하나도 못 찾았을 때
+
+
+def extract_keywords(text: str, limit: int = 3) -> List[str]:
+    """검사 텍스트에서 크롤링할 한글 키워드 선택 (빈도 높은 단어 + 긴 단어)"""
+    korean_words = [
+        word for word in re.findall(r'[가-힣]{2,5}', text)
+        if word not in STOP_WORDS
+    ]
+    word_freq = Counter(korean_words)
+
+    frequent_words = [word for word, count in word_freq.most_common(5) if count >= 2]
+    unique_words = [word for word, count in word_freq.most_common(10) if count == 1 and len(word) >= 3]
+    keywords = list(dict.fromkeys(frequent_words[:2] + unique_words[:2]))[:limit]
+
+    if not keywords:
+        # 마지막 fallback: 텍스트에서 가장 긴 단어들 선택
+        keywords = sorted(set(korean_words), key=len, reverse=True)[:limit]
+    return keywords or DEFAULT_KEYWORDS[:limit]
+
+
+class CrawlHintWorker:
+    """키워드 단위로 중복을 제거한 크롤링 요청 큐와 이를 처리하는 스레드 하나
+
+    submit은 텍스트 앞부분에서 키워드만 뽑아 큐에 넣고 바로 돌아갑니다. 이미 대기 중이거나
+    CRAWL_HINT_DEDUP_TTL 안에 크롤링한 키워드는 빼고, 큐가 가득 차면 힌트를 버립니다.
+    워커는 요청 세션을 쓰지 않고(문서 수는 통계 스냅샷, 저장은 적재 저장소 엔진) 키워드 사이에
+    CRAWL_HINT_INTERVAL만큼 쉬므로 검사가 몰려도 같은 사이트에 동시 크롤링이 생기지 않습니다.
+    """
+
+    def __init__(self, crawler: Optional[WebCrawlerService] = None, maxsize: int = None,
+                 interval: float = None, dedup_ttl: float = None):
+        self._crawler = crawler
+        self.interval = settings.CRAWL_HINT_INTERVAL if interval is None else interval
+        self.dedup_ttl = settings.CRAWL_HINT_DEDUP_TTL if dedup_ttl is None else dedup_ttl
+        self.queue: "queue.Queue[Tuple[str, ...]]" = queue.Queue(maxsize or settings.CRAWL_HINT_QUEUE_SIZE)
+        self.stats = Counter()
+        self._pending = set()  # 큐에 있거나 처리 중인 키워드
+        self._recent: Dict[str, float] = {}  # 키워드 -> 마지막 크롤링 시각 (monotonic)
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._last_crawl = 0.0
+
+    @property
+    def crawler(self) -> WebCrawlerService:
+        if self._crawler is None:
+            self._crawler = WebCrawlerService()
+        return self._crawler
+
+    def submit(self, text: str) -> bool:
+        """크롤링 힌트 등록 (새 키워드가 없거나 큐가 가득 차면 False)"""
+        keywords = extract_keywords(text[:settings.CRAWL_HINT_TEXT_CHARS])
+        now = time.monotonic()
+        with self._lock:
+            self.stats["submitted"] += 1
+            fresh = tuple(
+                keyword for keyword in keywords
+                if keyword not in self._pending and now - self._recent.get(keyword, -self.dedup_ttl) >= self.dedup_ttl
+            )
+            if not fresh:
+                self.stats["deduplicated"] += 1
+                return False
+            try:
+                self.queue.put_nowait(fresh)
+            except queue.Full:
+                self.stats["dropped"] += 1
+                return False
+            self._pending.update(fresh)
+        self._ensure_started()
+        return True
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="crawl-hints", daemon=True)
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            keywords = self.queue.get()
+            try:
+                self._crawl(keywords)
+            finally:
+                with self._lock:
+                    self._pending.difference_update(keywords)
+                self.queue.task_done()
+
+    def _crawl(self, keywords: Tuple[str, ...]):
+        if get_statistics_service().snapshot()["documents"]["total"] >= settings.CRAWL_HINT_MAX_DOCUMENTS:
+            with self._lock:
+                self.stats["skipped"] += 1
+            print("[*] 충분한 데이터가 있어 크롤링 생략")
+            return
+
+        print(f"🔍 크롤링 힌트 처리: {list(keywords)} (대기 {self.queue.qsize()}개)")
+        for keyword in keywords:
+            wait = self._last_crawl + self.interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                result = self.crawler.crawl_and_save(keyword, 3)  # 키워드당 3개 문서
+                with self._lock:
+                    self.stats["saved"] += result.get('saved_count', 0)
+                print(f"[OK] '{keyword}' 크롤링 완료: {result.get('saved_count', 0)}개 저장")
+            except Exception as e:
+                print(f"[ERROR] '{keyword}' 크롤링 오류: {e}")
+            finally:
+                self._last_crawl = time.monotonic()
+                with self._lock:
+                    self._recent[keyword] = self._last_crawl
+                    self.stats["crawled_keywords"] += 1
+        self._prune_recent()
+
+    def _prune_recent(self):
+        """중복 제거 기간이 지난 키워드 기록 삭제"""
+        cutoff = time.monotonic() - self.dedup_ttl
+        with self._lock:
+            for keyword in [keyword for keyword, crawled in self._recent.items() if crawled < cutoff]:
+                del self._recent[keyword]
+
+    def status(self) -> Dict:
+        with self._lock:
+            return {**self.stats, "queued": self.queue.qsize(), "pending_keywords": len(self._pending)}
+
+
+_crawl_hint_worker: Optional[CrawlHintWorker] = None
+_worker_lock = threading.Lock()
+
+
+def get_crawl_hint_worker() -> CrawlHintWorker:
+    """프로세스 공용 크롤링 힌트 워커"""
+    global _crawl_hint_worker
+    with _worker_lock:
+        if _crawl_hint_worker is None:
+            _crawl_hint_worker = CrawlHintWorker()
+        return _crawl_hint_worker
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""단계별 크롤링 파이프라인 (가져오기 → 파싱 → 정리/지문 → 일괄 저장)"""
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import AsyncIterable, Callable, Dict, List, Optional, Tuple
+
+from config import settings
+from services.async_crawl_engine import AsyncCrawlEngine
+from services.html_extractor import HtmlExtractor
+from utils.text_fingerprint import content_hash, simhash, to_signed64
+
+_DONE = object()  # 단계 종료 표시
+
+_parse_pool: Optional[ProcessPoolExecutor] = None
+_parse_pool_lock = threading.Lock()
+
+
+def get_parse_pool() -> ProcessPoolExecutor:
+    """HTML 파싱/지문 계산용 프로세스 풀 (프로세스당 하나만 생성)"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(max_workers=settings.CRAWL_PARSE_WORKERS or None)
+        return _parse_pool
+
+
+# 작업 프로세스 안에서 선택자 조합별로 한 번만 컴파일
+_extractors: Dict[Tuple, HtmlExtractor] = {}
+
+
+def parse_page(markup: str, content_selectors: Tuple[str, ...],
+               title_selectors: Tuple[str, ...]) -> Optional[Tuple[Optional[str], str]]:
+    """프로세스 풀 작업: (제목, 본문) 추출 (본문이 짧으면 None)"""
+    key = (content_selectors, title_selectors)
+    extractor = _extractors.get(key)
+    if extractor is None:
+        extractor = _extractors[key] = HtmlExtractor(content_selectors, title_selectors)
+    page = extractor.extract(markup)
+    return (page.title, page.content) if page else None
+
+
+def fingerprint(text: str) -> Tuple[str, int]:
+    """프로세스 풀 작업: 적재 저장소가 쓰는 content_hash / SimHash(부호 있는 64비트)"""
+    return content_hash(text), to_signed64(simhash(text))
+
+
+def normalize_content(content: str, clean: Optional[Callable[[str], str]] = None) -> Tuple[str, str, int]:
+    """프로세스 풀 작업: 본문 정리 후 지문 계산 (clean은 모듈 수준 함수여야 피클 가능)"""
+    if clean is not None:
+        content = clean(content)
+    return (content, *fingerprint(content))
+
+
+@dataclass
+class PageJob:
+    """크롤링할 기사 URL과 추출 규칙"""
+    url: str
+    content_selectors: Tuple[str, ...]
+    title_selectors: Tuple[str, ...]
+    source_type: str = "crawled"
+    source_name: str = ""
+    title: Optional[str] = None  # 검색 단계에서 알게 된 제목 (있으면 우선)
+
+
+@dataclass
+class StageStats:
+    name: str
+    workers: int
+    received: int = 0
+    emitted: int = 0
+    dropped: int = 0
+    errors: int = 0
+    busy: float = 0.0
+    started: Optional[float] = None
+    finished: Optional[float] = None
+
+    def to_dict(self) -> Dict:
+        wall = (self.finished - self.started) if self.started is not None and self.finished is not None else 0.0
+        return {
+            "workers": self.workers,
+            "received": self.received,
+            "emitted": self.emitted,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy, 3),
+            "items_per_sec": round(self.received / wall, 1) if wall > 0 else 0.0,
+        }
+
+
+@dataclass
+class PipelineResult:
+    articles: List[Dict] = field(default_factory=list)
+    saved: int = 0
+    elapsed: float = 0.0
+    stages: Dict[str, Dict] = field(default_factory=dict)
+
+
+class CrawlPipeline:
+    """경계 있는 큐로 이어진 4단계 크롤링 파이프라인
+
+    가져오기는 비동기 엔진(I/O), 파싱과 지문 계산은 프로세스 풀(CPU)에서 돌고, 저장은 묶음 단위로
+    스레드에서 실행합니다. 큐가 가득 차면 앞 단계가 기다리므로 느린 단계가 메모리를 채우지 않고,
+    단계마다 워커 수를 따로 정할 수 있습니다. 단계별 처리량은 PipelineResult.stages로 돌려줍니다.
+    """
+
+    def __init__(self, engine: AsyncCrawlEngine, repository=None, executor: Optional[Executor] = None,
+                 parse_workers: int = None, queue_size: int = None, batch_size: int = None):
+        self.engine = engine
+        self.repository = repository  # None이면 저장하지 않고 기사만 모음
+        self.executor = executor
+        self.parse_workers = parse_workers or settings.CRAWL_PARSE_WORKERS or os.cpu_count() or 1
+        self.queue_size = queue_size or settings.CRAWL_PIPELINE_QUEUE_SIZE
+        self.batch_size = batch_size or settings.INGEST_BATCH_SIZE
+
+    async def run(self, jobs: AsyncIterable[PageJob], accept: Optional[Callable[[Dict], bool]] = None,
+                  limit: Optional[int] = None, clean: Optional[Callable[[str], str]] = None) -> PipelineResult:
+        """jobs를 끝까지 처리 (clean으로 본문 정리, accept가 False인 기사는 버림, limit개를 모으면 이후 기사는 버림)"""
+        executor = self.executor or get_parse_pool()
+        loop = asyncio.get_running_loop()
+        result = PipelineResult()
+        started = time.perf_counter()
+        accepted = 0
+
+        async def fetch(job: PageJob):
+            response = await self.engine.fetch(job.url)
+            return (job, response.text) if response and response.ok else None
+
+        async def parse(item):
+            job, markup = item
+            parsed = await loop.run_in_executor(executor, parse_page, markup,
+                                                tuple(job.content_selectors), tuple(job.title_selectors))
+            return (job, parsed) if parsed else None
+
+        async def normalize(item):
+            nonlocal accepted
+            job, (title, content) = item
+            if limit is not None and accepted >= limit:
+                return None
+            content, digest, signed_simhash = await loop.run_in_executor(executor, normalize_content, content, clean)
+            article = {
+                "title": (job.title or title or "제목 없음")[:200],
+                "content": content,
+                "url": job.url,
+                "source_type": job.source_type,
+                "source_name": job.source_name,
+                "content_hash": digest,
+                "simhash": signed_simhash,
+            }
+            # 기준 확인과 개수 증가 사이에 await가 없으므로 워커 간 경쟁 없음
+            if (accept and not accept(article)) or (limit is not None and accepted >= limit):
+                return None
+            accepted += 1
+            return article
+
+        stages = [
+            StageStats("fetch", self.engine.max_concurrency),
+            StageStats("parse", self.parse_workers),
+            StageStats("normalize", self.parse_workers),
+            StageStats("ingest", 1),
+        ]
+        queues = [asyncio.Queue(maxsize=self.queue_size) for _ in stages]
+        handlers = [fetch, parse, normalize]
+
+        async def feed():
+            async for job in jobs:
+                await queues[0].put(job)
+            for _ in range(stages[0].workers):
+                await queues[0].put(_DONE)
+
+        async def stage_group(index: int):
+            stats = stages[index]
+            await asyncio.gather(*(
+                self._stage(stats, queues[index], queues[index + 1], handlers[index])
+                for _ in range(stats.workers)
+            ))
+            for _ in range(stages[index + 1].workers):
+                await queues[index + 1].put(_DONE)
+
+        await asyncio.gather(
+            feed(),
+            *(stage_group(i) for i in range(len(handlers))),
+            self._ingest(stages[-1], queues[-1], result),
+        )
+
+        result.elapsed = round(time.perf_counter() - started, 2)
+        result.stages = {stats.name: stats.to_dict() for stats in stages}
+        print(f"[PIPELINE] {len(result.articles)}개 수집, {result.saved}개 저장, {result.elapsed}초")
+        for name, stats in result.stages.items():
+            print(f"   {name:<9} {stats['received']:>4}건 {stats['items_per_sec']:>7}/s "
+                  f"(버림 {stats['dropped']}, 오류 {stats['errors']})")
+        return result
+
+    async def _stage(self, stats: StageStats, inbox: asyncio.Queue, outbox: asyncio.Queue, handler):
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                return
+            began = time.perf_counter()
+            if stats.started is None:
+                stats.started = began
+            stats.received += 1
+            try:
+                output = await handler(item)
+            except Exception as e:
+                stats.errors += 1
+                print(f"⚠️  [{stats.name}] 처리 실패: {e}")
+                output = None
+            stats.busy += time.perf_counter() - began
+            stats.finished = time.perf_counter()
+            if output is None:
+                stats.dropped += 1
+                continue
+            stats.emitted += 1
+            await outbox.put(output)  # 다음 단계 큐가 가득 차면 여기서 대기
+
+    async def _ingest(self, stats: StageStats, inbox: asyncio.Queue, result: PipelineResult):
+        batch: List[Dict] = []
+
+        async def flush():
+            if not batch:
+                return
+            began = time.perf_counter()
+            if self.repository is not None:
+                result.saved += await asyncio.to_thread(self.repository.insert_documents, list(batch))
+            result.articles.extend(batch)
+            stats.emitted += len(batch)
+            stats.busy += time.perf_counter() - began
+            stats.finished = time.perf_counter()
+            batch.clear()
+
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                break
+            if stats.started is None:
+                stats.started = time.perf_counter()
+            stats.received += 1
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                await flush()
+        await flush()
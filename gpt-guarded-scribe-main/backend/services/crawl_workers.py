@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""크롤링 프런티어를 비우는 워커 풀"""
+
+import threading
+import time
+from collections import Counter
+from typing import Dict, Optional
+
+from config import settings
+from services.crawl_frontier import CrawlFrontier, FrontierItem, get_crawl_frontier
+from services.web_crawler_service import UNCHANGED, WebCrawlerService
+
+
+class CrawlWorkerPool:
+    """워커 스레드가 프런티어에서 항목을 임대해 크롤링 → 저장 → 완료 기록
+
+    도메인 간격은 프런티어(crawl_domains)가 맞추므로 워커는 따로 sleep하지 않습니다.
+    같은 DB를 보는 프로세스를 여러 개 띄우면 그대로 수평 확장됩니다.
+    """
+
+    def __init__(self, frontier: Optional[CrawlFrontier] = None, crawler: Optional[WebCrawlerService] = None,
+                 workers: int = None, idle_sleep: float = 1.0):
+        self.frontier = frontier or get_crawl_frontier()
+        self.crawler = crawler or WebCrawlerService()
+        self.workers = workers or settings.FRONTIER_WORKERS
+        self.idle_sleep = idle_sleep
+        self.counts = Counter()
+        self._counts_lock = threading.Lock()
+
+    def run(self, until_empty: bool = True, stop_event: Optional[threading.Event] = None) -> Dict:
+        """워커를 띄우고 끝날 때까지 대기 (until_empty=False면 stop_event가 설정될 때까지)"""
+        stop_event = stop_event or threading.Event()
+        started = time.time()
+        threads = [
+            threading.Thread(target=self._worker, args=(until_empty, stop_event),
+                             name=f"crawl-worker-{i}", daemon=True)
+            for i in range(self.workers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        result = {**self.counts, "elapsed": round(time.time() - started, 2)}
+        print(f"[FRONTIER] 워커 종료: {result}")
+        return result
+
+    def _worker(self, until_empty: bool, stop_event: threading.Event):
+        while not stop_event.is_set():
+            items = self.frontier.lease(1)
+            if items:
+                try:
+                    self._process(items[0])
+                except Exception as e:
+                    print(f"[ERROR] 프런티어 항목 처리 오류 {items[0].url}: {e}")
+                    self._count("failed")
+                    self.frontier.complete(items[0], error=str(e))
+                continue
+            if until_empty and not self.frontier.has_work():
+                return
+            stop_event.wait(self.idle_sleep)
+
+    def _process(self, item: FrontierItem):
+        article = self.crawler.crawl_article(item.url)
+        if article is UNCHANGED:
+            self._count("unchanged")
+            self.frontier.complete(item)
+        elif not article:
+            self._count("failed")
+            self.frontier.complete(item, error="본문을 가져오지 못함")
+        else:
+            article["source_type"] = item.source_type
+            saved = self.crawler.save_to_database([article], raise_errors=True)  # DB 오류는 재시도 대상
+            self._count("saved" if saved else "duplicates")
+            self.frontier.complete(item)
+            print(f"✅ [{item.domain}] {article['title'][:50]}")
+
+    def _count(self, key: str):
+        with self._counts_lock:
+            self.counts[key] += 1
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""업로드 문서 스트리밍 추출 서비스"""
+
+import codecs
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple
+
+import PyPDF2
+from PyPDF2.generic import ArrayObject, DictionaryObject, IndirectObject, StreamObject
+from fastapi import UploadFile
+
+from config import settings
+from services.page_text_cache import get_page_text_cache
+from services.text_processor import TextProcessor
+
+PDF_TYPE = "application/pdf"
+TEXT_TYPE = "text/plain"
+DOCX_TYPES = [
+    "application/msword",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+]
+
+# 추출 방식이 바뀌면 올려서 기존 캐시를 무효화
+PAGE_CACHE_VERSION = b"pdf-page-text:v2:"
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """문서 추출용 프로세스 풀 (프로세스당 하나만 생성)"""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=settings.PDF_EXTRACTION_WORKERS or None)
+        return _process_pool
+
+
+def _hash_pdf_object(obj, digest, memo: Dict[Tuple[int, int], bytes]):
+    """PDF 객체를 결정적으로 직렬화해 digest에 반영 (간접 객체는 문서 안에서 한 번만 계산)"""
+    if isinstance(obj, IndirectObject):
+        ref = (obj.idnum, obj.generation)
+        if ref not in memo:
+            memo[ref] = b"cycle"  # 순환 참조 방지 (XObject가 자기 리소스를 다시 참조하는 경우 등)
+            sub = hashlib.sha256()
+            _hash_pdf_object(obj.get_object(), sub, memo)
+            memo[ref] = sub.digest()
+        digest.update(b"R" + memo[ref])
+    elif isinstance(obj, DictionaryObject):
+        digest.update(b"<<")
+        for key in sorted(obj.keys()):
+            digest.update(key.encode("utf-8"))
+            _hash_pdf_object(obj.raw_get(key), digest, memo)
+        digest.update(b">>")
+        if isinstance(obj, StreamObject):
+            data = obj.get_data()
+            digest.update(b"stream%d:" % len(data) + data)
+    elif isinstance(obj, ArrayObject):
+        digest.update(b"[")
+        for item in obj:
+            _hash_pdf_object(item, digest, memo)
+        digest.update(b"]")
+    else:
+        digest.update(repr(obj).encode("utf-8") + b" ")
+
+
+def page_content_hash(page: PyPDF2.PageObject, memo: Optional[Dict[Tuple[int, int], bytes]] = None) -> str:
+    """페이지 추출 결과를 결정하는 내용의 해시 (같은 키면 같은 텍스트)
+
+    콘텐츠 스트림만으로는 부족합니다. `/Fm0 Do`처럼 Form XObject를 그리거나 같은 글리프 ID를
+    다른 폰트(ToUnicode CMap)로 쓰는 페이지는 스트림이 같아도 텍스트가 다르므로,
+    /Resources(폰트, CMap, XObject를 재귀적으로)와 /Rotate도 함께 해시합니다.
+    memo를 넘기면 여러 페이지가 공유하는 폰트/XObject는 한 번만 해시합니다.
+    """
+    memo = {} if memo is None else memo
+    digest = hashlib.sha256(PAGE_CACHE_VERSION)
+    contents = page.get_contents()
+    if contents is not None:
+        streams = contents if isinstance(contents, ArrayObject) else [contents]
+        for stream in streams:
+            digest.update(stream.get_object().get_data())
+            digest.update(b"\n")
+    for key in ("/Resources", "/Rotate"):
+        digest.update(key.encode("utf-8"))
+        _hash_pdf_object(page.raw_get(key) if key in page else None, digest, memo)
+    return digest.hexdigest()
+
+
+def _extract_pdf_pages(path: str, page_indices: List[int]) -> List[str]:
+    """프로세스 풀 작업: 지정된 페이지들의 텍스트 추출"""
+    reader = PyPDF2.PdfReader(path)
+    return [reader.pages[i].extract_text() or "" for i in page_indices]
+
+
+class FileTooLargeError(ValueError):
+    """업로드 파일이 허용 크기를 넘은 경우"""
+
+
+class DocumentExtractor:
+    """업로드 파일을 임시 파일로 스트리밍하고 페이지 단위로 텍스트를 추출"""
+
+    def __init__(self):
+        self.text_processor = TextProcessor()
+        self.page_cache = get_page_text_cache()
+
+    async def spool_upload(self, file: UploadFile, max_size: Optional[int] = None) -> tempfile.SpooledTemporaryFile:
+        """업로드를 청크 단위로 읽어 임시 파일에 기록 (작은 파일은 메모리, 큰 파일은 디스크)"""
+        max_size = max_size or settings.MAX_FILE_SIZE
+        spooled = tempfile.SpooledTemporaryFile(max_size=settings.UPLOAD_SPOOL_MAX_SIZE)
+        total = 0
+
+        try:
+            while True:
+                chunk = await file.read(settings.UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                total += len(chunk)
+                if total > max_size:
+                    raise FileTooLargeError(f"파일 크기가 너무 큽니다 (최대 {max_size // (1024 * 1024)}MB)")
+                spooled.write(chunk)
+        except Exception:
+            spooled.close()
+            raise
+
+        spooled.seek(0)
+        return spooled
+
+    def extract_text(self, fileobj: BinaryIO, content_type: str, max_chars: Optional[int] = None) -> str:
+        """파일 객체에서 텍스트 추출 (페이지를 스트리밍 정규화한 뒤 한 번만 결합)"""
+        separator = "" if content_type == TEXT_TYPE else "\n"
+        try:
+            return self.text_processor.join_stream(
+                self.iter_pages(fileobj, content_type), separator, max_chars
+            )
+        except Exception as e:
+            raise ValueError(f"텍스트 추출 실패: {str(e)}")
+
+    def iter_pages(self, fileobj: BinaryIO, content_type: str) -> Iterator[str]:
+        """파일 형식별로 페이지(또는 문단, 텍스트 청크)를 순서대로 반환"""
+        if content_type == TEXT_TYPE:
+            yield from self._iter_text_chunks(fileobj)
+        elif content_type == PDF_TYPE:
+            yield from self._iter_pdf_pages(fileobj)
+        elif content_type in DOCX_TYPES:
+            yield from self.text_processor.iter_docx_paragraphs(fileobj)
+        else:
+            raise ValueError(f"Unsupported file type: {content_type}")
+
+    def _iter_text_chunks(self, fileobj: BinaryIO) -> Iterator[str]:
+        """UTF-8 텍스트를 청크 단위로 디코딩"""
+        decoder = codecs.getincrementaldecoder('utf-8')()
+        while True:
+            chunk = fileobj.read(settings.UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+
+    def _iter_pdf_pages(self, fileobj: BinaryIO) -> Iterator[str]:
+        """PDF 페이지 추출 - 캐시에 없는 페이지만 추출하고, 많으면 프로세스 풀에서 병렬 처리"""
+        reader = PyPDF2.PdfReader(fileobj)
+        page_count = len(reader.pages)
+        memo = {}
+        keys = [page_content_hash(page, memo) for page in reader.pages]
+        missing = [i for i, key in enumerate(keys) if not self.page_cache.contains(key)]
+
+        if missing:
+            print(f"[*] PDF {page_count}페이지 중 {len(missing)}페이지 추출 필요 (나머지는 캐시 사용)")
+
+        if len(missing) < settings.PDF_PARALLEL_MIN_PAGES:
+            for i, key in enumerate(keys):
+                yield self._cached_or_extract(reader, i, key)
+            return
+
+        # 작업 프로세스가 열 수 있도록 디스크 경로가 필요
+        path = self._materialize(fileobj, suffix=".pdf")
+        futures = []
+        batch_of = {}
+        try:
+            pool = get_process_pool()
+            step = settings.PDF_PAGES_PER_TASK
+            for start in range(0, len(missing), step):
+                indices = missing[start:start + step]
+                future = pool.submit(_extract_pdf_pages, path, indices)
+                futures.append(future)
+                for position, index in enumerate(indices):
+                    batch_of[index] = (future, position)
+
+            # 페이지 순서대로 캐시 또는 작업 결과를 꺼냄
+            for i, key in enumerate(keys):
+                if i not in batch_of:
+                    yield self._cached_or_extract(reader, i, key)
+                    continue
+                future, position = batch_of[i]
+                text = future.result()[position]
+                self.page_cache.put(key, text)
+                yield text
+        finally:
+            for future in futures:
+                future.cancel()
+            os.unlink(path)
+
+    def _cached_or_extract(self, reader: PyPDF2.PdfReader, index: int, key: str) -> str:
+        """캐시된 페이지 텍스트 반환, 없으면 현재 프로세스에서 추출 후 저장"""
+        text = self.page_cache.get(key)
+        if text is None:
+            text = reader.pages[index].extract_text() or ""
+            self.page_cache.put(key, text)
+        return text
+
+    def _materialize(self, fileobj: BinaryIO, suffix: str = "") -> str:
+        """파일 객체 내용을 이름 있는 임시 파일로 복사하고 경로 반환"""
+        fileobj.seek(0)
+        with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
+            shutil.copyfileobj(fileobj, tmp, settings.UPLOAD_CHUNK_SIZE)
+            return tmp.name
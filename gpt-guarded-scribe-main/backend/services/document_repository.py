@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""document_sources 적재 저장소 (database.py의 공용 엔진 사용)"""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from collections import Counter
+from typing import Dict, List, Optional
+
+from sqlalchemy import delete, func, insert, select, tuple_, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+
+from config import settings
+from database import engine as default_engine
+from models import DocumentChunk, DocumentSimhashBand, DocumentSource
+from utils.content_codec import compress_content, compression_enabled, full_text, preview
+from services.statistics_service import get_statistics_service
+from services.text_chunker import split_chunks
+from utils.text_fingerprint import (
+    content_hash, simhash, simhash_bands, hamming_distance, to_signed64, from_signed64
+)
+
+# SQLite는 쓰기 잠금이 DB 전체 단위이므로 적재 쓰기를 한 스레드로 직렬화
+_sqlite_writer = ThreadPoolExecutor(max_workers=1, thread_name_prefix="sqlite-ingest")
+
+
+class DocumentRepository:
+    """크롤러/생성기가 수집한 문서를 일괄 저장
+
+    DATABASE_URL이 가리키는 DB에 묶음마다 INSERT 한 번으로 저장하고,
+    이미 있는 URL/본문 해시는 ON CONFLICT DO NOTHING으로 건너뜁니다.
+    SimHash 밴드 테이블로 URL만 다른 근사 중복 문서도 걸러냅니다.
+    전체 본문은 압축 블롭(content_blob)으로, content 컬럼에는 미리보기만 저장합니다.
+    문장 청크(document_chunks)는 본문을 압축 없이 다시 담으므로 트라이그램 후보 검색이
+    읽는 PostgreSQL에서만 저장합니다 (SQLite는 전체 문서를 비교하므로 청크를 쓰지 않음).
+    SQLite에서는 여러 크롤러 스레드의 쓰기를 단일 writer 큐로 보냅니다.
+    """
+
+    def __init__(self, engine: Optional[Engine] = None):
+        self.engine = engine or default_engine
+        self.table = DocumentSource.__table__
+        self.band_table = DocumentSimhashBand.__table__
+        self.chunk_table = DocumentChunk.__table__
+        # candidate_retrieval.get_retriever와 같은 조건
+        self.store_chunks = self.engine.dialect.name == "postgresql"
+
+    def insert_documents(self, documents: List[Dict]) -> int:
+        """문서 dict 목록(title, content, url, source_type) 저장 후 새로 저장된 수 반환
+
+        content_hash/simhash/chunks를 미리 계산해 넘기면 (예: 작업 프로세스에서) 다시 계산하지 않습니다.
+        """
+        rows, chunk_sources = self._build_rows(documents)
+        if not rows:
+            return 0
+
+        if self.engine.dialect.name == "sqlite":
+            return _sqlite_writer.submit(self._write_rows, rows, chunk_sources).result()
+        return self._write_rows(rows, chunk_sources)
+
+    def _write_rows(self, rows: List[Dict], chunk_sources: Dict[str, tuple]) -> int:
+        saved = 0
+        batch_size = settings.INGEST_BATCH_SIZE
+        with self.engine.begin() as conn:
+            for start in range(0, len(rows), batch_size):
+                batch = rows[start:start + batch_size]
+                if settings.SIMHASH_MAX_DISTANCE > 0:
+                    batch = self._drop_near_duplicates(conn, batch)
+                if batch:
+                    saved += self._insert_batch(conn, batch, chunk_sources)
+        if saved:
+            # 커밋된 뒤에 무효화해야 커밋 전 카운터가 스냅샷에 캐시되지 않음
+            get_statistics_service().invalidate()
+        return saved
+
+    def _build_rows(self, documents: List[Dict]):
+        """저장용 행으로 변환하고 같은 요청 안의 중복 URL/본문 제거
+
+        행과 함께 content_hash별 (전체 본문, 미리 나눈 청크 또는 None)을 돌려줍니다.
+        """
+        now = datetime.utcnow()
+        compress = compression_enabled()
+        rows = []
+        chunk_sources = {}
+        seen_urls = set()
+        seen_hashes = set()
+
+        for document in documents:
+            url = document.get("url")
+            # 크롤링 파이프라인이 미리 계산한 지문이 있으면 재사용
+            digest = document.get("content_hash") or content_hash(document["content"])
+            if (url and url in seen_urls) or digest in seen_hashes:
+                continue
+            if url:
+                seen_urls.add(url)
+            seen_hashes.add(digest)
+
+            content = document["content"]
+            compressed = compress and len(content) > settings.CONTENT_PREVIEW_CHARS
+            chunk_sources[digest] = (content, document.get("chunks"))
+            rows.append({
+                "title": document["title"],
+                "content": preview(content) if compressed else content,
+                "content_blob": compress_content(content) if compressed else None,
+                "url": url,
+                "source_type": document.get("source_type", "web"),
+                "created_at": now,
+                "updated_at": now,
+                "is_active": True,
+                "content_hash": digest,
+                "simhash": document["simhash"] if document.get("simhash") is not None
+                           else to_signed64(simhash(content)),
+            })
+        return rows, chunk_sources
+
+    def _drop_near_duplicates(self, conn, rows: List[Dict]) -> List[Dict]:
+        """밴드 값이 같은 기존 문서 중 해밍 거리가 임계값 이하인 것이 있으면 제외"""
+        max_distance = settings.SIMHASH_MAX_DISTANCE
+        keys = {
+            (band, value)
+            for row in rows
+            for band, value in enumerate(simhash_bands(from_signed64(row["simhash"])))
+        }
+
+        candidates: Dict[tuple, List[int]] = {}
+        for band, value, existing in conn.execute(
+            select(self.band_table.c.band, self.band_table.c.value, self.table.c.simhash)
+            .join(self.table, self.table.c.id == self.band_table.c.source_id)
+            .where(tuple_(self.band_table.c.band, self.band_table.c.value).in_(list(keys)))
+            .where(self.table.c.is_active == True)
+        ):
+            candidates.setdefault((band, value), []).append(from_signed64(existing))
+
+        kept = []
+        for row in rows:
+            value = from_signed64(row["simhash"])
+            nearby = [
+                existing
+                for key in enumerate(simhash_bands(value))
+                for existing in candidates.get(key, ())
+            ]
+            nearby.extend(from_signed64(other["simhash"]) for other in kept)
+            if any(hamming_distance(value, other) <= max_distance for other in nearby):
+                print(f"⚠️  근사 중복 문서 제외: {row['title'][:50]}...")
+                continue
+            kept.append(row)
+        return kept
+
+    def _insert_batch(self, conn, rows: List[Dict], chunk_sources: Dict[str, tuple]) -> int:
+        dialect = self.engine.dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = pg_insert if dialect == "postgresql" else sqlite_insert
+            stmt = (
+                dialect_insert(self.table).values(rows)
+                .on_conflict_do_nothing()
+                .returning(self.table.c.id, self.table.c.simhash, self.table.c.content_hash)
+            )
+            inserted = conn.execute(stmt).all()
+        else:
+            # ON CONFLICT를 지원하지 않는 DB: 기존 URL/해시를 한 번에 조회해 제외
+            urls = [row["url"] for row in rows if row["url"]]
+            hashes = [row["content_hash"] for row in rows]
+            existing = conn.execute(
+                select(self.table.c.url, self.table.c.content_hash)
+                .where(self.table.c.url.in_(urls) | self.table.c.content_hash.in_(hashes))
+            ).all()
+            existing_urls = {url for url, _ in existing}
+            existing_hashes = {digest for _, digest in existing}
+            rows = [
+                row for row in rows
+                if row["url"] not in existing_urls and row["content_hash"] not in existing_hashes
+            ]
+            if not rows:
+                return 0
+            conn.execute(insert(self.table).values(rows))
+            inserted = conn.execute(
+                select(self.table.c.id, self.table.c.simhash, self.table.c.content_hash)
+                .where(self.table.c.content_hash.in_([row["content_hash"] for row in rows]))
+            ).all()
+
+        row_by_hash = {row["content_hash"]: row for row in rows}
+        self._insert_bands(conn, [(source_id, signed) for source_id, signed, _ in inserted])
+        self._insert_chunks(conn, [(source_id, *chunk_sources[digest]) for source_id, _, digest in inserted])
+        get_statistics_service().record_documents_ingested(
+            conn, Counter(row_by_hash[digest]["source_type"] for _, _, digest in inserted)
+        )
+        return len(inserted)
+
+    def _insert_bands(self, conn, inserted):
+        band_rows = [
+            {"source_id": source_id, "band": band, "value": value}
+            for source_id, signed in inserted
+            for band, value in enumerate(simhash_bands(from_signed64(signed)))
+        ]
+        if band_rows:
+            conn.execute(insert(self.band_table), band_rows)
+
+    def _insert_chunks(self, conn, documents):
+        """(source_id, content, 미리 나눈 청크 또는 None) 목록을 문장 청크로 나눠 저장"""
+        if not self.store_chunks:
+            return
+        chunk_rows = [
+            {
+                "source_id": source_id,
+                "chunk_index": index,
+                "content": chunk.text,
+                "start_offset": chunk.start,
+                "end_offset": chunk.end,
+                "chunk_hash": content_hash(chunk.text),
+            }
+            for source_id, content, chunks in documents
+            for index, chunk in enumerate(split_chunks(content) if chunks is None else chunks)
+        ]
+        if chunk_rows:
+            conn.execute(insert(self.chunk_table), chunk_rows)
+
+    def backfill_fingerprints(self, batch_size: int = 500) -> Dict[str, int]:
+        """지문이 없는 기존 문서에 content_hash/simhash/밴드를 채우고 정확 중복은 비활성화"""
+        stats = {"updated": 0, "deactivated": 0}
+        last_id = 0
+
+        while True:
+            with self.engine.begin() as conn:
+                batch = conn.execute(
+                    select(self.table.c.id, self.table.c.content, self.table.c.content_blob)
+                    .where(self.table.c.id > last_id, self.table.c.content_hash.is_(None),
+                           self.table.c.is_active == True)
+                    .order_by(self.table.c.id)
+                    .limit(batch_size)
+                ).all()
+                if not batch:
+                    break
+                last_id = batch[-1].id
+
+                texts = {row.id: full_text(row.content, row.content_blob) for row in batch}
+                digests = {row_id: content_hash(text) for row_id, text in texts.items()}
+                taken = set(conn.execute(
+                    select(self.table.c.content_hash)
+                    .where(self.table.c.content_hash.in_(set(digests.values())))
+                ).scalars())
+
+                fingerprinted = []
+                for row in batch:
+                    digest = digests[row.id]
+                    if digest in taken:
+                        conn.execute(update(self.table).where(self.table.c.id == row.id).values(is_active=False))
+                        stats["deactivated"] += 1
+                        continue
+                    taken.add(digest)
+                    signed = to_signed64(simhash(texts[row.id]))
+                    conn.execute(
+                        update(self.table).where(self.table.c.id == row.id)
+                        .values(content_hash=digest, simhash=signed)
+                    )
+                    fingerprinted.append((row.id, signed))
+
+                self._insert_bands(conn, fingerprinted)
+                stats["updated"] += len(fingerprinted)
+
+        if stats["deactivated"]:
+            get_statistics_service().rebuild_source_counts()
+        return stats
+
+    def backfill_chunks(self, batch_size: int = 200) -> int:
+        """청크가 없는 활성 문서를 청크로 나눠 저장하고 처리한 문서 수 반환
+
+        청크를 쓰지 않는 DB(SQLite)에서는 예전에 만든 청크를 지우고 0을 돌려줍니다.
+        """
+        if not self.store_chunks:
+            with self.engine.begin() as conn:
+                removed = conn.execute(delete(self.chunk_table)).rowcount
+            if removed:
+                print(f"🧹 사용하지 않는 청크 {removed}개 삭제")
+            return 0
+
+        processed = 0
+        last_id = 0
+
+        # 오프셋/해시 도입 전에 만든 청크는 다시 만듦
+        with self.engine.begin() as conn:
+            conn.execute(delete(self.chunk_table).where(self.chunk_table.c.chunk_hash.is_(None)))
+
+        has_chunks = select(self.chunk_table.c.id).where(self.chunk_table.c.source_id == self.table.c.id).exists()
+
+        while True:
+            with self.engine.begin() as conn:
+                batch = conn.execute(
+                    select(self.table.c.id, self.table.c.content, self.table.c.content_blob)
+                    .where(self.table.c.id > last_id, self.table.c.is_active == True, ~has_chunks)
+                    .order_by(self.table.c.id)
+                    .limit(batch_size)
+                ).all()
+                if not batch:
+                    break
+                last_id = batch[-1].id
+                self._insert_chunks(conn, [(row.id, full_text(row.content, row.content_blob), None) for row in batch])
+                processed += len(batch)
+
+        return processed
+
+    def backfill_compression(self, batch_size: int = 200) -> int:
+        """블롭 없이 content에 긴 본문을 둔 기존 문서를 압축 블롭 + 미리보기로 바꾸고 처리한 수 반환"""
+        if not compression_enabled():
+            return 0
+        processed = 0
+        last_id = 0
+
+        while True:
+            with self.engine.begin() as conn:
+                batch = conn.execute(
+                    select(self.table.c.id, self.table.c.content)
+                    .where(self.table.c.id > last_id, self.table.c.content_blob.is_(None),
+                           func.length(self.table.c.content) > settings.CONTENT_PREVIEW_CHARS)
+                    .order_by(self.table.c.id)
+                    .limit(batch_size)
+                ).all()
+                if not batch:
+                    break
+                last_id = batch[-1].id
+                for row in batch:
+                    conn.execute(
+                        update(self.table).where(self.table.c.id == row.id)
+                        .values(content=preview(row.content), content_blob=compress_content(row.content))
+                    )
+                processed += len(batch)
+
+        return processed
+
+
+_repository: Optional[DocumentRepository] = None
+
+
+def get_document_repository() -> DocumentRepository:
+    """프로세스 공용 저장소"""
+    global _repository
+    if _repository is None:
+        _repository = DocumentRepository()
+    return _repository
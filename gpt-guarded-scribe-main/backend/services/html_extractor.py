@@ -0,0 +1,178 @@
+#!/usr/bin/env python3
+"""lxml 기반 HTML 본문/제목/링크 추출 (선택자 사전 컴파일)"""
+
+import re
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+from urllib.parse import urljoin, urlparse
+
+from lxml import etree, html as lxml_html
+
+# 본문에서 통째로 건너뛰는 요소 (BeautifulSoup 버전에서 decompose하던 태그 + 위키 잡음)
+BOILERPLATE_TAGS = frozenset({
+    "script", "style", "noscript", "nav", "footer", "header", "aside",
+    "form", "iframe", "svg", "template", "button",
+})
+BOILERPLATE_CLASSES = frozenset({"mw-editsection", "reference", "navbox", "noprint"})
+
+_COMPOUND = re.compile(r"^(?P<tag>[A-Za-z][\w-]*|\*)?(?P<rest>(?:[#.][\w-]+|\[[^\]]+\])*)$")
+_TOKEN = re.compile(r"[#.][\w-]+|\[[^\]]+\]")
+_ATTRIBUTE = re.compile(r"""^\[\s*([\w-]+)\s*(?:([*^$]?=)\s*["']?([^"'\]]*)["']?\s*)?\]$""")
+
+
+def css_to_xpath(selector: str) -> str:
+    """크롤러에서 쓰는 CSS 선택자 부분집합을 XPath로 변환
+
+    태그, #id, .class, [attr], [attr="v"], [attr*="v"], [attr^="v"], [attr$="v"]와
+    공백(자손) 결합자를 지원합니다. 그 밖의 문법은 ValueError.
+    """
+    steps = []
+    for compound in selector.split():
+        match = _COMPOUND.match(compound)
+        if not match:
+            raise ValueError(f"지원하지 않는 선택자: {selector}")
+        conditions = []
+        for token in _TOKEN.findall(match.group("rest")):
+            if token[0] == "#":
+                conditions.append(f"@id='{token[1:]}'")
+            elif token[0] == ".":
+                conditions.append(f"contains(concat(' ', normalize-space(@class), ' '), ' {token[1:]} ')")
+            else:
+                conditions.append(_attribute_condition(token, selector))
+        steps.append((match.group("tag") or "*") + "".join(f"[{condition}]" for condition in conditions))
+    if not steps:
+        raise ValueError("빈 선택자")
+    return ".//" + "//".join(steps)
+
+
+def _attribute_condition(token: str, selector: str) -> str:
+    match = _ATTRIBUTE.match(token)
+    if not match:
+        raise ValueError(f"지원하지 않는 선택자: {selector}")
+    name, operator, value = match.groups()
+    if operator is None:
+        return f"@{name}"
+    if operator == "=":
+        return f"@{name}='{value}'"
+    if operator == "*=":
+        return f"contains(@{name}, '{value}')"
+    if operator == "^=":
+        return f"starts-with(@{name}, '{value}')"
+    # $=: XPath 1.0에 ends-with가 없음
+    return f"substring(@{name}, string-length(@{name}) - {len(value) - 1}) = '{value}'"
+
+
+def _compile(selectors: Iterable[str]) -> List[etree.XPath]:
+    return [etree.XPath(css_to_xpath(selector)) for selector in selectors]
+
+
+@dataclass
+class ExtractedPage:
+    title: Optional[str]
+    content: str
+
+
+class HtmlExtractor:
+    """선택자를 생성 시 XPath로 한 번 컴파일해 두고 페이지마다 재사용
+
+    본문 텍스트는 한 번의 트리 순회에서 잡음 요소(BOILERPLATE_*)의 하위 트리를 건너뛰며
+    모으므로, 페이지 전체를 지우고 다시 훑거나 전체 텍스트에 정규식을 돌리지 않습니다.
+    """
+
+    def __init__(self, content_selectors: Iterable[str], title_selectors: Iterable[str] = ("title", "h1"),
+                 min_content_length: int = 200, fallback: bool = False):
+        self.content_xpaths = _compile(content_selectors)
+        self.title_xpaths = _compile(title_selectors)
+        self.min_content_length = min_content_length
+        self.fallback = fallback  # 선택자가 모두 실패하면 <p> 전체, 그다음 <body> 전체 사용
+        self._paragraphs = etree.XPath("//p")
+        self._links = etree.XPath("//a[@href]/@href")
+
+    def parse(self, markup: str):
+        """HTML 문자열을 트리로 (비어 있거나 파싱할 수 없으면 None)"""
+        if not markup or not markup.strip():
+            return None
+        try:
+            try:
+                return lxml_html.document_fromstring(markup)
+            except ValueError:
+                # 인코딩 선언이 있는 문자열은 bytes로 넘겨야 함
+                return lxml_html.document_fromstring(markup.encode("utf-8"),
+                                                     parser=lxml_html.HTMLParser(encoding="utf-8"))
+        except (etree.ParserError, ValueError):
+            return None
+
+    def extract(self, markup: str) -> Optional[ExtractedPage]:
+        """제목과 본문 추출 (본문이 min_content_length보다 짧으면 None)"""
+        root = self.parse(markup)
+        if root is None:
+            return None
+        content = self.content(root)
+        if len(content) < self.min_content_length:
+            return None
+        return ExtractedPage(title=self.title(root), content=content)
+
+    def title(self, root) -> Optional[str]:
+        for xpath in self.title_xpaths:
+            for element in xpath(root):
+                text = " ".join(element.text_content().split())
+                if text:
+                    return text[:200]
+        return None
+
+    def content(self, root) -> str:
+        for xpath in self.content_xpaths:
+            elements = xpath(root)
+            if elements:
+                text = " ".join(self.text(element) for element in elements)
+                if len(text) >= self.min_content_length:
+                    return text
+        if not self.fallback:
+            return ""
+
+        paragraphs = " ".join(self.text(element) for element in self._paragraphs(root))
+        if len(paragraphs) >= self.min_content_length:
+            return paragraphs
+        body = root.find("body")
+        return self.text(body if body is not None else root)
+
+    def text(self, element) -> str:
+        """잡음 요소를 건너뛰며 텍스트를 모으고 공백을 하나로 정리"""
+        parts = []
+        stack = [element]
+        while stack:
+            item = stack.pop()
+            if isinstance(item, str):  # 자식 요소 뒤에 오는 tail 텍스트
+                parts.append(item)
+                continue
+            if not isinstance(item.tag, str) or _is_boilerplate(item):
+                continue  # 주석/처리 명령 또는 잡음 요소 (tail은 이미 스택에 있음)
+            if item.text:
+                parts.append(item.text)
+            for child in reversed(item):
+                if child.tail:
+                    stack.append(child.tail)
+                stack.append(child)
+        return " ".join("".join(parts).split())
+
+    def links(self, root, base_url: str, same_domain: Optional[str] = None, limit: int = 10) -> List[str]:
+        """페이지 링크를 절대 URL로 (same_domain이 있으면 해당 도메인만, 순서 유지 중복 제거)"""
+        links = []
+        for href in self._links(root):
+            url = urljoin(base_url, href.strip()).split("#", 1)[0]
+            if not url.startswith("http"):
+                continue
+            if same_domain and same_domain not in urlparse(url).netloc:
+                continue
+            if url not in links:
+                links.append(url)
+                if len(links) >= limit:
+                    break
+        return links
+
+
+def _is_boilerplate(element) -> bool:
+    if element.tag in BOILERPLATE_TAGS:
+        return True
+    classes = element.get("class")
+    return bool(classes) and not BOILERPLATE_CLASSES.isdisjoint(classes.split())
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""재크롤링용 HTTP 디스크 캐시 (ETag / Last-Modified / 본문 해시)"""
+
+import hashlib
+import json
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Dict, Optional
+
+from config import settings
+from services.page_text_cache import PageTextCache
+
+
+@dataclass
+class ConditionalResponse:
+    """조건부 GET 결과 (changed=False면 304 또는 본문 해시 동일)"""
+    url: str
+    status_code: int
+    text: str
+    changed: bool
+    entry: Optional[Dict] = None  # 아직 저장하지 않은 새 캐시 항목 (적재 성공 후 commit)
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code in (200, 304)
+
+
+class HttpCache:
+    """URL별 검증자(ETag, Last-Modified)와 응답 본문을 디스크에 보관
+
+    저장소는 PageTextCache(LRU 크기 제한, 임시 파일 + rename 쓰기)를 그대로 쓰고
+    항목은 URL의 SHA-256을 키로 한 JSON 한 개입니다. resolve는 새 항목을 돌려주기만 하고
+    호출 쪽이 파싱/저장에 성공한 뒤 commit해야 기록됩니다 (실패한 페이지가 다음 크롤링에서
+    "변경 없음"으로 건너뛰어지지 않도록).
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.store = PageTextCache(
+            cache_dir=cache_dir or settings.HTTP_CACHE_DIR,
+            max_bytes=settings.HTTP_CACHE_MAX_BYTES if max_bytes is None else max_bytes,
+            label="HTTP",
+        )
+        self._lock = threading.Lock()
+        self.stats = {"requests": 0, "not_modified": 0, "unchanged": 0, "changed": 0,
+                      "bytes_downloaded": 0, "bytes_saved": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.store.max_bytes > 0
+
+    def get(self, url: str) -> Optional[Dict]:
+        raw = self.store.get(_key(url))
+        if raw is None:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict[str, str]:
+        headers = {}
+        if entry:
+            if entry.get("etag"):
+                headers["If-None-Match"] = entry["etag"]
+            if entry.get("last_modified"):
+                headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def resolve(self, url: str, entry: Optional[Dict], response) -> ConditionalResponse:
+        """응답을 캐시 항목과 비교해 변경 여부 판단 (200이면 새 항목을 함께 돌려줌, 저장은 commit)"""
+        if response.status_code == 304 and entry:
+            self._count("not_modified", saved=len(entry["body"].encode("utf-8")))
+            return ConditionalResponse(url, 304, entry["body"], changed=False)
+
+        body = response.content or b""
+        if response.status_code != 200:
+            self._count("changed", downloaded=len(body))
+            return ConditionalResponse(url, response.status_code, response.text, changed=True)
+
+        digest = hashlib.sha256(body).hexdigest()
+        changed = not entry or entry.get("content_hash") != digest
+        self._count("changed" if changed else "unchanged", downloaded=len(body))
+        text = response.text
+        new_entry = {
+            "url": url,
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+            "content_hash": digest,
+            "fetched_at": datetime.utcnow().isoformat(),
+            "body": text,
+        }
+        return ConditionalResponse(url, 200, text, changed=changed, entry=new_entry)
+
+    def commit(self, url: str, entry: Optional[Dict]):
+        """resolve가 돌려준 항목 저장 (페이지 적재가 끝난 뒤 호출)"""
+        if entry and self.enabled:
+            self.store.put(_key(url), json.dumps(entry, ensure_ascii=False))
+
+    def _count(self, outcome: str, downloaded: int = 0, saved: int = 0):
+        with self._lock:
+            self.stats["requests"] += 1
+            self.stats[outcome] += 1
+            self.stats["bytes_downloaded"] += downloaded
+            self.stats["bytes_saved"] += saved
+
+
+def _key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
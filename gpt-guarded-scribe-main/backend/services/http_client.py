@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""크롤러 공용 HTTP 클라이언트 (호스트별 연결 풀, 재시도, 타임아웃, 연결 재사용 지표)"""
+
+import threading
+from collections import defaultdict
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from config import settings
+from services.http_cache import ConditionalResponse, HttpCache
+
+RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+
+def build_retry() -> Retry:
+    """GET/HEAD 일시 오류 재시도 (지수 백오프, Retry-After 준수)"""
+    return Retry(
+        total=settings.HTTP_RETRIES,
+        backoff_factor=settings.HTTP_BACKOFF_FACTOR,
+        status_forcelist=RETRY_STATUSES,
+        allowed_methods=frozenset({"GET", "HEAD"}),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+
+
+class HttpClientPool:
+    """호스트마다 keep-alive 세션을 하나씩 두고 재사용
+
+    모듈 함수 requests.get은 요청마다 새 TCP/TLS 연결을 맺지만, 여기서는 같은 호스트
+    요청이 같은 세션의 연결 풀을 쓰므로 ko.wikipedia.org, namu.wiki 같은 반복 요청이
+    기존 연결을 재사용합니다. 비동기 엔진(httpx)의 연결 수도 record_async로 함께 집계합니다.
+    """
+
+    def __init__(self, pool_maxsize: int = None, cache: Optional[HttpCache] = None):
+        self.cache = cache or HttpCache()
+        self.pool_maxsize = pool_maxsize or settings.HTTP_POOL_MAXSIZE
+        self.timeout = (settings.HTTP_CONNECT_TIMEOUT, settings.HTTP_READ_TIMEOUT)
+        self._sessions: Dict[str, requests.Session] = {}
+        self._lock = threading.Lock()
+        self._async_stats = defaultdict(lambda: {"requests": 0, "new_connections": 0})
+
+    def session_for(self, host: str) -> requests.Session:
+        with self._lock:
+            session = self._sessions.get(host)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=self.pool_maxsize,
+                                      max_retries=build_retry())
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                self._sessions[host] = session
+            return session
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        return self.session_for(urlparse(url).netloc).get(url, **kwargs)
+
+    def get_conditional(self, url: str, **kwargs) -> ConditionalResponse:
+        """캐시된 ETag/Last-Modified로 조건부 GET
+
+        304이거나 본문 해시가 이전과 같으면 changed=False로 캐시 본문을 돌려주므로
+        호출 쪽은 파싱과 저장을 건너뛸 수 있습니다. 새 검증자는 저장에 성공한 뒤
+        cache.commit(url, response.entry)로 기록합니다.
+        """
+        if not self.cache.enabled:
+            response = self.get(url, **kwargs)
+            return ConditionalResponse(url, response.status_code, response.text, changed=True)
+
+        entry = self.cache.get(url)
+        headers = {**kwargs.pop("headers", {}), **self.cache.conditional_headers(entry)}
+        response = self.get(url, headers=headers, **kwargs)
+        return self.cache.resolve(url, entry, response)
+
+    def record_async(self, host: str, new_connection: bool):
+        """비동기 엔진 요청 1건 기록 (새 연결을 맺었는지 여부)"""
+        stats = self._async_stats[host]
+        stats["requests"] += 1
+        stats["new_connections"] += int(new_connection)
+
+    def metrics(self) -> Dict:
+        """호스트별 요청 수 / 새 연결 수 / 재사용률"""
+        hosts = defaultdict(lambda: {"requests": 0, "new_connections": 0})
+        with self._lock:
+            sessions = list(self._sessions.values())
+        for session in sessions:
+            for adapter in set(session.adapters.values()):
+                for key in list(adapter.poolmanager.pools.keys()):
+                    pool = adapter.poolmanager.pools.get(key)
+                    if pool is None:
+                        continue
+                    stats = hosts[pool.host]
+                    stats["requests"] += pool.num_requests
+                    stats["new_connections"] += pool.num_connections
+        for host, stats in list(self._async_stats.items()):
+            hosts[host]["requests"] += stats["requests"]
+            hosts[host]["new_connections"] += stats["new_connections"]
+
+        result = {host: _with_reuse(stats) for host, stats in sorted(hosts.items())}
+        totals = {
+            "requests": sum(stats["requests"] for stats in hosts.values()),
+            "new_connections": sum(stats["new_connections"] for stats in hosts.values()),
+        }
+        return {"hosts": result, "totals": _with_reuse(totals), "sessions": len(sessions),
+                "cache": dict(self.cache.stats)}
+
+    def close(self):
+        with self._lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+
+def _with_reuse(stats: Dict) -> Dict:
+    requests_count = stats["requests"]
+    reused = max(requests_count - stats["new_connections"], 0)
+    return {
+        **stats,
+        "reused_connections": reused,
+        "reuse_ratio": round(reused / requests_count, 3) if requests_count else 0.0,
+    }
+
+
+_http_client: Optional[HttpClientPool] = None
+
+
+def get_http_client() -> HttpClientPool:
+    """프로세스 공용 HTTP 클라이언트"""
+    global _http_client
+    if _http_client is None:
+        _http_client = HttpClientPool()
+    return _http_client
@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+"""PDF 페이지 텍스트 디스크 캐시 (LRU 크기 제한)"""
+
+import os
+import tempfile
+import threading
+from typing import Optional
+
+from config import settings
+
+
+class PageTextCache:
+    """페이지 내용 해시 -> 추출된 텍스트를 디스크에 저장하는 캐시
+
+    파일 수정 시간을 마지막 사용 시각으로 사용하며, 전체 크기가 한도를 넘으면
+    오래 사용되지 않은 항목부터 삭제합니다. 여러 프로세스가 같은 디렉토리를
+    공유해도 안전하도록 쓰기는 임시 파일 + rename으로 처리합니다.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None,
+                 label: str = "PDF 페이지"):
+        self.cache_dir = cache_dir or settings.PDF_PAGE_CACHE_DIR
+        self.max_bytes = max_bytes if max_bytes is not None else settings.PDF_PAGE_CACHE_MAX_BYTES
+        self.label = label  # 정리 로그용 이름
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None  # 처음 쓰기 시점에 계산
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        # 한 디렉토리에 파일이 몰리지 않도록 앞 두 글자로 분산
+        return os.path.join(self.cache_dir, key[:2], f"{key}.txt")
+
+    def contains(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 텍스트 반환 (없으면 None)"""
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                text = f.read()
+            os.utime(path)  # LRU 갱신
+            return text
+        except (FileNotFoundError, OSError, UnicodeDecodeError):
+            return None
+
+    def put(self, key: str, text: str):
+        """텍스트 저장 후 필요하면 오래된 항목 정리"""
+        if self.max_bytes <= 0:
+            return
+
+        path = self._path(key)
+        data = text.encode("utf-8")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        for root, _dirs, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith(".txt"):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield path, stat.st_size, stat.st_mtime
+
+    def _scan_size(self) -> int:
+        return sum(size for _path, size, _mtime in self._entries())
+
+    def _evict(self):
+        """최근 사용 순으로 정렬하여 한도의 90%까지 줄임"""
+        entries = sorted(self._entries(), key=lambda entry: entry[2])
+        total = sum(size for _path, size, _mtime in entries)
+        target = int(self.max_bytes * 0.9)
+
+        removed = 0
+        for path, size, _mtime in entries:
+            if total <= target:
+                break
+            try:
+                os.unlink(path)
+                total -= size
+                removed += 1
+            except OSError:
+                continue
+
+        self._size = total
+        print(f"[CACHE] {self.label} 캐시 정리: {removed}개 삭제, 현재 {total // 1024}KB")
+
+
+_page_text_cache: Optional[PageTextCache] = None
+
+
+def get_page_text_cache() -> PageTextCache:
+    """프로세스 공용 페이지 캐시"""
+    global _page_text_cache
+    if _page_text_cache is None:
+        _page_text_cache = PageTextCache()
+    return _page_text_cache
@@ -0,0 +1,245 @@
+#!/usr/bin/env python3
+"""PostgreSQL created_at 범위 파티션 관리 (plagiarism_checks / plagiarism_matches)"""
+
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection, Engine
+
+from config import settings
+from database import engine as default_engine
+from models import PlagiarismCheck, PlagiarismMatch
+
+PARTITIONED_TABLES = (PlagiarismCheck.__table__, PlagiarismMatch.__table__)
+
+# 부모 테이블의 파티션 목록과 경계식 ('FOR VALUES FROM (...) TO (...)')
+PARTITIONS_QUERY = text("""
+    SELECT c.relname AS name, pg_get_expr(c.relpartbound, c.oid) AS bound
+    FROM pg_inherits i
+    JOIN pg_class c ON c.oid = i.inhrelid
+    JOIN pg_class p ON p.oid = i.inhparent
+    WHERE p.relname = :table_name
+    ORDER BY c.relname
+""")
+
+# 파티션 테이블은 PK에 파티션 키가 들어가야 해서 check_id 외래 키를 둘 수 없음
+# → 검사 행 삭제 시 매치를 지우는 트리거로 ON DELETE CASCADE를 대신함
+CASCADE_TRIGGER = """
+CREATE OR REPLACE FUNCTION plagiarism_checks_delete_matches() RETURNS trigger AS $$
+BEGIN
+    DELETE FROM plagiarism_matches WHERE check_id = OLD.id;
+    RETURN OLD;
+END
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS plagiarism_checks_delete_matches ON plagiarism_checks;
+CREATE TRIGGER plagiarism_checks_delete_matches
+    AFTER DELETE ON plagiarism_checks
+    FOR EACH ROW EXECUTE FUNCTION plagiarism_checks_delete_matches();
+"""
+
+
+class PartitionManager:
+    """검사/매치 테이블을 created_at 기준 일별·월별 파티션으로 운영
+
+    기존 테이블 변환(convert)과 다음 기간 파티션 미리 만들기(ensure_partitions)를
+    담당합니다. 시작 시(database.create_tables → setup)와 beat 작업에서 ensure_partitions를
+    호출하고, 둘 다 못 돌아도 DEFAULT 파티션이 INSERT를 받아 줍니다. 파티션이 되면 보관 기간 정리는 RetentionService가 DROP TABLE로
+    처리하고, created_at 조건이 있는 조회는 해당 기간 파티션만 읽습니다.
+    """
+
+    def __init__(self, engine: Optional[Engine] = None, interval: str = None, premake: int = None):
+        self.engine = engine or default_engine
+        self.interval = interval or settings.PARTITION_INTERVAL
+        self.premake = settings.PARTITION_PREMAKE if premake is None else premake
+        if self.interval not in ("day", "month"):
+            raise ValueError(f"지원하지 않는 파티션 단위: {self.interval}")
+
+    @property
+    def available(self) -> bool:
+        return self.engine.dialect.name == "postgresql"
+
+    def is_partitioned(self, conn: Connection, table_name: str) -> bool:
+        return bool(conn.execute(text(
+            "SELECT EXISTS (SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = :name)"
+        ), {"name": table_name}).scalar())
+
+    def setup(self) -> Dict:
+        """시작 시 호출: 빈 테이블이면 바로 파티션으로 변환하고 다음 파티션을 준비"""
+        if not self.available:
+            return {"status": "skipped", "reason": "PostgreSQL 전용"}
+
+        with self.engine.connect() as conn:
+            pending = [t.name for t in PARTITIONED_TABLES if not self.is_partitioned(conn, t.name)]
+            has_rows = any(conn.execute(text(f"SELECT EXISTS (SELECT 1 FROM {name})")).scalar()
+                           for name in pending)
+
+        if pending and has_rows:
+            # 데이터가 있는 테이블 변환은 전체 복사 + 배타 잠금이라 자동으로 하지 않음
+            print(f"[PARTITION] {pending} 테이블에 데이터가 있어 변환을 건너뜀 "
+                  f"(python partition_tables.py 로 변환)")
+            return {"status": "pending", "tables": pending}
+        if pending:
+            self.convert()
+        return {"status": "ok", "created": self.ensure_partitions()}
+
+    def convert(self) -> Dict:
+        """기존 테이블을 같은 구조의 파티션 테이블로 옮김 (한 트랜잭션)"""
+        if not self.available:
+            raise RuntimeError("테이블 파티셔닝은 PostgreSQL에서만 지원합니다")
+
+        copied = {}
+        with self.engine.begin() as conn:
+            tables = [t for t in PARTITIONED_TABLES if not self.is_partitioned(conn, t.name)]
+            if not tables:
+                return {"status": "already_partitioned", "copied": copied}
+            names = [t.name for t in tables]
+            conn.execute(text(f"LOCK TABLE {', '.join(names)} IN ACCESS EXCLUSIVE MODE"))
+
+            # 1) 파티션 테이블을 만들고 데이터 복사
+            if PlagiarismMatch.__tablename__ in names:
+                # 매치가 검사와 같은 기간 파티션에 들어가도록 검사의 created_at을 따름
+                conn.execute(text(
+                    "UPDATE plagiarism_checks SET created_at = (now() AT TIME ZONE 'utc') WHERE created_at IS NULL"
+                ))
+                conn.execute(text(
+                    "UPDATE plagiarism_matches m SET created_at = c.created_at FROM plagiarism_checks c "
+                    "WHERE c.id = m.check_id AND m.created_at IS DISTINCT FROM c.created_at"
+                ))
+            sequences = {}
+            for table in tables:
+                name = table.name
+                conn.execute(text(
+                    f"UPDATE {name} SET created_at = (now() AT TIME ZONE 'utc') WHERE created_at IS NULL"
+                ))
+                conn.execute(text(
+                    f"CREATE TABLE {name}_partitioned (LIKE {name} INCLUDING DEFAULTS) "
+                    f"PARTITION BY RANGE (created_at)"
+                ))
+                conn.execute(text(f"ALTER TABLE {name}_partitioned ALTER COLUMN created_at SET NOT NULL"))
+                oldest = conn.execute(text(f"SELECT min(created_at) FROM {name}")).scalar()
+                self._create_partitions(conn, name, oldest or datetime.utcnow(),
+                                        parent=f"{name}_partitioned")
+                copied[name] = conn.execute(text(
+                    f"INSERT INTO {name}_partitioned SELECT * FROM {name}"
+                )).rowcount
+
+                # 기존 테이블을 지워도 id 시퀀스(SERIAL)가 같이 지워지지 않게 분리
+                sequence = conn.execute(text("SELECT pg_get_serial_sequence(:t, 'id')"), {"t": name}).scalar()
+                if sequence:
+                    conn.execute(text(f"ALTER SEQUENCE {sequence} OWNED BY NONE"))
+                    sequences[name] = sequence
+
+            # 2) 기존 테이블 교체 (매치가 검사를 참조하므로 매치부터)
+            for name in sorted(names, key=lambda n: n != PlagiarismMatch.__tablename__):
+                conn.execute(text(f"DROP TABLE {name}"))
+            for table in tables:
+                name = table.name
+                conn.execute(text(f"ALTER TABLE {name}_partitioned RENAME TO {name}"))
+                pk = ", ".join(dict.fromkeys([c.name for c in table.primary_key.columns] + ["created_at"]))
+                conn.execute(text(f"ALTER TABLE {name} ADD CONSTRAINT {name}_pkey PRIMARY KEY ({pk})"))
+                for index in table.indexes:
+                    index.create(conn)
+                if name in sequences:
+                    conn.execute(text(f"ALTER SEQUENCE {sequences[name]} OWNED BY {name}.id"))
+
+            conn.exec_driver_sql(CASCADE_TRIGGER)
+
+        print(f"[PARTITION] 파티션 테이블로 변환 완료: {copied}")
+        return {"status": "converted", "copied": copied}
+
+    def ensure_partitions(self, now: Optional[datetime] = None) -> List[str]:
+        """현재 기간부터 premake 기간 뒤까지 파티션이 없으면 생성"""
+        if not self.available:
+            return []
+        created = []
+        with self.engine.begin() as conn:
+            for table in PARTITIONED_TABLES:
+                if self.is_partitioned(conn, table.name):
+                    created += self._create_partitions(conn, table.name, now or datetime.utcnow())
+        if created:
+            print(f"[PARTITION] 파티션 {len(created)}개 생성: {created}")
+        return created
+
+    def list_partitions(self) -> Dict[str, List[str]]:
+        if not self.available:
+            return {}
+        with self.engine.connect() as conn:
+            return {
+                table.name: conn.execute(PARTITIONS_QUERY, {"table_name": table.name}).scalars().all()
+                for table in PARTITIONED_TABLES
+            }
+
+    def _create_partitions(self, conn: Connection, table_name: str, since: datetime,
+                           parent: str = None) -> List[str]:
+        """since가 속한 기간부터 현재 + premake 기간까지의 파티션과 DEFAULT 파티션 생성
+
+        DEFAULT 파티션은 beat가 멈춰 다음 기간 파티션이 없을 때도 INSERT가 실패하지 않게 합니다.
+        그 사이 DEFAULT에 들어간 행은 해당 기간 파티션을 만들 때 옮깁니다.
+        """
+        parent = parent or table_name
+        existing = set(conn.execute(PARTITIONS_QUERY, {"table_name": parent}).scalars())
+        default = self.default_partition_name(table_name)
+
+        last = self._period_start(datetime.utcnow())
+        for _ in range(self.premake):
+            last = self._next_period(last)
+
+        periods = []
+        start = self._period_start(since)
+        while start <= last:
+            end = self._next_period(start)
+            name = self.partition_name(table_name, start)
+            if name not in existing:
+                periods.append((name, start, end))
+            start = end
+
+        # DEFAULT에 새 기간의 행이 있으면 그대로는 파티션을 만들 수 없으므로 잠시 분리
+        detached = default in existing and periods and conn.execute(text(
+            f"SELECT EXISTS (SELECT 1 FROM {default} WHERE created_at >= :start AND created_at < :end)"
+        ), {"start": periods[0][1], "end": periods[-1][2]}).scalar()
+        if detached:
+            conn.execute(text(f"ALTER TABLE {parent} DETACH PARTITION {default}"))
+
+        created = []
+        for name, start, end in periods:
+            conn.execute(text(
+                f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {parent} "
+                f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+            ))
+            created.append(name)
+
+        if detached:
+            # 분리된 DEFAULT에는 복제 트리거가 없으므로 DELETE가 매치를 지우지 않음
+            bounds = {"start": periods[0][1], "end": periods[-1][2]}
+            moved = conn.execute(text(
+                f"INSERT INTO {parent} SELECT * FROM {default} "
+                f"WHERE created_at >= :start AND created_at < :end"
+            ), bounds).rowcount
+            conn.execute(text(f"DELETE FROM {default} WHERE created_at >= :start AND created_at < :end"), bounds)
+            conn.execute(text(f"ALTER TABLE {parent} ATTACH PARTITION {default} DEFAULT"))
+            print(f"[PARTITION] {default}의 {moved}행을 새 파티션으로 이동")
+        elif default not in existing:
+            conn.execute(text(f"CREATE TABLE IF NOT EXISTS {default} PARTITION OF {parent} DEFAULT"))
+            created.append(default)
+        return created
+
+    def partition_name(self, table_name: str, start: datetime) -> str:
+        suffix = f"{start:%Y%m%d}" if self.interval == "day" else f"{start:%Y%m}"
+        return f"{table_name}_p{suffix}"
+
+    @staticmethod
+    def default_partition_name(table_name: str) -> str:
+        return f"{table_name}_default"
+
+    def _period_start(self, value: datetime) -> datetime:
+        if self.interval == "day":
+            return datetime(value.year, value.month, value.day)
+        return datetime(value.year, value.month, 1)
+
+    def _next_period(self, start: datetime) -> datetime:
+        if self.interval == "day":
+            return start + timedelta(days=1)
+        return datetime(start.year + start.month // 12, start.month % 12 + 1, 1)
@@ -1,16 +1,82 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
-from typing import List, Optional
+from sqlalchemy.orm import Session, joinedload, load_only, selectinload, undefer
+from sqlalchemy import desc, or_, and_
+from typing import Dict, List, Optional, Set, Tuple
+import base64
 import time
 from datetime import datetime
 
 # DocumentSource 모델을 import 해야 합니다.
-from models import PlagiarismCheck, PlagiarismMatch, DocumentSource
+from models import PlagiarismCheck, DocumentSource
 from services.text_processor import TextProcessor
 from services.similarity_calculator import SimilarityCalculator
 from services.web_crawler_service import WebCrawlerService
+from services.crawl_hint_worker import get_crawl_hint_worker
 from services.ai_analysis_service import AIAnalysisService, PlagiarismContextAnalyzer
 from services.realtime_improvement_service import RealTimeImprovementService
+from services.result_writer import ResultWriter
+from services.candidate_retrieval import ChunkCandidate, get_retriever
+from services.document_repository import get_document_repository
+from services.statistics_service import get_statistics_service
+
+# 이력 조회 시 읽어오는 요약 컬럼 (original_text 등 대용량 컬럼 제외)
+HISTORY_SUMMARY_COLUMNS = (
+    PlagiarismCheck.id,
+    PlagiarismCheck.similarity_score,
+    PlagiarismCheck.status,
+    PlagiarismCheck.created_at,
+    PlagiarismCheck.processing_time,
+    PlagiarismCheck.file_name,
+    PlagiarismCheck.file_type,
+)
+
+def encode_history_cursor(check: PlagiarismCheck) -> str:
+    """이력 페이지 커서 생성 (created_at|id를 URL-safe base64로 인코딩)"""
+    raw = f"{check.created_at.isoformat()}|{check.id}"
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii")
+
+def decode_history_cursor(cursor: str) -> Tuple[datetime, str]:
+    """이력 페이지 커서 해석 (형식이 잘못되면 ValueError)"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode("ascii")).decode("utf-8")
+        created_at, check_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), check_id
+    except Exception:
+        raise ValueError("잘못된 커서 값입니다")
+
+def check_exists(db: Session, check_id: str) -> bool:
+    """검사 행이 아직 있는지 (기본 키 조회만, 캐시된 응답을 내보내기 전 확인용)"""
+    return db.query(PlagiarismCheck.id).filter(PlagiarismCheck.id == check_id).first() is not None
+
+def _word_set(text: str) -> Set[str]:
+    """단어 겹침 비교용 단어 집합 (공백 정규화 후 소문자, 2자 이상, 숫자 제외)"""
+    return {w.lower() for w in text.split() if len(w) >= 2 and not w.isdigit()}
+
+def _overlap_similarity(original_words: Set[str], source_words: Set[str]) -> Optional[float]:
+    """Jaccard 유사도 + 공통 단어 보너스 (최대 95), 임계값 미달이면 None"""
+    common = len(original_words & source_words)
+    if common == 0:
+        return None
+    union_size = len(original_words | source_words)
+    similarity = common / union_size * 100 if union_size else 0
+    # 최소 유사도 2% 이상이거나 공통 단어 2개 이상이면 매치로 인정
+    if similarity < 2 and common < 2:
+        return None
+    return min(similarity + common * 2, 95)
+
+def _adjacent_span(group: List[ChunkCandidate]) -> str:
+    """가장 점수가 높은 청크와 출처 문서에서 바로 앞뒤로 이어지는 후보 청크를 합친 본문"""
+    best = max(group, key=lambda candidate: candidate.score)
+    if best.start_offset is None:
+        return best.content
+    ordered = sorted((c for c in group if c.start_offset is not None), key=lambda c: c.start_offset)
+    index = ordered.index(best)
+    first = last = index
+    # 청크 사이에는 잘라낸 공백/줄바꿈만 있음
+    while first > 0 and 0 <= ordered[first].start_offset - ordered[first - 1].end_offset <= 2:
+        first -= 1
+    while last < len(ordered) - 1 and 0 <= ordered[last + 1].start_offset - ordered[last].end_offset <= 2:
+        last += 1
+    return " ".join(candidate.content for candidate in ordered[first:last + 1])
 
 class PlagiarismService:
     def __init__(self, db: Session):
@@ -32,6 +98,7 @@ class PlagiarismService:
             status="checking"
         )
         self.db.add(check)
+        get_statistics_service().record_check_created(self.db)
         self.db.commit()
         return check
 
@@ -53,6 +120,7 @@ class PlagiarismService:
                     status="checking"
                 )
                 self.db.add(check)
+                get_statistics_service().record_check_created(self.db)
                 self.db.commit()
             
             # 데이터베이스 연결 확인
@@ -116,77 +184,113 @@ class PlagiarismService:
                 print(f"[ERROR] '{keyword}' 크롤링 오류: {e}")
 
     def _find_matches(self, original_text: str, processed_text: str, n_grams) -> List[dict]:
-        """스마트 유사도 검사 - 간단한 키워드 기반 매칭"""
+        """스마트 유사도 검사 - 간단한 키워드 기반 매칭
+        
+        PostgreSQL에서는 트라이그램 검색으로 찾은 후보 청크만 입력 문장과 비교하고(문서 본문은 읽지 않음)
+        나머지 DB에서는 미리보기(content)에 입력 단어가 하나라도 있는 문서만 본문 전체를 풀어 비교합니다
+        (미리보기 뒤에만 겹치는 단어가 있는 긴 문서는 빠짐). 점수는 어느 쪽이든 같은 단어 겹침 공식
+        (_overlap_similarity)으로 계산하며, 청크 해시가 같은 문장은 그대로 복사된 것으로 보고 95점입니다.
+        """
+        retriever = get_retriever(self.db)
+        if retriever is not None:
+            return self._match_candidate_chunks(retriever.search(original_text))
+        
         matches = []
-        all_sources = self.db.query(DocumentSource).filter(DocumentSource.is_active == True).all()
+        # 압축 본문(content_blob)은 읽지 않고 미리보기(content)만으로 1차 선별
+        all_sources = (
+            self.db.query(DocumentSource)
+            .filter(DocumentSource.is_active == True)
+            .order_by(DocumentSource.id)
+            .all()
+        )
         
         print(f"[DB] 검색 대상 문서 수: {len(all_sources)}개")
         
-        # 텍스트 정규화: 여러 공백, 줄바꿈을 단일 공백으로 변환
-        normalized_original = ' '.join(original_text.split())
-        normalized_original_lower = normalized_original.lower()
-        
         # 입력 텍스트에서 주요 단어 추출 (2자 이상, 숫자 제외)
-        original_words = [w.lower() for w in normalized_original.split() 
-                         if len(w) >= 2 and not w.isdigit()]
-        original_word_set = set(original_words)
+        original_word_set = _word_set(original_text)
         
         print(f"[*] 추출된 단어 수: {len(original_word_set)}개 (예: {list(original_word_set)[:5]}...)")
         
-        for source in all_sources:
+        passed = [source for source in all_sources if original_word_set & _word_set(source.content)]
+        print(f"[DB] 미리보기 선별 통과: {len(passed)}/{len(all_sources)}개")
+        if passed:
+            # 통과한 문서의 블롭만 쿼리 한 번으로 읽음 (세션에 있는 같은 객체에 채워짐)
+            self.db.query(DocumentSource).options(undefer(DocumentSource.content_blob)).filter(
+                DocumentSource.id.in_([source.id for source in passed])
+            ).all()
+        
+        for source in passed:
             print(f"[*] '{source.title}' 검사 중...")
             
-            # 소스 텍스트 정규화
-            normalized_source = ' '.join(source.content.split()).lower()
-            source_words = set(w.lower() for w in normalized_source.split() 
-                              if len(w) >= 2 and not w.isdigit())
-            
+            source_words = _word_set(source.full_content)
             # 공통 단어 찾기
             common_words = original_word_set.intersection(source_words)
+            final_similarity = _overlap_similarity(original_word_set, source_words)
             
-            print(f"   공통 단어: {len(common_words)}개")
+            if final_similarity is None:
+                print(f"   유사도 낮음 (임계값 미달, 공통 단어 {len(common_words)}개)")
+                continue
             
-            if len(common_words) > 0:
-                # 유사도 계산 (Jaccard 유사도)
-                union_size = len(original_word_set.union(source_words))
-                similarity = (len(common_words) / union_size * 100) if union_size > 0 else 0
-                
-                # 추가 유사도 계산: 공통 단어 비율
-                common_ratio = len(common_words) / len(original_word_set) * 100 if original_word_set else 0
-                
-                print(f"   계산된 유사도: {similarity:.1f}% (비율: {common_ratio:.1f}%)")
-                
-                # 최소 유사도 2% 이상이거나 공통 단어 2개 이상이면 매치로 인정
-                if similarity >= 2 or len(common_words) >= 2:
-                    # 공통 단어로 매치 생성
-                    matched_text = " ".join(sorted(list(common_words))[:15])  # 상위 15개 단어
-                    
-                    # 원본 텍스트에서 공통 단어의 위치 찾기
-                    text_lower = original_text.lower()
-                    first_match_pos = 0
-                    for word in common_words:
-                        pos = text_lower.find(word.lower())
-                        if pos >= 0:
-                            first_match_pos = pos
-                            break
-                    
-                    # 최종 유사도: Jaccard 유사도 + 공통 단어 보너스
-                    final_similarity = min(similarity + (len(common_words) * 2), 95)
-                    
-                    matches.append({
-                        "matched_text": matched_text,
-                        "source_title": source.title,
-                        "source_url": source.url,
-                        "similarity_score": final_similarity,
-                        "start_index": first_match_pos,
-                        "end_index": first_match_pos + len(matched_text),
-                        "match_type": "keyword"
-                    })
-                    print(f"[OK] 매치 발견: {final_similarity:.1f}% - 공통단어: {len(common_words)}개")
-                else:
-                    print(f"   유사도 낮음 (임계값 미달)")
+            # 공통 단어로 매치 생성
+            matched_text = " ".join(sorted(list(common_words))[:15])  # 상위 15개 단어
+            
+            # 원본 텍스트에서 공통 단어의 위치 찾기
+            text_lower = original_text.lower()
+            first_match_pos = 0
+            for word in common_words:
+                pos = text_lower.find(word.lower())
+                if pos >= 0:
+                    first_match_pos = pos
+                    break
+            
+            matches.append({
+                "matched_text": matched_text,
+                "source_title": source.title,
+                "source_url": source.url,
+                "similarity_score": final_similarity,
+                "start_index": first_match_pos,
+                "end_index": first_match_pos + len(matched_text),
+                "match_type": "keyword"
+            })
+            print(f"[OK] 매치 발견: {final_similarity:.1f}% - 공통단어: {len(common_words)}개")
+        
+        print(f"[RESULT] 총 {len(matches)}개의 매치 발견")
+        return matches
+
+    def _match_candidate_chunks(self, candidates: List[ChunkCandidate]) -> List[dict]:
+        """검색된 후보 청크를 (출처, 입력 문장)마다 검증해 문장 단위 매치로 변환
+        
+        청크 해시가 입력 문장과 같으면 그대로 95점, 아니면 가장 점수가 높은 청크와 출처 문서에서
+        바로 이어지는 청크(오프셋 기준)를 합친 구간을 입력 문장과 단어 겹침으로 비교합니다.
+        제목/URL은 검색 쿼리에서 함께 가져오므로 문서 행은 읽지 않습니다.
+        """
+        groups: Dict[Tuple[int, int], List[ChunkCandidate]] = {}
+        for candidate in candidates:
+            groups.setdefault((candidate.source_id, candidate.query_start), []).append(candidate)
+        
+        print(f"[DB] 트라이그램 후보 청크 {len(candidates)}개 → 문서 {len({key[0] for key in groups})}개")
+        
+        matches = []
+        for (_, query_start), group in sorted(groups.items(), key=lambda item: (item[0][1], item[0][0])):
+            first = group[0]
+            exact = next((candidate for candidate in group if candidate.exact), None)
+            if exact is not None:
+                source_text, similarity = exact.content, 95.0
             else:
-                print(f"   공통 단어 없음")
+                source_text = _adjacent_span(group)
+                similarity = _overlap_similarity(_word_set(first.query_text), _word_set(source_text))
+                if similarity is None:
+                    continue
+            matches.append({
+                "matched_text": first.query_text,
+                "source_text": source_text,
+                "source_title": first.source_title,
+                "source_url": first.source_url,
+                "similarity_score": similarity,
+                "start_index": query_start,
+                "end_index": first.query_end,
+                "match_type": "sentence"
+            })
         
         print(f"[RESULT] 총 {len(matches)}개의 매치 발견")
         return matches
@@ -222,61 +326,10 @@ class PlagiarismService:
         return overall_similarity
 
     def _save_results(self, check_id: str, matches: List[dict], similarity_score: float, processing_time: float):
-        """결과를 데이터베이스에 저장"""
+        """결과를 데이터베이스에 저장 (검사 갱신 + 매치 일괄 INSERT를 한 트랜잭션으로)"""
         print(f"[SAVE] 결과 저장 중: check_id={check_id}, 유사도={similarity_score}%, 매치={len(matches)}개")
-        
-        check = self.db.query(PlagiarismCheck).filter(PlagiarismCheck.id == check_id).first()
-        if check:
-            print(f"[OK] 검사 객체 발견: {check.id}")
-            check.similarity_score = similarity_score
-            check.status = "completed"
-            check.processing_time = processing_time
-            check.updated_at = datetime.utcnow()
-            
-            for i, match_data in enumerate(matches, 1):
-                print(f"[*] 매치 {i} 저장 중: {match_data['source_title'][:30]}...")
-                match = PlagiarismMatch(
-                    check_id=check_id,
-                    matched_text=match_data["matched_text"],
-                    source_text=match_data["matched_text"],
-                    source_title=match_data["source_title"],
-                    source_url=match_data["source_url"],
-                    similarity_score=match_data["similarity_score"],
-                    start_index=match_data["start_index"],
-                    end_index=match_data["end_index"]
-                )
-                self.db.add(match)
-            
-            self.db.commit()
-            print(f"[OK] 저장 완료!")
-        else:
-            print(f"[ERROR] 검사 객체를 찾을 수 없음: {check_id}")
-            # 새로운 검사 객체 생성
-            check = PlagiarismCheck(
-                id=check_id,
-                original_text="",  # 원본 텍스트가 없을 경우
-                similarity_score=similarity_score,
-                status="completed",
-                processing_time=processing_time,
-                updated_at=datetime.utcnow()
-            )
-            self.db.add(check)
-            
-            for match_data in matches:
-                match = PlagiarismMatch(
-                    check_id=check_id,
-                    matched_text=match_data["matched_text"],
-                    source_text=match_data["matched_text"],
-                    source_title=match_data["source_title"],
-                    source_url=match_data["source_url"],
-                    similarity_score=match_data["similarity_score"],
-                    start_index=match_data["start_index"],
-                    end_index=match_data["end_index"]
-                )
-                self.db.add(match)
-            
-            self.db.commit()
-            print(f"[OK] 새 객체 생성 후 저장 완료!")
+        saved = ResultWriter(self.db).save(check_id, matches, similarity_score, processing_time)
+        print(f"[OK] 저장 완료! (매치 {saved}개)")
 
     def _update_check_status(self, check_id: str, status: str):
         """검사 상태 업데이트"""
@@ -284,27 +337,62 @@ class PlagiarismService:
         if check:
             check.status = status
             check.updated_at = datetime.utcnow()
+            if status == "error":
+                get_statistics_service().record_check_failed(self.db, check.created_at)
             self.db.commit()
 
-    def get_check_result(self, check_id: str) -> Optional[PlagiarismCheck]:
-        """검사 결과 조회"""
-        return self.db.query(PlagiarismCheck).filter(PlagiarismCheck.id == check_id).first()
+    def get_check_result(self, check_id: str, with_matches: bool = False) -> Optional[PlagiarismCheck]:
+        """검사 결과 조회 (with_matches=True면 매치까지 한 번의 JOIN 쿼리로 로드)"""
+        query = self.db.query(PlagiarismCheck)
+        if with_matches:
+            query = query.options(joinedload(PlagiarismCheck.matches))
+        return query.filter(PlagiarismCheck.id == check_id).first()
 
-    def get_check_history(self, limit: int = 10, offset: int = 0) -> List[PlagiarismCheck]:
-        """검사 이력 조회"""
-        return (
-            self.db.query(PlagiarismCheck)
-            .order_by(desc(PlagiarismCheck.created_at))
-            .offset(offset)
-            .limit(limit)
+    def get_check_history(self, limit: int = 10, cursor: Optional[str] = None,
+                          include_matches: bool = False) -> Tuple[List[PlagiarismCheck], Optional[str]]:
+        """검사 이력 조회 (created_at, id 기준 키셋 페이지네이션)
+        
+        요약 컬럼만 읽고(original_text 제외), 매치는 요청 시 selectinload 한 번으로 가져옵니다.
+        반환값은 (검사 목록, 다음 페이지 커서)입니다.
+        """
+        query = self.db.query(PlagiarismCheck).options(
+            load_only(*HISTORY_SUMMARY_COLUMNS)
+        )
+        if include_matches:
+            query = query.options(selectinload(PlagiarismCheck.matches))
+        
+        if cursor:
+            cursor_created_at, cursor_id = decode_history_cursor(cursor)
+            query = query.filter(
+                or_(
+                    PlagiarismCheck.created_at < cursor_created_at,
+                    and_(
+                        PlagiarismCheck.created_at == cursor_created_at,
+                        PlagiarismCheck.id < cursor_id
+                    )
+                )
+            )
+        
+        # 다음 페이지 존재 여부 확인을 위해 한 개 더 조회
+        checks = (
+            query
+            .order_by(desc(PlagiarismCheck.created_at), desc(PlagiarismCheck.id))
+            .limit(limit + 1)
             .all()
         )
+        
+        next_cursor = None
+        if len(checks) > limit:
+            checks = checks[:limit]
+            next_cursor = encode_history_cursor(checks[-1])
+        
+        return checks, next_cursor
 
     def delete_check(self, check_id: str) -> bool:
         """검사 결과 삭제"""
         check = self.db.query(PlagiarismCheck).filter(PlagiarismCheck.id == check_id).first()
         if check:
-            self.db.query(PlagiarismMatch).filter(PlagiarismMatch.check_id == check_id).delete()
+            # 매치는 ON DELETE CASCADE로 함께 삭제
             self.db.delete(check)
             self.db.commit()
             return True
@@ -339,136 +427,29 @@ class PlagiarismService:
             }
         ]
         
-        for doc_data in sample_documents:
-            # 이미 존재하는지 확인
-            existing = self.db.query(DocumentSource).filter(DocumentSource.url == doc_data["url"]).first()
-            if not existing:
-                doc = DocumentSource(
-                    title=doc_data["title"],
-                    content=doc_data["content"],
-                    source_type=doc_data["source_type"],
-                    url=doc_data["url"],
-                    is_active=True
-                )
-                self.db.add(doc)
-        
-        self.db.commit()
+        # 적재 저장소를 거쳐 지문/청크까지 함께 저장 (이미 있는 URL은 건너뜀)
+        get_document_repository().insert_documents(sample_documents)
+        self.db.commit()  # 열린 읽기 트랜잭션을 끝내 새 문서가 보이도록
         print("[OK] 기본 샘플 데이터 생성 완료")
 
     def _schedule_background_crawling(self, text: str):
-        """스마트 백그라운드 웹 크롤링 스케줄링"""
-        import threading
-        from datetime import datetime, timedelta
-        
-        # 최근 1시간 내에 크롤링했는지 확인 (중복 방지)
-        cache_key = f"crawl_cache_{hash(text[:100])}"  # 텍스트 앞부분으로 캐시 키 생성
-        
-        def background_crawl():
-            try:
-                print("[*] 스마트 백그라운드 크롤링 시작...")
-                
-                # 현재 데이터베이스 상태 확인
-                current_count = self.db.query(DocumentSource).filter(DocumentSource.is_active == True).count()
-                print(f"[*] 현재 데이터베이스: {current_count}개 문서")
-                
-                if current_count < 100:  # 100개 미만일 때만 크롤링
-                    self._crawl_additional_data_optimized(text)
-                    
-                    # 크롤링 후 상태 확인
-                    new_count = self.db.query(DocumentSource).filter(DocumentSource.is_active == True).count()
-                    added = new_count - current_count
-                    print(f"[OK] 백그라운드 크롤링 완료: {added}개 추가됨 (총 {new_count}개)")
-                else:
-                    print("[*] 충분한 데이터가 있어 크롤링 생략")
-                    
-            except Exception as e:
-                print(f"[ERROR] 백그라운드 크롤링 오류: {e}")
-        
-        # 별도 스레드에서 실행 (메인 응답에 영향 없음)
-        thread = threading.Thread(target=background_crawl, daemon=True)
-        thread.start()
-        print("[*] 스마트 백그라운드 크롤링 스케줄됨 (응답 지연 없음)")
-
-    def _crawl_additional_data_optimized(self, text: str):
-        """최적화된 웹 크롤링 (백그라운드용)"""
-        # 텍스트에서 키워드 추출 (개선된 방법)
-        import re
-        from collections import Counter
-        
-        # 한글 명사만 추출 (2-5글자)
-        korean_words = re.findall(r'[가-힣]{2,5}', text)
-        
-        # 불용어 제거 (확장된 목록)
-        stop_words = {
-            '이것', '그것', '저것', '하나', '때문', '이런', '그런', '저런', '있는', '없는', '같은', '다른',
-            '것을', '것이', '것은', '이를', '이는', '그를', '그는', '저를', '저는', '할수', '있게', '되는',
-            '하는', '되고', '있다', '있고', '없고', '같이', '처럼', '정도', '부분', '경우', '때와', '경우',
-            '사람', '여자', '남자', '아이', '학생', '선생', '이번', '다음', '저번', '지난', '올해', '작년'
-        }
-        korean_words = [word for word in korean_words if word not in stop_words and len(word) >= 2]
-        
-        # 빈도 기준으로 키워드 선택 (조건 완화)
-        word_freq = Counter(korean_words)
-        
-        # 빈도가 높은 단어 우선, 없으면 길이가 긴 단어 선택
-        frequent_words = [word for word, count in word_freq.most_common(5) if count >= 2]
-        unique_words = [word for word, count in word_freq.most_common(10) if count == 1 and len(word) >= 3]
-        
-        # 최종 키워드 선택 (빈도 높은 단어 + 긴 단어)
-        top_keywords = frequent_words[:2] + unique_words[:2]
-        top_keywords = list(set(top_keywords))[:3]  # 중복 제거 및 3개 제한
-        
-        if not top_keywords:
-            # 마지막 fallback: 텍스트에서 가장 긴 단어들 선택
-            top_keywords = sorted(set(korean_words), key=len, reverse=True)[:3]
-        
-        if not top_keywords:
-            top_keywords = ["정보", "기술", "사회"]  # 범용적인 기본 키워드
-        
-        print(f"🔍 선택된 키워드: {top_keywords}")
-        print(f"📝 원본 텍스트 미리보기: {text[:50]}...")
-        
-        for keyword in top_keywords:
-            try:
-                print(f"[*] '{keyword}' 크롤링 중...")
-                result = self.web_crawler.crawl_and_save(keyword, 3)  # 키워드당 3개 문서
-                print(f"[OK] '{keyword}' 크롤링 완료: {result.get('saved_count', 0)}개 저장")
-                
-                # 각 키워드마다 1초 대기 (서버 부하 방지)
-                import time
-                time.sleep(1)
-                
-            except Exception as e:
-                print(f"[ERROR] '{keyword}' 크롤링 오류: {e}")
-                continue
+        """크롤링 힌트를 공용 워커 큐에 넣음 (키워드 중복 제거, 응답 지연 없음)"""
+        if get_crawl_hint_worker().submit(text):
+            print("[*] 백그라운드 크롤링 힌트 등록됨")
 
     def get_database_stats(self) -> dict:
-        """데이터베이스 통계 정보"""
+        """데이터베이스 통계 정보 (유형별 문서 카운터 스냅샷, 테이블 COUNT 없음)"""
         try:
-            total_docs = self.db.query(DocumentSource).filter(DocumentSource.is_active == True).count()
-            
-            # 소스별 통계
-            wikipedia_count = self.db.query(DocumentSource).filter(
-                DocumentSource.is_active == True,
-                DocumentSource.source_type == 'wikipedia'
-            ).count()
-            
-            namuwiki_count = self.db.query(DocumentSource).filter(
-                DocumentSource.is_active == True, 
-                DocumentSource.source_type == 'namuwiki'
-            ).count()
-            
-            academic_count = self.db.query(DocumentSource).filter(
-                DocumentSource.is_active == True,
-                DocumentSource.source_type == 'academic'
-            ).count()
+            documents = get_statistics_service().snapshot()["documents"]
+            by_type = documents["by_source_type"]
+            total_docs = documents["total"]
             
             return {
                 "total_documents": total_docs,
                 "sources": {
-                    "wikipedia": wikipedia_count,
-                    "namuwiki": namuwiki_count,
-                    "academic": academic_count
+                    "wikipedia": by_type.get("wikipedia", 0),
+                    "namuwiki": by_type.get("namuwiki", 0),
+                    "academic": by_type.get("academic", 0)
                 },
                 "status": "healthy" if total_docs > 20 else "needs_more_data"
             }
@@ -479,27 +460,13 @@ class PlagiarismService:
             }
 
     def cleanup_old_data(self, days_old: int = 30):
-        """오래된 데이터 정리"""
-        from datetime import datetime, timedelta
+        """오래된 데이터 정리 (RetentionService로 배치 삭제)"""
+        from services.retention_service import RetentionService
         
-        cutoff_date = datetime.now() - timedelta(days=days_old)
-        
-        # 오래된 검사 결과 삭제
-        old_checks = self.db.query(PlagiarismCheck).filter(
-            PlagiarismCheck.created_at < cutoff_date
-        ).all()
-        
-        deleted_count = 0
-        for check in old_checks:
-            # 관련 매치 먼저 삭제
-            self.db.query(PlagiarismMatch).filter(PlagiarismMatch.check_id == check.id).delete()
-            self.db.delete(check)
-            deleted_count += 1
-        
-        self.db.commit()
-        print(f"[*] {deleted_count}개의 오래된 검사 결과 정리 완료")
+        result = RetentionService(self.db.get_bind()).purge_older_than(days_old)
+        print(f"[*] {result.deleted_checks}개의 오래된 검사 결과 정리 완료")
         
-        return deleted_count
+        return result.deleted_checks
 
     def _check_sentence_similarity(self, original_sentences: List[str], source_content: str, source) -> List[dict]:
         """문장 단위 유사도 검사"""
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""검사 결과 응답 형태 조정 (원문 생략/압축, 출처 테이블, msgpack, gzip/brotli)"""
+
+import base64
+import gzip
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성
+    brotli = None
+
+try:
+    import msgpack
+except ImportError:  # 선택 의존성
+    msgpack = None
+
+TEXT_MODES = ("full", "omit", "gzip")
+SOURCE_MODES = ("inline", "table")
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+
+@dataclass(frozen=True)
+class ResponseShape:
+    """클라이언트가 요청한 응답 형태"""
+    text_mode: str = "full"
+    source_mode: str = "inline"
+    media_type: str = JSON_MEDIA_TYPE
+    encoding: str = "identity"
+
+    def cache_key(self, check_id: str) -> str:
+        """형태별로 별도 캐시 항목을 사용 (ETag도 형태마다 다름)"""
+        return f"{check_id}:{self.text_mode}.{self.source_mode}.{self.media_type}.{self.encoding}"
+
+    def headers(self) -> Dict[str, str]:
+        headers = {"Vary": "Accept, Accept-Encoding"}
+        if self.encoding != "identity":
+            headers["Content-Encoding"] = self.encoding
+        return headers
+
+
+def negotiate_shape(text_mode: str = "full", source_mode: str = "inline",
+                    accept: Optional[str] = None, accept_encoding: Optional[str] = None) -> ResponseShape:
+    """쿼리 파라미터와 Accept/Accept-Encoding 헤더로 응답 형태 결정"""
+    if text_mode not in TEXT_MODES:
+        raise ValueError(f"text는 {', '.join(TEXT_MODES)} 중 하나여야 합니다")
+    if source_mode not in SOURCE_MODES:
+        raise ValueError(f"sources는 {', '.join(SOURCE_MODES)} 중 하나여야 합니다")
+
+    media_type = JSON_MEDIA_TYPE
+    accept = (accept or "").lower()
+    if msgpack is not None and any(mt in accept for mt in MSGPACK_MEDIA_TYPES):
+        media_type = MSGPACK_MEDIA_TYPES[0]
+
+    encodings = _parse_accept_encoding(accept_encoding)
+    encoding = "identity"
+    if brotli is not None and "br" in encodings:
+        encoding = "br"
+    elif "gzip" in encodings:
+        encoding = "gzip"
+
+    return ResponseShape(text_mode, source_mode, media_type, encoding)
+
+
+def _parse_accept_encoding(header: Optional[str]) -> List[str]:
+    encodings = []
+    for part in (header or "").split(","):
+        name, _, params = part.strip().partition(";")
+        if not name:
+            continue
+        if params.strip().replace(" ", "") in ("q=0", "q=0.0"):
+            continue
+        encodings.append(name.strip().lower())
+    return encodings
+
+
+def shape_payload(payload: dict, shape: ResponseShape) -> dict:
+    """응답 dict에 원문 처리/출처 테이블 적용"""
+    payload = dict(payload)
+
+    original_text = payload.get("original_text") or ""
+    if shape.text_mode == "omit":
+        payload.pop("original_text", None)
+        payload["original_text_length"] = len(original_text)
+    elif shape.text_mode == "gzip":
+        compressed = gzip.compress(original_text.encode("utf-8"))
+        payload["original_text"] = base64.b64encode(compressed).decode("ascii")
+        payload["original_text_encoding"] = "gzip+base64"
+
+    if shape.source_mode == "table":
+        payload["sources"], payload["matches"] = _build_source_table(payload.get("matches") or [])
+
+    return payload
+
+
+def _build_source_table(matches: List[dict]) -> Tuple[List[dict], List[dict]]:
+    """매치마다 반복되는 출처 제목/URL을 테이블로 분리하고 인덱스로 참조"""
+    sources = []
+    source_index = {}
+    compact_matches = []
+
+    for match in matches:
+        key = (match.get("source_title"), match.get("source_url"))
+        index = source_index.get(key)
+        if index is None:
+            index = len(sources)
+            source_index[key] = index
+            sources.append({"title": key[0], "url": key[1]})
+
+        compact = {k: v for k, v in match.items() if k not in ("source_title", "source_url")}
+        compact["source_index"] = index
+        compact_matches.append(compact)
+
+    return sources, compact_matches
+
+
+def render_payload(payload: dict, shape: ResponseShape) -> bytes:
+    """직렬화 후 협상된 인코딩으로 압축"""
+    if shape.media_type == JSON_MEDIA_TYPE:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    else:
+        body = msgpack.packb(payload, use_bin_type=True)
+
+    return compress_body(body, shape.encoding)
+
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6)
+    return body
+
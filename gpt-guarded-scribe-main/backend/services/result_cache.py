@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""완료된 표절 검사 결과 응답 캐시 (프로세스 내 LRU + 선택적 Redis)"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional
+
+from config import settings
+
+
+@dataclass
+class CachedResult:
+    """직렬화된 응답 본문과 ETag"""
+    body: bytes
+    etag: str
+
+
+def make_etag(body: bytes) -> str:
+    """응답 본문으로 강한 ETag 생성"""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+class ResultCache:
+    """완료된 검사 결과는 바뀌지 않으므로 직렬화된 JSON을 그대로 보관
+
+    1차로 프로세스 메모리(LRU), 2차로 Redis를 사용합니다. Redis를 쓸 수 없으면
+    메모리 캐시만으로 동작합니다. 삭제된 검사의 무효화가 다른 워커의 메모리 캐시에는
+    전달되지 않으므로, 조회 경로는 캐시 적중 시에도 검사 행이 남아 있는지 확인합니다.
+    """
+
+    KEY_PREFIX = "plagiarism:result:"
+
+    def __init__(self, max_entries: Optional[int] = None, ttl: Optional[int] = None,
+                 redis_url: Optional[str] = None):
+        self.max_entries = max_entries or settings.RESULT_CACHE_MAX_ENTRIES
+        self.ttl = ttl or settings.RESULT_CACHE_TTL
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._redis = self._connect_redis(redis_url) if redis_url else None
+
+    def _connect_redis(self, redis_url: str):
+        try:
+            import redis
+            client = redis.Redis.from_url(redis_url, socket_timeout=0.5, socket_connect_timeout=0.5)
+            client.ping()
+            print(f"[CACHE] 결과 캐시 Redis 연결: {redis_url}")
+            return client
+        except Exception as e:
+            print(f"[CACHE] Redis 사용 불가, 메모리 캐시만 사용: {e}")
+            return None
+
+    def get(self, key: str) -> Optional[CachedResult]:
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                result, expires_at = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    return result
+                del self._entries[key]
+
+        if self._redis is None:
+            return None
+
+        try:
+            body = self._redis.get(self.KEY_PREFIX + key)
+        except Exception as e:
+            print(f"[CACHE] Redis 조회 실패: {e}")
+            return None
+        if body is None:
+            return None
+
+        result = CachedResult(body=body, etag=make_etag(body))
+        self._remember(key, result)
+        return result
+
+    def set(self, key: str, body: bytes) -> CachedResult:
+        result = CachedResult(body=body, etag=make_etag(body))
+        self._remember(key, result)
+
+        if self._redis is not None:
+            try:
+                self._redis.set(self.KEY_PREFIX + key, body, ex=self.ttl)
+            except Exception as e:
+                print(f"[CACHE] Redis 저장 실패: {e}")
+        return result
+
+    def invalidate(self, check_id: str):
+        """검사 ID에 속한 모든 응답 형태의 캐시 삭제 (키 형식: '{check_id}:{형태}')"""
+        prefix = f"{check_id}:"
+        with self._lock:
+            for key in [k for k in self._entries if k == check_id or k.startswith(prefix)]:
+                del self._entries[key]
+
+        if self._redis is not None:
+            try:
+                keys = list(self._redis.scan_iter(match=f"{self.KEY_PREFIX}{prefix}*"))
+                if keys:
+                    self._redis.delete(*keys)
+            except Exception as e:
+                print(f"[CACHE] Redis 삭제 실패: {e}")
+
+    def invalidate_many(self, check_ids):
+        """여러 검사의 캐시를 한 번에 삭제 (보관 기간 정리용, Redis는 키 목록을 한 번만 훑음)"""
+        check_ids = set(check_ids)
+        if not check_ids:
+            return
+        with self._lock:
+            for key in [k for k in self._entries if k.split(":", 1)[0] in check_ids]:
+                del self._entries[key]
+
+        if self._redis is not None:
+            try:
+                keys = [
+                    key for key in self._redis.scan_iter(match=f"{self.KEY_PREFIX}*", count=1000)
+                    if key.decode("utf-8")[len(self.KEY_PREFIX):].split(":", 1)[0] in check_ids
+                ]
+                for start in range(0, len(keys), 1000):
+                    self._redis.delete(*keys[start:start + 1000])
+            except Exception as e:
+                print(f"[CACHE] Redis 삭제 실패: {e}")
+
+    def _remember(self, key: str, result: CachedResult):
+        with self._lock:
+            self._entries[key] = (result, time.time() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+result_cache = ResultCache(
+    redis_url=settings.REDIS_URL if settings.RESULT_CACHE_USE_REDIS else None
+)
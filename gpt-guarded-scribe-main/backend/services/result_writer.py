@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""표절 검사 결과 일괄 저장 (multi-VALUES INSERT / PostgreSQL COPY)"""
+
+import io
+from datetime import datetime
+from typing import Dict, List
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session
+
+from config import settings
+from models import PlagiarismCheck, PlagiarismMatch
+from services.statistics_service import get_statistics_service
+
+MATCH_COLUMNS = (
+    "check_id", "matched_text", "source_text", "source_title", "source_url",
+    "similarity_score", "start_index", "end_index", "created_at",
+)
+
+
+class ResultWriter:
+    """검사 상태 갱신, 매치 저장, 일별 통계 증가를 한 트랜잭션에서 처리
+
+    ORM 객체를 매치마다 만들지 않고 행 dict를 모아 executemany로 INSERT 합니다.
+    PostgreSQL(psycopg2)에서 매치가 많으면 COPY로 전송합니다.
+    """
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def save(self, check_id: str, matches: List[dict], similarity_score: float,
+             processing_time: float) -> int:
+        """검사 결과 저장 후 저장된 매치 수 반환"""
+        now = datetime.utcnow()
+
+        stats = get_statistics_service()
+        try:
+            # 매치 created_at은 검사의 created_at (파티션 테이블에서 검사와 같은 기간 파티션에 들어감)
+            check_created_at = self.db.scalar(
+                select(PlagiarismCheck.created_at).where(PlagiarismCheck.id == check_id)
+            ) or now
+            rows = [self._match_row(check_id, match, check_created_at) for match in matches]
+            result = self.db.execute(
+                update(PlagiarismCheck)
+                .where(PlagiarismCheck.id == check_id)
+                .values(
+                    similarity_score=similarity_score,
+                    status="completed",
+                    processing_time=processing_time,
+                    updated_at=now
+                )
+            )
+            if result.rowcount == 0:
+                print(f"[!] 검사 객체를 찾을 수 없어 새로 생성: {check_id}")
+                self.db.execute(
+                    insert(PlagiarismCheck).values(
+                        id=check_id,
+                        original_text="",  # 원본 텍스트가 없을 경우
+                        similarity_score=similarity_score,
+                        status="completed",
+                        processing_time=processing_time,
+                        created_at=check_created_at,
+                        updated_at=now
+                    )
+                )
+                stats.record_check_created(self.db)
+
+            if rows:
+                if self._can_copy(len(rows)):
+                    self._copy_matches(rows)
+                else:
+                    self._insert_matches(rows)
+
+            stats.record_check_completed(self.db, similarity_score, processing_time, check_created_at)
+            self.db.commit()
+        except Exception:
+            self.db.rollback()
+            raise
+
+        # 세션에 남아 있는 검사 객체가 새 값을 다시 읽도록 만료 처리
+        self.db.expire_all()
+        return len(rows)
+
+    def _match_row(self, check_id: str, match: dict, created_at: datetime) -> Dict:
+        return {
+            "check_id": check_id,
+            "matched_text": match["matched_text"],
+            "source_text": match.get("source_text", match["matched_text"]),
+            "source_title": match["source_title"],
+            "source_url": match["source_url"],
+            "similarity_score": match["similarity_score"],
+            "start_index": match["start_index"],
+            "end_index": match["end_index"],
+            "created_at": created_at,
+        }
+
+    def _insert_matches(self, rows: List[Dict]):
+        """Core INSERT executemany (SQLAlchemy가 묶음 단위 multi-VALUES로 전송)"""
+        table = PlagiarismMatch.__table__
+        batch_size = settings.BULK_INSERT_BATCH_SIZE
+        for start in range(0, len(rows), batch_size):
+            self.db.execute(insert(table), rows[start:start + batch_size])
+
+    def _can_copy(self, row_count: int) -> bool:
+        bind = self.db.get_bind()
+        return (
+            bind.dialect.name == "postgresql"
+            and bind.dialect.driver == "psycopg2"
+            and row_count >= settings.BULK_COPY_MIN_ROWS
+        )
+
+    def _copy_matches(self, rows: List[Dict]):
+        """PostgreSQL COPY FROM STDIN으로 매치 전송 (현재 트랜잭션 안에서 실행)"""
+        buffer = copy_csv(rows)
+
+        dbapi_connection = self.db.connection().connection
+        with dbapi_connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {PlagiarismMatch.__tablename__} ({', '.join(MATCH_COLUMNS)}) "
+                "FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+
+
+def copy_csv(rows: List[Dict]) -> io.StringIO:
+    """COPY (FORMAT csv)용 본문: 값은 모두 따옴표로 감싸고 NULL만 따옴표 없는 빈 칸
+
+    csv 형식의 기본 NULL은 따옴표 없는 빈 문자열이므로 "\\N"이나 ""도 값 그대로 들어갑니다.
+    """
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(",".join(_csv_field(row[column]) for column in MATCH_COLUMNS))
+        buffer.write("\n")
+    buffer.seek(0)
+    return buffer
+
+
+def _csv_field(value) -> str:
+    if value is None:
+        return ""
+    text = value.isoformat(sep=" ") if isinstance(value, datetime) else str(value)
+    return '"' + text.replace('"', '""') + '"'
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""오래된 검사 결과 정리 (배치 삭제 + PostgreSQL 파티션 삭제)"""
+
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional
+
+from sqlalchemy import delete, select, text
+from sqlalchemy.engine import Connection, Engine
+
+from config import settings
+from database import engine as default_engine
+from models import PlagiarismCheck, PlagiarismMatch
+from services.partition_manager import PARTITIONS_QUERY
+from services.result_cache import result_cache
+
+
+@dataclass
+class RetentionResult:
+    cutoff: datetime
+    deleted_checks: int = 0
+    batches: int = 0
+    dropped_partitions: List[str] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def to_dict(self) -> Dict:
+        result = asdict(self)
+        result["cutoff"] = self.cutoff.isoformat()
+        result["elapsed"] = round(self.elapsed, 3)
+        return result
+
+
+class RetentionService:
+    """보관 기간이 지난 plagiarism_checks를 나눠서 삭제
+
+    created_at, id 인덱스 순으로 batch_size개씩 id를 골라 지우고 배치마다
+    커밋하므로 잠금과 WAL/트랜잭션 로그가 배치 크기로 제한됩니다. 매치는
+    ON DELETE CASCADE(파티션 테이블은 트리거)로 함께 지워집니다. PostgreSQL에서
+    테이블이 created_at 범위 파티션이면(PartitionManager) 기간이 통째로 지난
+    파티션은 DROP으로 먼저 처리합니다 (지우기 전에 검사 id를 읽어 건수에 포함).
+    지운 검사는 커밋 후 결과 응답 캐시에서도 무효화합니다.
+    """
+
+    def __init__(self, engine: Optional[Engine] = None):
+        self.engine = engine or default_engine
+        self.table = PlagiarismCheck.__table__
+
+    def purge_older_than(self, days: int = None, **kwargs) -> RetentionResult:
+        days = settings.RETENTION_DAYS if days is None else days
+        return self.purge(datetime.utcnow() - timedelta(days=days), **kwargs)
+
+    def purge(self, cutoff: datetime, batch_size: int = None, pause: float = None,
+              drop_partitions: bool = None,
+              on_progress: Optional[Callable[[RetentionResult], None]] = None) -> RetentionResult:
+        """cutoff 이전 검사 결과 삭제 (배치마다 on_progress 호출)"""
+        batch_size = batch_size or settings.RETENTION_BATCH_SIZE
+        pause = settings.RETENTION_BATCH_PAUSE if pause is None else pause
+        if drop_partitions is None:
+            drop_partitions = settings.RETENTION_DROP_PARTITIONS
+
+        result = RetentionResult(cutoff=cutoff)
+        started = time.time()
+
+        if drop_partitions and self.engine.dialect.name == "postgresql":
+            dropped_ids = []
+            with self.engine.begin() as conn:
+                # 매치 파티션부터 지워야 검사 파티션이 참조 없이 지워짐
+                for table_name in ("plagiarism_matches", "plagiarism_checks"):
+                    result.dropped_partitions += self._drop_expired_partitions(conn, table_name, cutoff,
+                                                                               dropped_ids)
+            result.deleted_checks += len(dropped_ids)
+            result_cache.invalidate_many(dropped_ids)
+            if result.dropped_partitions:
+                print(f"[RETENTION] 파티션 {len(result.dropped_partitions)}개 삭제: {result.dropped_partitions}")
+
+        # 파티션 경계에 걸친 나머지(또는 파티션이 아닌 테이블)는 배치 삭제
+        ids_query = (
+            select(self.table.c.id)
+            .where(self.table.c.created_at < cutoff)
+            .order_by(self.table.c.created_at, self.table.c.id)
+            .limit(batch_size)
+        )
+        while True:
+            with self.engine.begin() as conn:
+                ids = conn.execute(ids_query).scalars().all()
+                if not ids:
+                    break
+                conn.execute(delete(self.table).where(self.table.c.id.in_(ids)))
+            result_cache.invalidate_many(ids)
+
+            result.deleted_checks += len(ids)
+            result.batches += 1
+            result.elapsed = time.time() - started
+            if on_progress:
+                on_progress(result)
+            print(f"[RETENTION] 배치 {result.batches}: 누적 {result.deleted_checks}건 삭제")
+
+            if len(ids) < batch_size:
+                break
+            if pause > 0:
+                time.sleep(pause)  # 다른 쓰기 작업이 끼어들 수 있게 양보
+
+        result.elapsed = time.time() - started
+        print(f"[RETENTION] 정리 완료: 검사 {result.deleted_checks}건, "
+              f"파티션 {len(result.dropped_partitions)}개 ({result.elapsed:.2f}s)")
+        return result
+
+    def _drop_expired_partitions(self, conn: Connection, table_name: str, cutoff: datetime,
+                                 dropped_ids: List[str]) -> List[str]:
+        """상한 경계가 cutoff 이하인 범위 파티션 DROP (DEFAULT 파티션은 제외)
+
+        검사 파티션은 지우기 전에 id를 dropped_ids에 모으고 (삭제 건수, 캐시 무효화용)
+        그 검사의 매치가 다른 파티션에 남아 있으면 함께 지움
+        """
+        dropped = []
+        for row in conn.execute(PARTITIONS_QUERY, {"table_name": table_name}).all():
+            upper = _partition_upper_bound(row.bound)
+            if upper is not None and upper <= cutoff:
+                if table_name == self.table.name:
+                    ids = conn.execute(text(f'SELECT id FROM "{row.name}"')).scalars().all()
+                    # DROP TABLE은 삭제 트리거를 거치지 않으므로 다른 파티션에 남은 매치를 직접 지움
+                    if ids:
+                        conn.execute(delete(PlagiarismMatch.__table__)
+                                     .where(PlagiarismMatch.__table__.c.check_id.in_(ids)))
+                    dropped_ids += ids
+                conn.execute(text(f'DROP TABLE IF EXISTS "{row.name}"'))
+                dropped.append(row.name)
+        return dropped
+
+
+def _partition_upper_bound(bound: str) -> Optional[datetime]:
+    """파티션 경계식의 TO 값을 datetime으로 (MAXVALUE/DEFAULT면 None)"""
+    if not bound or " TO (" not in bound:
+        return None
+    value = bound.rsplit(" TO (", 1)[1].rstrip(")").strip("'")
+    if value.upper() == "MAXVALUE":
+        return None
+    try:
+        return datetime.fromisoformat(value.split("+")[0].strip())
+    except ValueError:
+        return None
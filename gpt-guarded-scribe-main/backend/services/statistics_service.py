@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""일별 통계 카운터 (검사 완료/문서 적재 시 증가, 조회는 메모리 스냅샷)"""
+
+import threading
+import time
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Dict, Optional
+
+from sqlalchemy import case, delete, event, func, insert, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from config import settings
+from database import engine as default_engine
+from models import DailyStatistics, DocumentSource, PlagiarismCheck, SourceTypeCount
+
+
+class StatisticsService:
+    """통계 카운터 증가와 조회용 스냅샷
+
+    record_* 메서드는 호출한 쪽의 세션/연결에서 UPSERT로 카운터만 더하므로
+    검사 결과 저장, 문서 적재와 같은 트랜잭션에 묶입니다. 검사 카운터는 rollup처럼
+    검사의 created_at 날짜로 나눕니다 (자정 직전에 만들고 자정 뒤에 끝난 검사도 같은 날). 통계 API는
+    statistics / source_type_counts(작은 테이블)에서 만든 스냅샷을
+    STATS_CACHE_TTL 동안 메모리에서 바로 돌려주고 원본 테이블은 세지 않습니다.
+
+    스냅샷 무효화는 커밋 뒤에 합니다 (커밋 전 값이 다른 요청의 스냅샷에 캐시되지 않도록).
+    Session은 after_commit 훅으로 자동 처리하고, Connection을 넘긴 쪽은 트랜잭션이 끝난 뒤
+    invalidate()를 호출해야 합니다 (DocumentRepository).
+
+    카운터를 줄이지 않는 경우:
+    - 보관 기간 정리(RetentionService): 일별 검사 카운터는 그날의 활동 기록이고,
+      RETENTION_DAYS가 STATS_DAYS보다 길어 스냅샷에 나오는 날짜의 검사는 지워지지 않음
+    - 중복 문서 비활성화: backfill_fingerprints가 끝난 뒤 rebuild_source_counts()로 다시 집계
+      (적재 시 근사 중복은 비활성화가 아니라 아예 저장하지 않으므로 카운터에 더해지지 않음)
+    """
+
+    def __init__(self, engine: Optional[Engine] = None):
+        self.engine = engine or default_engine
+        self.daily = DailyStatistics.__table__
+        self.source_counts = SourceTypeCount.__table__
+        self._lock = threading.Lock()
+        self._snapshot: Optional[Dict] = None
+        self._snapshot_at = 0.0
+
+    # ---- 카운터 증가 (호출한 쪽 트랜잭션 안에서 실행) ----
+
+    def record_check_created(self, executor, count: int = 1):
+        self._add_daily(executor, total_checks=count)
+
+    def record_check_completed(self, executor, similarity_score: float, processing_time: float,
+                               check_created_at: Optional[datetime] = None):
+        """검사 완료 (완료한 날이 아니라 검사를 만든 날의 행에 더함, rollup과 같은 기준)"""
+        self._add_daily(executor, completed_checks=1,
+                        similarity_score_sum=similarity_score or 0.0,
+                        processing_time_sum=processing_time or 0.0,
+                        at=check_created_at)
+
+    def record_check_failed(self, executor, check_created_at: Optional[datetime] = None):
+        self._add_daily(executor, error_checks=1, at=check_created_at)
+
+    def record_documents_ingested(self, executor, source_types: Counter):
+        """적재된 문서 수를 일별/유형별 카운터에 더함"""
+        if not source_types:
+            return
+        self._add_daily(executor, documents_ingested=sum(source_types.values()))
+        for source_type, count in source_types.items():
+            self._upsert(executor, self.source_counts, {"source_type": source_type},
+                         {"active_count": count})
+
+    def _add_daily(self, executor, at: Optional[datetime] = None, **deltas):
+        """at(기본 지금)이 속한 날의 카운터에 deltas를 더함"""
+        now = datetime.utcnow()
+        self._upsert(executor, self.daily, {"date": (at or now).date()}, deltas,
+                     extra={"updated_at": now})
+        self._invalidate_after_commit(executor)
+
+    def _invalidate_after_commit(self, executor):
+        """세션 트랜잭션이 커밋된 뒤 스냅샷 무효화 (세션마다 리스너 한 쌍만 등록)"""
+        if not isinstance(executor, Session):
+            return
+        executor.info["stats_invalidate_pending"] = True
+        if not executor.info.get("stats_listening"):
+            executor.info["stats_listening"] = True
+            event.listen(executor, "after_commit", self._on_commit)
+            event.listen(executor, "after_soft_rollback", self._on_rollback)
+
+    def _on_commit(self, session):
+        if session.info.pop("stats_invalidate_pending", False):
+            self.invalidate()
+
+    def _on_rollback(self, session, previous_transaction):
+        if not previous_transaction.nested:  # 세이브포인트 롤백이면 바깥 트랜잭션은 계속됨
+            session.info.pop("stats_invalidate_pending", None)
+
+    def _upsert(self, executor, table, key: Dict, deltas: Dict, extra: Dict = None):
+        """key 행이 있으면 deltas만큼 더하고 없으면 deltas 값으로 생성"""
+        extra = extra or {}
+        # Session이면 바인드된 엔진, Connection이면 자체 dialect 사용
+        dialect = (getattr(executor, "dialect", None) or executor.get_bind().dialect).name
+        if dialect in ("postgresql", "sqlite"):
+            dialect_insert = pg_insert if dialect == "postgresql" else sqlite_insert
+            stmt = dialect_insert(table).values(**key, **deltas, **extra)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(key),
+                set_={**{name: table.c[name] + stmt.excluded[name] for name in deltas}, **extra},
+            )
+            executor.execute(stmt)
+            return
+
+        where = [table.c[name] == value for name, value in key.items()]
+        result = executor.execute(
+            update(table).where(*where)
+            .values(**{name: table.c[name] + value for name, value in deltas.items()}, **extra)
+        )
+        if result.rowcount == 0:
+            executor.execute(insert(table).values(**key, **deltas, **extra))
+
+    # ---- 조회 ----
+
+    def invalidate(self):
+        self._snapshot_at = 0.0
+
+    def snapshot(self, max_age: float = None) -> Dict:
+        """메모리에 캐시된 통계 (max_age초보다 오래됐으면 작은 통계 테이블에서 다시 읽음)"""
+        max_age = settings.STATS_CACHE_TTL if max_age is None else max_age
+        with self._lock:
+            if self._snapshot is None or time.time() - self._snapshot_at > max_age:
+                self._snapshot = self._load_snapshot()
+                self._snapshot_at = time.time()
+            return self._snapshot
+
+    def _load_snapshot(self) -> Dict:
+        today = datetime.utcnow().date()
+        since = today - timedelta(days=settings.STATS_DAYS - 1)
+        with self.engine.connect() as conn:
+            days = conn.execute(
+                select(self.daily).where(self.daily.c.date >= since).order_by(self.daily.c.date)
+            ).mappings().all()
+            by_type = dict(conn.execute(
+                select(self.source_counts.c.source_type, self.source_counts.c.active_count)
+                .where(self.source_counts.c.active_count > 0)
+                .order_by(self.source_counts.c.active_count.desc())
+            ).all())
+
+        daily = {row["date"]: _day_summary(row) for row in days}
+        return {
+            "generated_at": datetime.utcnow().isoformat(),
+            "documents": {
+                "total": sum(by_type.values()),
+                "by_source_type": by_type,
+            },
+            "today": daily.get(today) or _day_summary({"date": today}),
+            "daily": [
+                daily.get(day) or _day_summary({"date": day})
+                for day in (since + timedelta(days=offset) for offset in range(settings.STATS_DAYS))
+            ],
+        }
+
+    # ---- 보정 (일 1회) ----
+
+    def rollup(self, day: Optional[date] = None) -> Dict:
+        """하루치 검사 카운터를 created_at 인덱스 범위로 다시 계산하고 유형별 문서 수를 재집계
+
+        카운터 증가가 누락된 경우(프로세스 중단 등)를 맞춥니다. 유지보수 작업은 오늘과 어제만 다시 계산하므로
+        보관 기간 정리로 지워진 예전 날짜의 카운터는 그대로 남습니다.
+        """
+        day = day or datetime.utcnow().date()
+        start = datetime(day.year, day.month, day.day)
+        checks = PlagiarismCheck.__table__
+        completed = checks.c.status == "completed"
+
+        with self.engine.begin() as conn:
+            row = conn.execute(
+                select(
+                    func.count(),
+                    func.sum(case((completed, 1), else_=0)),
+                    func.sum(case((checks.c.status == "error", 1), else_=0)),
+                    func.sum(case((completed, checks.c.similarity_score), else_=0.0)),
+                    func.sum(case((completed, checks.c.processing_time), else_=0.0)),
+                )
+                .where(checks.c.created_at >= start, checks.c.created_at < start + timedelta(days=1))
+            ).one()
+            values = {
+                "total_checks": row[0] or 0,
+                "completed_checks": row[1] or 0,
+                "error_checks": row[2] or 0,
+                "similarity_score_sum": float(row[3] or 0.0),
+                "processing_time_sum": float(row[4] or 0.0),
+            }
+            updated = conn.execute(
+                update(self.daily).where(self.daily.c.date == day)
+                .values(**values, updated_at=datetime.utcnow())
+            ).rowcount
+            if not updated:
+                conn.execute(insert(self.daily).values(date=day, **values))
+
+            type_counts = self.rebuild_source_counts(conn)
+
+        self.invalidate()
+        print(f"[STATS] {day} 통계 정리: {values}, 문서 유형 {len(type_counts)}개")
+        return {"date": day.isoformat(), **values, "source_types": type_counts}
+
+    def rebuild_source_counts(self, conn=None) -> Dict[str, int]:
+        """활성 문서 부분 인덱스로 유형별 문서 수를 다시 집계"""
+        if conn is None:
+            with self.engine.begin() as conn:
+                return self.rebuild_source_counts(conn)
+
+        sources = DocumentSource.__table__
+        counts = dict(conn.execute(
+            select(sources.c.source_type, func.count())
+            .where(sources.c.is_active == True)
+            .group_by(sources.c.source_type)
+        ).all())
+        conn.execute(delete(self.source_counts))
+        if counts:
+            conn.execute(insert(self.source_counts), [
+                {"source_type": source_type, "active_count": count}
+                for source_type, count in counts.items()
+            ])
+        self.invalidate()
+        return counts
+
+
+def _day_summary(row) -> Dict:
+    completed = row.get("completed_checks") or 0
+    total = row.get("total_checks") or 0
+    return {
+        "date": row["date"].isoformat(),
+        "total_checks": total,
+        "completed_checks": completed,
+        "error_checks": row.get("error_checks") or 0,
+        "documents_ingested": row.get("documents_ingested") or 0,
+        "avg_similarity_score": round((row.get("similarity_score_sum") or 0.0) / completed, 2) if completed else 0.0,
+        "avg_processing_time": round((row.get("processing_time_sum") or 0.0) / completed, 3) if completed else 0.0,
+    }
+
+
+_statistics_service: Optional[StatisticsService] = None
+
+
+def get_statistics_service() -> StatisticsService:
+    """프로세스 공용 통계 서비스 (스냅샷 캐시 공유)"""
+    global _statistics_service
+    if _statistics_service is None:
+        _statistics_service = StatisticsService()
+    return _statistics_service
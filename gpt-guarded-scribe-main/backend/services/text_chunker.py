@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""문서를 문장 단위 청크로 분할 (원문 오프셋 유지)"""
+
+import re
+from dataclasses import dataclass
+from typing import List
+
+# TextProcessor.extract_sentences와 같은 문장 경계 + 줄바꿈
+_SENTENCE_END = re.compile(r"[.!?。！？]+|\n+")
+
+MIN_CHUNK_CHARS = 20   # 이보다 짧은 문장은 다음 문장과 합침
+MAX_CHUNK_CHARS = 400  # 이보다 긴 문장은 공백 기준으로 나눔
+
+
+@dataclass
+class TextChunk:
+    start: int
+    end: int
+    text: str
+
+
+def split_chunks(text: str, min_chars: int = MIN_CHUNK_CHARS,
+                 max_chars: int = MAX_CHUNK_CHARS) -> List[TextChunk]:
+    """문장 경계로 나누고 짧은 문장은 합치며 긴 문장은 자른 청크 목록"""
+    chunks: List[TextChunk] = []
+    pending_start = None
+
+    position = 0
+    for boundary in _SENTENCE_END.finditer(text):
+        pending_start = _emit(text, pending_start, position, boundary.end(), min_chars, max_chars, chunks)
+        position = boundary.end()
+    if position < len(text):
+        pending_start = _emit(text, pending_start, position, len(text), min_chars, max_chars, chunks)
+
+    if pending_start is not None:
+        _append(text, pending_start, len(text), max_chars, chunks)
+    return chunks
+
+
+def _emit(text, pending_start, start, end, min_chars, max_chars, chunks):
+    """start~end 문장을 처리하고 아직 내보내지 않은 시작 위치 반환"""
+    if pending_start is None:
+        pending_start = start
+    if len(text[pending_start:end].strip()) < min_chars:
+        return pending_start
+    _append(text, pending_start, end, max_chars, chunks)
+    return None
+
+
+def _append(text, start, end, max_chars, chunks):
+    # 앞뒤 공백을 오프셋에서 제외
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if start >= end:
+        return
+
+    while end - start > max_chars:
+        cut = text.rfind(" ", start, start + max_chars)
+        if cut <= start:
+            cut = start + max_chars
+        chunks.append(TextChunk(start, cut, text[start:cut]))
+        start = cut
+        while start < end and text[start].isspace():
+            start += 1
+    if start < end:
+        chunks.append(TextChunk(start, end, text[start:end]))
@@ -1,6 +1,6 @@
 import re
 import string
-from typing import List, Dict
+from typing import List, Dict, Iterable, Iterator, Optional
 import PyPDF2
 from docx import Document
 import io
@@ -34,25 +34,45 @@ class TextProcessor:
     
     def _extract_from_pdf(self, file_content: bytes) -> str:
         """PDF에서 텍스트 추출"""
-        pdf_file = io.BytesIO(file_content)
-        pdf_reader = PyPDF2.PdfReader(pdf_file)
-        
-        text = ""
-        for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        
-        return text
+        return self.join_stream(self.iter_pdf_pages(io.BytesIO(file_content)))
     
     def _extract_from_docx(self, file_content: bytes) -> str:
         """DOCX에서 텍스트 추출"""
-        doc_file = io.BytesIO(file_content)
+        return self.join_stream(self.iter_docx_paragraphs(io.BytesIO(file_content)))
+    
+    def iter_pdf_pages(self, pdf_file) -> Iterator[str]:
+        """PDF 페이지별 텍스트를 순서대로 반환"""
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        for page in pdf_reader.pages:
+            yield page.extract_text() or ""
+    
+    def iter_docx_paragraphs(self, doc_file) -> Iterator[str]:
+        """DOCX 문단별 텍스트를 순서대로 반환"""
         doc = Document(doc_file)
-        
-        text = ""
         for paragraph in doc.paragraphs:
-            text += paragraph.text + "\n"
-        
-        return text
+            yield paragraph.text
+    
+    def normalize_stream(self, pieces: Iterable[str], separator: str = "\n",
+                         max_chars: Optional[int] = None) -> Iterator[str]:
+        """페이지/문단 단위 스트리밍 정규화
+        
+        조각을 하나씩 받아 정리한 뒤 바로 넘겨주므로 전체 문서를 여러 번 복사하지 않습니다.
+        max_chars에 닿으면 마지막 조각을 남은 길이만큼 자르고 나머지 조각은 읽지 않습니다.
+        """
+        total = 0
+        for piece in pieces:
+            # NUL 문자는 PostgreSQL TEXT 컬럼에 저장할 수 없음
+            piece = piece.replace("\x00", "") + separator
+            if max_chars is not None and total + len(piece) >= max_chars:
+                yield piece[:max_chars - total]
+                break
+            yield piece
+            total += len(piece)
+    
+    def join_stream(self, pieces: Iterable[str], separator: str = "\n",
+                    max_chars: Optional[int] = None) -> str:
+        """정규화된 조각들을 한 번에 결합"""
+        return "".join(self.normalize_stream(pieces, separator, max_chars))
     
     def preprocess_text(self, text: str) -> str:
         """텍스트 전처리"""
@@ -1,18 +1,32 @@
 #!/usr/bin/env python3
 """웹 크롤링 서비스"""
 
-import requests
-from bs4 import BeautifulSoup
-import sqlite3
-from datetime import datetime
 import re
 import time
 from urllib.parse import urljoin, urlparse
-from typing import List, Dict
+from typing import List, Dict, Optional
+
+from services.crawl_frontier import get_crawl_frontier
+from services.document_repository import DocumentRepository, get_document_repository
+from services.html_extractor import HtmlExtractor
+from services.http_client import HttpClientPool, get_http_client
+
+UNCHANGED = object()  # crawl_article: 이전 크롤링 이후 바뀌지 않은 페이지
+
+# 일반 웹페이지용 추출기 (선택자는 모듈 로드 시 한 번 컴파일)
+PAGE_EXTRACTOR = HtmlExtractor(
+    content_selectors=['.content', '.article', '.post', '#content', 'main', '.main-content', 'article', '.entry-content'],
+    title_selectors=['title', 'h1', '.title', '#title', '[class*="title"]'],
+    fallback=True,
+)
 
 class WebCrawlerService:
-    def __init__(self, db_path="plagiarism.db"):
-        self.db_path = db_path
+    def __init__(self, repository: Optional[DocumentRepository] = None,
+                 http_client: Optional[HttpClientPool] = None):
+        self.repository = repository or get_document_repository()
+        self.http = http_client or get_http_client()  # 호스트별 keep-alive 세션 재사용
+        self.unchanged_urls: List[str] = []  # 마지막 crawl_search_results에서 변경 없던 URL
+        self._pending_cache: Dict[str, Dict] = {}  # URL별 저장 대기 중인 HTTP 캐시 항목
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
@@ -21,9 +35,32 @@ class WebCrawlerService:
         """Google 검색 결과를 크롤링 (시뮬레이션)"""
         print(f"🔍 '{query}' 검색 중...")
         
+        results = []
+        self.unchanged_urls = []
+        for i, url in enumerate(self.search_urls(query, num_results)):
+            try:
+                content = self.crawl_article(url)
+                if content is UNCHANGED:
+                    self.unchanged_urls.append(url)
+                    print(f"♻️  변경 없음, 건너뜀: {url}")
+                elif content and len(content.get('content', '')) > 100:
+                    results.append(content)
+                    print(f"✅ 크롤링 완료 {i+1}/{num_results}: {content['title'][:50]}...")
+                else:
+                    print(f"❌ 크롤링 실패: {url}")
+                    
+                # 요청 간 지연
+                time.sleep(1)
+                
+            except Exception as e:
+                print(f"❌ 오류: {url} - {e}")
+                
+        return results
+    
+    def search_urls(self, query: str, num_results: int = 5) -> List[str]:
+        """검색어에 대한 후보 URL 목록"""
         # 실제 환경에서는 Google Search API나 다른 검색 엔진 API 사용
         # 여기서는 시뮬레이션용으로 일반적인 웹사이트들을 크롤링
-        
         # 다양한 한국어 콘텐츠 사이트들
         sample_urls = [
             "https://ko.wikipedia.org/wiki/%EC%9D%B8%EA%B3%B5%EC%A7%80%EB%8A%A5",
@@ -38,40 +75,39 @@ class WebCrawlerService:
             "https://ko.wikipedia.org/wiki/%EA%B2%BD%EC%A0%9C",
             "https://ko.wikipedia.org/wiki/%EC%82%AC%ED%9A%8C",
         ]
-        
-        results = []
-        for i, url in enumerate(sample_urls[:num_results]):
-            try:
-                content = self.crawl_article(url)
-                if content and len(content.get('content', '')) > 100:
-                    results.append(content)
-                    print(f"✅ 크롤링 완료 {i+1}/{num_results}: {content['title'][:50]}...")
-                else:
-                    print(f"❌ 크롤링 실패: {url}")
-                    
-                # 요청 간 지연
-                time.sleep(1)
-                
-            except Exception as e:
-                print(f"❌ 오류: {url} - {e}")
-                
-        return results
+        return sample_urls[:num_results]
+
+    def enqueue_search(self, query: str, num_results: int = 5, priority: int = 0) -> int:
+        """검색 결과 URL을 크롤링 프런티어에 넣고 새로 추가된 수 반환 (크롤링은 워커가 수행)"""
+        added = get_crawl_frontier().enqueue(self.search_urls(query, num_results), priority=priority, query=query)
+        print(f"📥 '{query}' 프런티어 추가: {added}개")
+        return added
     
     def crawl_article(self, url: str) -> Dict:
-        """개별 웹페이지 크롤링"""
+        """개별 웹페이지 크롤링 (이전과 같은 페이지면 UNCHANGED)"""
         try:
-            response = requests.get(url, headers=self.headers, timeout=10)
-            response.raise_for_status()
+            response = self.http.get_conditional(url, headers=self.headers)
+            if not response.ok:
+                print(f"크롤링 오류 {url}: HTTP {response.status_code}")
+                return None
+            if not response.changed:
+                # 304 또는 본문 해시 동일: 이미 저장된 내용이므로 파싱/저장 생략
+                return UNCHANGED
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            page = PAGE_EXTRACTOR.parse(response.text)
+            if page is None:
+                return None
             
             # 제목 추출
-            title = self._extract_title(soup) or self._extract_title_from_url(url)
+            title = PAGE_EXTRACTOR.title(page) or self._extract_title_from_url(url)
             
-            # 본문 추출
-            content = self._extract_content(soup)
+            # 본문 추출 (잡음 요소를 건너뛰며 한 번에 순회)
+            content = PAGE_EXTRACTOR.content(page)
             
             if content and len(content) > 100:
+                # 검증자는 저장에 성공한 뒤 기록 (save_to_database)
+                if response.entry:
+                    self._pending_cache[url] = response.entry
                 return {
                     'title': title,
                     'content': self._clean_text(content),
@@ -84,60 +120,6 @@ class WebCrawlerService:
             
         return None
     
-    def _extract_title(self, soup: BeautifulSoup) -> str:
-        """제목 추출"""
-        # 여러 가능한 제목 선택자 시도
-        selectors = [
-            'title',
-            'h1',
-            '.title',
-            '#title',
-            '[class*="title"]'
-        ]
-        
-        for selector in selectors:
-            element = soup.select_one(selector)
-            if element and element.get_text().strip():
-                return element.get_text().strip()[:200]
-                
-        return "제목 없음"
-    
-    def _extract_content(self, soup: BeautifulSoup) -> str:
-        """본문 추출"""
-        # 불필요한 요소 제거
-        for element in soup(['script', 'style', 'nav', 'footer', 'header', 'aside']):
-            element.decompose()
-        
-        # 본문 후보들
-        content_selectors = [
-            '.content',
-            '.article',
-            '.post',
-            '#content',
-            'main',
-            '.main-content',
-            'article',
-            '.entry-content'
-        ]
-        
-        # 선택자로 본문 찾기
-        for selector in content_selectors:
-            elements = soup.select(selector)
-            if elements:
-                content = ' '.join([el.get_text() for el in elements])
-                if len(content) > 200:
-                    return content
-        
-        # 모든 p 태그 내용
-        paragraphs = soup.find_all('p')
-        if paragraphs:
-            content = ' '.join([p.get_text() for p in paragraphs])
-            if len(content) > 200:
-                return content
-        
-        # 전체 텍스트
-        return soup.get_text()
-    
     def _extract_title_from_url(self, url: str) -> str:
         """URL에서 제목 추출"""
         parsed = urlparse(url)
@@ -152,57 +134,34 @@ class WebCrawlerService:
         text = re.sub(r'\s+', ' ', text)
         # 특수 문자 정리
         text = re.sub(r'[^\w\s가-힣.,!?]', '', text)
-        # 길이 제한 (데이터베이스 저장 용량 고려)
-        return text.strip()[:5000]
+        # 길이는 자르지 않음 (저장소가 전체 본문을 압축해 저장)
+        return text.strip()
     
-    def save_to_database(self, articles: List[Dict]) -> int:
-        """크롤링된 데이터를 데이터베이스에 저장"""
+    def save_to_database(self, articles: List[Dict], raise_errors: bool = False) -> int:
+        """크롤링된 데이터를 데이터베이스에 저장 (이미 있는 URL은 건너뜀)
+
+        저장이 끝난 기사만 HTTP 캐시에 검증자를 기록합니다. 실패하면 다음 크롤링에서
+        같은 페이지를 다시 파싱/저장합니다. raise_errors=True면 DB 오류를 그대로 올립니다.
+        """
         if not articles:
             return 0
+        entries = [(article['url'], self._pending_cache.pop(article['url'], None))
+                   for article in articles if article.get('url')]
             
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            current_time = datetime.now().strftime('%Y-%m-%d %H:%M:%S.%f')
-            saved_count = 0
-            
-            for article in articles:
-                # 중복 체크
-                cursor.execute(
-                    "SELECT id FROM document_sources WHERE url = ? AND is_active = 1",
-                    (article['url'],)
-                )
-                
-                if cursor.fetchone():
-                    print(f"⚠️  이미 존재: {article['title'][:50]}...")
-                    continue
-                
-                # 저장
-                cursor.execute("""
-                    INSERT INTO document_sources 
-                    (title, content, url, source_type, created_at, updated_at, is_active)
-                    VALUES (?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    article['title'],
-                    article['content'],
-                    article['url'],
-                    article['source_type'],
-                    current_time,
-                    current_time,
-                    1
-                ))
-                saved_count += 1
-                print(f"💾 저장됨: {article['title'][:50]}...")
-            
-            conn.commit()
-            conn.close()
-            
-            return saved_count
+            saved_count = self.repository.insert_documents(articles)
+            skipped = len(articles) - saved_count
+            print(f"💾 저장됨: {saved_count}개" + (f" (⚠️  중복 {skipped}개 제외)" if skipped else ""))
             
         except Exception as e:
             print(f"❌ 데이터베이스 저장 오류: {e}")
+            if raise_errors:
+                raise
             return 0
+
+        for url, entry in entries:
+            self.http.cache.commit(url, entry)
+        return saved_count
     
     def crawl_and_save(self, query: str, num_results: int = 5) -> Dict:
         """검색하고 크롤링해서 데이터베이스에 저장"""
@@ -219,6 +178,7 @@ class WebCrawlerService:
             'query': query,
             'total_crawled': len(articles),
             'saved_count': saved_count,
+            'unchanged_count': len(self.unchanged_urls),
             'articles': [
                 {
                     'title': article['title'][:100],
@@ -229,7 +189,8 @@ class WebCrawlerService:
             ]
         }
         
-        print(f"✅ 크롤링 완료: {len(articles)}개 수집, {saved_count}개 저장")
+        print(f"✅ 크롤링 완료: {len(articles)}개 수집, {saved_count}개 저장"
+              + (f", {len(self.unchanged_urls)}개 변경 없음" if self.unchanged_urls else ""))
         return result
 
 if __name__ == "__main__":
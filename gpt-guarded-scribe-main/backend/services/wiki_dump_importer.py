@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""위키백과 XML 덤프(kowiki-*-pages-articles.xml[.bz2]) 일괄 적재"""
+
+import bz2
+import html
+import re
+import time
+from concurrent.futures import Executor
+from functools import partial
+from itertools import islice
+from typing import Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
+
+from lxml import etree
+
+from config import settings
+from services.crawl_pipeline import get_parse_pool
+from services.document_repository import get_document_repository
+from services.text_chunker import split_chunks
+from utils.text_fingerprint import content_hash, simhash, to_signed64
+
+WIKI_BASE_URL = "https://ko.wikipedia.org/wiki/"
+
+_COMMENT = re.compile(r"<!--.*?-->", re.S)
+_REF = re.compile(r"<ref[^>]*/>|<ref[^>]*>.*?</ref>", re.S | re.I)
+_BLOCK = re.compile(r"<(math|gallery|syntaxhighlight|source|pre|timeline|score|chem)\b[^>]*>.*?</\1>", re.S | re.I)
+_TEMPLATE = re.compile(r"\{\{[^{}]*\}\}")  # 가장 안쪽 틀부터 반복 제거
+_TABLE = re.compile(r"\{\|(?:(?!\{\|).)*?\|\}", re.S)  # 가장 안쪽 표부터 반복 제거
+_FILE_LINK = re.compile(r"\[\[(?:파일|그림|File|Image|분류|Category)\s*:(?:[^\[\]]|\[\[[^\[\]]*\]\])*\]\]", re.I)
+_INTERWIKI = re.compile(r"\[\[[a-z][a-z-]{1,11}:[^\[\]]*\]\]")
+_LINK = re.compile(r"\[\[(?:[^|\[\]]*\|)?([^\[\]]*)\]\]")
+_EXTERNAL = re.compile(r"\[(?:https?:)?//[^\s\]]+\s*([^\]]*)\]")
+_HEADING = re.compile(r"^(=+)\s*(.*?)\s*\1\s*$", re.M)
+_HTML_TAG = re.compile(r"</?[A-Za-z][^>]*>")
+_EMPHASIS = re.compile(r"'{2,}")
+_MAGIC_WORD = re.compile(r"__[A-Z]+__")
+_LIST_MARKER = re.compile(r"^[*#:;]+\s*", re.M)
+_DANGLING = re.compile(r"\s*[,;]\s*(?=[,;)])|\(\s*\)")  # 틀을 지우고 남은 "(한자, , AI)" 같은 구두점
+# 이 제목의 문단부터는 본문이 아님
+_TRAILING_SECTIONS = frozenset({"각주", "주석", "같이 보기", "참고 문헌", "참고 자료", "외부 링크", "출처"})
+
+
+def strip_wikitext(text: str) -> str:
+    """위키 문법을 걷어내고 문단을 줄바꿈으로 구분한 본문만 남김"""
+    text = _COMMENT.sub("", text)
+    text = _REF.sub("", text)
+    text = _BLOCK.sub("", text)
+    text = _remove_nested(_TEMPLATE, text)
+    text = _remove_nested(_TABLE, text)
+    text = _FILE_LINK.sub("", text)
+    text = _INTERWIKI.sub("", text)
+    text = _LINK.sub(r"\1", text)
+    text = _EXTERNAL.sub(r"\1", text)
+
+    for heading in _HEADING.finditer(text):
+        if heading.group(2) in _TRAILING_SECTIONS:
+            text = text[:heading.start()]
+            break
+    text = _HEADING.sub(r"\2", text)
+
+    text = _HTML_TAG.sub("", text)
+    text = _EMPHASIS.sub("", text)
+    text = _MAGIC_WORD.sub("", text)
+    text = _LIST_MARKER.sub("", html.unescape(text))
+    text = _DANGLING.sub("", text)
+
+    lines = (" ".join(line.split()) for line in text.split("\n"))
+    return "\n".join(line for line in lines if line and line[0] not in "|!{}")
+
+
+def _remove_nested(pattern: re.Pattern, text: str) -> str:
+    while True:
+        text, count = pattern.subn("", text)
+        if not count:
+            return text
+
+
+def iter_pages(path: str, limit: Optional[int] = None) -> Iterator[Tuple[str, str]]:
+    """덤프에서 일반 문서(이름공간 0, 넘겨주기 제외)의 (제목, 위키 원문)을 차례로
+
+    iterparse로 <page>가 끝날 때마다 처리하고 지우므로 덤프 크기와 관계없이 메모리가 일정합니다.
+    """
+    opener = bz2.open if path.endswith(".bz2") else open
+    count = 0
+    with opener(path, "rb") as dump:
+        for _, page in etree.iterparse(dump, events=("end",), tag="{*}page", huge_tree=True):
+            if page.findtext("{*}ns") == "0" and page.find("{*}redirect") is None:
+                title = page.findtext("{*}title") or ""
+                text = page.findtext("{*}revision/{*}text") or ""
+                if title and text:
+                    yield title, text
+                    count += 1
+            # 처리한 <page>와 앞서 지나간 형제 노드를 트리에서 떼어냄
+            page.clear(keep_tail=True)
+            parent = page.getparent()
+            while page.getprevious() is not None:
+                del parent[0]
+            if limit is not None and count >= limit:
+                return
+
+
+def prepare_page(page: Tuple[str, str], min_chars: int = 500) -> Optional[Dict]:
+    """프로세스 풀 작업: 마크업 제거 → 지문 → 청크까지 계산한 저장용 문서 (짧은 문서는 None)"""
+    title, wikitext = page
+    content = strip_wikitext(wikitext)
+    if len(content) < min_chars:
+        return None
+    return {
+        "title": title[:200],
+        "content": content,
+        "url": WIKI_BASE_URL + quote(title.replace(" ", "_")),
+        "source_type": "wikipedia",
+        "content_hash": content_hash(content),
+        "simhash": to_signed64(simhash(content)),
+        "chunks": split_chunks(content),
+    }
+
+
+class WikiDumpImporter:
+    """덤프를 묶음 단위로 읽어 프로세스 풀에서 정리하고 저장소에 일괄 저장
+
+    한 묶음을 저장하는 동안 다음 묶음을 작업 프로세스가 처리하며, 메모리에는 많아야 두 묶음만 둡니다.
+    """
+
+    def __init__(self, repository=None, executor: Optional[Executor] = None,
+                 batch_size: int = None, min_chars: int = None):
+        self.repository = repository or get_document_repository()
+        self.executor = executor
+        self.batch_size = batch_size or settings.WIKI_DUMP_BATCH_SIZE
+        self.min_chars = min_chars or settings.WIKI_DUMP_MIN_CHARS
+
+    def run(self, path: str, limit: Optional[int] = None) -> Dict:
+        executor = self.executor or get_parse_pool()
+        prepare = partial(prepare_page, min_chars=self.min_chars)
+        stats = {"pages": 0, "articles": 0, "saved": 0}
+        started = time.perf_counter()
+
+        pages = iter_pages(path, limit)
+        pending = None
+        while True:
+            batch = list(islice(pages, self.batch_size))
+            # 다음 묶음을 풀에 넘긴 뒤 이전 묶음을 저장 (파싱과 저장이 겹침)
+            submitted = executor.map(prepare, batch, chunksize=max(1, len(batch) // 32)) if batch else None
+            if pending is not None:
+                self._store(pending, stats, started)
+            if submitted is None:
+                break
+            stats["pages"] += len(batch)
+            pending = submitted
+
+        stats["elapsed"] = round(time.perf_counter() - started, 2)
+        stats["pages_per_sec"] = round(stats["pages"] / stats["elapsed"], 1) if stats["elapsed"] else 0.0
+        print(f"[WIKI] 완료: 문서 {stats['pages']}개 중 {stats['articles']}개 본문, "
+              f"{stats['saved']}개 새로 저장 ({stats['elapsed']}초, {stats['pages_per_sec']}/s)")
+        return stats
+
+    def _store(self, results, stats: Dict, started: float):
+        articles: List[Dict] = [article for article in results if article]
+        stats["articles"] += len(articles)
+        if articles:
+            stats["saved"] += self.repository.insert_documents(articles)
+        elapsed = time.perf_counter() - started
+        print(f"[WIKI] 본문 {stats['articles']}개 처리, {stats['saved']}개 저장 "
+              f"({stats['articles'] / elapsed:.1f}/s)")
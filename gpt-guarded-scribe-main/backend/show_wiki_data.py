@@ -25,7 +25,7 @@ def show_wiki_sources():
         print(f"   URL: {source.url}")
         print(f"   소스 타입: {source.source_type}")
         print(f"   생성일: {source.created_at}")
-        print(f"   내용 길이: {len(source.content)}자")
+        print(f"   내용 길이: {len(source.full_content)}자")
         
         # 내용 미리보기 (처음 300자)
         preview = source.content[:300].replace('\n', ' ').replace('\r', ' ')
@@ -1,82 +1,67 @@
 from celery_app import celery_app
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine, text
+from sqlalchemy import text
 from datetime import datetime, timedelta
 import logging
 
 from config import settings
-from models import PlagiarismCheck, PlagiarismMatch
+from database import SessionLocal  # database.py의 공용 엔진/풀 사용
+from services.partition_manager import PartitionManager
+from services.retention_service import RetentionService
+from services.statistics_service import get_statistics_service
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# 데이터베이스 연결
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
-
-@celery_app.task
-def cleanup_old_results():
-    """오래된 검사 결과 정리"""
-    db = SessionLocal()
+@celery_app.task(bind=True)
+def cleanup_old_results(self, days: int = None):
+    """오래된 검사 결과 정리 (배치 삭제, 진행 상황은 작업 상태로 보고)"""
+    def report(progress):
+        self.update_state(state='PROGRESS', meta=progress.to_dict())
     
     try:
-        # 30일 이전의 검사 결과 삭제
-        cutoff_date = datetime.utcnow() - timedelta(days=30)
-        
-        # 먼저 관련 매치들 삭제
-        old_matches = db.query(PlagiarismMatch).join(PlagiarismCheck).filter(
-            PlagiarismCheck.created_at < cutoff_date
-        )
-        match_count = old_matches.count()
-        old_matches.delete(synchronize_session=False)
-        
-        # 그 다음 검사 결과 삭제
-        old_checks = db.query(PlagiarismCheck).filter(
-            PlagiarismCheck.created_at < cutoff_date
-        )
-        check_count = old_checks.count()
-        old_checks.delete(synchronize_session=False)
-        
-        db.commit()
+        result = RetentionService().purge_older_than(days, on_progress=report)
         
-        logger.info(f"Cleaned up {check_count} old checks and {match_count} matches")
+        logger.info(f"Cleaned up {result.deleted_checks} old checks "
+                    f"in {result.batches} batches, dropped partitions: {result.dropped_partitions}")
         
-        return {
-            'status': 'completed',
-            'deleted_checks': check_count,
-            'deleted_matches': match_count
-        }
+        return {'status': 'completed', **result.to_dict()}
         
     except Exception as e:
-        db.rollback()
         logger.error(f"Error during cleanup: {str(e)}")
         raise e
+
+@celery_app.task
+def maintain_partitions():
+    """다음 기간 검사/매치 파티션 미리 생성 (PostgreSQL 파티셔닝 사용 시)"""
+    if not settings.PARTITIONING_ENABLED:
+        return {'status': 'skipped', 'reason': 'partitioning disabled'}
+    
+    try:
+        created = PartitionManager().ensure_partitions()
+        logger.info(f"Partitions ready, created: {created}")
+        return {'status': 'completed', 'created_partitions': created}
         
-    finally:
-        db.close()
+    except Exception as e:
+        logger.error(f"Error maintaining partitions: {str(e)}")
+        raise e
 
 @celery_app.task
 def update_daily_statistics():
-    """일일 통계 업데이트"""
-    db = SessionLocal()
-    
+    """일일 통계 정리 (어제/오늘 카운터 보정 + 유형별 문서 수 재집계)"""
     try:
-        # 통계 업데이트 SQL 실행
-        db.execute(text("SELECT update_daily_statistics()"))
-        db.commit()
+        service = get_statistics_service()
+        today = datetime.utcnow().date()
+        service.rollup(today - timedelta(days=1))
+        result = service.rollup(today)
         
         logger.info("Daily statistics updated successfully")
         
-        return {'status': 'completed', 'updated_date': datetime.utcnow().date()}
+        return {'status': 'completed', 'updated_date': today.isoformat(), 'today': result}
         
     except Exception as e:
-        db.rollback()
         logger.error(f"Error updating statistics: {str(e)}")
         raise e
-        
-    finally:
-        db.close()
 
 @celery_app.task
 def optimize_database():
@@ -105,27 +90,18 @@ def optimize_database():
 
 @celery_app.task
 def backup_statistics():
-    """통계 데이터 백업"""
-    db = SessionLocal()
-    
+    """통계 데이터 백업 (어제 일별 통계 행 기준)"""
     try:
-        # 통계 데이터 조회
-        stats = db.execute(text("""
-            SELECT 
-                COUNT(*) as total_checks,
-                COUNT(*) FILTER (WHERE status = 'completed') as completed_checks,
-                AVG(similarity_score) FILTER (WHERE status = 'completed') as avg_similarity,
-                AVG(processing_time) FILTER (WHERE status = 'completed') as avg_processing_time
-            FROM plagiarism_checks 
-            WHERE created_at >= CURRENT_DATE - INTERVAL '1 day'
-        """)).fetchone()
+        yesterday = (datetime.utcnow().date() - timedelta(days=1)).isoformat()
+        daily = get_statistics_service().snapshot(max_age=0)["daily"]
+        stats = next((day for day in daily if day['date'] == yesterday), None) or {}
         
         backup_data = {
-            'date': datetime.utcnow().date().isoformat(),
-            'total_checks': stats[0] if stats else 0,
-            'completed_checks': stats[1] if stats else 0,
-            'avg_similarity': float(stats[2]) if stats and stats[2] else 0.0,
-            'avg_processing_time': float(stats[3]) if stats and stats[3] else 0.0
+            'date': yesterday,
+            'total_checks': stats.get('total_checks', 0),
+            'completed_checks': stats.get('completed_checks', 0),
+            'avg_similarity': stats.get('avg_similarity_score', 0.0),
+            'avg_processing_time': stats.get('avg_processing_time', 0.0)
         }
         
         logger.info(f"Statistics backup created: {backup_data}")
@@ -135,33 +111,22 @@ def backup_statistics():
     except Exception as e:
         logger.error(f"Error during statistics backup: {str(e)}")
         raise e
-        
-    finally:
-        db.close()
 
 @celery_app.task
 def health_check():
-    """시스템 헬스 체크"""
+    """시스템 헬스 체크 (검사 수/에러율은 일별 통계 카운터 사용)"""
     db = SessionLocal()
     
     try:
         # 데이터베이스 연결 테스트
         db.execute(text("SELECT 1"))
         
-        # 최근 검사 활동 확인
-        recent_checks = db.query(PlagiarismCheck).filter(
-            PlagiarismCheck.created_at >= datetime.utcnow() - timedelta(hours=1)
-        ).count()
-        
-        # 에러 비율 확인
-        error_checks = db.query(PlagiarismCheck).filter(
-            PlagiarismCheck.status == 'error',
-            PlagiarismCheck.created_at >= datetime.utcnow() - timedelta(hours=24)
-        ).count()
-        
-        total_checks = db.query(PlagiarismCheck).filter(
-            PlagiarismCheck.created_at >= datetime.utcnow() - timedelta(hours=24)
-        ).count()
+        # 오늘/어제 카운터로 최근 활동과 에러 비율 확인 (검사 테이블 COUNT 없음)
+        daily = get_statistics_service().snapshot(max_age=0)["daily"]
+        recent_days = daily[-2:]
+        recent_checks = daily[-1]['total_checks']
+        error_checks = sum(day['error_checks'] for day in recent_days)
+        total_checks = sum(day['total_checks'] for day in recent_days)
         
         error_rate = (error_checks / total_checks * 100) if total_checks > 0 else 0
         
@@ -187,4 +152,4 @@ def health_check():
         }
         
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
@@ -1,17 +1,12 @@
 from celery import current_task
 from celery_app import celery_app
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
 from typing import List, Dict
 import time
 
-from config import settings
+from database import SessionLocal  # database.py의 공용 엔진/풀 사용
 from services.plagiarism_service import PlagiarismService
 from models import PlagiarismCheck
-
-# 데이터베이스 연결
-engine = create_engine(settings.DATABASE_URL)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+from services.statistics_service import get_statistics_service
 
 @celery_app.task(bind=True, max_retries=3)
 def process_plagiarism_check(self, check_id: str, text: str):
@@ -48,6 +43,7 @@ def process_plagiarism_check(self, check_id: str, text: str):
         check = db.query(PlagiarismCheck).filter(PlagiarismCheck.id == check_id).first()
         if check:
             check.status = 'error'
+            get_statistics_service().record_check_failed(db, check.created_at)
             db.commit()
         db.close()
         
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+비동기 크롤링 엔진 테스트 (로컬 스텁 HTTP 서버 사용, 외부 네트워크 불필요)
+127.0.0.1 / 127.0.0.2 를 서로 다른 도메인으로 보고 도메인별 요청 간격과
+도메인 간 동시 실행, 긴 Retry-After 포기, AICrawlerService 전체 흐름을 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from services.ai_crawler_service import AICrawlerService, CrawlTarget
+from services.async_crawl_engine import AsyncCrawlEngine, DomainScheduler
+from services.http_client import HttpClientPool
+
+ARTICLE_TEXT = "스텁 서버가 돌려주는 테스트용 본문 문장입니다. " * 40
+RESPONSE_DELAY = 0.2  # 요청마다 서버 응답 지연 (초)
+LIMITED_REQUESTS = []  # /limited/ 경로 요청 기록
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive 연결 재사용 확인용
+
+    def do_GET(self):
+        time.sleep(RESPONSE_DELAY)
+        host = self.headers["Host"]
+        if self.path.startswith("/limited/"):
+            # 항상 429 + Retry-After: <경로 마지막 값>초
+            LIMITED_REQUESTS.append(self.path)
+            self.send_response(429)
+            self.send_header("Retry-After", self.path.rsplit("/", 1)[1])
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        if self.path.startswith("/search"):
+            links = "".join(f'<a href="http://{host}/article/{i}">글 {i}</a>' for i in range(3))
+            body = f"<html><body>{links}</body></html>"
+        elif self.path.startswith("/article/"):
+            number = self.path.rsplit("/", 1)[1]
+            body = (f"<html><head><title>{host} 문서 {number}</title></head><body>"
+                    f"<h1>{host} 문서 {number}</h1><div class='content'>{ARTICLE_TEXT}</div></body></html>")
+        else:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = body.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_port():
+    server = ThreadingHTTPServer(("0.0.0.0", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server.server_address[1]
+    server.shutdown()
+
+
+async def _timed_fetch(urls, rate, burst=1):
+    async with AsyncCrawlEngine(scheduler=DomainScheduler(rate=rate, burst=burst)) as engine:
+        started = time.monotonic()
+        results = await engine.fetch_many(urls)
+        return time.monotonic() - started, results
+
+
+def test_same_domain_is_rate_limited(stub_port):
+    """같은 도메인 요청은 토큰 버킷 속도(초당 5개)를 넘지 않음"""
+    urls = [f"http://127.0.0.1:{stub_port}/article/{i}" for i in range(5)]
+    elapsed, results = asyncio.run(_timed_fetch(urls, rate=5))
+
+    assert all(result and result.ok for result in results)
+    assert elapsed >= 4 / 5  # 첫 요청 이후 4개는 0.2초 간격
+
+
+def test_domains_are_fetched_concurrently(stub_port):
+    """도메인마다 따로 제한되므로 전체 시간은 합이 아니라 가장 느린 도메인 수준"""
+    per_domain = 4
+    urls = [
+        f"http://{host}:{stub_port}/article/{i}"
+        for host in ("127.0.0.1", "127.0.0.2")
+        for i in range(per_domain)
+    ]
+    elapsed, results = asyncio.run(_timed_fetch(urls, rate=5))
+
+    assert all(result and result.ok for result in results)
+    single_domain = (per_domain - 1) / 5 + RESPONSE_DELAY
+    assert elapsed < single_domain * 1.6, f"{elapsed:.2f}s (도메인 하나: {single_domain:.2f}s)"
+
+
+def test_connections_are_reused(stub_port, monkeypatch):
+    """같은 호스트 반복 요청은 풀의 keep-alive 연결을 재사용하고 지표에 반영됨"""
+    pool = HttpClientPool()
+    monkeypatch.setattr("services.async_crawl_engine.get_http_client", lambda: pool)
+
+    for i in range(5):
+        assert pool.get(f"http://127.0.0.1:{stub_port}/article/{i}").status_code == 200
+
+    async def fetch_sequentially():
+        async with AsyncCrawlEngine(scheduler=DomainScheduler(rate=50)) as engine:
+            for i in range(5):
+                assert (await engine.fetch(f"http://127.0.0.2:{stub_port}/article/{i}")).ok
+    asyncio.run(fetch_sequentially())
+
+    expected = {"requests": 5, "new_connections": 1, "reused_connections": 4, "reuse_ratio": 0.8}
+    hosts = pool.metrics()["hosts"]
+    assert hosts["127.0.0.1"] == expected  # requests 세션 풀
+    assert hosts["127.0.0.2"] == expected  # 비동기 엔진(httpx)
+
+
+def test_long_retry_after_gives_up_instead_of_waiting(stub_port, monkeypatch):
+    """Retry-After가 HTTP_READ_TIMEOUT보다 길면 기다리지 않고 429 결과를 바로 돌려줌"""
+    monkeypatch.setattr("config.settings.HTTP_READ_TIMEOUT", 2.0)
+    monkeypatch.setattr("config.settings.HTTP_RETRIES", 2)
+    LIMITED_REQUESTS.clear()
+
+    elapsed, results = asyncio.run(_timed_fetch([f"http://127.0.0.1:{stub_port}/limited/3600"], rate=50))
+
+    assert results[0].status_code == 429
+    assert LIMITED_REQUESTS == ["/limited/3600"]
+    assert elapsed < 2.0
+
+    # 짧은 Retry-After는 따르고 재시도 횟수만큼 다시 요청
+    LIMITED_REQUESTS.clear()
+    _elapsed, results = asyncio.run(_timed_fetch([f"http://127.0.0.1:{stub_port}/limited/0"], rate=50))
+    assert results[0].status_code == 429 and len(LIMITED_REQUESTS) == 3
+
+
+def test_intelligent_search_against_stub(stub_port, monkeypatch):
+    """검색 페이지 → 기사 링크 → 본문 추출까지 스텁 도메인 두 곳에서 동시에 수행"""
+    monkeypatch.setattr("config.settings.CRAWL_DOMAIN_RATE", 20.0)
+    crawler = AICrawlerService(repository=object())
+    crawler.crawl_targets = {
+        name: CrawlTarget(
+            domain=f"{host}:{stub_port}",
+            name=name,
+            search_url_pattern=f"http://{host}:{stub_port}/search?q={{}}",
+            content_selectors=[".content"],
+            title_selectors=["h1"],
+        )
+        for name, host in (("stub_a", "127.0.0.1"), ("stub_b", "127.0.0.2"))
+    }
+
+    articles = crawler.intelligent_search("스텁", num_results=20)
+
+    assert {article["source_name"] for article in articles} == {"stub_a", "stub_b"}
+    assert all(len(article["content"]) >= 500 for article in articles)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+배치 작업 테스트 (가짜 크롤링, 메모리 SQLite, 네트워크 불필요)
+요청은 작업 ID만 받고 바로 끝나는지, 주제들이 한 엔진을 공유하며 동시에 처리되는지,
+진행 상황과 요약이 끝난 항목 기준으로 모이고 다른 프로세스(다른 registry)에서도 조회되는지,
+실행하던 프로세스가 중단된 작업은 결과를 남긴 채 failed가 되는지 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.pool import StaticPool
+
+from models import Base
+from routers.plagiarism import _crawl_batch_summary
+from services.ai_crawler_service import AICrawlerService
+from services.batch_jobs import BatchJobLimitError, BatchJobRegistry
+
+TOPIC_SECONDS = 0.3  # 가짜 크롤링 한 주제에 걸리는 시간
+
+
+def _wait(job, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not job.done and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert job.done
+
+
+def test_batch_crawl_fans_out_over_one_engine(monkeypatch):
+    engines = []
+
+    async def fake_crawl(self, query, num_results=15, engine=None):
+        engines.append(engine)
+        await asyncio.sleep(TOPIC_SECONDS)
+        if query == "실패":
+            raise RuntimeError("차단됨")
+        return {"total_crawled": 3, "saved_count": 2, "sources_used": ["stub"]}
+
+    monkeypatch.setattr(AICrawlerService, "ai_enhanced_crawl_async", fake_crawl)
+    crawler = AICrawlerService(repository=object())
+    queries = [f"주제{i}" for i in range(9)] + ["실패"]
+    finished = []
+
+    started = time.monotonic()
+    results = asyncio.run(crawler.batch_crawl_async(queries, 5, on_result=lambda q, r: finished.append(q)))
+    elapsed = time.monotonic() - started
+
+    assert elapsed < TOPIC_SECONDS * 2  # 10개 주제가 주제 하나 걸리는 시간 정도에 끝남
+    assert len(set(map(id, engines))) == 1 and engines[0] is not None  # 도메인 토큰 버킷 공유
+    assert [r["query"] for r in results] == queries
+    assert results[-1]["status"] == "failed" and results[-1]["error"] == "차단됨"
+    assert sorted(finished) == sorted(queries)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def _registry(engine, **kwargs):
+    registry = BatchJobRegistry(engine, **kwargs)
+    registry.register_kind("crawl", _crawl_batch_summary)
+    return registry
+
+
+def test_registry_reports_progress_and_summary(engine):
+    registry = _registry(engine, max_running=1)
+    other_process = _registry(engine, max_running=1)  # 같은 DB를 보는 다른 워커 프로세스
+    release = threading.Event()
+
+    async def run(job):
+        registry.record(job, "가", {"query": "가", "status": "success", "collected": 3, "saved": 2, "sources": []})
+        await asyncio.to_thread(release.wait, 5)
+        registry.record(job, "나", {"query": "나", "status": "failed", "error": "x", "collected": 0, "saved": 0,
+                                    "sources": []})
+
+    job = registry.submit("crawl", ["가", "나"], run)
+    with pytest.raises(BatchJobLimitError):
+        other_process.submit("crawl", ["다"], run)  # 실행 중 작업 수는 DB 기준
+
+    deadline = time.monotonic() + 5
+    while not job.results and time.monotonic() < deadline:
+        time.sleep(0.01)
+    partial = other_process.get(job.id).to_dict()
+    assert partial["status"] == "running"
+    assert partial["progress"] == {"total": 2, "finished": 1, "failed": 0, "percent": 50.0}
+    assert partial["batch_summary"]["total_saved"] == 2
+
+    release.set()
+    _wait(job)
+    final = other_process.get(job.id).to_dict()
+    assert final["status"] == "completed"
+    assert final["batch_summary"]["successful"] == 1 and final["batch_summary"]["failed"] == 1
+    assert [r["query"] for r in final["results"]] == ["가", "나"]
+    assert [listed.id for listed in other_process.list()] == [job.id]
+    assert other_process.get("없는-작업") is None
+
+
+def test_interrupted_job_is_failed_with_partial_results(engine, monkeypatch):
+    monkeypatch.setattr("config.settings.BATCH_JOB_HEARTBEAT", 1)
+    registry = _registry(engine)
+    stop = threading.Event()
+
+    async def run(job):
+        registry.record(job, "가", {"query": "가", "status": "success", "collected": 1, "saved": 1, "sources": []})
+        await asyncio.to_thread(stop.wait, 5)
+
+    job = registry.submit("crawl", ["가", "나"], run)
+    deadline = time.monotonic() + 5
+    while not job.results and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    # 재시작한 프로세스: 생존 시각이 끊긴 지 3주기가 지나면 실패 처리
+    restarted = _registry(engine)
+    assert restarted.recover_stale(datetime.utcnow() + timedelta(seconds=2), force=True) == 0
+    assert restarted.recover_stale(datetime.utcnow() + timedelta(seconds=10), force=True) == 1
+    interrupted = restarted.get(job.id).to_dict()
+    assert interrupted["status"] == "failed" and "중단" in interrupted["error"]
+    assert [r["query"] for r in interrupted["results"]] == ["가"]
+    stop.set()
+    _wait(job)
+
+
+def test_only_recent_finished_jobs_are_kept(engine):
+    registry = _registry(engine, history=2)
+
+    async def run(job):
+        pass
+
+    jobs = []
+    for i in range(4):
+        jobs.append(registry.submit("crawl", [f"주제{i}"], run))
+        _wait(jobs[-1])
+    assert [job.id for job in registry.list()] == [jobs[3].id, jobs[2].id, jobs[1].id]  # 새 작업 + 끝난 작업 2개
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
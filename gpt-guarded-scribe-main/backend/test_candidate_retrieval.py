@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+표절 후보 검색 테스트
+SQLite(메모리)에서는 후보 검색기 없이 전체 문서를 비교하는지, 후보 검색기가 있으면 문서를 읽지 않고
+후보 청크로 문장을 검증하는지(해시 일치, 이어지는 청크, 단어가 겹치지 않는 청크), TEST_POSTGRES_URL이
+있으면 pg_trgm 검색이 복사된 문장의 청크를 찾고 무관한 문서는 빼는지 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import create_engine, delete, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models import Base, DocumentSource
+import services.plagiarism_service as plagiarism_service
+from services.candidate_retrieval import ChunkCandidate, TrigramRetriever, get_retriever
+from services.document_repository import DocumentRepository
+from services.plagiarism_service import PlagiarismService
+
+URL_PREFIX = "https://retrieval-test.example/"
+DOCUMENTS = [
+    {"title": "광합성", "url": URL_PREFIX + "photosynthesis", "source_type": "academic",
+     "content": "광합성은 식물이 빛 에너지를 이용해 이산화탄소와 물로 포도당을 만드는 과정입니다. "
+                "엽록체의 틸라코이드 막에서 명반응이 일어나고 스트로마에서 캘빈 회로가 진행됩니다."},
+    {"title": "조선 건국", "url": URL_PREFIX + "joseon", "source_type": "academic",
+     "content": "조선은 1392년 이성계가 고려를 무너뜨리고 세운 나라로 한양을 도읍으로 정했습니다. "
+                "건국 초기에는 성리학을 통치 이념으로 삼아 제도를 정비했습니다."},
+]
+QUERY = ("이번 보고서는 식물의 에너지 대사를 다룹니다. "
+         "광합성은 식물이 빛 에너지를 이용해 이산화탄소와 물로 포도당을 만드는 과정입니다.")
+
+
+def _ingest(engine):
+    DocumentRepository(engine).insert_documents([dict(document) for document in DOCUMENTS])
+
+
+def test_sqlite_compares_every_active_document():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    _ingest(engine)
+
+    with sessionmaker(bind=engine)() as db:
+        assert get_retriever(db) is None
+        service = PlagiarismService(db)
+        matches = service._find_matches(QUERY, service.text_processor.preprocess_text(QUERY), [])
+
+    assert {match["source_title"] for match in matches} >= {"광합성"}
+
+
+def _candidate(source_id, query, content, start_offset, score, exact=False, title="광합성"):
+    query_start = QUERY.index(query)
+    return ChunkCandidate(chunk_id=start_offset, source_id=source_id, source_title=title,
+                          source_url=URL_PREFIX + title, content=content, start_offset=start_offset,
+                          end_offset=start_offset + len(content), score=score, query_text=query,
+                          query_start=query_start, query_end=query_start + len(query), exact=exact)
+
+
+def test_retrieved_chunks_are_verified_without_reading_documents(monkeypatch):
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    first, second = QUERY.split(". ", 1)
+    first += "."
+    candidates = [
+        # 두 번째 문장: 청크 해시가 같음
+        _candidate(1, second, second, 0, 0.9, exact=True),
+        # 첫 번째 문장: 출처에서 바로 이어지는 두 청크를 합쳐 비교
+        _candidate(2, first, "이번 보고서는 식물의", 10, 0.5, title="보고서"),
+        _candidate(2, first, "에너지 대사를 다룹니다.", 22, 0.4, title="보고서"),
+        # 트라이그램만 비슷하고 단어는 겹치지 않음 → 버림
+        _candidate(3, first, "이번보고서는 식물의에너지대사를다룹니다.", 0, 0.3, title="무관"),
+    ]
+
+    class FakeRetriever:
+        """PostgreSQL 트라이그램 검색 대신 정해진 후보 청크를 돌려줌"""
+        def search(self, text):
+            return candidates
+
+    monkeypatch.setattr(plagiarism_service, "get_retriever", lambda db: FakeRetriever())
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    with sessionmaker(bind=engine)() as db:
+        service = PlagiarismService(db)
+        matches = service._find_matches(QUERY, service.text_processor.preprocess_text(QUERY), [])
+
+    assert statements == []  # 문서 본문/행을 읽지 않음
+    assert [(m["source_title"], m["start_index"], m["end_index"]) for m in matches] == [
+        ("보고서", 0, len(first)), ("광합성", QUERY.index(second), len(QUERY)),
+    ]
+    assert matches[0]["source_text"] == "이번 보고서는 식물의 에너지 대사를 다룹니다."
+    assert matches[0]["similarity_score"] == 95  # 단어 5개가 모두 겹침: 100% (최대 95)
+    assert matches[1]["similarity_score"] == 95.0 and matches[1]["source_text"] == second
+    assert all(QUERY[m["start_index"]:m["end_index"]] == m["matched_text"] for m in matches)
+
+
+@pytest.fixture
+def postgres_engine():
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL이 없어 PostgreSQL 확인을 건너뜀")
+    engine = create_engine(url)
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+    Base.metadata.create_all(engine)
+    _ingest(engine)
+    yield engine
+    with engine.begin() as conn:
+        conn.execute(delete(DocumentSource.__table__).where(DocumentSource.url.startswith(URL_PREFIX)))
+    engine.dispose()
+
+
+def test_postgres_trigram_search_finds_copied_sentence(postgres_engine):
+    with sessionmaker(bind=postgres_engine)() as db:
+        assert isinstance(get_retriever(db), TrigramRetriever)
+        candidates = [c for c in TrigramRetriever(db).search(QUERY) if c.source_url.startswith(URL_PREFIX)]
+
+    assert candidates and {c.source_title for c in candidates} == {"광합성"}
+    best = max(candidates, key=lambda c: c.score)
+    assert best.exact and best.score > 0.9
+    assert QUERY[best.query_start:best.query_end] == best.query_text
+    assert DOCUMENTS[0]["content"][best.start_offset:best.end_offset] == best.content
+
+    with sessionmaker(bind=postgres_engine)() as db:
+        service = PlagiarismService(db)
+        matches = [m for m in service._find_matches(QUERY, service.text_processor.preprocess_text(QUERY), [])
+                   if m["source_url"].startswith(URL_PREFIX)]
+    assert any(m["similarity_score"] == 95.0 and m["matched_text"] == best.query_text for m in matches)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
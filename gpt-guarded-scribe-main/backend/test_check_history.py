@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검사 이력 키셋 페이지네이션 테스트 (메모리 SQLite)
+created_at이 같은 검사가 있어도 페이지가 빠짐/중복 없이 이어지는지, 요약 컬럼만 읽는지,
+include=matches가 페이지당 쿼리 하나로 매치를 가져오는지, 잘못된 입력이 400인지 확인합니다.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import get_db
+from models import Base, PlagiarismCheck, PlagiarismMatch
+from routers import plagiarism
+from services.plagiarism_service import PlagiarismService
+
+BASE_TIME = datetime(2024, 5, 1, 12, 0, 0)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        for i in range(25):
+            # 세 개씩 같은 시각 → (created_at, id) 동점 처리 확인
+            check = PlagiarismCheck(id=f"check-{i:02d}", original_text="원문 " * 500, status="completed",
+                                    similarity_score=float(i), created_at=BASE_TIME + timedelta(minutes=i // 3))
+            check.matches = [
+                PlagiarismMatch(matched_text=f"매치 {i}-{j}", source_text="출처", source_title="제목",
+                                similarity_score=50.0, start_index=0, end_index=5)
+                for j in range(2)
+            ]
+            db.add(check)
+        db.commit()
+    return engine
+
+
+@pytest.fixture
+def client(engine):
+    Session = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = FastAPI()
+    app.include_router(plagiarism.router, prefix="/api")
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def test_pages_walk_every_check_once_newest_first(engine):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    seen, cursor = [], None
+    with sessionmaker(bind=engine)() as db:
+        service = PlagiarismService(db)
+        while True:
+            checks, cursor = service.get_check_history(limit=10, cursor=cursor)
+            seen.extend(check.id for check in checks)
+            if cursor is None:
+                break
+
+    assert seen == [f"check-{i:02d}" for i in reversed(range(25))]
+    assert len(statements) == 3
+    assert not any("original_text" in statement for statement in statements)  # 요약 컬럼만
+
+
+def test_include_matches_loads_matches_with_one_extra_query(engine, client):
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    page = client.get("/api/history", params={"limit": 5, "include": "matches"}).json()
+
+    assert [item["id"] for item in page["items"]] == [f"check-{i:02d}" for i in range(24, 19, -1)]
+    assert all(len(item["matches"]) == 2 for item in page["items"])
+    assert len([s for s in statements if "FROM plagiarism_matches" in s]) == 1  # 검사마다가 아니라 한 번
+
+    next_page = client.get("/api/history", params={"limit": 5, "cursor": page["next_cursor"]}).json()
+    assert next_page["items"][0]["id"] == "check-19"
+    assert next_page["items"][0]["matches"] is None
+
+
+def test_bad_limit_or_cursor_is_rejected(client):
+    assert client.get("/api/history", params={"limit": 0}).status_code == 400
+    assert client.get("/api/history", params={"limit": 101}).status_code == 400
+    assert client.get("/api/history", params={"cursor": "not-a-cursor"}).status_code == 400
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
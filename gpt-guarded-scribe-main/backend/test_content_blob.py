@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+문서 본문 압축 저장 테스트 (임시 SQLite DB)
+긴 기사를 자르지 않고 압축 블롭으로 저장하는지, 청크가 기사 끝부분까지 만들어지는지(PostgreSQL처럼
+청크를 저장할 때), SQLite에서는 청크를 저장하지 않아 DB가 원문보다 작아지는지,
+블롭은 full_content에 접근할 때만 읽는지, 표절 검사가 미리보기에서 걸러진 문서의 블롭은 읽지도
+풀지도 않는지 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import create_engine, event, func, select, text
+from sqlalchemy.orm import Session
+
+from models import Base, DocumentChunk, DocumentSource
+from utils import content_codec
+from utils.content_codec import CODEC_ZLIB, compress_content, decompress_content
+from services.document_repository import DocumentRepository
+from services.plagiarism_service import PlagiarismService
+
+PARAGRAPHS = [f"{i}번째 문단은 기사 뒷부분까지 표절 검사 대상이 되는지 확인하기 위한 문장입니다." for i in range(400)]
+ARTICLE = " ".join(PARAGRAPHS)
+
+
+def test_codec_round_trip(monkeypatch):
+    monkeypatch.setattr("config.settings.CONTENT_COMPRESSION", "zlib")
+    blob = compress_content(ARTICLE)
+    assert blob[:1] == CODEC_ZLIB
+    assert decompress_content(blob) == ARTICLE
+    assert len(blob) < len(ARTICLE.encode("utf-8")) / 5
+    with pytest.raises(ValueError):
+        decompress_content(b"\x09abc")
+
+
+def test_full_article_is_stored_compressed_and_loaded_lazily(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'blob.db'}")
+    Base.metadata.create_all(engine)
+    assert len(ARTICLE) > 8000  # 예전 크롤러가 잘라 버리던 길이
+    saved = DocumentRepository(engine).insert_documents([
+        {"title": "긴 기사", "content": ARTICLE, "url": "https://example.com/long", "source_type": "crawled"},
+        {"title": "짧은 글", "content": "짧은 본문입니다.", "url": "https://example.com/short", "source_type": "crawled"},
+    ])
+    assert saved == 2
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    with Session(engine) as session:
+        long_doc, short_doc = session.query(DocumentSource).order_by(DocumentSource.id).all()
+        assert not any("content_blob" in statement for statement in statements)  # 목록 조회는 블롭을 읽지 않음
+
+        assert len(long_doc.content) == 1000 and long_doc.full_content == ARTICLE
+        assert any("content_blob" in statement for statement in statements)
+        assert short_doc.content_blob is None and short_doc.full_content == "짧은 본문입니다."
+
+
+def test_chunks_cover_the_tail_when_stored(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'chunks.db'}")
+    Base.metadata.create_all(engine)
+    repository = DocumentRepository(engine)
+    repository.store_chunks = True  # PostgreSQL(트라이그램 후보 검색)과 같은 경로
+    repository.insert_documents([{"title": "긴 기사", "content": ARTICLE, "url": "https://example.com/long"}])
+
+    with engine.connect() as conn:
+        tail_chunk = conn.execute(select(DocumentChunk.content).where(DocumentChunk.content.contains("399번째"))).scalar()
+    assert tail_chunk is not None
+
+
+def test_sqlite_storage_is_a_fraction_of_the_text(tmp_path, monkeypatch):
+    """SQLite에는 청크 행이 없고 문서 행(미리보기 + 압축 블롭)이 원문 크기의 일부만 차지"""
+    monkeypatch.setattr("config.settings.CONTENT_COMPRESSION", "zlib")
+    monkeypatch.setattr("config.settings.SIMHASH_MAX_DISTANCE", 0)  # 문단 순서만 다른 문서도 모두 저장
+    engine = create_engine(f"sqlite:///{tmp_path / 'size.db'}")
+    Base.metadata.create_all(engine)
+    documents = [
+        {"title": f"기사 {n}", "content": " ".join(f"{n}-{p}" for p in PARAGRAPHS[n:] + PARAGRAPHS[:n]),
+         "url": f"https://example.com/{n}", "source_type": "crawled"}
+        for n in range(20)
+    ]
+    raw_bytes = sum(len(document["content"].encode("utf-8")) for document in documents)
+    repository = DocumentRepository(engine)
+    assert not repository.store_chunks
+    assert repository.insert_documents(documents) == 20
+
+    with engine.connect() as conn:
+        stored = conn.execute(text(
+            "SELECT SUM(LENGTH(CAST(content AS BLOB))) + SUM(LENGTH(content_blob)) FROM document_sources"
+        )).scalar()
+        assert conn.execute(select(func.count()).select_from(DocumentChunk)).scalar() == 0
+    assert stored < raw_bytes / 3, f"{stored} / {raw_bytes} bytes"
+
+    # 예전에 SQLite에 만든 청크는 backfill_chunks가 정리
+    with engine.begin() as conn:
+        conn.execute(DocumentChunk.__table__.insert(), [{"source_id": 1, "chunk_index": 0, "content": "예전 청크"}])
+    assert repository.backfill_chunks() == 0
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(DocumentChunk)).scalar() == 0
+
+
+def test_plagiarism_check_decompresses_only_sources_passing_the_preview(tmp_path, monkeypatch):
+    engine = create_engine(f"sqlite:///{tmp_path / 'check.db'}")
+    Base.metadata.create_all(engine)
+    unrelated = " ".join(f"{i}장 항해 일지에는 바람과 파도의 기록이 남아 있습니다." for i in range(400))
+    DocumentRepository(engine).insert_documents([
+        {"title": "긴 기사", "content": ARTICLE, "url": "https://example.com/long", "source_type": "crawled"},
+        {"title": "항해 일지", "content": unrelated, "url": "https://example.com/log", "source_type": "crawled"},
+    ])
+    decompressed = []
+    monkeypatch.setattr(content_codec, "decompress_content",
+                        lambda blob: decompressed.append(blob) or decompress_content(blob))
+    blob_reads = []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, params, context, executemany:
+                 blob_reads.append(params) if "content_blob" in statement else None)
+
+    query = "표절 검사 대상이 되는지 확인하기 위한 문장입니다."
+    with Session(engine) as session:
+        service = PlagiarismService(session)
+        matches = service._find_matches(query, service.text_processor.preprocess_text(query), [])
+        long_id = session.query(DocumentSource.id).filter(DocumentSource.title == "긴 기사").scalar()
+
+    assert [match["source_title"] for match in matches] == ["긴 기사"]
+    assert len(decompressed) == 1  # 미리보기에서 걸러진 문서는 압축을 풀지 않음
+    assert len(blob_reads) == 1 and list(blob_reads[0]) == [long_id]  # 블롭도 통과한 문서만 읽음
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+크롤링 프런티어 테스트 (임시 SQLite DB, 외부 네트워크 불필요)
+URL 정규화/중복 제거, 도메인별 요청 간격, 재시도와 임대 회수, 오래된 완료 항목 재크롤링,
+워커 풀 처리를 확인합니다.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import create_engine
+
+from models import Base
+from services.crawl_frontier import BloomFilter, CrawlFrontier, normalize_url
+from services.crawl_workers import CrawlWorkerPool
+from services.web_crawler_service import UNCHANGED
+
+
+@pytest.fixture
+def frontier(tmp_path, monkeypatch):
+    monkeypatch.setattr("config.settings.CRAWL_DOMAIN_RATE", 0.5)  # 도메인당 2초 간격
+    engine = create_engine(f"sqlite:///{tmp_path / 'frontier.db'}")
+    Base.metadata.create_all(engine)
+    return CrawlFrontier(engine)
+
+
+def test_normalize_url():
+    encoded = "https://ko.wikipedia.org/wiki/%EC%9D%B8%EA%B3%B5%EC%A7%80%EB%8A%A5"
+    assert normalize_url("HTTPS://Ko.Wikipedia.org:443/wiki/인공지능#개요") == encoded
+    assert normalize_url(encoded) == encoded
+    assert (normalize_url("http://example.com/a?b=2&a=1&utm_source=x")
+            == "http://example.com/a?a=1&b=2")
+    assert normalize_url("http://example.com") == "http://example.com/"
+    assert normalize_url("mailto:someone@example.com") is None
+
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    urls = [f"https://example.com/{i}" for i in range(1000)]
+    for url in urls:
+        bloom.add(url)
+    assert all(url in bloom for url in urls)
+    false_positives = sum(f"https://other.org/{i}" in bloom for i in range(1000))
+    assert false_positives < 50
+
+
+def test_enqueue_deduplicates_across_calls(frontier):
+    assert frontier.enqueue(["https://a.com/1", "https://a.com/1#x", "https://b.com/1"]) == 2
+    assert frontier.enqueue(["https://A.com/1", "https://a.com/2"]) == 1
+
+    # 새 프로세스(빈 Bloom 필터)도 DB의 UNIQUE(url)로 중복을 걸러냄
+    assert CrawlFrontier(frontier.engine).enqueue(["https://a.com/2", "https://c.com/1"]) == 1
+    assert frontier.stats()["by_status"] == {"pending": 4}
+
+
+def test_lease_respects_priority_and_domain_delay(frontier):
+    frontier.enqueue(["https://a.com/low", "https://b.com/1"])
+    frontier.enqueue(["https://a.com/high"], priority=10)
+    now = datetime.utcnow()
+
+    first = frontier.lease(limit=5, now=now)
+    assert [item.url for item in first] == ["https://a.com/high", "https://b.com/1"]  # 도메인당 하나
+    assert frontier.lease(limit=5, now=now + timedelta(seconds=1)) == []  # a.com은 2초 뒤
+    assert [item.url for item in frontier.lease(limit=5, now=now + timedelta(seconds=2))] == ["https://a.com/low"]
+
+
+def test_failed_items_retry_then_fail(frontier, monkeypatch):
+    monkeypatch.setattr("config.settings.FRONTIER_MAX_ATTEMPTS", 2)
+    monkeypatch.setattr("config.settings.FRONTIER_RETRY_DELAY", 10)
+    frontier.enqueue(["https://a.com/broken"])
+    now = datetime.utcnow()
+
+    item = frontier.lease(now=now)[0]
+    frontier.complete(item, error="HTTP 500")
+    assert frontier.lease(now=now + timedelta(seconds=5)) == []  # 재시도 대기 중
+
+    item = frontier.lease(now=now + timedelta(seconds=30))[0]
+    assert item.attempts == 2
+    frontier.complete(item, error="HTTP 500")
+    assert frontier.stats()["by_status"] == {"failed": 1}
+    assert not frontier.has_work()
+
+
+def test_expired_leases_are_recovered(frontier):
+    frontier.enqueue(["https://a.com/1"])
+    now = datetime.utcnow()
+    assert frontier.lease(now=now)  # 워커가 가져간 뒤 중단됐다고 가정
+
+    later = now + timedelta(seconds=frontier.lease_seconds + 1)
+    assert frontier.recover_expired(later, force=True) == 1
+    assert frontier.lease(now=later)[0].url == "https://a.com/1"
+
+
+def test_done_items_are_recrawled_after_recrawl_days(frontier, monkeypatch):
+    monkeypatch.setattr("config.settings.FRONTIER_RECRAWL_DAYS", 7)
+    frontier.enqueue(["https://a.com/1"])
+    now = datetime.utcnow()
+    frontier.complete(frontier.lease(now=now)[0])
+    assert frontier.enqueue(["https://a.com/1"]) == 0  # 완료된 URL은 다시 넣어도 건너뜀
+
+    assert frontier.requeue_stale(now + timedelta(days=6), force=True) == 0
+    later = now + timedelta(days=8)
+    assert frontier.requeue_stale(later, force=True) == 1
+
+    item = frontier.lease(now=later)[0]
+    assert item.url == "https://a.com/1" and item.attempts == 1
+    frontier.complete(item)
+    assert frontier.stats()["by_status"] == {"done": 1}
+
+    monkeypatch.setattr("config.settings.FRONTIER_RECRAWL_DAYS", 0)  # 0이면 재크롤링 안 함
+    assert frontier.requeue_stale(now + timedelta(days=30), force=True) == 0
+
+
+class FakeCrawler:
+    def __init__(self):
+        self.saved = []
+
+    def crawl_article(self, url):
+        if url.endswith("/same"):
+            return UNCHANGED
+        return {"title": url, "content": "본문 " * 100, "url": url, "source_type": "crawled"}
+
+    def save_to_database(self, articles, raise_errors=False):
+        self.saved.extend(articles)
+        return len(articles)
+
+
+def test_worker_pool_drains_frontier(frontier, monkeypatch):
+    monkeypatch.setattr("config.settings.CRAWL_DOMAIN_RATE", 100.0)
+    frontier.enqueue([f"https://site{i}.com/doc" for i in range(6)] + ["https://site0.com/same"],
+                     source_type="wiki")
+    crawler = FakeCrawler()
+
+    result = CrawlWorkerPool(frontier=frontier, crawler=crawler, workers=3, idle_sleep=0.05).run()
+
+    assert result["saved"] == 6 and result["unchanged"] == 1
+    assert {article["source_type"] for article in crawler.saved} == {"wiki"}
+    assert frontier.stats()["by_status"] == {"done": 7}
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
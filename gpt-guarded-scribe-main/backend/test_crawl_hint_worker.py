@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+백그라운드 크롤링 힌트 워커 테스트 (가짜 크롤러 사용, 네트워크/DB 불필요)
+검사가 몰려도 키워드별로 한 번만, 한 번에 하나씩, 간격을 두고 크롤링하는지 확인합니다.
+"""
+
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from services.crawl_hint_worker import CrawlHintWorker, extract_keywords
+
+TEXT = "인공지능 기술은 인공지능 연구와 머신러닝 연구를 바탕으로 발전하고 있습니다. 자연어처리 분야도 성장했습니다."
+
+
+class FakeCrawler:
+    def __init__(self):
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+        self._lock = threading.Lock()
+
+    def crawl_and_save(self, keyword, num_results):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.calls.append((keyword, time.monotonic()))
+        time.sleep(0.01)
+        with self._lock:
+            self.active -= 1
+        return {"saved_count": 1}
+
+
+@pytest.fixture(autouse=True)
+def small_corpus(monkeypatch):
+    snapshot = {"documents": {"total": 0}}
+    monkeypatch.setattr("services.crawl_hint_worker.get_statistics_service",
+                        lambda: type("Stats", (), {"snapshot": lambda self: snapshot})())
+
+
+def _drain(worker):
+    worker.queue.join()
+
+
+def test_extract_keywords():
+    assert extract_keywords(TEXT) == ["인공지능", "기술은", "연구와"]  # 빈도 2회 단어 먼저
+    assert extract_keywords("abc 123") == ["정보", "기술", "사회"]
+
+
+def test_burst_of_checks_crawls_each_keyword_once():
+    crawler = FakeCrawler()
+    worker = CrawlHintWorker(crawler=crawler, interval=0.05)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        accepted = list(pool.map(worker.submit, [TEXT] * 30))
+    _drain(worker)
+
+    keywords = [keyword for keyword, _ in crawler.calls]
+    assert sum(accepted) == 1
+    assert sorted(keywords) == sorted(set(keywords)) == sorted(extract_keywords(TEXT))
+    assert crawler.max_active == 1
+    gaps = [b - a for (_, a), (_, b) in zip(crawler.calls, crawler.calls[1:])]
+    assert all(gap >= 0.05 for gap in gaps)
+
+    # 중복 제거 기간 안에는 같은 키워드를 다시 크롤링하지 않음
+    assert worker.submit(TEXT) is False
+    assert worker.status()["deduplicated"] == 30
+
+
+def test_full_queue_drops_hints():
+    started = threading.Event()
+    release = threading.Event()
+
+    class BlockingCrawler(FakeCrawler):
+        def crawl_and_save(self, keyword, num_results):
+            started.set()
+            release.wait(5)
+            return {"saved_count": 0}
+
+    worker = CrawlHintWorker(crawler=BlockingCrawler(), maxsize=1, interval=0)
+    assert worker.submit("첫번째 문서는 가나다라 입니다")
+    started.wait(5)
+    assert worker.submit("두번째 문서는 마바사아 입니다")  # 큐 한 칸 사용
+    assert worker.submit("세번째 문서는 자차카타 입니다") is False
+    assert worker.status()["dropped"] == 1
+    release.set()
+    _drain(worker)
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+단계별 크롤링 파이프라인 테스트 (가짜 엔진/저장소 사용, 네트워크/DB 불필요)
+단계별 통계, 프로세스 풀 파싱/지문, 묶음 저장, 느린 단계에서의 배압을 확인합니다.
+"""
+
+import asyncio
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from services.ai_crawler_service import clean_article_text
+from services.crawl_pipeline import CrawlPipeline, PageJob, fingerprint
+
+ARTICLE_TEXT = "파이프라인 테스트용 본문 문장입니다. ★ " * 40
+
+
+class FakeResponse:
+    ok = True
+
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeEngine:
+    max_concurrency = 4
+
+    def __init__(self):
+        self.fetched = 0
+
+    async def fetch(self, url):
+        await asyncio.sleep(0.001)
+        self.fetched += 1
+        number = url.rsplit("/", 1)[1]
+        if number == "short":
+            return FakeResponse("<html><body><div class='content'>짧음</div></body></html>")
+        return FakeResponse(f"<html><body><h1>문서 {number}</h1>"
+                            f"<div class='content'>{number} {ARTICLE_TEXT}</div></body></html>")
+
+
+class FakeRepository:
+    def __init__(self, delay=0.0, engine=None):
+        self.batches = []
+        self.delay = delay
+        self.engine = engine
+        self.max_ahead = 0  # 저장이 끝나기 전에 앞서 가져온 페이지 수
+
+    def insert_documents(self, documents):
+        if self.engine is not None:
+            saved = sum(len(batch) for batch in self.batches)
+            self.max_ahead = max(self.max_ahead, self.engine.fetched - saved)
+        time.sleep(self.delay)
+        self.batches.append(documents)
+        return len(documents)
+
+
+async def _jobs(urls):
+    for url in urls:
+        yield PageJob(url=url, content_selectors=(".content",), title_selectors=("h1",), source_name="stub")
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as pool:
+        yield pool
+
+
+def test_stages_parse_fingerprint_and_batch(executor):
+    urls = [f"http://stub/article/{i}" for i in range(10)] + ["http://stub/article/short"]
+    repository = FakeRepository()
+    pipeline = CrawlPipeline(FakeEngine(), repository=repository, executor=executor,
+                             parse_workers=2, batch_size=4)
+
+    result = asyncio.run(pipeline.run(_jobs(urls), accept=lambda a: not a["url"].endswith("/9"),
+                                      clean=clean_article_text))
+
+    assert result.saved == len(result.articles) == 9
+    assert [len(batch) for batch in repository.batches] == [4, 4, 1]
+    article = result.articles[0]
+    assert article["title"].startswith("문서 ") and "★" not in article["content"]
+    assert (article["content_hash"], article["simhash"]) == fingerprint(article["content"])
+
+    stages = result.stages
+    assert [stages[name]["received"] for name in ("fetch", "parse", "normalize", "ingest")] == [11, 11, 10, 9]
+    assert stages["parse"]["dropped"] == 1  # 본문이 짧은 페이지
+    assert stages["normalize"]["dropped"] == 1  # accept 거절
+
+
+def test_limit_and_backpressure(executor):
+    """저장이 느리면 큐가 차서 가져오기도 멈춤 (앞서 가는 양이 큐 크기로 제한됨)"""
+    engine = FakeEngine()
+    repository = FakeRepository(delay=0.05, engine=engine)
+    pipeline = CrawlPipeline(engine, repository=repository, executor=executor,
+                             parse_workers=2, queue_size=2, batch_size=1)
+
+    result = asyncio.run(pipeline.run(_jobs(f"http://stub/article/{i}" for i in range(40)), limit=30))
+
+    assert result.saved == 30
+    # 큐 4개 x 2칸 + 단계별 워커가 들고 있는 항목 정도만 앞서 감
+    assert repository.max_ahead <= 4 * 2 + engine.max_concurrency + 2 * 2 + 1
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
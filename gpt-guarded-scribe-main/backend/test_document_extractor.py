@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+업로드 문서 추출 테스트 (테스트 안에서 만든 작은 PDF, 네트워크/DB 불필요)
+업로드를 청크 단위로 임시 파일에 옮기는지, 페이지가 많으면 프로세스 풀에서 추출해도
+페이지 순서가 유지되고 두 번째부터는 캐시를 쓰는지, max_chars에서 정확히 자르고 읽기를 멈추는지
+(업로드 API가 MAX_TEXT_LENGTH를 넘기는지),
+콘텐츠 스트림이 같아도 폰트/XObject가 다른 페이지는 캐시 키가 달라지는지 확인합니다.
+"""
+
+import asyncio
+import io
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import PyPDF2
+import pytest
+from fastapi import FastAPI, UploadFile
+from fastapi.testclient import TestClient
+
+import services.document_extractor as document_extractor
+from routers import plagiarism
+from services.document_extractor import (
+    PDF_TYPE, TEXT_TYPE, DocumentExtractor, FileTooLargeError, page_content_hash
+)
+from services.page_text_cache import PageTextCache
+
+
+def build_pdf(objects):
+    """객체 본문 목록(1번이 Catalog)으로 최소 PDF 바이트 생성"""
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def stream(data: bytes, extra: bytes = b"") -> bytes:
+    return b"<< /Length %d %s>>\nstream\n" % (len(data), extra) + data + b"\nendstream"
+
+
+def text_pdf(lines):
+    """한 페이지에 한 줄씩 Helvetica로 쓴 PDF"""
+    page_numbers = [4 + 2 * i for i in range(len(lines))]
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(b"%d 0 R" % n for n in page_numbers), len(lines)),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    for number, line in zip(page_numbers, lines):
+        objects.append(b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % (number + 1))
+        objects.append(stream(b"BT /F1 12 Tf 72 700 Td (%s) Tj ET" % line.encode("ascii")))
+    return build_pdf(objects)
+
+
+def form_xobject_pdf(word: bytes):
+    """본문이 `/Fm0 Do`뿐이고 글자는 Form XObject 안에 있는 PDF"""
+    return build_pdf([
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /XObject << /Fm0 5 0 R >> >> /Contents 4 0 R >>",
+        stream(b"/Fm0 Do"),
+        stream(b"BT /F1 12 Tf 72 700 Td (%s) Tj ET" % word,
+               b"/Type /XObject /Subtype /Form /BBox [0 0 612 792] /Resources << /Font << /F1 6 0 R >> >> "),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ])
+
+
+def to_unicode_pdf(target: bytes):
+    """같은 글리프 스트림 (AAA)을 ToUnicode CMap으로 다른 글자에 대응시킨 PDF"""
+    cmap = (b"/CIDInit /ProcSet findresource begin 12 dict begin begincmap /CMapName /T def "
+            b"1 begincodespacerange <00> <FF> endcodespacerange "
+            b"1 beginbfchar <41> <%s> endbfchar endcmap CMapName currentdict /CMap defineresource pop end end" % target)
+    return build_pdf([
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 5 0 R >> >> /Contents 4 0 R >>",
+        stream(b"BT /F1 12 Tf 72 700 Td (AAA) Tj ET"),
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /ToUnicode 6 0 R >>",
+        stream(cmap),
+    ])
+
+
+class CountingPool(ProcessPoolExecutor):
+    def __init__(self):
+        super().__init__(max_workers=2)
+        self.submitted = []
+
+    def submit(self, fn, *args, **kwargs):
+        self.submitted.append(args[1])
+        return super().submit(fn, *args, **kwargs)
+
+
+class RecordingFile(io.BytesIO):
+    def __init__(self, data):
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.reads.append(len(data))
+        return data
+
+
+@pytest.fixture
+def extractor(tmp_path):
+    extractor = DocumentExtractor()
+    extractor.page_cache = PageTextCache(str(tmp_path / "pages"), max_bytes=1024 * 1024)
+    return extractor
+
+
+def test_spool_upload_streams_in_chunks_and_enforces_limit(monkeypatch, extractor):
+    monkeypatch.setattr("config.settings.UPLOAD_CHUNK_SIZE", 1024)
+    monkeypatch.setattr("config.settings.UPLOAD_SPOOL_MAX_SIZE", 4096)
+    data = os.urandom(10_000)
+    raw = RecordingFile(data)
+
+    spooled = asyncio.run(extractor.spool_upload(UploadFile(file=raw, filename="a.bin"), max_size=20_000))
+    try:
+        assert max(raw.reads) <= 1024  # 한 번에 청크 하나씩만 읽음
+        assert spooled._rolled  # 스풀 한도를 넘으면 디스크 임시 파일로 전환
+        assert spooled.read() == data
+    finally:
+        spooled.close()
+
+    with pytest.raises(FileTooLargeError):
+        asyncio.run(extractor.spool_upload(UploadFile(file=io.BytesIO(data), filename="b.bin"), max_size=5000))
+
+
+def test_large_pdf_is_extracted_in_pool_in_page_order_then_cached(monkeypatch, extractor):
+    monkeypatch.setattr("config.settings.PDF_PARALLEL_MIN_PAGES", 2)
+    monkeypatch.setattr("config.settings.PDF_PAGES_PER_TASK", 3)
+    pool = CountingPool()
+    monkeypatch.setattr(document_extractor, "get_process_pool", lambda: pool)
+    lines = [f"Page number {i}" for i in range(7)]
+    data = text_pdf(lines)
+
+    try:
+        text = extractor.extract_text(io.BytesIO(data), PDF_TYPE)
+        assert pool.submitted == [[0, 1, 2], [3, 4, 5], [6]]
+        assert [line.strip() for line in text.strip().split("\n")] == lines
+
+        pool.submitted.clear()
+        assert extractor.extract_text(io.BytesIO(data), PDF_TYPE) == text
+        assert pool.submitted == []  # 모든 페이지가 캐시에서 나옴
+    finally:
+        pool.shutdown()
+
+
+def test_max_chars_stops_reading_the_upload(monkeypatch, extractor):
+    monkeypatch.setattr("config.settings.UPLOAD_CHUNK_SIZE", 100)
+    raw = RecordingFile(("가나다라마바사아자차" * 1000).encode("utf-8"))
+
+    text = extractor.extract_text(raw, TEXT_TYPE, max_chars=250)
+
+    assert text == ("가나다라마바사아자차" * 25)  # 정확히 max_chars에서 자름
+    assert len(raw.reads) < 10  # 30KB 전체가 아니라 필요한 청크만 읽음
+    assert "가나다라" in text
+
+
+def test_pdf_extraction_is_cut_at_max_chars(extractor):
+    lines = [f"Page number {i}" for i in range(7)]
+    text = extractor.extract_text(io.BytesIO(text_pdf(lines)), PDF_TYPE, max_chars=30)
+    assert len(text) == 30 and text.startswith("Page number 0")
+
+
+def test_upload_endpoint_limits_extraction_to_max_text_length(monkeypatch):
+    monkeypatch.setattr("config.settings.MAX_TEXT_LENGTH", 1234)
+    calls = []
+
+    def fake_extract(self, fileobj, content_type, max_chars=None):
+        calls.append(max_chars)
+        raise ValueError("중단")  # 추출 인자만 확인하고 400으로 끝냄
+
+    monkeypatch.setattr(DocumentExtractor, "extract_text", fake_extract)
+    app = FastAPI()
+    app.include_router(plagiarism.router, prefix="/api")
+    response = TestClient(app).post("/api/check/file", files={"file": ("a.txt", b"x" * 5000, TEXT_TYPE)})
+
+    assert response.status_code == 400 and calls == [1234]
+
+
+@pytest.mark.parametrize("first, second, expected", [
+    (form_xobject_pdf(b"Alpha"), form_xobject_pdf(b"Bravo"), ("Alpha", "Bravo")),
+    (to_unicode_pdf(b"0058"), to_unicode_pdf(b"0059"), ("XXX", "YYY")),
+])
+def test_pages_sharing_a_content_stream_do_not_share_cache_entries(extractor, first, second, expected):
+    first_page = PyPDF2.PdfReader(io.BytesIO(first)).pages[0]
+    second_page = PyPDF2.PdfReader(io.BytesIO(second)).pages[0]
+    assert first_page.get_contents().get_data() == second_page.get_contents().get_data()
+    assert page_content_hash(first_page) != page_content_hash(second_page)
+
+    # 다른 사용자의 업로드 텍스트가 캐시에서 새어 나오지 않음
+    texts = [extractor.extract_text(io.BytesIO(data), PDF_TYPE).strip() for data in (first, second)]
+    assert tuple(texts) == expected
+    assert extractor.extract_text(io.BytesIO(first), PDF_TYPE).strip() == expected[0]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+lxml HtmlExtractor 테스트 (fixtures/html의 저장된 페이지 사용)
+선택자 변환, 잡음 요소 제거, 대체 경로, 링크 추출을 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from services.html_extractor import HtmlExtractor, css_to_xpath
+from services.web_crawler_service import PAGE_EXTRACTOR
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "html")
+
+
+def load(name):
+    with open(os.path.join(FIXTURE_DIR, name), encoding="utf-8") as f:
+        return f.read()
+
+
+def test_css_to_xpath():
+    assert css_to_xpath("h1.firstHeading") == (
+        ".//h1[contains(concat(' ', normalize-space(@class), ' '), ' firstHeading ')]")
+    assert css_to_xpath("#content") == ".//*[@id='content']"
+    assert css_to_xpath('[class*="title"]') == ".//*[contains(@class, 'title')]"
+    assert css_to_xpath(".result a") == (
+        ".//*[contains(concat(' ', normalize-space(@class), ' '), ' result ')]//a")
+    with pytest.raises(ValueError):
+        css_to_xpath("div > p")
+
+
+def test_wikipedia_fixture_skips_boilerplate():
+    extractor = HtmlExtractor(['.mw-parser-output'], ['h1.firstHeading', 'h1'])
+    page = extractor.extract(load("wikipedia_article.html"))
+
+    assert page.title == "인공지능"
+    assert len(page.content) > 5000
+    for noise in ("편집", "관련 문서", "바닥글", "메뉴", "window.__CONFIG__", "[0]"):
+        assert noise not in page.content
+
+
+def test_fallback_to_paragraphs():
+    page = PAGE_EXTRACTOR.extract(load("news_article.html"))
+
+    assert page.title.startswith("교육 정책 변화와 디지털 전환")
+    assert "관련 기사" not in page.content and "등록" not in page.content
+    assert HtmlExtractor(['.content']).extract(load("news_article.html")) is None  # 대체 경로 없음
+
+
+def test_inline_text_and_tail_order():
+    extractor = HtmlExtractor(['.content'], min_content_length=1)
+    page = extractor.extract("<div class='content'>앞 <b>굵게</b>뒤<script>x()</script> 끝<!-- 주석 --></div>")
+    assert page.content == "앞 굵게뒤 끝"
+    assert extractor.extract("") is None
+
+
+def test_links_are_absolute_and_same_domain():
+    root = PAGE_EXTRACTOR.parse(
+        '<a href="/wiki/A">A</a><a href="https://ko.wikipedia.org/wiki/B#s">B</a>'
+        '<a href="https://other.org/x">X</a><a href="/wiki/A">A</a><a href="javascript:void(0)">J</a>'
+    )
+    links = PAGE_EXTRACTOR.links(root, "https://ko.wikipedia.org/w/index.php?search=a",
+                                 same_domain="ko.wikipedia.org")
+    assert links == ["https://ko.wikipedia.org/wiki/A", "https://ko.wikipedia.org/wiki/B"]
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
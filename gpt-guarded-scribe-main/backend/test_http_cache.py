@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+재크롤링 조건부 GET 테스트 (로컬 스텁 서버)
+ETag가 있는 페이지는 304, 검증자가 없는 페이지는 본문 해시로 변경 여부를 판단하고
+변경 없는 페이지는 파싱/저장을 건너뛰는지, 저장에 실패한 페이지는 다음 크롤링에서
+다시 가져오는지 확인합니다.
+"""
+
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+
+from services.http_cache import HttpCache
+from services.http_client import HttpClientPool
+from services.web_crawler_service import UNCHANGED, WebCrawlerService
+
+PAGES = {
+    "/etag": "<html><body><h1>ETag 문서</h1><div class='content'>" + "변경되지 않는 본문입니다. " * 30 + "</div></body></html>",
+    "/plain": "<html><body><h1>일반 문서</h1><div class='content'>" + "검증자 없는 본문입니다. " * 30 + "</div></body></html>",
+}
+ETAG = '"v1"'
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if self.path == "/etag" and self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        data = PAGES[self.path].encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        if self.path == "/etag":
+            self.send_header("ETag", ETAG)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def base_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+class FakeRepository:
+    """insert_documents 호출을 기록하고 fail_next=True면 한 번 실패"""
+
+    def __init__(self):
+        self.saved = []
+        self.fail_next = False
+
+    def insert_documents(self, documents):
+        if self.fail_next:
+            self.fail_next = False
+            raise RuntimeError("NOT NULL constraint failed")
+        self.saved.extend(documents)
+        return len(documents)
+
+
+@pytest.fixture
+def crawler(tmp_path):
+    pool = HttpClientPool(cache=HttpCache(cache_dir=str(tmp_path), max_bytes=1024 * 1024))
+    return WebCrawlerService(repository=FakeRepository(), http_client=pool)
+
+
+def _crawl_and_save(crawler, url):
+    article = crawler.crawl_article(url)
+    if article and article is not UNCHANGED:
+        crawler.save_to_database([article])
+    return article
+
+
+def test_etag_revalidation_returns_unchanged(base_url, crawler):
+    first = _crawl_and_save(crawler, f"{base_url}/etag")
+    second = _crawl_and_save(crawler, f"{base_url}/etag")
+
+    assert first["title"] == "ETag 문서"
+    assert second is UNCHANGED
+    stats = crawler.http.metrics()["cache"]
+    assert stats["not_modified"] == 1
+    assert stats["bytes_saved"] == len(PAGES["/etag"].encode("utf-8"))
+
+
+def test_same_body_without_validators_is_unchanged(base_url, crawler):
+    assert _crawl_and_save(crawler, f"{base_url}/plain")["title"] == "일반 문서"
+    assert _crawl_and_save(crawler, f"{base_url}/plain") is UNCHANGED
+    assert crawler.http.metrics()["cache"]["unchanged"] == 1
+
+
+@pytest.mark.parametrize("path", ["/etag", "/plain"])
+def test_failed_save_does_not_record_validators(base_url, crawler, path):
+    """첫 저장이 실패하면 캐시에 기록하지 않으므로 다음 크롤링에서 다시 파싱/저장"""
+    crawler.repository.fail_next = True
+    assert _crawl_and_save(crawler, f"{base_url}{path}")["title"]
+    assert crawler.repository.saved == []
+
+    retry = _crawl_and_save(crawler, f"{base_url}{path}")
+    assert retry is not UNCHANGED and [doc["url"] for doc in crawler.repository.saved] == [f"{base_url}{path}"]
+    assert _crawl_and_save(crawler, f"{base_url}{path}") is UNCHANGED
+
+
+def test_unsaved_article_is_fetched_again(base_url, crawler):
+    """파싱만 하고 저장하지 않은 페이지는 변경 없음으로 취급하지 않음"""
+    assert crawler.crawl_article(f"{base_url}/plain") is not UNCHANGED
+    assert crawler.crawl_article(f"{base_url}/plain") is not UNCHANGED
+
+
+def test_cache_disabled_always_refetches(base_url, tmp_path):
+    pool = HttpClientPool(cache=HttpCache(cache_dir=str(tmp_path), max_bytes=0))
+    crawler = WebCrawlerService(repository=FakeRepository(), http_client=pool)
+
+    assert _crawl_and_save(crawler, f"{base_url}/etag") is not UNCHANGED
+    assert _crawl_and_save(crawler, f"{base_url}/etag") is not UNCHANGED
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검사/매치 테이블 파티션 테스트
+SQLite에서는 아무것도 하지 않는지, TEST_POSTGRES_URL이 있으면 임시 스키마에서
+미리 만든 기간 밖의 INSERT도 DEFAULT 파티션으로 들어가고 나중에 해당 기간 파티션으로
+옮겨지는지, 파티션 DROP으로 지운 검사도 정리 건수에 들어가는지, 파티션 경계 직전에 만들어지고
+경계 뒤에 끝난 검사의 매치가 검사 파티션과 함께 지워지는지 확인합니다.
+"""
+
+import os
+import sys
+import uuid
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import create_engine, func, select, text
+from sqlalchemy.orm import sessionmaker
+
+import services.retention_service as retention_service
+from models import Base, PlagiarismCheck, PlagiarismMatch
+from services.partition_manager import PARTITIONS_QUERY, PartitionManager
+from services.result_cache import ResultCache
+from services.result_writer import ResultWriter
+from services.retention_service import RetentionService
+
+
+def test_sqlite_is_left_alone():
+    engine = create_engine("sqlite://")
+    manager = PartitionManager(engine, interval="month")
+    assert manager.setup()["status"] == "skipped"
+    assert manager.ensure_partitions() == []
+    assert manager.partition_name("plagiarism_checks", datetime(2024, 12, 1)) == "plagiarism_checks_p202412"
+    assert manager._next_period(datetime(2024, 12, 1)) == datetime(2025, 1, 1)
+
+
+@pytest.fixture
+def postgres_engine():
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL이 없어 PostgreSQL 확인을 건너뜀")
+    schema = f"partition_test_{uuid.uuid4().hex[:8]}"
+    with create_engine(url).begin() as conn:
+        conn.execute(text(f"CREATE SCHEMA {schema}"))
+    engine = create_engine(url, connect_args={"options": f"-csearch_path={schema}"})
+    Base.metadata.create_all(engine, tables=[PlagiarismCheck.__table__, PlagiarismMatch.__table__])
+    yield engine
+    engine.dispose()
+    with create_engine(url).begin() as conn:
+        conn.execute(text(f"DROP SCHEMA {schema} CASCADE"))
+
+
+def _add_check(engine, check_id, created_at):
+    with sessionmaker(bind=engine)() as db:
+        check = PlagiarismCheck(id=check_id, original_text="원문", status="completed", created_at=created_at)
+        check.matches = [PlagiarismMatch(matched_text="원문", source_text="출처", source_title="제목",
+                                         similarity_score=10.0, start_index=0, end_index=2, created_at=created_at)]
+        db.add(check)
+        db.commit()
+
+
+def _rows_in(engine, partition):
+    with engine.connect() as conn:
+        return conn.execute(text(f"SELECT count(*) FROM {partition}")).scalar()
+
+
+def test_insert_beyond_premade_partitions_goes_to_default(postgres_engine):
+    manager = PartitionManager(postgres_engine, interval="day", premake=1)
+    assert manager.setup()["status"] == "ok"
+    future = datetime.utcnow() + timedelta(days=5)
+
+    _add_check(postgres_engine, "late", future)  # beat가 멈춘 상황: 이 날짜 파티션이 아직 없음
+
+    assert _rows_in(postgres_engine, "plagiarism_checks_default") == 1
+    assert _rows_in(postgres_engine, "plagiarism_matches_default") == 1
+
+    # beat가 돌아오면 해당 날짜 파티션을 만들고 DEFAULT의 행을 옮김 (매치는 그대로)
+    PartitionManager(postgres_engine, interval="day", premake=7).ensure_partitions()
+    day_partition = manager.partition_name("plagiarism_checks", future)
+    assert _rows_in(postgres_engine, day_partition) == 1
+    assert _rows_in(postgres_engine, "plagiarism_checks_default") == 0
+    with postgres_engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(PlagiarismMatch)).scalar() == 1
+        assert "plagiarism_checks_default" in conn.execute(
+            PARTITIONS_QUERY, {"table_name": "plagiarism_checks"}).scalars().all()
+
+
+def test_dropped_partitions_are_counted_and_invalidated(postgres_engine, monkeypatch):
+    cache = ResultCache(max_entries=10, ttl=3600)
+    monkeypatch.setattr(retention_service, "result_cache", cache)
+    now = datetime.utcnow()
+    manager = PartitionManager(postgres_engine, interval="day", premake=1)
+    manager.setup()
+    manager.ensure_partitions(now=now - timedelta(days=10))
+    for i in range(3):
+        _add_check(postgres_engine, f"old-{i}", now - timedelta(days=9, hours=i))
+    _add_check(postgres_engine, "recent", now)
+    cache.set("old-0:full.inline.application/json.identity", b"{}")
+
+    result = RetentionService(postgres_engine).purge(now - timedelta(days=5), pause=0, drop_partitions=True)
+
+    assert result.dropped_partitions and result.deleted_checks == 3
+    assert cache.get("old-0:full.inline.application/json.identity") is None
+    with postgres_engine.connect() as conn:
+        assert conn.execute(select(PlagiarismCheck.id)).scalars().all() == ["recent"]
+
+
+def test_matches_of_a_check_finished_after_the_boundary_are_purged_with_it(postgres_engine):
+    now = datetime.utcnow()
+    manager = PartitionManager(postgres_engine, interval="day", premake=1)
+    manager.setup()
+    manager.ensure_partitions(now=now - timedelta(days=10))
+    boundary = datetime(*(now - timedelta(days=8)).timetuple()[:3])
+    created_at = boundary - timedelta(seconds=1)  # 경계 1초 전에 만들어지고 경계 뒤에 끝난 검사
+
+    with sessionmaker(bind=postgres_engine)() as db:
+        db.add(PlagiarismCheck(id="late-night", original_text="원문", status="checking", created_at=created_at))
+        db.commit()
+        ResultWriter(db).save("late-night", [{"matched_text": "원문", "source_title": "제목", "source_url": None,
+                                              "similarity_score": 10.0, "start_index": 0, "end_index": 2}], 10.0, 0.1)
+    # 예전 방식으로 완료 시각에 저장돼 다음 날 파티션에 들어간 매치
+    _add_check(postgres_engine, "legacy", created_at)
+    with postgres_engine.begin() as conn:
+        conn.execute(text("UPDATE plagiarism_matches SET created_at = :t WHERE check_id = 'legacy'"),
+                     {"t": boundary + timedelta(seconds=1)})
+
+    day_partition = manager.partition_name("plagiarism_matches", created_at)
+    with postgres_engine.connect() as conn:
+        assert conn.execute(text(f"SELECT check_id FROM {day_partition}")).scalars().all() == ["late-night"]
+
+    result = RetentionService(postgres_engine).purge(boundary, pause=0, drop_partitions=True)
+
+    assert result.deleted_checks == 2
+    with postgres_engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(PlagiarismMatch)).scalar() == 0
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+자주 실행되는 쿼리가 인덱스를 사용하는지 EXPLAIN으로 확인하는 테스트
+임시 SQLite DB에 마이그레이션을 적용한 뒤 쿼리 계획을 검사합니다.
+TEST_POSTGRES_URL을 지정하면 PostgreSQL에서도 같은 쿼리를 확인합니다.
+"""
+
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import and_, create_engine, func, or_, select, text
+
+from models import Base, DailyStatistics, DocumentChunk, DocumentSource, PlagiarismCheck, PlagiarismMatch
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+CUTOFF = datetime(2024, 1, 1)
+
+HOT_QUERIES = {
+    "활성 문서 수": select(func.count()).select_from(DocumentSource).where(DocumentSource.is_active == True),
+    "유형별 활성 문서 수": select(DocumentSource.source_type, func.count())
+        .where(DocumentSource.is_active == True).group_by(DocumentSource.source_type),
+    "URL 중복 확인": select(DocumentSource.url).where(DocumentSource.url.in_(["https://a", "https://b"])),
+    "검사 이력 첫 페이지": select(PlagiarismCheck.id, PlagiarismCheck.created_at)
+        .order_by(PlagiarismCheck.created_at.desc(), PlagiarismCheck.id.desc()).limit(11),
+    "검사 이력 커서 페이지": select(PlagiarismCheck.id, PlagiarismCheck.created_at)
+        .where(or_(PlagiarismCheck.created_at < CUTOFF,
+                   and_(PlagiarismCheck.created_at == CUTOFF, PlagiarismCheck.id < "m")))
+        .order_by(PlagiarismCheck.created_at.desc(), PlagiarismCheck.id.desc()).limit(11),
+    "상태별 최근 검사": select(PlagiarismCheck.id)
+        .where(PlagiarismCheck.status == "completed", PlagiarismCheck.created_at >= CUTOFF),
+    "보관 기간 지난 검사": select(PlagiarismCheck.id).where(PlagiarismCheck.created_at < CUTOFF),
+    "검사별 매치": select(PlagiarismMatch).where(PlagiarismMatch.check_id == "check-1"),
+    "청크 해시 조회": select(DocumentChunk.source_id).where(DocumentChunk.chunk_hash == "abc"),
+    "최근 일별 통계": select(DailyStatistics).where(DailyStatistics.date >= CUTOFF.date()),
+}
+
+
+def _migrate(engine):
+    Base.metadata.create_all(bind=engine)
+    config = Config(os.path.join(BASE_DIR, "alembic.ini"))
+    config.set_main_option("script_location", os.path.join(BASE_DIR, "migrations"))
+    config.attributes["configure_logger"] = False
+    with engine.begin() as connection:
+        config.attributes["connection"] = connection
+        command.upgrade(config, "head")
+
+
+def _sql(engine, query) -> str:
+    return str(query.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True}))
+
+
+@pytest.fixture(scope="module")
+def sqlite_engine():
+    tmp_dir = tempfile.mkdtemp()
+    engine = create_engine(f"sqlite:///{os.path.join(tmp_dir, 'indexes.db')}")
+    _migrate(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_sqlite_hot_query_uses_index(sqlite_engine, name):
+    """SQLite: 테이블 전체 스캔(SCAN 테이블, 인덱스 없음)이 없어야 함"""
+    with sqlite_engine.connect() as conn:
+        plan = [row[-1] for row in conn.execute(text("EXPLAIN QUERY PLAN " + _sql(sqlite_engine, HOT_QUERIES[name])))]
+
+    full_scans = [step for step in plan if step.startswith("SCAN") and "USING" not in step]
+    assert not full_scans, f"{name}: 인덱스 미사용 {plan}"
+    assert any("INDEX" in step or "PRIMARY KEY" in step for step in plan), f"{name}: {plan}"
+
+
+@pytest.mark.parametrize("name", list(HOT_QUERIES))
+def test_postgres_hot_query_uses_index(name):
+    """PostgreSQL: 순차 스캔을 끈 상태에서 인덱스 계획이 나오는지 확인"""
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL이 없어 PostgreSQL 확인을 건너뜀")
+
+    engine = create_engine(url)
+    _migrate(engine)
+    with engine.begin() as conn:
+        conn.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = "\n".join(row[0] for row in conn.execute(text("EXPLAIN " + _sql(engine, HOT_QUERIES[name]))))
+    engine.dispose()
+
+    assert "Seq Scan" not in plan, f"{name}: 인덱스 미사용\n{plan}"
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
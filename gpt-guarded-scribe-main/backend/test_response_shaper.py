@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검사 결과 응답 형태 테스트 (메모리 SQLite)
+text=omit|gzip, sources=table, msgpack, br/gzip 협상이 같은 결과를 더 작게 돌려주는지,
+형태마다 ETag가 따로인지, 잘못된 값은 400인지 확인합니다.
+"""
+
+import base64
+import gzip
+import json
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import get_db
+from models import Base, PlagiarismCheck, PlagiarismMatch
+from routers import plagiarism
+from services.response_shaper import msgpack
+from services.result_cache import ResultCache
+
+ORIGINAL = "표절 검사 대상 원문입니다. " * 200
+
+
+@pytest.fixture
+def client(monkeypatch):
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    Session = sessionmaker(bind=engine)
+    with Session() as db:
+        check = PlagiarismCheck(id="big", original_text=ORIGINAL, status="completed", similarity_score=60.0)
+        check.matches = [
+            PlagiarismMatch(matched_text=f"원문 {i}", source_text="출처", source_title=f"출처 {i % 3}",
+                            source_url=f"https://example.com/{i % 3}", similarity_score=60.0,
+                            start_index=i, end_index=i + 5)
+            for i in range(30)
+        ]
+        db.add(check)
+        db.commit()
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(plagiarism, "result_cache", ResultCache(max_entries=20, ttl=3600))
+    app = FastAPI()
+    app.include_router(plagiarism.router, prefix="/api")
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def _get(client, params=None, **headers):
+    return client.get("/api/check/big", params=params, headers={"Accept-Encoding": "identity", **headers})
+
+
+def test_text_modes(client):
+    full = _get(client).json()
+    assert full["original_text"] == ORIGINAL
+
+    omitted = _get(client, {"text": "omit"}).json()
+    assert "original_text" not in omitted and omitted["original_text_length"] == len(ORIGINAL)
+    assert omitted["matches"] == full["matches"]
+
+    packed = _get(client, {"text": "gzip"}).json()
+    assert packed["original_text_encoding"] == "gzip+base64"
+    assert gzip.decompress(base64.b64decode(packed["original_text"])).decode("utf-8") == ORIGINAL
+
+
+def test_source_table_references_each_source_once(client):
+    full = _get(client).json()
+    table = _get(client, {"sources": "table"}).json()
+
+    assert len(table["sources"]) == 3
+    rebuilt = [
+        {**{k: v for k, v in match.items() if k != "source_index"},
+         "source_title": table["sources"][match["source_index"]]["title"],
+         "source_url": table["sources"][match["source_index"]]["url"]}
+        for match in table["matches"]
+    ]
+    assert rebuilt == full["matches"]
+
+
+def test_encoding_and_media_type_negotiation(client):
+    plain = _get(client)
+    zipped = _get(client, **{"Accept-Encoding": "gzip"})
+    assert zipped.headers["content-encoding"] == "gzip"
+    assert zipped.content == plain.content  # httpx가 풀어 줌
+    assert int(zipped.headers["content-length"]) < len(plain.content) / 5
+    assert zipped.headers["etag"] != plain.headers["etag"]  # 형태마다 다른 캐시 항목
+    assert "Accept-Encoding" in zipped.headers["vary"]
+
+    if msgpack is not None:
+        packed = _get(client, Accept="application/msgpack")
+        assert packed.headers["content-type"].startswith("application/msgpack")
+        assert msgpack.unpackb(packed.content, raw=False) == json.loads(plain.content)
+
+
+def test_unknown_shape_is_rejected(client):
+    assert _get(client, {"text": "zip"}).status_code == 400
+    assert _get(client, {"sources": "list"}).status_code == 400
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검사 결과 응답 캐시 테스트 (메모리 SQLite)
+완료된 결과는 캐시와 ETag(304)로 응답하고, 다른 워커나 보관 기간 정리가 행을 지운 뒤에는
+캐시에 남아 있던 결과나 304 대신 404를 돌려주는지 확인합니다.
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from database import get_db
+from models import Base, PlagiarismCheck, PlagiarismMatch
+from routers import plagiarism
+from services.result_cache import ResultCache
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as db:
+        check = PlagiarismCheck(id="done", original_text="검사할 원문입니다.", status="completed", similarity_score=40.0)
+        check.matches = [PlagiarismMatch(matched_text="원문", source_text="출처", source_title="제목",
+                                         similarity_score=40.0, start_index=0, end_index=2)]
+        db.add(check)
+        db.commit()
+    return engine
+
+
+@pytest.fixture
+def client(engine, monkeypatch):
+    Session = sessionmaker(bind=engine)
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(plagiarism, "result_cache", ResultCache(max_entries=10, ttl=3600))
+    app = FastAPI()
+    app.include_router(plagiarism.router, prefix="/api")
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+def test_cached_result_is_served_with_etag(engine, client):
+    first = client.get("/api/check/done")
+    assert first.status_code == 200 and first.json()["matches"][0]["matched_text"] == "원문"
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    second = client.get("/api/check/done")
+    assert second.content == first.content and second.headers["etag"] == first.headers["etag"]
+    assert len(statements) == 1 and "plagiarism_matches" not in statements[0]  # 존재 확인만
+
+    assert client.get("/api/check/done", headers={"If-None-Match": first.headers["etag"]}).status_code == 304
+
+
+def test_purged_check_is_not_served_from_cache(engine, client):
+    etag = client.get("/api/check/done").headers["etag"]
+
+    # 다른 워커의 삭제 / RetentionService.purge / 파티션 삭제처럼 이 프로세스의 캐시를 거치지 않는 삭제
+    with engine.begin() as conn:
+        conn.execute(text("DELETE FROM plagiarism_matches"))
+        conn.execute(text("DELETE FROM plagiarism_checks"))
+
+    assert client.get("/api/check/done", headers={"If-None-Match": etag}).status_code == 404
+    assert client.get("/api/check/done").status_code == 404
+
+    # 무효화된 캐시 대신 새로 저장된 행을 읽음
+    with sessionmaker(bind=engine)() as db:
+        db.add(PlagiarismCheck(id="done", original_text="다시 검사한 원문입니다.", status="completed"))
+        db.commit()
+    again = client.get("/api/check/done")
+    assert again.status_code == 200 and again.json()["matches"] == [] and again.headers["etag"] != etag
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+검사 결과 일괄 저장 테스트 (메모리 SQLite)
+매치를 묶음 단위 executemany로 넣고 검사 갱신/통계와 함께 한 번만 커밋하는지,
+중간에 실패하면 검사 상태와 매치가 모두 원래대로 남는지, COPY 본문이 "\\N" 같은 값을 NULL로
+바꾸지 않는지 (TEST_POSTGRES_URL이 있으면 실제 COPY로도) 확인합니다.
+"""
+
+import csv
+import os
+import sys
+import uuid
+from datetime import datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import create_engine, delete, event, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from models import Base, DailyStatistics, PlagiarismCheck, PlagiarismMatch
+from services.result_writer import ResultWriter, copy_csv
+
+
+def _match(i):
+    return {"matched_text": f"문장 {i}", "source_title": "출처", "source_url": "https://example.com",
+            "similarity_score": 70.0, "start_index": i, "end_index": i + 3}
+
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(PlagiarismCheck(id="c1", original_text="원문", status="checking"))
+        session.commit()
+        yield session
+
+
+def test_matches_are_inserted_in_batches_in_one_transaction(db, monkeypatch):
+    monkeypatch.setattr("config.settings.BULK_INSERT_BATCH_SIZE", 100)
+    engine = db.get_bind()
+    inserts, commits = [], []
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, params, context, executemany:
+                 inserts.append(executemany) if statement.startswith("INSERT INTO plagiarism_matches") else None)
+    event.listen(engine, "commit", lambda conn: commits.append(1))
+
+    saved = ResultWriter(db).save("c1", [_match(i) for i in range(250)], 70.0, 1.5)
+
+    assert saved == 250
+    assert inserts == [True, True, True]  # 행마다가 아니라 100개 묶음마다 한 번
+    assert len(commits) == 1
+    check = db.get(PlagiarismCheck, "c1")
+    assert check.status == "completed" and check.similarity_score == 70.0 and check.processing_time == 1.5
+    assert db.scalar(select(func.count()).select_from(PlagiarismMatch)) == 250
+    assert db.scalar(select(DailyStatistics.completed_checks)) == 1
+
+
+def test_failure_rolls_back_check_update_and_matches(db):
+    matches = [_match(i) for i in range(5)] + [{**_match(5), "matched_text": None}]  # NOT NULL 위반
+
+    with pytest.raises(Exception):
+        ResultWriter(db).save("c1", matches, 70.0, 1.5)
+
+    assert db.get(PlagiarismCheck, "c1").status == "checking"
+    assert db.scalar(select(func.count()).select_from(PlagiarismMatch)) == 0
+    assert db.scalar(select(func.count()).select_from(DailyStatistics)) == 0
+
+
+def test_missing_check_is_created_with_its_matches(db):
+    assert ResultWriter(db).save("c2", [_match(0)], 10.0, 0.1) == 1
+    assert db.get(PlagiarismCheck, "c2").status == "completed"
+    assert db.scalar(select(DailyStatistics.total_checks)) == 1
+
+
+def test_matches_take_the_check_created_at(db):
+    created_at = datetime(2024, 5, 1, 23, 59, 59)
+    db.add(PlagiarismCheck(id="c3", original_text="원문", status="checking", created_at=created_at))
+    db.commit()
+
+    ResultWriter(db).save("c3", [_match(0), _match(1)], 10.0, 0.1)
+
+    assert db.scalars(select(PlagiarismMatch.created_at).where(PlagiarismMatch.check_id == "c3")).all() == [
+        created_at, created_at
+    ]  # 완료 시각이 아니라 검사 시각 (검사와 같은 파티션)
+
+
+def test_copy_csv_quotes_values_and_leaves_nulls_unquoted():
+    row = {"check_id": "c1", "matched_text": "\\N", "source_text": 'a "b",\nc', "source_title": "",
+           "source_url": None, "similarity_score": 70.5, "start_index": 0, "end_index": 3,
+           "created_at": datetime(2024, 5, 1, 12, 0, 0, 123000)}
+
+    line = copy_csv([row]).getvalue()
+
+    assert line.startswith('"c1","\\N","a ""b"",\nc","",,"70.5"')  # NULL만 따옴표 없는 빈 칸
+    assert line.endswith(',"2024-05-01 12:00:00.123000"\n')
+    assert next(csv.reader(copy_csv([row]))) == [
+        "c1", "\\N", 'a "b",\nc', "", "", "70.5", "0", "3", "2024-05-01 12:00:00.123000"
+    ]
+
+
+def test_postgres_copy_keeps_backslash_n_values(monkeypatch):
+    url = os.getenv("TEST_POSTGRES_URL")
+    if not url:
+        pytest.skip("TEST_POSTGRES_URL이 없어 PostgreSQL 확인을 건너뜀")
+    monkeypatch.setattr("config.settings.BULK_COPY_MIN_ROWS", 1)
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    check_id = f"copy-{uuid.uuid4().hex[:8]}"
+    try:
+        with sessionmaker(bind=engine)() as db:
+            matches = [{**_match(0), "matched_text": "\\N", "source_title": "\\N"},
+                       {**_match(1), "source_url": None}]
+            assert ResultWriter(db).save(check_id, matches, 10.0, 0.1) == 2
+            rows = db.execute(select(PlagiarismMatch.matched_text, PlagiarismMatch.source_title,
+                                     PlagiarismMatch.source_url)
+                              .where(PlagiarismMatch.check_id == check_id)
+                              .order_by(PlagiarismMatch.start_index)).all()
+        assert [tuple(row) for row in rows] == [("\\N", "\\N", "https://example.com"),
+                                                 ("문장 1", "출처", None)]
+    finally:
+        with engine.begin() as conn:
+            conn.execute(delete(PlagiarismCheck.__table__).where(PlagiarismCheck.id == check_id))
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
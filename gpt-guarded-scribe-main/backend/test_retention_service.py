@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+보관 기간 정리 테스트 (메모리 SQLite)
+cutoff 이전 검사만 batch_size개씩 지우고 배치마다 커밋/진행 보고/대기하는지, 배치 크기의
+배수일 때 경계가 맞는지, 매치가 함께 지워지고 결과 캐시에서도 빠지는지 확인합니다.
+"""
+
+import os
+import sys
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import create_engine, event, func, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import services.retention_service as retention_service
+from database import apply_sqlite_pragmas
+from models import Base, PlagiarismCheck, PlagiarismMatch
+from services.result_cache import ResultCache
+from services.retention_service import RetentionService, _partition_upper_bound
+
+CUTOFF = datetime(2024, 3, 1)
+
+
+def _engine(old: int, new: int):
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", lambda dbapi_connection, record: apply_sqlite_pragmas(dbapi_connection, True))
+    Base.metadata.create_all(engine)
+    with sessionmaker(bind=engine)() as db:
+        for i in range(old + new):
+            # old개는 cutoff 이전, 나머지는 cutoff 시각부터 (경계 값은 남겨야 함)
+            created_at = CUTOFF - timedelta(hours=old - i) if i < old else CUTOFF + timedelta(hours=i - old)
+            check = PlagiarismCheck(id=f"c{i:03d}", original_text="원문", status="completed", created_at=created_at)
+            check.matches = [PlagiarismMatch(matched_text="원문", source_text="출처", source_title="제목",
+                                             similarity_score=10.0, start_index=0, end_index=2)]
+            db.add(check)
+        db.commit()
+    return engine
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = ResultCache(max_entries=100, ttl=3600)
+    monkeypatch.setattr(retention_service, "result_cache", cache)
+    return cache
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    calls = []
+    monkeypatch.setattr(retention_service.time, "sleep", calls.append)
+    return calls
+
+
+@pytest.mark.parametrize("old, batch_size, batches", [(7, 3, 3), (6, 3, 2), (0, 3, 0)])
+def test_purge_deletes_only_before_cutoff_in_batches(cache, sleeps, old, batch_size, batches):
+    engine = _engine(old=old, new=4)
+    commits, progress = [], []
+    event.listen(engine, "commit", lambda conn: commits.append(1))
+
+    result = RetentionService(engine).purge(CUTOFF, batch_size=batch_size, pause=0.5,
+                                            on_progress=lambda r: progress.append(r.deleted_checks))
+
+    assert result.deleted_checks == old and result.batches == batches
+    assert progress == [min(batch_size * (n + 1), old) for n in range(batches)]
+    # 가득 찬 배치 뒤에만 대기 (덜 찬 마지막 배치 뒤에는 바로 끝남)
+    assert sleeps == [0.5] * (old // batch_size)
+    assert len(commits) >= batches
+    with engine.connect() as conn:
+        remaining = conn.execute(select(PlagiarismCheck.id, PlagiarismCheck.created_at)).all()
+        assert len(remaining) == 4 and all(created_at >= CUTOFF for _id, created_at in remaining)
+        assert conn.execute(select(func.count()).select_from(PlagiarismMatch)).scalar() == 4  # CASCADE
+
+
+def test_purged_checks_are_invalidated_in_result_cache(cache, sleeps):
+    engine = _engine(old=5, new=2)
+    for check_id in ("c000", "c004", "c005"):
+        cache.set(f"{check_id}:full.inline.application/json.identity", b"{}")
+
+    RetentionService(engine).purge(CUTOFF, batch_size=2, pause=0)
+
+    assert cache.get("c000:full.inline.application/json.identity") is None
+    assert cache.get("c004:full.inline.application/json.identity") is None
+    assert cache.get("c005:full.inline.application/json.identity") is not None
+
+
+def test_partition_upper_bound_parsing():
+    assert _partition_upper_bound("FOR VALUES FROM ('2024-01-01 00:00:00') TO ('2024-02-01 00:00:00')") \
+        == datetime(2024, 2, 1)
+    assert _partition_upper_bound("FOR VALUES FROM ('2024-01-01') TO (MAXVALUE)") is None
+    assert _partition_upper_bound("DEFAULT") is None
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+SQLite 성능 프로파일 테스트 (임시 SQLite 파일 DB)
+연결마다 WAL/동기화/외래 키 PRAGMA가 적용되는지, 여러 크롤러 스레드가 동시에 적재해도
+쓰기는 단일 writer 스레드에서만 실행되어 "database is locked" 없이 모두 저장되는지 확인합니다.
+"""
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import create_engine, event, func, select, text
+
+from database import apply_sqlite_pragmas
+from models import Base, DocumentSource
+from services.document_repository import DocumentRepository
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'profile.db'}", connect_args={"check_same_thread": False})
+    event.listen(engine, "connect", lambda dbapi_connection, record: apply_sqlite_pragmas(dbapi_connection))
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+def test_pragmas_are_applied_per_connection(engine):
+    with engine.connect() as conn:
+        assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+        assert conn.execute(text("PRAGMA foreign_keys")).scalar() == 1
+        assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+
+
+def test_concurrent_ingest_goes_through_one_writer_thread(engine):
+    writers = set()
+    event.listen(engine, "before_cursor_execute",
+                 lambda conn, cursor, statement, *args: writers.add(threading.current_thread().name)
+                 if statement.startswith("INSERT INTO document_sources") else None)
+    repository = DocumentRepository(engine)
+
+    def crawl(worker):
+        return repository.insert_documents([
+            {"title": f"문서 {worker}-{i}", "url": f"https://example.com/{worker}/{i}", "source_type": "web",
+             "content": f"{worker}번 크롤러가 {i}번째로 수집한 서로 다른 내용의 문서 {worker * 100 + i} 입니다."}
+            for i in range(5)
+        ])
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        saved = list(pool.map(crawl, range(16)))
+
+    assert saved == [5] * 16
+    assert len(writers) == 1 and next(iter(writers)).startswith("sqlite-ingest")
+    with engine.connect() as conn:
+        assert conn.execute(select(func.count()).select_from(DocumentSource)).scalar() == 80
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+통계 스냅샷 무효화 테스트 (메모리 SQLite)
+카운터를 더한 트랜잭션이 커밋되기 전에는 스냅샷을 무효화하지 않아 커밋 전 값이 캐시되지 않는지,
+롤백하면 무효화가 취소되는지, 문서 적재는 커밋 뒤에 스냅샷을 무효화하는지, 자정 직전에 만들고
+다음 날 끝난 검사를 카운터와 rollup이 같은 날에 세는지 확인합니다.
+"""
+
+import os
+import sys
+from datetime import date, datetime
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import services.document_repository as document_repository
+from models import Base, DailyStatistics, PlagiarismCheck
+from services.document_repository import DocumentRepository
+from services.result_writer import ResultWriter
+from services.statistics_service import StatisticsService
+
+
+def _engine():
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    return engine
+
+
+def test_snapshot_is_invalidated_only_after_commit():
+    engine = _engine()
+    stats = StatisticsService(engine)
+    assert stats.snapshot(max_age=3600)["today"]["total_checks"] == 0
+
+    with sessionmaker(bind=engine)() as db:
+        stats.record_check_created(db, count=2)
+        stats.record_check_created(db)
+        # 커밋 전: 스냅샷은 그대로 (무효화됐다면 여기서 다시 읽어 커밋 전 상태를 캐시했을 것)
+        assert stats._snapshot_at > 0
+        db.commit()
+        assert stats._snapshot_at == 0.0
+
+    assert stats.snapshot(max_age=3600)["today"]["total_checks"] == 3
+
+
+def test_rollback_cancels_pending_invalidation():
+    engine = _engine()
+    stats = StatisticsService(engine)
+    stats.snapshot(max_age=3600)
+
+    with sessionmaker(bind=engine)() as db:
+        stats.record_check_failed(db)
+        db.rollback()
+        db.commit()  # 빈 트랜잭션 커밋에서는 무효화하지 않음
+        assert stats._snapshot_at > 0 and "stats_invalidate_pending" not in db.info
+
+        stats.record_check_failed(db)
+        db.commit()
+        assert stats._snapshot_at == 0.0
+
+    assert stats.snapshot(max_age=3600)["today"]["error_checks"] == 1
+
+
+def test_repository_ingest_invalidates_after_commit(monkeypatch):
+    engine = _engine()
+    stats = StatisticsService(engine)
+    monkeypatch.setattr(document_repository, "get_statistics_service", lambda: stats)
+    stats.snapshot(max_age=3600)
+
+    saved = DocumentRepository(engine).insert_documents([
+        {"title": "문서", "url": "https://example.com/stats", "source_type": "web",
+         "content": "통계 스냅샷 무효화를 확인하기 위한 충분히 긴 문서 본문입니다."},
+    ])
+
+    assert saved == 1 and stats._snapshot_at == 0.0
+    snapshot = stats.snapshot(max_age=3600)
+    assert snapshot["today"]["documents_ingested"] == 1
+    assert snapshot["documents"]["by_source_type"] == {"web": 1}
+
+
+def test_late_night_check_is_counted_on_the_day_rollup_uses():
+    engine = _engine()
+    created_at = datetime(2024, 5, 1, 23, 59)
+    with sessionmaker(bind=engine)() as db:
+        db.add(PlagiarismCheck(id="late", original_text="원문", status="checking", created_at=created_at))
+        StatisticsService(engine).record_check_created(db)  # 생성 카운터는 오늘 날짜에 더해짐
+        db.commit()
+        ResultWriter(db).save("late", [], 40.0, 2.0)  # 완료는 다음 날 이후
+
+    def counters():
+        with engine.connect() as conn:
+            return {row.date: (row.completed_checks, row.similarity_score_sum, row.processing_time_sum)
+                    for row in conn.execute(select(DailyStatistics)).all() if row.completed_checks}
+
+    assert counters() == {date(2024, 5, 1): (1, 40.0, 2.0)}
+    StatisticsService(engine).rollup(date(2024, 5, 1))
+    assert counters() == {date(2024, 5, 1): (1, 40.0, 2.0)}  # 카운터와 보정 결과가 같은 날에 일치
+
+
+if __name__ == "__main__":
+    import pytest
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+위키백과 덤프 적재 테스트 (fixtures/wiki의 작은 샘플 덤프, 임시 SQLite DB)
+마크업 제거, 넘겨주기/다른 이름공간 제외, bz2 입력, 청크/지문 저장과 재실행 시 중복 제외를 확인합니다.
+"""
+
+import bz2
+import os
+import shutil
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pytest
+from sqlalchemy import create_engine, func, select
+
+from models import Base, DocumentChunk, DocumentSource
+from services.document_repository import DocumentRepository
+from utils.text_fingerprint import content_hash
+from services.wiki_dump_importer import WikiDumpImporter, iter_pages, strip_wikitext
+
+SAMPLE_DUMP = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures", "wiki", "kowiki-sample.xml")
+
+
+def test_strip_wikitext():
+    text = strip_wikitext(
+        "{{정보상자|이름={{중첩}}}}'''굵게'''(漢字, {{llang|en|x}}, AI)는 [[문서|보이는 글]]과 [[링크]]이다.<ref>출처</ref>\n"
+        "[[파일:그림.png|섬네일|설명 [[링크]]]]\n{| class=\"wikitable\"\n| 칸 || 칸\n|}\n"
+        "== 개요 ==\n* 목록 &amp; [https://example.org 외부] <!-- 주석 -->\n"
+        "== 각주 ==\n{{각주}}\n[[분류:테스트]]"
+    )
+    assert text == "굵게(漢字, AI)는 보이는 글과 링크이다.\n개요\n목록 & 외부"
+
+
+def test_iter_pages_skips_redirects_and_other_namespaces(tmp_path):
+    titles = [title for title, _ in iter_pages(SAMPLE_DUMP)]
+    assert titles == ["인공지능", "기후 변화", "토막글", "자연어 처리"]
+
+    compressed = tmp_path / "kowiki-sample.xml.bz2"
+    with open(SAMPLE_DUMP, "rb") as src, bz2.open(compressed, "wb") as dst:
+        shutil.copyfileobj(src, dst)
+    assert [title for title, _ in iter_pages(str(compressed), limit=2)] == titles[:2]
+
+
+def test_import_sample_dump(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'wiki.db'}")
+    Base.metadata.create_all(engine)
+    repository = DocumentRepository(engine)
+    repository.store_chunks = True  # 작업 프로세스에서 미리 나눈 청크 저장 경로 확인 (PostgreSQL과 같음)
+
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        importer = WikiDumpImporter(repository=repository, executor=executor, batch_size=2)
+        stats = importer.run(SAMPLE_DUMP)
+        again = importer.run(SAMPLE_DUMP)
+
+    assert (stats["pages"], stats["articles"], stats["saved"]) == (4, 3, 3)  # 토막글은 너무 짧음
+    assert again["saved"] == 0
+
+    with engine.connect() as conn:
+        documents = conn.execute(select(DocumentSource.url, DocumentSource.content, DocumentSource.content_hash,
+                                        DocumentSource.simhash, DocumentSource.source_type)).all()
+        chunks = conn.execute(select(func.count()).select_from(DocumentChunk)).scalar()
+
+    assert {document.source_type for document in documents} == {"wikipedia"}
+    assert "https://ko.wikipedia.org/wiki/%EA%B8%B0%ED%9B%84_%EB%B3%80%ED%99%94" in {d.url for d in documents}
+    assert all(d.content_hash == content_hash(d.content) and d.simhash is not None for d in documents)
+    assert chunks >= 3 * 5
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-v"]))
@@ -0,0 +1 @@
+"""서비스와 ORM 모델이 함께 쓰는 순수 함수 모듈 (다른 계층에 의존하지 않음)"""
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""문서 본문 압축 저장 (zstd, 없으면 zlib)"""
+
+import zlib
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:  # 선택 의존성
+    zstandard = None
+
+from config import settings
+
+# 블롭 첫 바이트: 압축 방식 (나중에 방식이 바뀌어도 기존 블롭을 읽을 수 있게)
+CODEC_ZLIB = b"\x01"
+CODEC_ZSTD = b"\x02"
+
+ZLIB_LEVEL = 6
+ZSTD_LEVEL = 10
+
+
+def compression_enabled() -> bool:
+    return settings.CONTENT_COMPRESSION != "none"
+
+
+def compress_content(text: str) -> bytes:
+    """본문을 방식 표시 바이트 + 압축 데이터로"""
+    data = text.encode("utf-8")
+    if settings.CONTENT_COMPRESSION == "zstd" and zstandard is not None:
+        return CODEC_ZSTD + zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(data)
+    return CODEC_ZLIB + zlib.compress(data, ZLIB_LEVEL)
+
+
+def decompress_content(blob: bytes) -> str:
+    codec, data = bytes(blob[:1]), bytes(blob[1:])
+    if codec == CODEC_ZLIB:
+        return zlib.decompress(data).decode("utf-8")
+    if codec == CODEC_ZSTD:
+        if zstandard is None:
+            raise RuntimeError("zstd로 압축된 본문을 읽으려면 zstandard 패키지가 필요합니다")
+        return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+    raise ValueError(f"알 수 없는 본문 압축 방식: {codec!r}")
+
+
+def full_text(content: str, blob: Optional[bytes]) -> str:
+    """content 컬럼(미리보기)과 content_blob으로 전체 본문 (블롭이 없는 예전 행은 content 그대로)"""
+    return decompress_content(blob) if blob else content
+
+
+def preview(text: str) -> str:
+    """content 컬럼에 남기는 앞부분 (목록/미리보기용)"""
+    return text[:settings.CONTENT_PREVIEW_CHARS]
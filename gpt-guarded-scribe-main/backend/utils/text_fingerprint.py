@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""문서 지문 (정확 중복용 content hash, 근사 중복용 64비트 SimHash)"""
+
+import hashlib
+import re
+from collections import Counter
+from typing import List
+
+SIMHASH_BITS = 64
+SIMHASH_BANDS = 4  # 16비트씩 4개: 해밍 거리 3 이하인 두 값은 적어도 한 밴드가 같음
+BAND_BITS = SIMHASH_BITS // SIMHASH_BANDS
+SHINGLE_SIZE = 2
+
+_WORD_PATTERN = re.compile(r"[\w가-힣]+")
+
+
+def normalize_text(text: str) -> str:
+    """공백/대소문자 차이를 없앤 비교용 텍스트"""
+    return " ".join(text.lower().split())
+
+
+def content_hash(text: str) -> str:
+    """정규화된 본문의 SHA-256 (미러링/재크롤링된 같은 본문 판별용)"""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def simhash(text: str) -> int:
+    """단어 바이그램 기반 64비트 SimHash (부호 없는 정수)"""
+    words = _WORD_PATTERN.findall(text.lower())
+    if len(words) >= SHINGLE_SIZE:
+        features = Counter(
+            " ".join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)
+        )
+    else:
+        features = Counter(words)
+
+    weights = [0] * SIMHASH_BITS
+    for feature, count in features.items():
+        h = int.from_bytes(hashlib.blake2b(feature.encode("utf-8"), digest_size=8).digest(), "big")
+        for bit in range(SIMHASH_BITS):
+            weights[bit] += count if (h >> bit) & 1 else -count
+
+    value = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            value |= 1 << bit
+    return value
+
+
+def hamming_distance(a: int, b: int) -> int:
+    return bin((a ^ b) & ((1 << SIMHASH_BITS) - 1)).count("1")
+
+
+def simhash_bands(value: int) -> List[int]:
+    """밴드 테이블 조회용 16비트 조각들"""
+    mask = (1 << BAND_BITS) - 1
+    return [(value >> (band * BAND_BITS)) & mask for band in range(SIMHASH_BANDS)]
+
+
+def to_signed64(value: int) -> int:
+    """BIGINT 컬럼 저장용 (부호 있는 64비트로 변환)"""
+    return value - (1 << 64) if value >= (1 << 63) else value
+
+
+def from_signed64(value: int) -> int:
+    return value + (1 << 64) if value < 0 else value
@@ -41,13 +41,13 @@ CREATE TABLE IF NOT EXISTS plagiarism_matches (
 CREATE TABLE IF NOT EXISTS document_sources (
     id SERIAL PRIMARY KEY,
     title VARCHAR(500) NOT NULL,
-    content TEXT NOT NULL,
+    content TEXT NOT NULL,     -- content_blob이 있으면 앞부분 미리보기만
+    content_blob BYTEA,        -- 압축된 전체 본문 (content_codec: 첫 바이트가 압축 방식)
     url TEXT,
-    source_type VARCHAR(50) NOT NULL DEFAULT 'web' CHECK (source_type IN ('academic', 'web', 'book', 'article', 'thesis')),
+    source_type VARCHAR(50) NOT NULL DEFAULT 'web',  -- academic, web, crawled, wikipedia_*, ai_generated 등
     vector_embedding JSON,
-    content_hash VARCHAR(64) UNIQUE GENERATED ALWAYS AS (
-        ENCODE(SHA256(content::bytea), 'hex')
-    ) STORED,
+    content_hash VARCHAR(64),  -- 정규화된 본문 SHA-256 (적재 시 애플리케이션에서 계산)
+    simhash BIGINT,            -- 근사 중복 판정용 64비트 SimHash
     created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP,
     is_active BOOLEAN DEFAULT TRUE,
@@ -55,6 +55,26 @@ CREATE TABLE IF NOT EXISTS document_sources (
     domain VARCHAR(100)
 );
 
+-- SimHash 밴드 테이블 (16비트 x 4, 근사 중복 후보 조회용)
+CREATE TABLE IF NOT EXISTS document_simhash_bands (
+    source_id INTEGER NOT NULL REFERENCES document_sources(id) ON DELETE CASCADE,
+    band SMALLINT NOT NULL,
+    value INTEGER NOT NULL,
+    PRIMARY KEY (source_id, band, value)
+);
+
+-- 문서 문장 청크 테이블 (트라이그램 후보 검색용)
+CREATE TABLE IF NOT EXISTS document_chunks (
+    id SERIAL PRIMARY KEY,
+    source_id INTEGER NOT NULL REFERENCES document_sources(id) ON DELETE CASCADE,
+    chunk_index INTEGER NOT NULL,
+    content TEXT NOT NULL,
+    start_offset INTEGER,      -- 원문 내 위치
+    end_offset INTEGER,
+    token_count INTEGER,
+    chunk_hash VARCHAR(64)     -- 정규화된 청크 SHA-256
+);
+
 -- 사용자 세션 테이블
 CREATE TABLE IF NOT EXISTS user_sessions (
     id VARCHAR(36) PRIMARY KEY DEFAULT uuid_generate_v4()::text,
@@ -86,9 +106,14 @@ CREATE INDEX IF NOT EXISTS idx_plagiarism_matches_check_id ON plagiarism_matches
 CREATE INDEX IF NOT EXISTS idx_plagiarism_matches_similarity ON plagiarism_matches(similarity_score DESC);
 CREATE INDEX IF NOT EXISTS idx_plagiarism_matches_source_title ON plagiarism_matches USING GIN(source_title gin_trgm_ops);
 
-CREATE INDEX IF NOT EXISTS idx_document_sources_content_hash ON document_sources(content_hash);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_document_sources_content_hash ON document_sources(content_hash);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_document_sources_url ON document_sources(url);
 CREATE INDEX IF NOT EXISTS idx_document_sources_source_type ON document_sources(source_type);
 CREATE INDEX IF NOT EXISTS idx_document_sources_is_active ON document_sources(is_active);
+CREATE INDEX IF NOT EXISTS ix_document_simhash_bands_lookup ON document_simhash_bands(band, value);
+CREATE INDEX IF NOT EXISTS ix_document_chunks_source_id ON document_chunks(source_id, chunk_index);
+CREATE INDEX IF NOT EXISTS ix_document_chunks_chunk_hash ON document_chunks(chunk_hash);
+CREATE INDEX IF NOT EXISTS ix_document_chunks_content_trgm ON document_chunks USING GIN(content gin_trgm_ops);
 CREATE INDEX IF NOT EXISTS idx_document_sources_content_search ON document_sources USING GIN(to_tsvector('simple', content));
 CREATE INDEX IF NOT EXISTS idx_document_sources_title_search ON document_sources USING GIN(to_tsvector('simple', title));
 
@@ -123,55 +148,56 @@ CREATE TRIGGER update_document_sources_updated_at
     FOR EACH ROW EXECUTE FUNCTION update_updated_at_column();
 
 -- 파티션 테이블 (대량 데이터 처리용)
--- CREATE TABLE IF NOT EXISTS plagiarism_checks_partitioned (
---     LIKE plagiarism_checks INCLUDING ALL
--- ) PARTITION BY RANGE (created_at);
+-- plagiarism_checks / plagiarism_matches의 created_at 범위 파티셔닝은
+-- backend/partition_tables.py(PartitionManager)가 기존 테이블을 변환하고
+-- 다음 기간 파티션을 미리 만듭니다 (PARTITIONING_ENABLED=true, PARTITION_INTERVAL=day|month).
+-- 변환 후 check_id 외래 키 대신 plagiarism_checks_delete_matches 트리거가 매치를 지웁니다.
 
--- 월별 파티션 예시
--- CREATE TABLE IF NOT EXISTS plagiarism_checks_2024_01 PARTITION OF plagiarism_checks_partitioned
---     FOR VALUES FROM ('2024-01-01') TO ('2024-02-01');
-
--- 통계 테이블
+-- 통계 테이블 (검사 완료/문서 적재 시 애플리케이션이 날짜별로 UPSERT 증가)
 CREATE TABLE IF NOT EXISTS statistics (
     id SERIAL PRIMARY KEY,
-    date DATE DEFAULT CURRENT_DATE,
-    total_checks INTEGER DEFAULT 0,
-    completed_checks INTEGER DEFAULT 0,
-    error_checks INTEGER DEFAULT 0,
-    avg_similarity_score FLOAT DEFAULT 0.0,
-    avg_processing_time FLOAT DEFAULT 0.0,
-    created_at TIMESTAMP WITH TIME ZONE DEFAULT CURRENT_TIMESTAMP
+    date DATE NOT NULL DEFAULT CURRENT_DATE,
+    total_checks INTEGER NOT NULL DEFAULT 0,
+    completed_checks INTEGER NOT NULL DEFAULT 0,
+    error_checks INTEGER NOT NULL DEFAULT 0,
+    similarity_score_sum FLOAT NOT NULL DEFAULT 0.0,
+    processing_time_sum FLOAT NOT NULL DEFAULT 0.0,
+    documents_ingested INTEGER NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP
 );
+CREATE UNIQUE INDEX IF NOT EXISTS ux_statistics_date ON statistics(date);
 
--- 통계 업데이트 함수
-CREATE OR REPLACE FUNCTION update_daily_statistics()
-RETURNS VOID AS $$
-BEGIN
-    INSERT INTO statistics (
-        date, 
-        total_checks, 
-        completed_checks, 
-        error_checks, 
-        avg_similarity_score, 
-        avg_processing_time
-    )
-    SELECT 
-        CURRENT_DATE,
-        COUNT(*),
-        COUNT(*) FILTER (WHERE status = 'completed'),
-        COUNT(*) FILTER (WHERE status = 'error'),
-        AVG(similarity_score) FILTER (WHERE status = 'completed'),
-        AVG(processing_time) FILTER (WHERE status = 'completed')
-    FROM plagiarism_checks 
-    WHERE DATE(created_at) = CURRENT_DATE
-    ON CONFLICT (date) DO UPDATE SET
-        total_checks = EXCLUDED.total_checks,
-        completed_checks = EXCLUDED.completed_checks,
-        error_checks = EXCLUDED.error_checks,
-        avg_similarity_score = EXCLUDED.avg_similarity_score,
-        avg_processing_time = EXCLUDED.avg_processing_time;
-END;
-$$ LANGUAGE plpgsql;
+-- 출처 유형별 활성 문서 수 (통계 API가 document_sources를 세지 않도록)
+CREATE TABLE IF NOT EXISTS source_type_counts (
+    source_type VARCHAR PRIMARY KEY,
+    active_count INTEGER NOT NULL DEFAULT 0
+);
+
+-- 크롤링 프런티어 (DB 대기열, 정규화된 URL당 한 행)
+CREATE TABLE IF NOT EXISTS crawl_frontier (
+    id SERIAL PRIMARY KEY,
+    url VARCHAR NOT NULL,
+    domain VARCHAR NOT NULL,
+    priority INTEGER NOT NULL DEFAULT 0,
+    status VARCHAR NOT NULL DEFAULT 'pending',
+    query VARCHAR,
+    source_type VARCHAR NOT NULL DEFAULT 'crawled',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_fetch_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    leased_until TIMESTAMP,
+    last_error VARCHAR,
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_crawl_frontier_url ON crawl_frontier (url);
+CREATE INDEX IF NOT EXISTS ix_crawl_frontier_status_due ON crawl_frontier (status, next_fetch_at, priority);
+
+-- 도메인별 다음 요청 가능 시각
+CREATE TABLE IF NOT EXISTS crawl_domains (
+    domain VARCHAR PRIMARY KEY,
+    next_fetch_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    crawl_delay DOUBLE PRECISION NOT NULL
+);
 
 -- 권한 설정
 GRANT ALL PRIVILEGES ON ALL TABLES IN SCHEMA public TO postgres;
@@ -30,7 +30,19 @@ interface CrawlResult {
   error?: string;
 }
 
-interface BatchCrawlResponse {
+interface BatchJobProgress {
+  job_id?: string;
+  status?: 'queued' | 'running' | 'completed' | 'failed';
+  progress?: {
+    total: number;
+    finished: number;
+    failed: number;
+    percent: number;
+  };
+  error?: string | null;
+}
+
+interface BatchCrawlResponse extends BatchJobProgress {
   success: boolean;
   batch_summary: {
     total_queries: number;
@@ -61,6 +73,22 @@ interface SingleCrawlResponse {
   message: string;
 }
 
+// 배치 작업은 작업 ID만 바로 돌려주므로 끝날 때까지 진행 상황을 조회
+const pollBatchJob = async <T extends BatchJobProgress>(jobUrl: string, onUpdate: (job: T) => void): Promise<T> => {
+  while (true) {
+    const response = await fetch(jobUrl);
+    if (!response.ok) {
+      throw new Error(await response.text());
+    }
+    const job: T = await response.json();
+    onUpdate(job);
+    if (job.status === 'completed' || job.status === 'failed') {
+      return job;
+    }
+    await new Promise(resolve => setTimeout(resolve, 1000));
+  }
+};
+
 const AICrawlingManager: React.FC = () => {
   const [singleQuery, setSingleQuery] = useState('');
   const [batchQueries, setBatchQueries] = useState('');
@@ -144,20 +172,20 @@ const AICrawlingManager: React.FC = () => {
     setBatchResult(null);
 
     try {
-      const response = await fetch(`${API_BASE}/crawl/batch`, {
+      const response = await fetch(`${API_BASE}/crawl/batch?results_per_query=${resultsPerQuery}`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
-        body: JSON.stringify({
-          queries: queries,
-          results_per_query: resultsPerQuery
-        }),
+        body: JSON.stringify(queries),
       });
 
       if (response.ok) {
-        const data: BatchCrawlResponse = await response.json();
-        setBatchResult(data);
+        const { job_id } = await response.json();
+        const job = await pollBatchJob<BatchCrawlResponse>(`${API_BASE}/jobs/${job_id}`, setBatchResult);
+        if (job.status === 'failed') {
+          alert(`배치 크롤링 실패: ${job.error}`);
+        }
       } else {
         const error = await response.text();
         alert(`배치 크롤링 실패: ${error}`);
@@ -268,20 +296,20 @@ const AICrawlingManager: React.FC = () => {
     setAiBatchResult(null);
 
     try {
-      const response = await fetch(`${API_BASE}/ai-knowledge/batch-generate`, {
+      const response = await fetch(`${API_BASE}/ai-knowledge/batch-generate?articles_per_topic=${aiArticlesPerTopic}`, {
         method: 'POST',
         headers: {
           'Content-Type': 'application/json',
         },
-        body: JSON.stringify({
-          topics: topics,
-          articles_per_topic: aiArticlesPerTopic
-        }),
+        body: JSON.stringify(topics),
       });
 
       if (response.ok) {
-        const data = await response.json();
-        setAiBatchResult(data);
+        const { job_id } = await response.json();
+        const job = await pollBatchJob<BatchJobProgress>(`${API_BASE}/jobs/${job_id}`, setAiBatchResult);
+        if (job.status === 'failed') {
+          alert(`AI 지식 배치 생성 실패: ${job.error}`);
+        }
       } else {
         const error = await response.text();
         alert(`AI 지식 배치 생성 실패: ${error}`);
@@ -462,6 +490,14 @@ const AICrawlingManager: React.FC = () => {
 
               {batchResult && (
                 <div className="mt-4 space-y-4">
+                  {batchResult.progress && batchResult.status !== 'completed' && (
+                    <div className="space-y-1">
+                      <Progress value={batchResult.progress.percent} />
+                      <p className="text-sm text-gray-600">
+                        진행 중: {batchResult.progress.finished}/{batchResult.progress.total}개 주제 완료
+                      </p>
+                    </div>
+                  )}
                   <Alert>
                     <CheckCircle className="w-4 h-4" />
                     <AlertDescription>
@@ -629,6 +665,14 @@ const AICrawlingManager: React.FC = () => {
 
                 {aiBatchResult && (
                   <div className="mt-4 space-y-4">
+                    {aiBatchResult.progress && aiBatchResult.status !== 'completed' && (
+                      <div className="space-y-1">
+                        <Progress value={aiBatchResult.progress.percent} />
+                        <p className="text-sm text-gray-600">
+                          진행 중: {aiBatchResult.progress.finished}/{aiBatchResult.progress.total}개 주제 완료
+                        </p>
+                      </div>
+                    )}
                     <Alert>
                       <CheckCircle className="w-4 h-4" />
                       <AlertDescription>